@@ -0,0 +1,4 @@
+def column_chunks(table, n):
+    # Batches are zero-copy slices of table.
+    for batch in table.to_batches(max_chunksize=n):
+        yield batch.columns
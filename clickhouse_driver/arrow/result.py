@@ -0,0 +1,89 @@
+import pyarrow as pa
+
+from ..columns.arrow.service import get_arrow_type
+from ..protocol import ServerPacketTypes
+
+
+def block_to_record_batch(block):
+    names = [name for name, _ in block.columns_with_types]
+    return pa.RecordBatch.from_arrays(block.get_columns(), names=names)
+
+
+class ArrowQueryResult(object):
+    """
+    Stores query result from multiple blocks as ``pyarrow.Table``.
+    """
+
+    def __init__(self, packet_generator, context):
+        self.packet_generator = packet_generator
+        self.context = context
+
+        self.batches = []
+        self.columns_with_types = []
+
+        super(ArrowQueryResult, self).__init__()
+
+    def store(self, packet):
+        # Totals and extremes are not part of result table.
+        if packet.type != ServerPacketTypes.DATA:
+            return
+
+        block = packet.block
+
+        # Header block contains no rows. Pick columns from it.
+        if block.num_rows:
+            self.batches.append(block_to_record_batch(block))
+
+        elif not self.columns_with_types:
+            self.columns_with_types = block.columns_with_types
+
+    def get_schema(self):
+        return pa.schema([
+            (name, get_arrow_type(self.context, type_))
+            for name, type_ in self.columns_with_types
+        ])
+
+    def get_result(self):
+        """
+        :return: stored query result.
+        """
+
+        for packet in self.packet_generator:
+            self.store(packet)
+
+        if self.batches:
+            schema = self.batches[0].schema
+            if all(x.schema == schema for x in self.batches):
+                return pa.Table.from_batches(self.batches)
+
+            # Types of generic columns are inferred per block and may differ.
+            # For example, block with NULLs only has null type.
+            return pa.concat_tables(
+                [pa.Table.from_batches([x]) for x in self.batches],
+                promote_options='permissive'
+            )
+
+        return self.get_schema().empty_table()
+
+
+class ArrowIterQueryResult(object):
+    """
+    Provides iteration over returned data by ``pyarrow.RecordBatch``
+    per block.
+    """
+
+    def __init__(self, packet_generator):
+        self.packet_generator = packet_generator
+        super(ArrowIterQueryResult, self).__init__()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            packet = next(self.packet_generator)
+            if packet.type != ServerPacketTypes.DATA:
+                continue
+
+            if packet.block.num_rows:
+                return block_to_record_batch(packet.block)
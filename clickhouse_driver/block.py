@@ -225,3 +225,36 @@ class RowOrientedBlock(BaseBlock):
                 'Unsupported row type: {}. dict is expected.'
                 .format(type(row))
             )
+
+
+class RawBlock(object):
+    """
+    Block in Native format. Columns data is kept as bytes without decoding.
+
+    :param columns_with_types: names and types of columns.
+    :param num_rows: number of rows in block.
+    :param data: block bytes: block info, columns headers and columns data.
+    :param info: block info.
+    :param compressed: ``True`` if ``data`` holds compressed frames of
+                       the block as they were received from the server.
+    """
+
+    def __init__(self, columns_with_types, num_rows, data, info=None,
+                 compressed=False):
+        self.columns_with_types = columns_with_types
+        self.num_rows = num_rows
+        self.data = data
+        self.info = info or BlockInfo()
+        self.compressed = compressed
+
+        super(RawBlock, self).__init__()
+
+    @property
+    def num_columns(self):
+        return len(self.columns_with_types)
+
+    def __repr__(self):
+        return '<RawBlock: {} rows, {} bytes{}>'.format(
+            self.num_rows, len(self.data),
+            ', compressed' if self.compressed else ''
+        )
@@ -1484,11 +1484,11 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "clickhouse_driver/bufferedreader.pyx",
-  "venv/lib/python3.10/site-packages/Cython/Includes/cpython/contextvars.pxd",
+  "contextvars.pxd",
   "<stringsource>",
-  "venv/lib/python3.10/site-packages/Cython/Includes/cpython/type.pxd",
-  "venv/lib/python3.10/site-packages/Cython/Includes/cpython/bool.pxd",
-  "venv/lib/python3.10/site-packages/Cython/Includes/cpython/complex.pxd",
+  "type.pxd",
+  "bool.pxd",
+  "complex.pxd",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* ForceInitThreads.proto */
@@ -1531,7 +1531,7 @@ struct __pyx_opt_args_7cpython_11contextvars_get_value_no_default {
   PyObject *default_value;
 };
 
-/* "clickhouse_driver/bufferedreader.pyx":10
+/* "clickhouse_driver/bufferedreader.pyx":13
  * 
  * 
  * cdef class BufferedReader(object):             # <<<<<<<<<<<<<<
@@ -1540,14 +1540,15 @@ struct __pyx_opt_args_7cpython_11contextvars_get_value_no_default {
  */
 struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader {
   PyObject_HEAD
+  struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_vtab;
   unsigned PY_LONG_LONG position;
   unsigned PY_LONG_LONG current_buffer_size;
   PyObject *buffer;
 };
 
 
-/* "clickhouse_driver/bufferedreader.pyx":229
- * 
+/* "clickhouse_driver/bufferedreader.pyx":402
+ *             PyMem_Free(data)
  * 
  * cdef class BufferedSocketReader(BufferedReader):             # <<<<<<<<<<<<<<
  *     cdef object sock
@@ -1559,7 +1560,7 @@ struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedSocketReader {
 };
 
 
-/* "clickhouse_driver/bufferedreader.pyx":243
+/* "clickhouse_driver/bufferedreader.pyx":416
  * 
  * 
  * cdef class CompressedBufferedReader(BufferedReader):             # <<<<<<<<<<<<<<
@@ -1571,6 +1572,48 @@ struct __pyx_obj_17clickhouse_driver_14bufferedreader_CompressedBufferedReader {
   PyObject *read_block;
 };
 
+
+
+/* "clickhouse_driver/bufferedreader.pyx":13
+ * 
+ * 
+ * cdef class BufferedReader(object):             # <<<<<<<<<<<<<<
+ *     cdef public unsigned long long position, current_buffer_size
+ *     cdef public bytearray buffer
+ */
+
+struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader {
+  PyObject *(*copy_into)(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *, char *, unsigned PY_LONG_LONG);
+};
+static struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedReader;
+
+
+/* "clickhouse_driver/bufferedreader.pyx":402
+ *             PyMem_Free(data)
+ * 
+ * cdef class BufferedSocketReader(BufferedReader):             # <<<<<<<<<<<<<<
+ *     cdef object sock
+ * 
+ */
+
+struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedSocketReader {
+  struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader __pyx_base;
+};
+static struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedSocketReader *__pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedSocketReader;
+
+
+/* "clickhouse_driver/bufferedreader.pyx":416
+ * 
+ * 
+ * cdef class CompressedBufferedReader(BufferedReader):             # <<<<<<<<<<<<<<
+ *     cdef object read_block
+ * 
+ */
+
+struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_CompressedBufferedReader {
+  struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader __pyx_base;
+};
+static struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_CompressedBufferedReader *__pyx_vtabptr_17clickhouse_driver_14bufferedreader_CompressedBufferedReader;
 /* #### Code section: utility_code_proto ### */
 
 /* --- Runtime support code (head) --- */
@@ -1853,8 +1896,37 @@ static int __Pyx_CheckKeywordStrings(PyObject *kw, const char* function_name, in
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* PyObjectCallNoArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
 
 /* GetItemIntByteArray.proto */
 #define __Pyx_GetItemInt_ByteArray(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
@@ -1864,6 +1936,9 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 static CYTHON_INLINE int __Pyx_GetItemInt_ByteArray_Fast(PyObject* string, Py_ssize_t i,
                                                          int wraparound, int boundscheck);
 
+/* PyObjectCallNoArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+
 /* decode_c_string_utf16.proto */
 static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16(const char *s, Py_ssize_t size, const char *errors) {
     int byteorder = 0;
@@ -1884,30 +1959,6 @@ static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
          const char* encoding, const char* errors,
          PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors));
 
-/* GetTopmostException.proto */
-#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
-static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
-#endif
-
-/* SaveResetException.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-#else
-#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
-#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
-#endif
-
-/* GetException.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
-static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#else
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
-#endif
-
 /* RaiseUnexpectedTypeError.proto */
 static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
 
@@ -2047,6 +2098,17 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
 #endif
 
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyTypeObject *type);
+
+/* MergeVTables.proto */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_MergeVtables(PyTypeObject *type);
+#endif
+
 /* SetupReduce.proto */
 #if !CYTHON_COMPILING_IN_LIMITED_API
 static int __Pyx_setup_reduce(PyObject* type_obj);
@@ -2302,6 +2364,7 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 /* #### Code section: module_declarations ### */
 static CYTHON_INLINE double __pyx_f_7cpython_7complex_7complex_4real_real(PyComplexObject *__pyx_v_self); /* proto*/
 static CYTHON_INLINE double __pyx_f_7cpython_7complex_7complex_4imag_imag(PyComplexObject *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_17clickhouse_driver_14bufferedreader_14BufferedReader_copy_into(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, char *__pyx_v_out, unsigned PY_LONG_LONG __pyx_v_unread); /* proto*/
 
 /* Module declarations from "cpython.version" */
 
@@ -2414,12 +2477,12 @@ static PyObject *__pyx_builtin_EOFError;
 static const char __pyx_k_b[] = "b";
 static const char __pyx_k_i[] = "i";
 static const char __pyx_k_j[] = "j";
-static const char __pyx_k_t[] = "t";
 static const char __pyx_k__3[] = ".";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_rv[] = "rv";
-static const char __pyx_k__33[] = "?";
+static const char __pyx_k__39[] = "?";
 static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_out[] = "out";
 static const char __pyx_k_data[] = "data";
 static const char __pyx_k_dict[] = "__dict__";
 static const char __pyx_k_init[] = "__init__";
@@ -2431,6 +2494,7 @@ static const char __pyx_k_self[] = "self";
 static const char __pyx_k_size[] = "size";
 static const char __pyx_k_sock[] = "sock";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_view[] = "view";
 static const char __pyx_k_items[] = "items";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_right[] = "right";
@@ -2451,14 +2515,18 @@ static const char __pyx_k_update[] = "update";
 static const char __pyx_k_bufsize[] = "bufsize";
 static const char __pyx_k_disable[] = "disable";
 static const char __pyx_k_n_items[] = "n_items";
+static const char __pyx_k_offsets[] = "offsets";
 static const char __pyx_k_EOFError[] = "EOFError";
 static const char __pyx_k_c_string[] = "c_string";
 static const char __pyx_k_data_ptr[] = "data_ptr";
 static const char __pyx_k_encoding[] = "encoding";
 static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_new_data[] = "new_data";
 static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_read_one[] = "read_one";
+static const char __pyx_k_readinto[] = "readinto";
 static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_data_size[] = "data_size";
 static const char __pyx_k_isenabled[] = "isenabled";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_recv_into[] = "recv_into";
@@ -2466,23 +2534,27 @@ static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_buffer_ptr[] = "buffer_ptr";
 static const char __pyx_k_bytes_read[] = "bytes_read";
 static const char __pyx_k_c_encoding[] = "c_encoding";
+static const char __pyx_k_chunk_size[] = "chunk_size";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_read_block[] = "read_block";
-static const char __pyx_k_read_bytes[] = "read_bytes";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_offsets_ptr[] = "offsets_ptr";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_read_strings[] = "read_strings";
 static const char __pyx_k_stringsource[] = "<stringsource>";
 static const char __pyx_k_use_setstate[] = "use_setstate";
 static const char __pyx_k_c_string_size[] = "c_string_size";
+static const char __pyx_k_data_capacity[] = "data_capacity";
 static const char __pyx_k_next_position[] = "next_position";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_BufferedReader[] = "BufferedReader";
 static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_read_into_buffer[] = "read_into_buffer";
+static const char __pyx_k_read_strings_raw[] = "read_strings_raw";
 static const char __pyx_k_UnicodeDecodeError[] = "UnicodeDecodeError";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
@@ -2490,7 +2562,9 @@ static const char __pyx_k_read_fixed_strings[] = "read_fixed_strings";
 static const char __pyx_k_BufferedReader_read[] = "BufferedReader.read";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
 static const char __pyx_k_BufferedSocketReader[] = "BufferedSocketReader";
+static const char __pyx_k_read_strings_buffers[] = "read_strings_buffers";
 static const char __pyx_k_BufferedReader_read_one[] = "BufferedReader.read_one";
+static const char __pyx_k_BufferedReader_readinto[] = "BufferedReader.readinto";
 static const char __pyx_k_CompressedBufferedReader[] = "CompressedBufferedReader";
 static const char __pyx_k_BufferedReader_read_strings[] = "BufferedReader.read_strings";
 static const char __pyx_k_pyx_unpickle_BufferedReader[] = "__pyx_unpickle_BufferedReader";
@@ -2499,9 +2573,11 @@ static const char __pyx_k_BufferedReader___reduce_cython[] = "BufferedReader.__r
 static const char __pyx_k_pyx_unpickle_BufferedSocketRea[] = "__pyx_unpickle_BufferedSocketReader";
 static const char __pyx_k_pyx_unpickle_CompressedBuffere[] = "__pyx_unpickle_CompressedBufferedReader";
 static const char __pyx_k_BufferedReader_read_into_buffer[] = "BufferedReader.read_into_buffer";
+static const char __pyx_k_BufferedReader_read_strings_raw[] = "BufferedReader.read_strings_raw";
 static const char __pyx_k_BufferedSocketReader___setstate[] = "BufferedSocketReader.__setstate_cython__";
 static const char __pyx_k_BufferedReader___setstate_cython[] = "BufferedReader.__setstate_cython__";
 static const char __pyx_k_BufferedReader_read_fixed_string[] = "BufferedReader.read_fixed_strings_as_bytes";
+static const char __pyx_k_BufferedReader_read_strings_buff[] = "BufferedReader.read_strings_buffers";
 static const char __pyx_k_BufferedSocketReader___reduce_cy[] = "BufferedSocketReader.__reduce_cython__";
 static const char __pyx_k_BufferedSocketReader_read_into_b[] = "BufferedSocketReader.read_into_buffer";
 static const char __pyx_k_CompressedBufferedReader___reduc[] = "CompressedBufferedReader.__reduce_cython__";
@@ -2518,10 +2594,13 @@ static const char __pyx_k_clickhouse_driver_bufferedreader_2[] = "clickhouse_dri
 static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader___init__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_bufsize); /* proto */
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_2read_into_buffer(CYTHON_UNUSED struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_4read(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_unread); /* proto */
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6read_one(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding); /* proto */
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_fixed_strings_as_bytes(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length); /* proto */
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6readinto(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_out); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_one(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings_as_bytes(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_14read_fixed_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_16read_strings_buffers(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_18read_strings_raw(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items); /* proto */
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8position___get__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
 static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8position_2__set__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_19current_buffer_size___get__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
@@ -2529,8 +2608,8 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_19curr
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6buffer___get__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
 static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6buffer_2__set__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6buffer_4__del__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_14__reduce_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_16__setstate_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_20__reduce_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_22__setstate_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketReader___init__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedSocketReader *__pyx_v_self, PyObject *__pyx_v_sock, PyObject *__pyx_v_bufsize); /* proto */
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_2read_into_buffer(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedSocketReader *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_4__reduce_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedSocketReader *__pyx_v_self); /* proto */
@@ -2680,6 +2759,9 @@ typedef struct {
   PyObject *__pyx_n_s_BufferedReader_read_into_buffer;
   PyObject *__pyx_n_s_BufferedReader_read_one;
   PyObject *__pyx_n_s_BufferedReader_read_strings;
+  PyObject *__pyx_n_s_BufferedReader_read_strings_buff;
+  PyObject *__pyx_n_s_BufferedReader_read_strings_raw;
+  PyObject *__pyx_n_s_BufferedReader_readinto;
   PyObject *__pyx_n_s_BufferedSocketReader;
   PyObject *__pyx_n_s_BufferedSocketReader___reduce_cy;
   PyObject *__pyx_n_s_BufferedSocketReader___setstate;
@@ -2698,7 +2780,7 @@ typedef struct {
   PyObject *__pyx_kp_u_Unexpected_EOF_while_reading_byt;
   PyObject *__pyx_n_s_UnicodeDecodeError;
   PyObject *__pyx_kp_u__3;
-  PyObject *__pyx_n_s__33;
+  PyObject *__pyx_n_s__39;
   PyObject *__pyx_n_s_asyncio_coroutines;
   PyObject *__pyx_n_s_b;
   PyObject *__pyx_n_s_buffer_ptr;
@@ -2707,11 +2789,14 @@ typedef struct {
   PyObject *__pyx_n_s_c_encoding;
   PyObject *__pyx_n_s_c_string;
   PyObject *__pyx_n_s_c_string_size;
+  PyObject *__pyx_n_s_chunk_size;
   PyObject *__pyx_kp_s_clickhouse_driver_bufferedreader;
   PyObject *__pyx_n_s_clickhouse_driver_bufferedreader_2;
   PyObject *__pyx_n_s_cline_in_traceback;
   PyObject *__pyx_n_s_data;
+  PyObject *__pyx_n_s_data_capacity;
   PyObject *__pyx_n_s_data_ptr;
+  PyObject *__pyx_n_s_data_size;
   PyObject *__pyx_n_s_dict;
   PyObject *__pyx_n_s_dict_2;
   PyObject *__pyx_kp_u_disable;
@@ -2733,8 +2818,12 @@ typedef struct {
   PyObject *__pyx_n_s_n_items;
   PyObject *__pyx_n_s_name;
   PyObject *__pyx_n_s_new;
+  PyObject *__pyx_n_s_new_data;
   PyObject *__pyx_n_s_next_position;
   PyObject *__pyx_n_s_object;
+  PyObject *__pyx_n_s_offsets;
+  PyObject *__pyx_n_s_offsets_ptr;
+  PyObject *__pyx_n_s_out;
   PyObject *__pyx_n_s_pickle;
   PyObject *__pyx_n_s_pyx_PickleError;
   PyObject *__pyx_n_s_pyx_checksum;
@@ -2744,15 +2833,18 @@ typedef struct {
   PyObject *__pyx_n_s_pyx_unpickle_BufferedReader;
   PyObject *__pyx_n_s_pyx_unpickle_BufferedSocketRea;
   PyObject *__pyx_n_s_pyx_unpickle_CompressedBuffere;
+  PyObject *__pyx_n_s_pyx_vtable;
   PyObject *__pyx_n_s_range;
   PyObject *__pyx_n_s_read;
   PyObject *__pyx_n_s_read_block;
-  PyObject *__pyx_n_s_read_bytes;
   PyObject *__pyx_n_s_read_fixed_strings;
   PyObject *__pyx_n_s_read_fixed_strings_as_bytes;
   PyObject *__pyx_n_s_read_into_buffer;
   PyObject *__pyx_n_s_read_one;
   PyObject *__pyx_n_s_read_strings;
+  PyObject *__pyx_n_s_read_strings_buffers;
+  PyObject *__pyx_n_s_read_strings_raw;
+  PyObject *__pyx_n_s_readinto;
   PyObject *__pyx_n_s_recv_into;
   PyObject *__pyx_n_s_reduce;
   PyObject *__pyx_n_s_reduce_cython;
@@ -2768,12 +2860,12 @@ typedef struct {
   PyObject *__pyx_n_s_state;
   PyObject *__pyx_kp_s_stringsource;
   PyObject *__pyx_n_s_super;
-  PyObject *__pyx_n_s_t;
   PyObject *__pyx_n_s_test;
   PyObject *__pyx_n_s_unread;
   PyObject *__pyx_n_s_update;
   PyObject *__pyx_n_s_use_setstate;
   PyObject *__pyx_kp_u_utf_8;
+  PyObject *__pyx_n_s_view;
   PyObject *__pyx_int_8157372;
   PyObject *__pyx_int_25411819;
   PyObject *__pyx_int_44607813;
@@ -2792,28 +2884,34 @@ typedef struct {
   PyObject *__pyx_tuple__10;
   PyObject *__pyx_tuple__12;
   PyObject *__pyx_tuple__14;
-  PyObject *__pyx_tuple__15;
+  PyObject *__pyx_tuple__16;
   PyObject *__pyx_tuple__17;
   PyObject *__pyx_tuple__19;
   PyObject *__pyx_tuple__21;
-  PyObject *__pyx_tuple__29;
+  PyObject *__pyx_tuple__23;
+  PyObject *__pyx_tuple__25;
+  PyObject *__pyx_tuple__27;
+  PyObject *__pyx_tuple__35;
   PyObject *__pyx_codeobj__7;
   PyObject *__pyx_codeobj__9;
   PyObject *__pyx_codeobj__11;
   PyObject *__pyx_codeobj__13;
-  PyObject *__pyx_codeobj__16;
+  PyObject *__pyx_codeobj__15;
   PyObject *__pyx_codeobj__18;
   PyObject *__pyx_codeobj__20;
   PyObject *__pyx_codeobj__22;
-  PyObject *__pyx_codeobj__23;
   PyObject *__pyx_codeobj__24;
-  PyObject *__pyx_codeobj__25;
   PyObject *__pyx_codeobj__26;
-  PyObject *__pyx_codeobj__27;
   PyObject *__pyx_codeobj__28;
+  PyObject *__pyx_codeobj__29;
   PyObject *__pyx_codeobj__30;
   PyObject *__pyx_codeobj__31;
   PyObject *__pyx_codeobj__32;
+  PyObject *__pyx_codeobj__33;
+  PyObject *__pyx_codeobj__34;
+  PyObject *__pyx_codeobj__36;
+  PyObject *__pyx_codeobj__37;
+  PyObject *__pyx_codeobj__38;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -2874,6 +2972,9 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_BufferedReader_read_into_buffer);
   Py_CLEAR(clear_module_state->__pyx_n_s_BufferedReader_read_one);
   Py_CLEAR(clear_module_state->__pyx_n_s_BufferedReader_read_strings);
+  Py_CLEAR(clear_module_state->__pyx_n_s_BufferedReader_read_strings_buff);
+  Py_CLEAR(clear_module_state->__pyx_n_s_BufferedReader_read_strings_raw);
+  Py_CLEAR(clear_module_state->__pyx_n_s_BufferedReader_readinto);
   Py_CLEAR(clear_module_state->__pyx_n_s_BufferedSocketReader);
   Py_CLEAR(clear_module_state->__pyx_n_s_BufferedSocketReader___reduce_cy);
   Py_CLEAR(clear_module_state->__pyx_n_s_BufferedSocketReader___setstate);
@@ -2892,7 +2993,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_u_Unexpected_EOF_while_reading_byt);
   Py_CLEAR(clear_module_state->__pyx_n_s_UnicodeDecodeError);
   Py_CLEAR(clear_module_state->__pyx_kp_u__3);
-  Py_CLEAR(clear_module_state->__pyx_n_s__33);
+  Py_CLEAR(clear_module_state->__pyx_n_s__39);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
   Py_CLEAR(clear_module_state->__pyx_n_s_b);
   Py_CLEAR(clear_module_state->__pyx_n_s_buffer_ptr);
@@ -2901,11 +3002,14 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_c_encoding);
   Py_CLEAR(clear_module_state->__pyx_n_s_c_string);
   Py_CLEAR(clear_module_state->__pyx_n_s_c_string_size);
+  Py_CLEAR(clear_module_state->__pyx_n_s_chunk_size);
   Py_CLEAR(clear_module_state->__pyx_kp_s_clickhouse_driver_bufferedreader);
   Py_CLEAR(clear_module_state->__pyx_n_s_clickhouse_driver_bufferedreader_2);
   Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
   Py_CLEAR(clear_module_state->__pyx_n_s_data);
+  Py_CLEAR(clear_module_state->__pyx_n_s_data_capacity);
   Py_CLEAR(clear_module_state->__pyx_n_s_data_ptr);
+  Py_CLEAR(clear_module_state->__pyx_n_s_data_size);
   Py_CLEAR(clear_module_state->__pyx_n_s_dict);
   Py_CLEAR(clear_module_state->__pyx_n_s_dict_2);
   Py_CLEAR(clear_module_state->__pyx_kp_u_disable);
@@ -2927,8 +3031,12 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_n_items);
   Py_CLEAR(clear_module_state->__pyx_n_s_name);
   Py_CLEAR(clear_module_state->__pyx_n_s_new);
+  Py_CLEAR(clear_module_state->__pyx_n_s_new_data);
   Py_CLEAR(clear_module_state->__pyx_n_s_next_position);
   Py_CLEAR(clear_module_state->__pyx_n_s_object);
+  Py_CLEAR(clear_module_state->__pyx_n_s_offsets);
+  Py_CLEAR(clear_module_state->__pyx_n_s_offsets_ptr);
+  Py_CLEAR(clear_module_state->__pyx_n_s_out);
   Py_CLEAR(clear_module_state->__pyx_n_s_pickle);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_PickleError);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_checksum);
@@ -2938,15 +3046,18 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_unpickle_BufferedReader);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_unpickle_BufferedSocketRea);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_unpickle_CompressedBuffere);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pyx_vtable);
   Py_CLEAR(clear_module_state->__pyx_n_s_range);
   Py_CLEAR(clear_module_state->__pyx_n_s_read);
   Py_CLEAR(clear_module_state->__pyx_n_s_read_block);
-  Py_CLEAR(clear_module_state->__pyx_n_s_read_bytes);
   Py_CLEAR(clear_module_state->__pyx_n_s_read_fixed_strings);
   Py_CLEAR(clear_module_state->__pyx_n_s_read_fixed_strings_as_bytes);
   Py_CLEAR(clear_module_state->__pyx_n_s_read_into_buffer);
   Py_CLEAR(clear_module_state->__pyx_n_s_read_one);
   Py_CLEAR(clear_module_state->__pyx_n_s_read_strings);
+  Py_CLEAR(clear_module_state->__pyx_n_s_read_strings_buffers);
+  Py_CLEAR(clear_module_state->__pyx_n_s_read_strings_raw);
+  Py_CLEAR(clear_module_state->__pyx_n_s_readinto);
   Py_CLEAR(clear_module_state->__pyx_n_s_recv_into);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
@@ -2962,12 +3073,12 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_state);
   Py_CLEAR(clear_module_state->__pyx_kp_s_stringsource);
   Py_CLEAR(clear_module_state->__pyx_n_s_super);
-  Py_CLEAR(clear_module_state->__pyx_n_s_t);
   Py_CLEAR(clear_module_state->__pyx_n_s_test);
   Py_CLEAR(clear_module_state->__pyx_n_s_unread);
   Py_CLEAR(clear_module_state->__pyx_n_s_update);
   Py_CLEAR(clear_module_state->__pyx_n_s_use_setstate);
   Py_CLEAR(clear_module_state->__pyx_kp_u_utf_8);
+  Py_CLEAR(clear_module_state->__pyx_n_s_view);
   Py_CLEAR(clear_module_state->__pyx_int_8157372);
   Py_CLEAR(clear_module_state->__pyx_int_25411819);
   Py_CLEAR(clear_module_state->__pyx_int_44607813);
@@ -2986,28 +3097,34 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_tuple__10);
   Py_CLEAR(clear_module_state->__pyx_tuple__12);
   Py_CLEAR(clear_module_state->__pyx_tuple__14);
-  Py_CLEAR(clear_module_state->__pyx_tuple__15);
+  Py_CLEAR(clear_module_state->__pyx_tuple__16);
   Py_CLEAR(clear_module_state->__pyx_tuple__17);
   Py_CLEAR(clear_module_state->__pyx_tuple__19);
   Py_CLEAR(clear_module_state->__pyx_tuple__21);
-  Py_CLEAR(clear_module_state->__pyx_tuple__29);
+  Py_CLEAR(clear_module_state->__pyx_tuple__23);
+  Py_CLEAR(clear_module_state->__pyx_tuple__25);
+  Py_CLEAR(clear_module_state->__pyx_tuple__27);
+  Py_CLEAR(clear_module_state->__pyx_tuple__35);
   Py_CLEAR(clear_module_state->__pyx_codeobj__7);
   Py_CLEAR(clear_module_state->__pyx_codeobj__9);
   Py_CLEAR(clear_module_state->__pyx_codeobj__11);
   Py_CLEAR(clear_module_state->__pyx_codeobj__13);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__16);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__15);
   Py_CLEAR(clear_module_state->__pyx_codeobj__18);
   Py_CLEAR(clear_module_state->__pyx_codeobj__20);
   Py_CLEAR(clear_module_state->__pyx_codeobj__22);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__23);
   Py_CLEAR(clear_module_state->__pyx_codeobj__24);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__25);
   Py_CLEAR(clear_module_state->__pyx_codeobj__26);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__27);
   Py_CLEAR(clear_module_state->__pyx_codeobj__28);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__29);
   Py_CLEAR(clear_module_state->__pyx_codeobj__30);
   Py_CLEAR(clear_module_state->__pyx_codeobj__31);
   Py_CLEAR(clear_module_state->__pyx_codeobj__32);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__33);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__34);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__36);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__37);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__38);
   return 0;
 }
 #endif
@@ -3046,6 +3163,9 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_BufferedReader_read_into_buffer);
   Py_VISIT(traverse_module_state->__pyx_n_s_BufferedReader_read_one);
   Py_VISIT(traverse_module_state->__pyx_n_s_BufferedReader_read_strings);
+  Py_VISIT(traverse_module_state->__pyx_n_s_BufferedReader_read_strings_buff);
+  Py_VISIT(traverse_module_state->__pyx_n_s_BufferedReader_read_strings_raw);
+  Py_VISIT(traverse_module_state->__pyx_n_s_BufferedReader_readinto);
   Py_VISIT(traverse_module_state->__pyx_n_s_BufferedSocketReader);
   Py_VISIT(traverse_module_state->__pyx_n_s_BufferedSocketReader___reduce_cy);
   Py_VISIT(traverse_module_state->__pyx_n_s_BufferedSocketReader___setstate);
@@ -3064,7 +3184,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_u_Unexpected_EOF_while_reading_byt);
   Py_VISIT(traverse_module_state->__pyx_n_s_UnicodeDecodeError);
   Py_VISIT(traverse_module_state->__pyx_kp_u__3);
-  Py_VISIT(traverse_module_state->__pyx_n_s__33);
+  Py_VISIT(traverse_module_state->__pyx_n_s__39);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
   Py_VISIT(traverse_module_state->__pyx_n_s_b);
   Py_VISIT(traverse_module_state->__pyx_n_s_buffer_ptr);
@@ -3073,11 +3193,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_c_encoding);
   Py_VISIT(traverse_module_state->__pyx_n_s_c_string);
   Py_VISIT(traverse_module_state->__pyx_n_s_c_string_size);
+  Py_VISIT(traverse_module_state->__pyx_n_s_chunk_size);
   Py_VISIT(traverse_module_state->__pyx_kp_s_clickhouse_driver_bufferedreader);
   Py_VISIT(traverse_module_state->__pyx_n_s_clickhouse_driver_bufferedreader_2);
   Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
   Py_VISIT(traverse_module_state->__pyx_n_s_data);
+  Py_VISIT(traverse_module_state->__pyx_n_s_data_capacity);
   Py_VISIT(traverse_module_state->__pyx_n_s_data_ptr);
+  Py_VISIT(traverse_module_state->__pyx_n_s_data_size);
   Py_VISIT(traverse_module_state->__pyx_n_s_dict);
   Py_VISIT(traverse_module_state->__pyx_n_s_dict_2);
   Py_VISIT(traverse_module_state->__pyx_kp_u_disable);
@@ -3099,8 +3222,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_n_items);
   Py_VISIT(traverse_module_state->__pyx_n_s_name);
   Py_VISIT(traverse_module_state->__pyx_n_s_new);
+  Py_VISIT(traverse_module_state->__pyx_n_s_new_data);
   Py_VISIT(traverse_module_state->__pyx_n_s_next_position);
   Py_VISIT(traverse_module_state->__pyx_n_s_object);
+  Py_VISIT(traverse_module_state->__pyx_n_s_offsets);
+  Py_VISIT(traverse_module_state->__pyx_n_s_offsets_ptr);
+  Py_VISIT(traverse_module_state->__pyx_n_s_out);
   Py_VISIT(traverse_module_state->__pyx_n_s_pickle);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_PickleError);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_checksum);
@@ -3110,15 +3237,18 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_unpickle_BufferedReader);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_unpickle_BufferedSocketRea);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_unpickle_CompressedBuffere);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pyx_vtable);
   Py_VISIT(traverse_module_state->__pyx_n_s_range);
   Py_VISIT(traverse_module_state->__pyx_n_s_read);
   Py_VISIT(traverse_module_state->__pyx_n_s_read_block);
-  Py_VISIT(traverse_module_state->__pyx_n_s_read_bytes);
   Py_VISIT(traverse_module_state->__pyx_n_s_read_fixed_strings);
   Py_VISIT(traverse_module_state->__pyx_n_s_read_fixed_strings_as_bytes);
   Py_VISIT(traverse_module_state->__pyx_n_s_read_into_buffer);
   Py_VISIT(traverse_module_state->__pyx_n_s_read_one);
   Py_VISIT(traverse_module_state->__pyx_n_s_read_strings);
+  Py_VISIT(traverse_module_state->__pyx_n_s_read_strings_buffers);
+  Py_VISIT(traverse_module_state->__pyx_n_s_read_strings_raw);
+  Py_VISIT(traverse_module_state->__pyx_n_s_readinto);
   Py_VISIT(traverse_module_state->__pyx_n_s_recv_into);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
@@ -3134,12 +3264,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_state);
   Py_VISIT(traverse_module_state->__pyx_kp_s_stringsource);
   Py_VISIT(traverse_module_state->__pyx_n_s_super);
-  Py_VISIT(traverse_module_state->__pyx_n_s_t);
   Py_VISIT(traverse_module_state->__pyx_n_s_test);
   Py_VISIT(traverse_module_state->__pyx_n_s_unread);
   Py_VISIT(traverse_module_state->__pyx_n_s_update);
   Py_VISIT(traverse_module_state->__pyx_n_s_use_setstate);
   Py_VISIT(traverse_module_state->__pyx_kp_u_utf_8);
+  Py_VISIT(traverse_module_state->__pyx_n_s_view);
   Py_VISIT(traverse_module_state->__pyx_int_8157372);
   Py_VISIT(traverse_module_state->__pyx_int_25411819);
   Py_VISIT(traverse_module_state->__pyx_int_44607813);
@@ -3158,28 +3288,34 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_tuple__10);
   Py_VISIT(traverse_module_state->__pyx_tuple__12);
   Py_VISIT(traverse_module_state->__pyx_tuple__14);
-  Py_VISIT(traverse_module_state->__pyx_tuple__15);
+  Py_VISIT(traverse_module_state->__pyx_tuple__16);
   Py_VISIT(traverse_module_state->__pyx_tuple__17);
   Py_VISIT(traverse_module_state->__pyx_tuple__19);
   Py_VISIT(traverse_module_state->__pyx_tuple__21);
-  Py_VISIT(traverse_module_state->__pyx_tuple__29);
+  Py_VISIT(traverse_module_state->__pyx_tuple__23);
+  Py_VISIT(traverse_module_state->__pyx_tuple__25);
+  Py_VISIT(traverse_module_state->__pyx_tuple__27);
+  Py_VISIT(traverse_module_state->__pyx_tuple__35);
   Py_VISIT(traverse_module_state->__pyx_codeobj__7);
   Py_VISIT(traverse_module_state->__pyx_codeobj__9);
   Py_VISIT(traverse_module_state->__pyx_codeobj__11);
   Py_VISIT(traverse_module_state->__pyx_codeobj__13);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__16);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__15);
   Py_VISIT(traverse_module_state->__pyx_codeobj__18);
   Py_VISIT(traverse_module_state->__pyx_codeobj__20);
   Py_VISIT(traverse_module_state->__pyx_codeobj__22);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__23);
   Py_VISIT(traverse_module_state->__pyx_codeobj__24);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__25);
   Py_VISIT(traverse_module_state->__pyx_codeobj__26);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__27);
   Py_VISIT(traverse_module_state->__pyx_codeobj__28);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__29);
   Py_VISIT(traverse_module_state->__pyx_codeobj__30);
   Py_VISIT(traverse_module_state->__pyx_codeobj__31);
   Py_VISIT(traverse_module_state->__pyx_codeobj__32);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__33);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__34);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__36);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__37);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__38);
   return 0;
 }
 #endif
@@ -3316,6 +3452,9 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_BufferedReader_read_into_buffer __pyx_mstate_global->__pyx_n_s_BufferedReader_read_into_buffer
 #define __pyx_n_s_BufferedReader_read_one __pyx_mstate_global->__pyx_n_s_BufferedReader_read_one
 #define __pyx_n_s_BufferedReader_read_strings __pyx_mstate_global->__pyx_n_s_BufferedReader_read_strings
+#define __pyx_n_s_BufferedReader_read_strings_buff __pyx_mstate_global->__pyx_n_s_BufferedReader_read_strings_buff
+#define __pyx_n_s_BufferedReader_read_strings_raw __pyx_mstate_global->__pyx_n_s_BufferedReader_read_strings_raw
+#define __pyx_n_s_BufferedReader_readinto __pyx_mstate_global->__pyx_n_s_BufferedReader_readinto
 #define __pyx_n_s_BufferedSocketReader __pyx_mstate_global->__pyx_n_s_BufferedSocketReader
 #define __pyx_n_s_BufferedSocketReader___reduce_cy __pyx_mstate_global->__pyx_n_s_BufferedSocketReader___reduce_cy
 #define __pyx_n_s_BufferedSocketReader___setstate __pyx_mstate_global->__pyx_n_s_BufferedSocketReader___setstate
@@ -3334,7 +3473,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_u_Unexpected_EOF_while_reading_byt __pyx_mstate_global->__pyx_kp_u_Unexpected_EOF_while_reading_byt
 #define __pyx_n_s_UnicodeDecodeError __pyx_mstate_global->__pyx_n_s_UnicodeDecodeError
 #define __pyx_kp_u__3 __pyx_mstate_global->__pyx_kp_u__3
-#define __pyx_n_s__33 __pyx_mstate_global->__pyx_n_s__33
+#define __pyx_n_s__39 __pyx_mstate_global->__pyx_n_s__39
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
 #define __pyx_n_s_b __pyx_mstate_global->__pyx_n_s_b
 #define __pyx_n_s_buffer_ptr __pyx_mstate_global->__pyx_n_s_buffer_ptr
@@ -3343,11 +3482,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_c_encoding __pyx_mstate_global->__pyx_n_s_c_encoding
 #define __pyx_n_s_c_string __pyx_mstate_global->__pyx_n_s_c_string
 #define __pyx_n_s_c_string_size __pyx_mstate_global->__pyx_n_s_c_string_size
+#define __pyx_n_s_chunk_size __pyx_mstate_global->__pyx_n_s_chunk_size
 #define __pyx_kp_s_clickhouse_driver_bufferedreader __pyx_mstate_global->__pyx_kp_s_clickhouse_driver_bufferedreader
 #define __pyx_n_s_clickhouse_driver_bufferedreader_2 __pyx_mstate_global->__pyx_n_s_clickhouse_driver_bufferedreader_2
 #define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
 #define __pyx_n_s_data __pyx_mstate_global->__pyx_n_s_data
+#define __pyx_n_s_data_capacity __pyx_mstate_global->__pyx_n_s_data_capacity
 #define __pyx_n_s_data_ptr __pyx_mstate_global->__pyx_n_s_data_ptr
+#define __pyx_n_s_data_size __pyx_mstate_global->__pyx_n_s_data_size
 #define __pyx_n_s_dict __pyx_mstate_global->__pyx_n_s_dict
 #define __pyx_n_s_dict_2 __pyx_mstate_global->__pyx_n_s_dict_2
 #define __pyx_kp_u_disable __pyx_mstate_global->__pyx_kp_u_disable
@@ -3369,8 +3511,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_n_items __pyx_mstate_global->__pyx_n_s_n_items
 #define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
 #define __pyx_n_s_new __pyx_mstate_global->__pyx_n_s_new
+#define __pyx_n_s_new_data __pyx_mstate_global->__pyx_n_s_new_data
 #define __pyx_n_s_next_position __pyx_mstate_global->__pyx_n_s_next_position
 #define __pyx_n_s_object __pyx_mstate_global->__pyx_n_s_object
+#define __pyx_n_s_offsets __pyx_mstate_global->__pyx_n_s_offsets
+#define __pyx_n_s_offsets_ptr __pyx_mstate_global->__pyx_n_s_offsets_ptr
+#define __pyx_n_s_out __pyx_mstate_global->__pyx_n_s_out
 #define __pyx_n_s_pickle __pyx_mstate_global->__pyx_n_s_pickle
 #define __pyx_n_s_pyx_PickleError __pyx_mstate_global->__pyx_n_s_pyx_PickleError
 #define __pyx_n_s_pyx_checksum __pyx_mstate_global->__pyx_n_s_pyx_checksum
@@ -3380,15 +3526,18 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_pyx_unpickle_BufferedReader __pyx_mstate_global->__pyx_n_s_pyx_unpickle_BufferedReader
 #define __pyx_n_s_pyx_unpickle_BufferedSocketRea __pyx_mstate_global->__pyx_n_s_pyx_unpickle_BufferedSocketRea
 #define __pyx_n_s_pyx_unpickle_CompressedBuffere __pyx_mstate_global->__pyx_n_s_pyx_unpickle_CompressedBuffere
+#define __pyx_n_s_pyx_vtable __pyx_mstate_global->__pyx_n_s_pyx_vtable
 #define __pyx_n_s_range __pyx_mstate_global->__pyx_n_s_range
 #define __pyx_n_s_read __pyx_mstate_global->__pyx_n_s_read
 #define __pyx_n_s_read_block __pyx_mstate_global->__pyx_n_s_read_block
-#define __pyx_n_s_read_bytes __pyx_mstate_global->__pyx_n_s_read_bytes
 #define __pyx_n_s_read_fixed_strings __pyx_mstate_global->__pyx_n_s_read_fixed_strings
 #define __pyx_n_s_read_fixed_strings_as_bytes __pyx_mstate_global->__pyx_n_s_read_fixed_strings_as_bytes
 #define __pyx_n_s_read_into_buffer __pyx_mstate_global->__pyx_n_s_read_into_buffer
 #define __pyx_n_s_read_one __pyx_mstate_global->__pyx_n_s_read_one
 #define __pyx_n_s_read_strings __pyx_mstate_global->__pyx_n_s_read_strings
+#define __pyx_n_s_read_strings_buffers __pyx_mstate_global->__pyx_n_s_read_strings_buffers
+#define __pyx_n_s_read_strings_raw __pyx_mstate_global->__pyx_n_s_read_strings_raw
+#define __pyx_n_s_readinto __pyx_mstate_global->__pyx_n_s_readinto
 #define __pyx_n_s_recv_into __pyx_mstate_global->__pyx_n_s_recv_into
 #define __pyx_n_s_reduce __pyx_mstate_global->__pyx_n_s_reduce
 #define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
@@ -3404,12 +3553,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_state __pyx_mstate_global->__pyx_n_s_state
 #define __pyx_kp_s_stringsource __pyx_mstate_global->__pyx_kp_s_stringsource
 #define __pyx_n_s_super __pyx_mstate_global->__pyx_n_s_super
-#define __pyx_n_s_t __pyx_mstate_global->__pyx_n_s_t
 #define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
 #define __pyx_n_s_unread __pyx_mstate_global->__pyx_n_s_unread
 #define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
 #define __pyx_n_s_use_setstate __pyx_mstate_global->__pyx_n_s_use_setstate
 #define __pyx_kp_u_utf_8 __pyx_mstate_global->__pyx_kp_u_utf_8
+#define __pyx_n_s_view __pyx_mstate_global->__pyx_n_s_view
 #define __pyx_int_8157372 __pyx_mstate_global->__pyx_int_8157372
 #define __pyx_int_25411819 __pyx_mstate_global->__pyx_int_25411819
 #define __pyx_int_44607813 __pyx_mstate_global->__pyx_int_44607813
@@ -3428,28 +3577,34 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_tuple__10 __pyx_mstate_global->__pyx_tuple__10
 #define __pyx_tuple__12 __pyx_mstate_global->__pyx_tuple__12
 #define __pyx_tuple__14 __pyx_mstate_global->__pyx_tuple__14
-#define __pyx_tuple__15 __pyx_mstate_global->__pyx_tuple__15
+#define __pyx_tuple__16 __pyx_mstate_global->__pyx_tuple__16
 #define __pyx_tuple__17 __pyx_mstate_global->__pyx_tuple__17
 #define __pyx_tuple__19 __pyx_mstate_global->__pyx_tuple__19
 #define __pyx_tuple__21 __pyx_mstate_global->__pyx_tuple__21
-#define __pyx_tuple__29 __pyx_mstate_global->__pyx_tuple__29
+#define __pyx_tuple__23 __pyx_mstate_global->__pyx_tuple__23
+#define __pyx_tuple__25 __pyx_mstate_global->__pyx_tuple__25
+#define __pyx_tuple__27 __pyx_mstate_global->__pyx_tuple__27
+#define __pyx_tuple__35 __pyx_mstate_global->__pyx_tuple__35
 #define __pyx_codeobj__7 __pyx_mstate_global->__pyx_codeobj__7
 #define __pyx_codeobj__9 __pyx_mstate_global->__pyx_codeobj__9
 #define __pyx_codeobj__11 __pyx_mstate_global->__pyx_codeobj__11
 #define __pyx_codeobj__13 __pyx_mstate_global->__pyx_codeobj__13
-#define __pyx_codeobj__16 __pyx_mstate_global->__pyx_codeobj__16
+#define __pyx_codeobj__15 __pyx_mstate_global->__pyx_codeobj__15
 #define __pyx_codeobj__18 __pyx_mstate_global->__pyx_codeobj__18
 #define __pyx_codeobj__20 __pyx_mstate_global->__pyx_codeobj__20
 #define __pyx_codeobj__22 __pyx_mstate_global->__pyx_codeobj__22
-#define __pyx_codeobj__23 __pyx_mstate_global->__pyx_codeobj__23
 #define __pyx_codeobj__24 __pyx_mstate_global->__pyx_codeobj__24
-#define __pyx_codeobj__25 __pyx_mstate_global->__pyx_codeobj__25
 #define __pyx_codeobj__26 __pyx_mstate_global->__pyx_codeobj__26
-#define __pyx_codeobj__27 __pyx_mstate_global->__pyx_codeobj__27
 #define __pyx_codeobj__28 __pyx_mstate_global->__pyx_codeobj__28
+#define __pyx_codeobj__29 __pyx_mstate_global->__pyx_codeobj__29
 #define __pyx_codeobj__30 __pyx_mstate_global->__pyx_codeobj__30
 #define __pyx_codeobj__31 __pyx_mstate_global->__pyx_codeobj__31
 #define __pyx_codeobj__32 __pyx_mstate_global->__pyx_codeobj__32
+#define __pyx_codeobj__33 __pyx_mstate_global->__pyx_codeobj__33
+#define __pyx_codeobj__34 __pyx_mstate_global->__pyx_codeobj__34
+#define __pyx_codeobj__36 __pyx_mstate_global->__pyx_codeobj__36
+#define __pyx_codeobj__37 __pyx_mstate_global->__pyx_codeobj__37
+#define __pyx_codeobj__38 __pyx_mstate_global->__pyx_codeobj__38
 /* #### Code section: module_code ### */
 
 /* "cpython/complex.pxd":19
@@ -3745,7 +3900,7 @@ static CYTHON_INLINE PyObject *__pyx_f_7cpython_11contextvars_get_value_no_defau
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":14
+/* "clickhouse_driver/bufferedreader.pyx":17
  *     cdef public bytearray buffer
  * 
  *     def __init__(self, bufsize):             # <<<<<<<<<<<<<<
@@ -3789,12 +3944,12 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_1__ini
           (void)__Pyx_Arg_NewRef_VARARGS(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 17, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 14, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 17, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -3805,7 +3960,7 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_1__ini
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 14, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 17, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3844,14 +3999,14 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader___init
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":15
+  /* "clickhouse_driver/bufferedreader.pyx":18
  * 
  *     def __init__(self, bufsize):
  *         self.buffer = bytearray(bufsize)             # <<<<<<<<<<<<<<
  * 
  *         self.position = 0
  */
-  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_bufsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_bufsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->buffer);
@@ -3859,7 +4014,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader___init
   __pyx_v_self->buffer = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":17
+  /* "clickhouse_driver/bufferedreader.pyx":20
  *         self.buffer = bytearray(bufsize)
  * 
  *         self.position = 0             # <<<<<<<<<<<<<<
@@ -3868,7 +4023,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader___init
  */
   __pyx_v_self->position = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":18
+  /* "clickhouse_driver/bufferedreader.pyx":21
  * 
  *         self.position = 0
  *         self.current_buffer_size = 0             # <<<<<<<<<<<<<<
@@ -3877,25 +4032,25 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader___init
  */
   __pyx_v_self->current_buffer_size = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":20
+  /* "clickhouse_driver/bufferedreader.pyx":23
  *         self.current_buffer_size = 0
  * 
  *         super(BufferedReader, self).__init__()             # <<<<<<<<<<<<<<
  * 
  *     def read_into_buffer(self):
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
   __Pyx_GIVEREF((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader))) __PYX_ERR(0, 20, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader))) __PYX_ERR(0, 23, __pyx_L1_error);
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_GIVEREF((PyObject *)__pyx_v_self);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 20, __pyx_L1_error);
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 20, __pyx_L1_error)
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 23, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -3916,13 +4071,13 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader___init
     PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 0+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 20, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":14
+  /* "clickhouse_driver/bufferedreader.pyx":17
  *     cdef public bytearray buffer
  * 
  *     def __init__(self, bufsize):             # <<<<<<<<<<<<<<
@@ -3944,7 +4099,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader___init
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":22
+/* "clickhouse_driver/bufferedreader.pyx":25
  *         super(BufferedReader, self).__init__()
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -4001,7 +4156,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_into_buffer", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":23
+  /* "clickhouse_driver/bufferedreader.pyx":26
  * 
  *     def read_into_buffer(self):
  *         raise NotImplementedError             # <<<<<<<<<<<<<<
@@ -4009,9 +4164,9 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
  *     def read(self, unsigned long long unread):
  */
   __Pyx_Raise(__pyx_builtin_NotImplementedError, 0, 0, 0);
-  __PYX_ERR(0, 23, __pyx_L1_error)
+  __PYX_ERR(0, 26, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":22
+  /* "clickhouse_driver/bufferedreader.pyx":25
  *         super(BufferedReader, self).__init__()
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -4028,7 +4183,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":25
+/* "clickhouse_driver/bufferedreader.pyx":28
  *         raise NotImplementedError
  * 
  *     def read(self, unsigned long long unread):             # <<<<<<<<<<<<<<
@@ -4089,23 +4244,23 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 25, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read") < 0)) __PYX_ERR(0, 25, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read") < 0)) __PYX_ERR(0, 28, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    __pyx_v_unread = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_unread == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 25, __pyx_L3_error)
+    __pyx_v_unread = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_unread == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 25, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 28, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4134,265 +4289,128 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
 
 static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_4read(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_unread) {
   unsigned PY_LONG_LONG __pyx_v_next_position;
-  unsigned PY_LONG_LONG __pyx_v_t;
   char *__pyx_v_buffer_ptr;
-  unsigned PY_LONG_LONG __pyx_v_read_bytes;
   PyObject *__pyx_v_rv = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  unsigned PY_LONG_LONG __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  unsigned PY_LONG_LONG __pyx_t_7;
-  unsigned PY_LONG_LONG __pyx_t_8;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  char *__pyx_t_3;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":28
+  /* "clickhouse_driver/bufferedreader.pyx":31
  *         # When the buffer is large enough bytes read are almost
  *         # always hit the buffer.
  *         cdef unsigned long long next_position = unread + self.position             # <<<<<<<<<<<<<<
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
  *         if next_position < self.current_buffer_size:
- *             t = self.position
  */
   __pyx_v_next_position = (__pyx_v_unread + __pyx_v_self->position);
 
-  /* "clickhouse_driver/bufferedreader.pyx":29
+  /* "clickhouse_driver/bufferedreader.pyx":32
  *         # always hit the buffer.
  *         cdef unsigned long long next_position = unread + self.position
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         if next_position < self.current_buffer_size:
+ *             rv = PyBytes_FromStringAndSize(&buffer_ptr[self.position], unread)
+ */
+  __pyx_t_1 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":33
+ *         cdef unsigned long long next_position = unread + self.position
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
  *         if next_position < self.current_buffer_size:             # <<<<<<<<<<<<<<
- *             t = self.position
+ *             rv = PyBytes_FromStringAndSize(&buffer_ptr[self.position], unread)
  *             self.position = next_position
  */
-  __pyx_t_1 = (__pyx_v_next_position < __pyx_v_self->current_buffer_size);
-  if (__pyx_t_1) {
+  __pyx_t_2 = (__pyx_v_next_position < __pyx_v_self->current_buffer_size);
+  if (__pyx_t_2) {
 
-    /* "clickhouse_driver/bufferedreader.pyx":30
- *         cdef unsigned long long next_position = unread + self.position
+    /* "clickhouse_driver/bufferedreader.pyx":34
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
  *         if next_position < self.current_buffer_size:
- *             t = self.position             # <<<<<<<<<<<<<<
+ *             rv = PyBytes_FromStringAndSize(&buffer_ptr[self.position], unread)             # <<<<<<<<<<<<<<
  *             self.position = next_position
- *             return bytes(self.buffer[t:self.position])
+ *             return rv
  */
-    __pyx_t_2 = __pyx_v_self->position;
-    __pyx_v_t = __pyx_t_2;
+    __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_unread); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_rv = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":31
+    /* "clickhouse_driver/bufferedreader.pyx":35
  *         if next_position < self.current_buffer_size:
- *             t = self.position
+ *             rv = PyBytes_FromStringAndSize(&buffer_ptr[self.position], unread)
  *             self.position = next_position             # <<<<<<<<<<<<<<
- *             return bytes(self.buffer[t:self.position])
+ *             return rv
  * 
  */
     __pyx_v_self->position = __pyx_v_next_position;
 
-    /* "clickhouse_driver/bufferedreader.pyx":32
- *             t = self.position
+    /* "clickhouse_driver/bufferedreader.pyx":36
+ *             rv = PyBytes_FromStringAndSize(&buffer_ptr[self.position], unread)
  *             self.position = next_position
- *             return bytes(self.buffer[t:self.position])             # <<<<<<<<<<<<<<
+ *             return rv             # <<<<<<<<<<<<<<
  * 
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ *         rv = PyBytes_FromStringAndSize(NULL, unread)
  */
     __Pyx_XDECREF(__pyx_r);
-    if (unlikely(__pyx_v_self->buffer == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 32, __pyx_L1_error)
-    }
-    __pyx_t_3 = PySequence_GetSlice(__pyx_v_self->buffer, __pyx_v_t, __pyx_v_self->position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_4;
-    __pyx_t_4 = 0;
+    __Pyx_INCREF(__pyx_v_rv);
+    __pyx_r = __pyx_v_rv;
     goto __pyx_L0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":29
- *         # always hit the buffer.
+    /* "clickhouse_driver/bufferedreader.pyx":33
  *         cdef unsigned long long next_position = unread + self.position
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
  *         if next_position < self.current_buffer_size:             # <<<<<<<<<<<<<<
- *             t = self.position
+ *             rv = PyBytes_FromStringAndSize(&buffer_ptr[self.position], unread)
  *             self.position = next_position
  */
   }
 
-  /* "clickhouse_driver/bufferedreader.pyx":34
- *             return bytes(self.buffer[t:self.position])
- * 
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *         cdef unsigned long long read_bytes
- *         rv = bytes()
- */
-  __pyx_t_4 = __pyx_v_self->buffer;
-  __Pyx_INCREF(__pyx_t_4);
-  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-  /* "clickhouse_driver/bufferedreader.pyx":36
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
- *         cdef unsigned long long read_bytes
- *         rv = bytes()             # <<<<<<<<<<<<<<
- * 
- *         while unread > 0:
- */
-  __pyx_t_4 = __Pyx_PyObject_CallNoArg(((PyObject *)(&PyBytes_Type))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 36, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_v_rv = ((PyObject*)__pyx_t_4);
-  __pyx_t_4 = 0;
-
   /* "clickhouse_driver/bufferedreader.pyx":38
- *         rv = bytes()
- * 
- *         while unread > 0:             # <<<<<<<<<<<<<<
- *             if self.position == self.current_buffer_size:
- *                 self.read_into_buffer()
- */
-  while (1) {
-    __pyx_t_1 = (__pyx_v_unread > 0);
-    if (!__pyx_t_1) break;
-
-    /* "clickhouse_driver/bufferedreader.pyx":39
- * 
- *         while unread > 0:
- *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
- */
-    __pyx_t_1 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
-    if (__pyx_t_1) {
-
-      /* "clickhouse_driver/bufferedreader.pyx":40
- *         while unread > 0:
- *             if self.position == self.current_buffer_size:
- *                 self.read_into_buffer()             # <<<<<<<<<<<<<<
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
- *                 self.position = 0
- */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 40, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = NULL;
-      __pyx_t_6 = 0;
-      #if CYTHON_UNPACK_METHODS
-      if (likely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-          __pyx_t_6 = 1;
-        }
-      }
-      #endif
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
-        __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 40, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      }
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-      /* "clickhouse_driver/bufferedreader.pyx":41
- *             if self.position == self.current_buffer_size:
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *                 self.position = 0
- * 
- */
-      __pyx_t_4 = __pyx_v_self->buffer;
-      __Pyx_INCREF(__pyx_t_4);
-      __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-      /* "clickhouse_driver/bufferedreader.pyx":42
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
- *                 self.position = 0             # <<<<<<<<<<<<<<
- * 
- *             read_bytes = min(unread, self.current_buffer_size - self.position)
- */
-      __pyx_v_self->position = 0;
-
-      /* "clickhouse_driver/bufferedreader.pyx":39
- * 
- *         while unread > 0:
- *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
- */
-    }
-
-    /* "clickhouse_driver/bufferedreader.pyx":44
- *                 self.position = 0
- * 
- *             read_bytes = min(unread, self.current_buffer_size - self.position)             # <<<<<<<<<<<<<<
- *             rv += PyBytes_FromStringAndSize(
- *                 &buffer_ptr[self.position], read_bytes
- */
-    __pyx_t_2 = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
-    __pyx_t_7 = __pyx_v_unread;
-    __pyx_t_1 = (__pyx_t_2 < __pyx_t_7);
-    if (__pyx_t_1) {
-      __pyx_t_8 = __pyx_t_2;
-    } else {
-      __pyx_t_8 = __pyx_t_7;
-    }
-    __pyx_v_read_bytes = __pyx_t_8;
-
-    /* "clickhouse_driver/bufferedreader.pyx":45
- * 
- *             read_bytes = min(unread, self.current_buffer_size - self.position)
- *             rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                 &buffer_ptr[self.position], read_bytes
- *             )
- */
-    __pyx_t_4 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_read_bytes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 45, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_rv, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 45, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF_SET(__pyx_v_rv, ((PyObject*)__pyx_t_3));
-    __pyx_t_3 = 0;
-
-    /* "clickhouse_driver/bufferedreader.pyx":48
- *                 &buffer_ptr[self.position], read_bytes
- *             )
- *             self.position += read_bytes             # <<<<<<<<<<<<<<
- *             unread -= read_bytes
+ *             return rv
  * 
+ *         rv = PyBytes_FromStringAndSize(NULL, unread)             # <<<<<<<<<<<<<<
+ *         self.copy_into(PyBytes_AsString(rv), unread)
+ *         return rv
  */
-    __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_read_bytes);
+  __pyx_t_1 = PyBytes_FromStringAndSize(NULL, __pyx_v_unread); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_rv = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":49
- *             )
- *             self.position += read_bytes
- *             unread -= read_bytes             # <<<<<<<<<<<<<<
+  /* "clickhouse_driver/bufferedreader.pyx":39
  * 
+ *         rv = PyBytes_FromStringAndSize(NULL, unread)
+ *         self.copy_into(PyBytes_AsString(rv), unread)             # <<<<<<<<<<<<<<
  *         return rv
+ * 
  */
-    __pyx_v_unread = (__pyx_v_unread - __pyx_v_read_bytes);
-  }
+  __pyx_t_3 = PyBytes_AsString(__pyx_v_rv); if (unlikely(__pyx_t_3 == ((char *)NULL))) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self->__pyx_vtab)->copy_into(__pyx_v_self, __pyx_t_3, __pyx_v_unread); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":51
- *             unread -= read_bytes
- * 
+  /* "clickhouse_driver/bufferedreader.pyx":40
+ *         rv = PyBytes_FromStringAndSize(NULL, unread)
+ *         self.copy_into(PyBytes_AsString(rv), unread)
  *         return rv             # <<<<<<<<<<<<<<
  * 
- *     def read_one(self):
+ *     def readinto(self, out):
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_rv);
   __pyx_r = __pyx_v_rv;
   goto __pyx_L0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":25
+  /* "clickhouse_driver/bufferedreader.pyx":28
  *         raise NotImplementedError
  * 
  *     def read(self, unsigned long long unread):             # <<<<<<<<<<<<<<
@@ -4402,9 +4420,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -4414,222 +4430,43 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":53
+/* "clickhouse_driver/bufferedreader.pyx":42
  *         return rv
  * 
- *     def read_one(self):             # <<<<<<<<<<<<<<
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()
+ *     def readinto(self, out):             # <<<<<<<<<<<<<<
+ *         """
+ *         Fills writable buffer with next bytes. Unlike :meth:`read` there is
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7read_one(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7readinto(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_7read_one = {"read_one", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7read_one, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7read_one(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_6readinto, "\n        Fills writable buffer with next bytes. Unlike :meth:`read` there is\n        no intermediate bytes object: data is copied from reader buffer\n        straight into ``out``, for example, into preallocated NumPy array.\n\n        :param out: object supporting writable buffer protocol.\n        :return: number of bytes read.\n        ");
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_7readinto = {"readinto", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7readinto, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_6readinto};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7readinto(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
+  PyObject *__pyx_v_out = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read_one (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) {
-    __Pyx_RaiseArgtupleInvalid("read_one", 1, 0, 0, __pyx_nargs); return NULL;}
-  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "read_one", 0))) return NULL;
-  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6read_one(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6read_one(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
-  unsigned char __pyx_v_rv;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("read_one", 1);
-
-  /* "clickhouse_driver/bufferedreader.pyx":54
- * 
- *     def read_one(self):
- *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *             self.read_into_buffer()
- *             self.position = 0
- */
-  __pyx_t_1 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
-  if (__pyx_t_1) {
-
-    /* "clickhouse_driver/bufferedreader.pyx":55
- *     def read_one(self):
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()             # <<<<<<<<<<<<<<
- *             self.position = 0
- * 
- */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "clickhouse_driver/bufferedreader.pyx":56
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()
- *             self.position = 0             # <<<<<<<<<<<<<<
- * 
- *         rv = self.buffer[self.position]
- */
-    __pyx_v_self->position = 0;
-
-    /* "clickhouse_driver/bufferedreader.pyx":54
- * 
- *     def read_one(self):
- *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *             self.read_into_buffer()
- *             self.position = 0
- */
-  }
-
-  /* "clickhouse_driver/bufferedreader.pyx":58
- *             self.position = 0
- * 
- *         rv = self.buffer[self.position]             # <<<<<<<<<<<<<<
- *         self.position += 1
- *         return rv
- */
-  __pyx_t_5 = __Pyx_GetItemInt_ByteArray(__pyx_v_self->buffer, __pyx_v_self->position, unsigned PY_LONG_LONG, 0, __Pyx_PyInt_From_unsigned_PY_LONG_LONG, 0, 0, 1); if (unlikely(__pyx_t_5 == -1)) __PYX_ERR(0, 58, __pyx_L1_error)
-  __pyx_v_rv = __pyx_t_5;
-
-  /* "clickhouse_driver/bufferedreader.pyx":59
- * 
- *         rv = self.buffer[self.position]
- *         self.position += 1             # <<<<<<<<<<<<<<
- *         return rv
- * 
- */
-  __pyx_v_self->position = (__pyx_v_self->position + 1);
-
-  /* "clickhouse_driver/bufferedreader.pyx":60
- *         rv = self.buffer[self.position]
- *         self.position += 1
- *         return rv             # <<<<<<<<<<<<<<
- * 
- *     def read_strings(self, unsigned long long n_items, encoding=None):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_unsigned_char(__pyx_v_rv); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  /* "clickhouse_driver/bufferedreader.pyx":53
- *         return rv
- * 
- *     def read_one(self):             # <<<<<<<<<<<<<<
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_one", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "clickhouse_driver/bufferedreader.pyx":62
- *         return rv
- * 
- *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
- *         """
- *         Python has great overhead between function calls.
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_strings(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_strings, "\n        Python has great overhead between function calls.\n        We inline strings reading logic here to avoid this overhead.\n        ");
-static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_strings = {"read_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_strings};
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_strings(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  unsigned PY_LONG_LONG __pyx_v_n_items;
-  PyObject *__pyx_v_encoding = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read_strings (wrapper)", 0);
+  __Pyx_RefNannySetupContext("readinto (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -4639,13 +4476,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_encoding,0};
-    values[1] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -4654,39 +4488,27 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_items)) != 0)) {
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_out)) != 0)) {
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 62, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 42, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
-          if (value) { values[1] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 62, __pyx_L3_error)
-        }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_strings") < 0)) __PYX_ERR(0, 62, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "readinto") < 0)) __PYX_ERR(0, 42, __pyx_L3_error)
       }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    __pyx_v_n_items = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_n_items == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 62, __pyx_L3_error)
-    __pyx_v_encoding = values[1];
+    __pyx_v_out = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_strings", 0, 1, 2, __pyx_nargs); __PYX_ERR(0, 62, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("readinto", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 42, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4696,11 +4518,11 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.readinto", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_strings(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_encoding);
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6readinto(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_out);
 
   /* function exit code */
   {
@@ -4713,577 +4535,873 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding) {
-  PyObject *__pyx_v_items = NULL;
-  unsigned PY_LONG_LONG __pyx_v_i;
-  char *__pyx_v_buffer_ptr;
-  unsigned PY_LONG_LONG __pyx_v_right;
-  unsigned PY_LONG_LONG __pyx_v_size;
-  unsigned PY_LONG_LONG __pyx_v_shift;
-  unsigned PY_LONG_LONG __pyx_v_bytes_read;
-  unsigned PY_LONG_LONG __pyx_v_b;
-  char *__pyx_v_c_string;
-  unsigned PY_LONG_LONG __pyx_v_c_string_size;
-  char *__pyx_v_c_encoding;
-  PyObject *__pyx_v_rv = 0;
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6readinto(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_out) {
+  Py_buffer __pyx_v_view;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  char *__pyx_t_6;
-  unsigned PY_LONG_LONG __pyx_t_7;
-  unsigned PY_LONG_LONG __pyx_t_8;
-  unsigned PY_LONG_LONG __pyx_t_9;
-  unsigned PY_LONG_LONG __pyx_t_10;
-  unsigned PY_LONG_LONG __pyx_t_11;
-  unsigned PY_LONG_LONG __pyx_t_12;
-  PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
-  PyObject *__pyx_t_15 = NULL;
-  PyObject *__pyx_t_16 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  char const *__pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("read_strings", 0);
-  __Pyx_INCREF(__pyx_v_encoding);
+  __Pyx_RefNannySetupContext("readinto", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":67
- *         We inline strings reading logic here to avoid this overhead.
+  /* "clickhouse_driver/bufferedreader.pyx":52
  *         """
- *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
- * 
- *         cdef unsigned long long i
+ *         cdef Py_buffer view
+ *         PyObject_GetBuffer(out, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)             # <<<<<<<<<<<<<<
+ *         try:
+ *             self.copy_into(<char *> view.buf, view.len)
  */
-  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_items = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_1 = PyObject_GetBuffer(__pyx_v_out, (&__pyx_v_view), (PyBUF_SIMPLE | PyBUF_WRITABLE)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 52, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":71
- *         cdef unsigned long long i
- *         # Buffer vars
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *         cdef unsigned long long right
- *         # String length vars
+  /* "clickhouse_driver/bufferedreader.pyx":53
+ *         cdef Py_buffer view
+ *         PyObject_GetBuffer(out, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)
+ *         try:             # <<<<<<<<<<<<<<
+ *             self.copy_into(<char *> view.buf, view.len)
+ *         finally:
  */
-  __pyx_t_1 = __pyx_v_self->buffer;
-  __Pyx_INCREF(__pyx_t_1);
-  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  /*try:*/ {
 
-  /* "clickhouse_driver/bufferedreader.pyx":78
- * 
- *         # String for decode vars.
- *         cdef char *c_string = NULL             # <<<<<<<<<<<<<<
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL
+    /* "clickhouse_driver/bufferedreader.pyx":54
+ *         PyObject_GetBuffer(out, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)
+ *         try:
+ *             self.copy_into(<char *> view.buf, view.len)             # <<<<<<<<<<<<<<
+ *         finally:
+ *             PyBuffer_Release(&view)
  */
-  __pyx_v_c_string = NULL;
+    __pyx_t_2 = ((struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self->__pyx_vtab)->copy_into(__pyx_v_self, ((char *)__pyx_v_view.buf), __pyx_v_view.len); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 54, __pyx_L4_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
 
-  /* "clickhouse_driver/bufferedreader.pyx":79
- *         # String for decode vars.
- *         cdef char *c_string = NULL
- *         cdef unsigned long long c_string_size = 1024             # <<<<<<<<<<<<<<
- *         cdef char *c_encoding = NULL
- *         if encoding:
+  /* "clickhouse_driver/bufferedreader.pyx":56
+ *             self.copy_into(<char *> view.buf, view.len)
+ *         finally:
+ *             PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ * 
+ *         return view.len
  */
-  __pyx_v_c_string_size = 0x400;
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_view));
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_5 = 0; __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0)) __Pyx_ErrFetch(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_6);
+      __Pyx_XGOTREF(__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __pyx_t_1 = __pyx_lineno; __pyx_t_3 = __pyx_clineno; __pyx_t_4 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      }
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_ErrRestore(__pyx_t_5, __pyx_t_6, __pyx_t_7);
+      __pyx_t_5 = 0; __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0;
+      __pyx_lineno = __pyx_t_1; __pyx_clineno = __pyx_t_3; __pyx_filename = __pyx_t_4;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
 
-  /* "clickhouse_driver/bufferedreader.pyx":80
- *         cdef char *c_string = NULL
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL             # <<<<<<<<<<<<<<
- *         if encoding:
- *             encoding = encoding.encode('utf-8')
+  /* "clickhouse_driver/bufferedreader.pyx":58
+ *             PyBuffer_Release(&view)
+ * 
+ *         return view.len             # <<<<<<<<<<<<<<
+ * 
+ *     cdef copy_into(self, char* out, unsigned long long unread):
  */
-  __pyx_v_c_encoding = NULL;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_view.len); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":81
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL
- *         if encoding:             # <<<<<<<<<<<<<<
- *             encoding = encoding.encode('utf-8')
- *             c_encoding = encoding
+  /* "clickhouse_driver/bufferedreader.pyx":42
+ *         return rv
+ * 
+ *     def readinto(self, out):             # <<<<<<<<<<<<<<
+ *         """
+ *         Fills writable buffer with next bytes. Unlike :meth:`read` there is
  */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_encoding); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 81, __pyx_L1_error)
-  if (__pyx_t_2) {
 
-    /* "clickhouse_driver/bufferedreader.pyx":82
- *         cdef char *c_encoding = NULL
- *         if encoding:
- *             encoding = encoding.encode('utf-8')             # <<<<<<<<<<<<<<
- *             c_encoding = encoding
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.readinto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "clickhouse_driver/bufferedreader.pyx":60
+ *         return view.len
  * 
+ *     cdef copy_into(self, char* out, unsigned long long unread):             # <<<<<<<<<<<<<<
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ *         cdef unsigned long long read_bytes
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_kp_u_utf_8};
-      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_1);
-    __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":83
- *         if encoding:
- *             encoding = encoding.encode('utf-8')
- *             c_encoding = encoding             # <<<<<<<<<<<<<<
+static PyObject *__pyx_f_17clickhouse_driver_14bufferedreader_14BufferedReader_copy_into(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, char *__pyx_v_out, unsigned PY_LONG_LONG __pyx_v_unread) {
+  char *__pyx_v_buffer_ptr;
+  unsigned PY_LONG_LONG __pyx_v_read_bytes;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  unsigned PY_LONG_LONG __pyx_t_6;
+  unsigned PY_LONG_LONG __pyx_t_7;
+  unsigned PY_LONG_LONG __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("copy_into", 1);
+
+  /* "clickhouse_driver/bufferedreader.pyx":61
+ * 
+ *     cdef copy_into(self, char* out, unsigned long long unread):
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long read_bytes
  * 
- *         cdef object rv = object()
  */
-    __pyx_t_6 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __pyx_v_c_encoding = __pyx_t_6;
+  __pyx_t_1 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":81
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL
- *         if encoding:             # <<<<<<<<<<<<<<
- *             encoding = encoding.encode('utf-8')
- *             c_encoding = encoding
+  /* "clickhouse_driver/bufferedreader.pyx":64
+ *         cdef unsigned long long read_bytes
+ * 
+ *         while unread > 0:             # <<<<<<<<<<<<<<
+ *             if self.position == self.current_buffer_size:
+ *                 self.read_into_buffer()
  */
-  }
+  while (1) {
+    __pyx_t_2 = (__pyx_v_unread > 0);
+    if (!__pyx_t_2) break;
 
-  /* "clickhouse_driver/bufferedreader.pyx":85
- *             c_encoding = encoding
+    /* "clickhouse_driver/bufferedreader.pyx":65
  * 
- *         cdef object rv = object()             # <<<<<<<<<<<<<<
- *         # String for decode vars.
- *         if c_encoding:
+ *         while unread > 0:
+ *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                 self.read_into_buffer()
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)
  */
-  __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_builtin_object); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_rv = __pyx_t_1;
-  __pyx_t_1 = 0;
+    __pyx_t_2 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
+    if (__pyx_t_2) {
 
-  /* "clickhouse_driver/bufferedreader.pyx":87
- *         cdef object rv = object()
- *         # String for decode vars.
- *         if c_encoding:             # <<<<<<<<<<<<<<
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
- * 
+      /* "clickhouse_driver/bufferedreader.pyx":66
+ *         while unread > 0:
+ *             if self.position == self.current_buffer_size:
+ *                 self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                 self.position = 0
  */
-  __pyx_t_2 = (__pyx_v_c_encoding != 0);
-  if (__pyx_t_2) {
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = NULL;
+      __pyx_t_5 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (likely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+          __pyx_t_5 = 1;
+        }
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+        __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 66, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":88
- *         # String for decode vars.
- *         if c_encoding:
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)             # <<<<<<<<<<<<<<
+      /* "clickhouse_driver/bufferedreader.pyx":67
+ *             if self.position == self.current_buffer_size:
+ *                 self.read_into_buffer()
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                 self.position = 0
  * 
- *         for i in range(n_items):
  */
-    __pyx_v_c_string = ((char *)PyMem_Realloc(NULL, __pyx_v_c_string_size));
+      __pyx_t_1 = __pyx_v_self->buffer;
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":87
- *         cdef object rv = object()
- *         # String for decode vars.
- *         if c_encoding:             # <<<<<<<<<<<<<<
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+      /* "clickhouse_driver/bufferedreader.pyx":68
+ *                 self.read_into_buffer()
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                 self.position = 0             # <<<<<<<<<<<<<<
  * 
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)
  */
-  }
+      __pyx_v_self->position = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":90
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
- * 
- *         for i in range(n_items):             # <<<<<<<<<<<<<<
- *             shift = size = 0
+      /* "clickhouse_driver/bufferedreader.pyx":65
  * 
+ *         while unread > 0:
+ *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                 self.read_into_buffer()
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)
  */
-  __pyx_t_7 = __pyx_v_n_items;
-  __pyx_t_8 = __pyx_t_7;
-  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-    __pyx_v_i = __pyx_t_9;
+    }
 
-    /* "clickhouse_driver/bufferedreader.pyx":91
- * 
- *         for i in range(n_items):
- *             shift = size = 0             # <<<<<<<<<<<<<<
+    /* "clickhouse_driver/bufferedreader.pyx":70
+ *                 self.position = 0
  * 
- *             # Read string size
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)             # <<<<<<<<<<<<<<
+ *             memcpy(out, &buffer_ptr[self.position], read_bytes)
+ *             out += read_bytes
  */
-    __pyx_v_shift = 0;
-    __pyx_v_size = 0;
+    __pyx_t_6 = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+    __pyx_t_7 = __pyx_v_unread;
+    __pyx_t_2 = (__pyx_t_6 < __pyx_t_7);
+    if (__pyx_t_2) {
+      __pyx_t_8 = __pyx_t_6;
+    } else {
+      __pyx_t_8 = __pyx_t_7;
+    }
+    __pyx_v_read_bytes = __pyx_t_8;
 
-    /* "clickhouse_driver/bufferedreader.pyx":94
+    /* "clickhouse_driver/bufferedreader.pyx":71
  * 
- *             # Read string size
- *             while True:             # <<<<<<<<<<<<<<
- *                 if self.position == self.current_buffer_size:
- *                     self.read_into_buffer()
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)
+ *             memcpy(out, &buffer_ptr[self.position], read_bytes)             # <<<<<<<<<<<<<<
+ *             out += read_bytes
+ *             self.position += read_bytes
  */
-    while (1) {
+    (void)(memcpy(__pyx_v_out, (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_read_bytes));
 
-      /* "clickhouse_driver/bufferedreader.pyx":95
- *             # Read string size
- *             while True:
- *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                     self.read_into_buffer()
- *                     # `read_into_buffer` can override buffer
+    /* "clickhouse_driver/bufferedreader.pyx":72
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)
+ *             memcpy(out, &buffer_ptr[self.position], read_bytes)
+ *             out += read_bytes             # <<<<<<<<<<<<<<
+ *             self.position += read_bytes
+ *             unread -= read_bytes
  */
-      __pyx_t_2 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
-      if (__pyx_t_2) {
+    __pyx_v_out = (__pyx_v_out + __pyx_v_read_bytes);
 
-        /* "clickhouse_driver/bufferedreader.pyx":96
- *             while True:
- *                 if self.position == self.current_buffer_size:
- *                     self.read_into_buffer()             # <<<<<<<<<<<<<<
- *                     # `read_into_buffer` can override buffer
- *                     buffer_ptr = PyByteArray_AsString(self.buffer)
+    /* "clickhouse_driver/bufferedreader.pyx":73
+ *             memcpy(out, &buffer_ptr[self.position], read_bytes)
+ *             out += read_bytes
+ *             self.position += read_bytes             # <<<<<<<<<<<<<<
+ *             unread -= read_bytes
+ * 
  */
-        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = NULL;
-        __pyx_t_5 = 0;
-        #if CYTHON_UNPACK_METHODS
-        if (likely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_4);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
-            __pyx_t_5 = 1;
-          }
-        }
-        #endif
-        {
-          PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-          __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        }
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_read_bytes);
 
-        /* "clickhouse_driver/bufferedreader.pyx":98
- *                     self.read_into_buffer()
- *                     # `read_into_buffer` can override buffer
- *                     buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *                     self.position = 0
+    /* "clickhouse_driver/bufferedreader.pyx":74
+ *             out += read_bytes
+ *             self.position += read_bytes
+ *             unread -= read_bytes             # <<<<<<<<<<<<<<
  * 
+ *     def read_one(self):
  */
-        __pyx_t_1 = __pyx_v_self->buffer;
-        __Pyx_INCREF(__pyx_t_1);
-        __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_unread = (__pyx_v_unread - __pyx_v_read_bytes);
+  }
 
-        /* "clickhouse_driver/bufferedreader.pyx":99
- *                     # `read_into_buffer` can override buffer
- *                     buffer_ptr = PyByteArray_AsString(self.buffer)
- *                     self.position = 0             # <<<<<<<<<<<<<<
+  /* "clickhouse_driver/bufferedreader.pyx":60
+ *         return view.len
  * 
- *                 b = buffer_ptr[self.position]
+ *     cdef copy_into(self, char* out, unsigned long long unread):             # <<<<<<<<<<<<<<
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ *         cdef unsigned long long read_bytes
  */
-        __pyx_v_self->position = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":95
- *             # Read string size
- *             while True:
- *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                     self.read_into_buffer()
- *                     # `read_into_buffer` can override buffer
- */
-      }
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.copy_into", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "clickhouse_driver/bufferedreader.pyx":101
- *                     self.position = 0
- * 
- *                 b = buffer_ptr[self.position]             # <<<<<<<<<<<<<<
- *                 self.position += 1
+/* "clickhouse_driver/bufferedreader.pyx":76
+ *             unread -= read_bytes
  * 
+ *     def read_one(self):             # <<<<<<<<<<<<<<
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()
  */
-      __pyx_v_b = (__pyx_v_buffer_ptr[__pyx_v_self->position]);
 
-      /* "clickhouse_driver/bufferedreader.pyx":102
- * 
- *                 b = buffer_ptr[self.position]
- *                 self.position += 1             # <<<<<<<<<<<<<<
- * 
- *                 size |= (b & 0x7f) << shift
- */
-      __pyx_v_self->position = (__pyx_v_self->position + 1);
+/* Python wrapper */
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_one(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_one = {"read_one", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_one, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_one(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("read_one (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("read_one", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "read_one", 0))) return NULL;
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_one(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
 
-      /* "clickhouse_driver/bufferedreader.pyx":104
- *                 self.position += 1
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_one(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
+  unsigned char __pyx_v_rv;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_one", 1);
+
+  /* "clickhouse_driver/bufferedreader.pyx":77
  * 
- *                 size |= (b & 0x7f) << shift             # <<<<<<<<<<<<<<
- *                 if b < 0x80:
- *                     break
+ *     def read_one(self):
+ *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             self.read_into_buffer()
+ *             self.position = 0
  */
-      __pyx_v_size = (__pyx_v_size | ((__pyx_v_b & 0x7f) << __pyx_v_shift));
+  __pyx_t_1 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
+  if (__pyx_t_1) {
 
-      /* "clickhouse_driver/bufferedreader.pyx":105
- * 
- *                 size |= (b & 0x7f) << shift
- *                 if b < 0x80:             # <<<<<<<<<<<<<<
- *                     break
+    /* "clickhouse_driver/bufferedreader.pyx":78
+ *     def read_one(self):
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *             self.position = 0
  * 
  */
-      __pyx_t_2 = (__pyx_v_b < 0x80);
-      if (__pyx_t_2) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 78, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":106
- *                 size |= (b & 0x7f) << shift
- *                 if b < 0x80:
- *                     break             # <<<<<<<<<<<<<<
+    /* "clickhouse_driver/bufferedreader.pyx":79
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()
+ *             self.position = 0             # <<<<<<<<<<<<<<
  * 
- *                 shift += 7
+ *         rv = self.buffer[self.position]
  */
-        goto __pyx_L8_break;
+    __pyx_v_self->position = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":105
- * 
- *                 size |= (b & 0x7f) << shift
- *                 if b < 0x80:             # <<<<<<<<<<<<<<
- *                     break
+    /* "clickhouse_driver/bufferedreader.pyx":77
  * 
+ *     def read_one(self):
+ *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             self.read_into_buffer()
+ *             self.position = 0
  */
-      }
+  }
 
-      /* "clickhouse_driver/bufferedreader.pyx":108
- *                     break
- * 
- *                 shift += 7             # <<<<<<<<<<<<<<
+  /* "clickhouse_driver/bufferedreader.pyx":81
+ *             self.position = 0
  * 
- *             right = self.position + size
+ *         rv = self.buffer[self.position]             # <<<<<<<<<<<<<<
+ *         self.position += 1
+ *         return rv
  */
-      __pyx_v_shift = (__pyx_v_shift + 7);
-    }
-    __pyx_L8_break:;
+  __pyx_t_5 = __Pyx_GetItemInt_ByteArray(__pyx_v_self->buffer, __pyx_v_self->position, unsigned PY_LONG_LONG, 0, __Pyx_PyInt_From_unsigned_PY_LONG_LONG, 0, 0, 1); if (unlikely(__pyx_t_5 == -1)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_v_rv = __pyx_t_5;
 
-    /* "clickhouse_driver/bufferedreader.pyx":110
- *                 shift += 7
+  /* "clickhouse_driver/bufferedreader.pyx":82
  * 
- *             right = self.position + size             # <<<<<<<<<<<<<<
+ *         rv = self.buffer[self.position]
+ *         self.position += 1             # <<<<<<<<<<<<<<
+ *         return rv
  * 
- *             if c_encoding:
  */
-    __pyx_v_right = (__pyx_v_self->position + __pyx_v_size);
+  __pyx_v_self->position = (__pyx_v_self->position + 1);
 
-    /* "clickhouse_driver/bufferedreader.pyx":112
- *             right = self.position + size
+  /* "clickhouse_driver/bufferedreader.pyx":83
+ *         rv = self.buffer[self.position]
+ *         self.position += 1
+ *         return rv             # <<<<<<<<<<<<<<
  * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1
+ *     def read_strings(self, unsigned long long n_items, encoding=None):
  */
-    __pyx_t_2 = (__pyx_v_c_encoding != 0);
-    if (__pyx_t_2) {
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_char(__pyx_v_rv); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-      /* "clickhouse_driver/bufferedreader.pyx":113
+  /* "clickhouse_driver/bufferedreader.pyx":76
+ *             unread -= read_bytes
  * 
- *             if c_encoding:
- *                 if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- */
-      __pyx_t_2 = ((__pyx_v_size + 1) > __pyx_v_c_string_size);
-      if (__pyx_t_2) {
-
-        /* "clickhouse_driver/bufferedreader.pyx":114
- *             if c_encoding:
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1             # <<<<<<<<<<<<<<
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:
+ *     def read_one(self):             # <<<<<<<<<<<<<<
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()
  */
-        __pyx_v_c_string_size = (__pyx_v_size + 1);
 
-        /* "clickhouse_driver/bufferedreader.pyx":115
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)             # <<<<<<<<<<<<<<
- *                     if c_string is NULL:
- *                         raise MemoryError()
- */
-        __pyx_v_c_string = ((char *)PyMem_Realloc(__pyx_v_c_string, __pyx_v_c_string_size));
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_one", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-        /* "clickhouse_driver/bufferedreader.pyx":116
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:             # <<<<<<<<<<<<<<
- *                         raise MemoryError()
- *                 c_string[size] = 0
+/* "clickhouse_driver/bufferedreader.pyx":85
+ *         return rv
+ * 
+ *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Python has great overhead between function calls.
  */
-        __pyx_t_2 = (__pyx_v_c_string == NULL);
-        if (unlikely(__pyx_t_2)) {
 
-          /* "clickhouse_driver/bufferedreader.pyx":117
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:
- *                         raise MemoryError()             # <<<<<<<<<<<<<<
- *                 c_string[size] = 0
- *                 bytes_read = 0
- */
-          PyErr_NoMemory(); __PYX_ERR(0, 117, __pyx_L1_error)
-
-          /* "clickhouse_driver/bufferedreader.pyx":116
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:             # <<<<<<<<<<<<<<
- *                         raise MemoryError()
- *                 c_string[size] = 0
- */
+/* Python wrapper */
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_strings(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_strings, "\n        Python has great overhead between function calls.\n        We inline strings reading logic here to avoid this overhead.\n        ");
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_strings = {"read_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_strings};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_strings(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  unsigned PY_LONG_LONG __pyx_v_n_items;
+  PyObject *__pyx_v_encoding = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("read_strings (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_encoding,0};
+    values[1] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_items)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
         }
-
-        /* "clickhouse_driver/bufferedreader.pyx":113
- * 
- *             if c_encoding:
- *                 if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- */
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
+          if (value) { values[1] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_strings") < 0)) __PYX_ERR(0, 85, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
       }
+    }
+    __pyx_v_n_items = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_n_items == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L3_error)
+    __pyx_v_encoding = values[1];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("read_strings", 0, 1, 2, __pyx_nargs); __PYX_ERR(0, 85, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_strings(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_encoding);
 
-      /* "clickhouse_driver/bufferedreader.pyx":118
- *                     if c_string is NULL:
- *                         raise MemoryError()
- *                 c_string[size] = 0             # <<<<<<<<<<<<<<
- *                 bytes_read = 0
- * 
- */
-      (__pyx_v_c_string[__pyx_v_size]) = 0;
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "clickhouse_driver/bufferedreader.pyx":119
- *                         raise MemoryError()
- *                 c_string[size] = 0
- *                 bytes_read = 0             # <<<<<<<<<<<<<<
- * 
- *             # Decoding pure c strings in Cython is faster than in pure Python.
- */
-      __pyx_v_bytes_read = 0;
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding) {
+  PyObject *__pyx_v_items = NULL;
+  unsigned PY_LONG_LONG __pyx_v_i;
+  char *__pyx_v_buffer_ptr;
+  unsigned PY_LONG_LONG __pyx_v_right;
+  unsigned PY_LONG_LONG __pyx_v_size;
+  unsigned PY_LONG_LONG __pyx_v_shift;
+  unsigned PY_LONG_LONG __pyx_v_bytes_read;
+  unsigned PY_LONG_LONG __pyx_v_b;
+  char *__pyx_v_c_string;
+  unsigned PY_LONG_LONG __pyx_v_c_string_size;
+  char *__pyx_v_c_encoding;
+  PyObject *__pyx_v_rv = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  char *__pyx_t_6;
+  unsigned PY_LONG_LONG __pyx_t_7;
+  unsigned PY_LONG_LONG __pyx_t_8;
+  unsigned PY_LONG_LONG __pyx_t_9;
+  unsigned PY_LONG_LONG __pyx_t_10;
+  unsigned PY_LONG_LONG __pyx_t_11;
+  unsigned PY_LONG_LONG __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_strings", 0);
+  __Pyx_INCREF(__pyx_v_encoding);
 
-      /* "clickhouse_driver/bufferedreader.pyx":112
- *             right = self.position + size
+  /* "clickhouse_driver/bufferedreader.pyx":90
+ *         We inline strings reading logic here to avoid this overhead.
+ *         """
+ *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
  * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1
+ *         cdef unsigned long long i
  */
-    }
+  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_items = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":124
- *             # We need to copy it into buffer for adding null symbol at the end.
- *             # In ClickHouse block there is no null
- *             if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 if c_encoding:
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
+  /* "clickhouse_driver/bufferedreader.pyx":94
+ *         cdef unsigned long long i
+ *         # Buffer vars
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long right
+ *         # String length vars
  */
-    __pyx_t_2 = (__pyx_v_right > __pyx_v_self->current_buffer_size);
-    if (__pyx_t_2) {
+  __pyx_t_1 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "clickhouse_driver/bufferedreader.pyx":125
- *             # In ClickHouse block there is no null
- *             if right > self.current_buffer_size:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
- *                            self.current_buffer_size - self.position)
+  /* "clickhouse_driver/bufferedreader.pyx":101
+ * 
+ *         # String for decode vars.
+ *         cdef char *c_string = NULL             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL
  */
-      __pyx_t_2 = (__pyx_v_c_encoding != 0);
-      if (__pyx_t_2) {
+  __pyx_v_c_string = NULL;
 
-        /* "clickhouse_driver/bufferedreader.pyx":126
- *             if right > self.current_buffer_size:
- *                 if c_encoding:
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],             # <<<<<<<<<<<<<<
- *                            self.current_buffer_size - self.position)
- *                 else:
+  /* "clickhouse_driver/bufferedreader.pyx":102
+ *         # String for decode vars.
+ *         cdef char *c_string = NULL
+ *         cdef unsigned long long c_string_size = 1024             # <<<<<<<<<<<<<<
+ *         cdef char *c_encoding = NULL
+ *         if encoding:
  */
-        (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)));
+  __pyx_v_c_string_size = 0x400;
 
-        /* "clickhouse_driver/bufferedreader.pyx":125
- *             # In ClickHouse block there is no null
- *             if right > self.current_buffer_size:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
- *                            self.current_buffer_size - self.position)
+  /* "clickhouse_driver/bufferedreader.pyx":103
+ *         cdef char *c_string = NULL
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL             # <<<<<<<<<<<<<<
+ *         if encoding:
+ *             encoding = encoding.encode('utf-8')
  */
-        goto __pyx_L15;
-      }
+  __pyx_v_c_encoding = NULL;
 
-      /* "clickhouse_driver/bufferedreader.pyx":129
- *                            self.current_buffer_size - self.position)
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                         &buffer_ptr[self.position],
- *                         self.current_buffer_size - self.position
+  /* "clickhouse_driver/bufferedreader.pyx":104
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL
+ *         if encoding:             # <<<<<<<<<<<<<<
+ *             encoding = encoding.encode('utf-8')
+ *             c_encoding = encoding
  */
-      /*else*/ {
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_encoding); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 104, __pyx_L1_error)
+  if (__pyx_t_2) {
 
-        /* "clickhouse_driver/bufferedreader.pyx":131
- *                     rv = PyBytes_FromStringAndSize(
- *                         &buffer_ptr[self.position],
- *                         self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
- *                     )
+    /* "clickhouse_driver/bufferedreader.pyx":105
+ *         cdef char *c_encoding = NULL
+ *         if encoding:
+ *             encoding = encoding.encode('utf-8')             # <<<<<<<<<<<<<<
+ *             c_encoding = encoding
  * 
  */
-        __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_1);
-        __pyx_t_1 = 0;
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 105, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
       }
-      __pyx_L15:;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_kp_u_utf_8};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_1);
+    __pyx_t_1 = 0;
 
-      /* "clickhouse_driver/bufferedreader.pyx":134
- *                     )
+    /* "clickhouse_driver/bufferedreader.pyx":106
+ *         if encoding:
+ *             encoding = encoding.encode('utf-8')
+ *             c_encoding = encoding             # <<<<<<<<<<<<<<
  * 
- *                 bytes_read = self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
- *                 # Read the rest of the string.
- *                 while bytes_read != size:
+ *         cdef object rv = object()
  */
-      __pyx_v_bytes_read = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+    __pyx_t_6 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 106, __pyx_L1_error)
+    __pyx_v_c_encoding = __pyx_t_6;
 
-      /* "clickhouse_driver/bufferedreader.pyx":136
- *                 bytes_read = self.current_buffer_size - self.position
- *                 # Read the rest of the string.
- *                 while bytes_read != size:             # <<<<<<<<<<<<<<
- *                     self.position = size - bytes_read
+    /* "clickhouse_driver/bufferedreader.pyx":104
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL
+ *         if encoding:             # <<<<<<<<<<<<<<
+ *             encoding = encoding.encode('utf-8')
+ *             c_encoding = encoding
+ */
+  }
+
+  /* "clickhouse_driver/bufferedreader.pyx":108
+ *             c_encoding = encoding
  * 
+ *         cdef object rv = object()             # <<<<<<<<<<<<<<
+ *         # String for decode vars.
+ *         if c_encoding:
  */
-      while (1) {
-        __pyx_t_2 = (__pyx_v_bytes_read != __pyx_v_size);
-        if (!__pyx_t_2) break;
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_builtin_object); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_rv = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":137
- *                 # Read the rest of the string.
- *                 while bytes_read != size:
- *                     self.position = size - bytes_read             # <<<<<<<<<<<<<<
+  /* "clickhouse_driver/bufferedreader.pyx":110
+ *         cdef object rv = object()
+ *         # String for decode vars.
+ *         if c_encoding:             # <<<<<<<<<<<<<<
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
  * 
- *                     self.read_into_buffer()
  */
-        __pyx_v_self->position = (__pyx_v_size - __pyx_v_bytes_read);
+  __pyx_t_2 = (__pyx_v_c_encoding != 0);
+  if (__pyx_t_2) {
 
-        /* "clickhouse_driver/bufferedreader.pyx":139
- *                     self.position = size - bytes_read
+    /* "clickhouse_driver/bufferedreader.pyx":111
+ *         # String for decode vars.
+ *         if c_encoding:
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(n_items):
+ */
+    __pyx_v_c_string = ((char *)PyMem_Realloc(NULL, __pyx_v_c_string_size));
+
+    /* "clickhouse_driver/bufferedreader.pyx":110
+ *         cdef object rv = object()
+ *         # String for decode vars.
+ *         if c_encoding:             # <<<<<<<<<<<<<<
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+ * 
+ */
+  }
+
+  /* "clickhouse_driver/bufferedreader.pyx":113
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+ * 
+ *         for i in range(n_items):             # <<<<<<<<<<<<<<
+ *             shift = size = 0
+ * 
+ */
+  __pyx_t_7 = __pyx_v_n_items;
+  __pyx_t_8 = __pyx_t_7;
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_i = __pyx_t_9;
+
+    /* "clickhouse_driver/bufferedreader.pyx":114
+ * 
+ *         for i in range(n_items):
+ *             shift = size = 0             # <<<<<<<<<<<<<<
+ * 
+ *             # Read string size
+ */
+    __pyx_v_shift = 0;
+    __pyx_v_size = 0;
+
+    /* "clickhouse_driver/bufferedreader.pyx":117
  * 
+ *             # Read string size
+ *             while True:             # <<<<<<<<<<<<<<
+ *                 if self.position == self.current_buffer_size:
+ *                     self.read_into_buffer()
+ */
+    while (1) {
+
+      /* "clickhouse_driver/bufferedreader.pyx":118
+ *             # Read string size
+ *             while True:
+ *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                     self.read_into_buffer()
+ *                     # `read_into_buffer` can override buffer
+ */
+      __pyx_t_2 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
+      if (__pyx_t_2) {
+
+        /* "clickhouse_driver/bufferedreader.pyx":119
+ *             while True:
+ *                 if self.position == self.current_buffer_size:
  *                     self.read_into_buffer()             # <<<<<<<<<<<<<<
  *                     # `read_into_buffer` can override buffer
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)
  */
-        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 139, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 119, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __pyx_t_4 = NULL;
         __pyx_t_5 = 0;
@@ -5303,435 +5421,1666 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
           PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
           __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
           __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
+          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 119, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         }
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":141
+        /* "clickhouse_driver/bufferedreader.pyx":121
  *                     self.read_into_buffer()
  *                     # `read_into_buffer` can override buffer
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *                     # There can be not enough data in buffer.
- *                     self.position = min(
+ *                     self.position = 0
+ * 
  */
         __pyx_t_1 = __pyx_v_self->buffer;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":144
- *                     # There can be not enough data in buffer.
- *                     self.position = min(
- *                         self.position, self.current_buffer_size             # <<<<<<<<<<<<<<
- *                     )
- *                     if c_encoding:
+        /* "clickhouse_driver/bufferedreader.pyx":122
+ *                     # `read_into_buffer` can override buffer
+ *                     buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                     self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *                 b = buffer_ptr[self.position]
  */
-        __pyx_t_10 = __pyx_v_self->current_buffer_size;
-        __pyx_t_11 = __pyx_v_self->position;
-        __pyx_t_2 = (__pyx_t_10 < __pyx_t_11);
-        if (__pyx_t_2) {
-          __pyx_t_12 = __pyx_t_10;
-        } else {
-          __pyx_t_12 = __pyx_t_11;
-        }
+        __pyx_v_self->position = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":143
- *                     buffer_ptr = PyByteArray_AsString(self.buffer)
- *                     # There can be not enough data in buffer.
- *                     self.position = min(             # <<<<<<<<<<<<<<
- *                         self.position, self.current_buffer_size
- *                     )
+        /* "clickhouse_driver/bufferedreader.pyx":118
+ *             # Read string size
+ *             while True:
+ *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                     self.read_into_buffer()
+ *                     # `read_into_buffer` can override buffer
  */
-        __pyx_v_self->position = __pyx_t_12;
+      }
 
-        /* "clickhouse_driver/bufferedreader.pyx":146
- *                         self.position, self.current_buffer_size
- *                     )
- *                     if c_encoding:             # <<<<<<<<<<<<<<
- *                         memcpy(
- *                             &c_string[bytes_read], buffer_ptr, self.position
+      /* "clickhouse_driver/bufferedreader.pyx":124
+ *                     self.position = 0
+ * 
+ *                 b = buffer_ptr[self.position]             # <<<<<<<<<<<<<<
+ *                 self.position += 1
+ * 
  */
-        __pyx_t_2 = (__pyx_v_c_encoding != 0);
-        if (__pyx_t_2) {
+      __pyx_v_b = (__pyx_v_buffer_ptr[__pyx_v_self->position]);
 
-          /* "clickhouse_driver/bufferedreader.pyx":147
- *                     )
- *                     if c_encoding:
- *                         memcpy(             # <<<<<<<<<<<<<<
- *                             &c_string[bytes_read], buffer_ptr, self.position
- *                         )
+      /* "clickhouse_driver/bufferedreader.pyx":125
+ * 
+ *                 b = buffer_ptr[self.position]
+ *                 self.position += 1             # <<<<<<<<<<<<<<
+ * 
+ *                 size |= (b & 0x7f) << shift
  */
-          (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), __pyx_v_buffer_ptr, __pyx_v_self->position));
+      __pyx_v_self->position = (__pyx_v_self->position + 1);
 
-          /* "clickhouse_driver/bufferedreader.pyx":146
- *                         self.position, self.current_buffer_size
- *                     )
- *                     if c_encoding:             # <<<<<<<<<<<<<<
- *                         memcpy(
- *                             &c_string[bytes_read], buffer_ptr, self.position
+      /* "clickhouse_driver/bufferedreader.pyx":127
+ *                 self.position += 1
+ * 
+ *                 size |= (b & 0x7f) << shift             # <<<<<<<<<<<<<<
+ *                 if b < 0x80:
+ *                     break
  */
-          goto __pyx_L18;
-        }
+      __pyx_v_size = (__pyx_v_size | ((__pyx_v_b & 0x7f) << __pyx_v_shift));
 
-        /* "clickhouse_driver/bufferedreader.pyx":151
- *                         )
- *                     else:
- *                         rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                             buffer_ptr, self.position
- *                         )
+      /* "clickhouse_driver/bufferedreader.pyx":128
+ * 
+ *                 size |= (b & 0x7f) << shift
+ *                 if b < 0x80:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
  */
-        /*else*/ {
+      __pyx_t_2 = (__pyx_v_b < 0x80);
+      if (__pyx_t_2) {
+
+        /* "clickhouse_driver/bufferedreader.pyx":129
+ *                 size |= (b & 0x7f) << shift
+ *                 if b < 0x80:
+ *                     break             # <<<<<<<<<<<<<<
+ * 
+ *                 shift += 7
+ */
+        goto __pyx_L8_break;
+
+        /* "clickhouse_driver/bufferedreader.pyx":128
+ * 
+ *                 size |= (b & 0x7f) << shift
+ *                 if b < 0x80:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+ */
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":131
+ *                     break
+ * 
+ *                 shift += 7             # <<<<<<<<<<<<<<
+ * 
+ *             right = self.position + size
+ */
+      __pyx_v_shift = (__pyx_v_shift + 7);
+    }
+    __pyx_L8_break:;
+
+    /* "clickhouse_driver/bufferedreader.pyx":133
+ *                 shift += 7
+ * 
+ *             right = self.position + size             # <<<<<<<<<<<<<<
+ * 
+ *             if c_encoding:
+ */
+    __pyx_v_right = (__pyx_v_self->position + __pyx_v_size);
+
+    /* "clickhouse_driver/bufferedreader.pyx":135
+ *             right = self.position + size
+ * 
+ *             if c_encoding:             # <<<<<<<<<<<<<<
+ *                 if size + 1 > c_string_size:
+ *                     c_string_size = size + 1
+ */
+    __pyx_t_2 = (__pyx_v_c_encoding != 0);
+    if (__pyx_t_2) {
+
+      /* "clickhouse_driver/bufferedreader.pyx":136
+ * 
+ *             if c_encoding:
+ *                 if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
+ *                     c_string_size = size + 1
+ *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
+ */
+      __pyx_t_2 = ((__pyx_v_size + 1) > __pyx_v_c_string_size);
+      if (__pyx_t_2) {
+
+        /* "clickhouse_driver/bufferedreader.pyx":137
+ *             if c_encoding:
+ *                 if size + 1 > c_string_size:
+ *                     c_string_size = size + 1             # <<<<<<<<<<<<<<
+ *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
+ *                     if c_string is NULL:
+ */
+        __pyx_v_c_string_size = (__pyx_v_size + 1);
+
+        /* "clickhouse_driver/bufferedreader.pyx":138
+ *                 if size + 1 > c_string_size:
+ *                     c_string_size = size + 1
+ *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)             # <<<<<<<<<<<<<<
+ *                     if c_string is NULL:
+ *                         raise MemoryError()
+ */
+        __pyx_v_c_string = ((char *)PyMem_Realloc(__pyx_v_c_string, __pyx_v_c_string_size));
+
+        /* "clickhouse_driver/bufferedreader.pyx":139
+ *                     c_string_size = size + 1
+ *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
+ *                     if c_string is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                 c_string[size] = 0
+ */
+        __pyx_t_2 = (__pyx_v_c_string == NULL);
+        if (unlikely(__pyx_t_2)) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":140
+ *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
+ *                     if c_string is NULL:
+ *                         raise MemoryError()             # <<<<<<<<<<<<<<
+ *                 c_string[size] = 0
+ *                 bytes_read = 0
+ */
+          PyErr_NoMemory(); __PYX_ERR(0, 140, __pyx_L1_error)
+
+          /* "clickhouse_driver/bufferedreader.pyx":139
+ *                     c_string_size = size + 1
+ *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
+ *                     if c_string is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                 c_string[size] = 0
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":136
+ * 
+ *             if c_encoding:
+ *                 if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
+ *                     c_string_size = size + 1
+ *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
+ */
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":141
+ *                     if c_string is NULL:
+ *                         raise MemoryError()
+ *                 c_string[size] = 0             # <<<<<<<<<<<<<<
+ *                 bytes_read = 0
+ * 
+ */
+      (__pyx_v_c_string[__pyx_v_size]) = 0;
+
+      /* "clickhouse_driver/bufferedreader.pyx":142
+ *                         raise MemoryError()
+ *                 c_string[size] = 0
+ *                 bytes_read = 0             # <<<<<<<<<<<<<<
+ * 
+ *             # Decoding pure c strings in Cython is faster than in pure Python.
+ */
+      __pyx_v_bytes_read = 0;
+
+      /* "clickhouse_driver/bufferedreader.pyx":135
+ *             right = self.position + size
+ * 
+ *             if c_encoding:             # <<<<<<<<<<<<<<
+ *                 if size + 1 > c_string_size:
+ *                     c_string_size = size + 1
+ */
+    }
+
+    /* "clickhouse_driver/bufferedreader.pyx":147
+ *             # We need to copy it into buffer for adding null symbol at the end.
+ *             # In ClickHouse block there is no null
+ *             if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                 if c_encoding:
+ *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
+ */
+    __pyx_t_2 = (__pyx_v_right > __pyx_v_self->current_buffer_size);
+    if (__pyx_t_2) {
+
+      /* "clickhouse_driver/bufferedreader.pyx":148
+ *             # In ClickHouse block there is no null
+ *             if right > self.current_buffer_size:
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
+ *                            self.current_buffer_size - self.position)
+ */
+      __pyx_t_2 = (__pyx_v_c_encoding != 0);
+      if (__pyx_t_2) {
+
+        /* "clickhouse_driver/bufferedreader.pyx":149
+ *             if right > self.current_buffer_size:
+ *                 if c_encoding:
+ *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],             # <<<<<<<<<<<<<<
+ *                            self.current_buffer_size - self.position)
+ *                 else:
+ */
+        (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)));
+
+        /* "clickhouse_driver/bufferedreader.pyx":148
+ *             # In ClickHouse block there is no null
+ *             if right > self.current_buffer_size:
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
+ *                            self.current_buffer_size - self.position)
+ */
+        goto __pyx_L15;
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":152
+ *                            self.current_buffer_size - self.position)
+ *                 else:
+ *                     rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                         &buffer_ptr[self.position],
+ *                         self.current_buffer_size - self.position
+ */
+      /*else*/ {
+
+        /* "clickhouse_driver/bufferedreader.pyx":154
+ *                     rv = PyBytes_FromStringAndSize(
+ *                         &buffer_ptr[self.position],
+ *                         self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
+ *                     )
+ * 
+ */
+        __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_1);
+        __pyx_t_1 = 0;
+      }
+      __pyx_L15:;
+
+      /* "clickhouse_driver/bufferedreader.pyx":157
+ *                     )
+ * 
+ *                 bytes_read = self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
+ *                 # Read the rest of the string.
+ *                 while bytes_read != size:
+ */
+      __pyx_v_bytes_read = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+
+      /* "clickhouse_driver/bufferedreader.pyx":159
+ *                 bytes_read = self.current_buffer_size - self.position
+ *                 # Read the rest of the string.
+ *                 while bytes_read != size:             # <<<<<<<<<<<<<<
+ *                     self.position = size - bytes_read
+ * 
+ */
+      while (1) {
+        __pyx_t_2 = (__pyx_v_bytes_read != __pyx_v_size);
+        if (!__pyx_t_2) break;
+
+        /* "clickhouse_driver/bufferedreader.pyx":160
+ *                 # Read the rest of the string.
+ *                 while bytes_read != size:
+ *                     self.position = size - bytes_read             # <<<<<<<<<<<<<<
+ * 
+ *                     self.read_into_buffer()
+ */
+        __pyx_v_self->position = (__pyx_v_size - __pyx_v_bytes_read);
+
+        /* "clickhouse_driver/bufferedreader.pyx":162
+ *                     self.position = size - bytes_read
+ * 
+ *                     self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                     # `read_into_buffer` can override buffer
+ *                     buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = NULL;
+        __pyx_t_5 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (likely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __pyx_t_5 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+          __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 162, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+        /* "clickhouse_driver/bufferedreader.pyx":164
+ *                     self.read_into_buffer()
+ *                     # `read_into_buffer` can override buffer
+ *                     buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                     # There can be not enough data in buffer.
+ *                     self.position = min(
+ */
+        __pyx_t_1 = __pyx_v_self->buffer;
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+        /* "clickhouse_driver/bufferedreader.pyx":167
+ *                     # There can be not enough data in buffer.
+ *                     self.position = min(
+ *                         self.position, self.current_buffer_size             # <<<<<<<<<<<<<<
+ *                     )
+ *                     if c_encoding:
+ */
+        __pyx_t_10 = __pyx_v_self->current_buffer_size;
+        __pyx_t_11 = __pyx_v_self->position;
+        __pyx_t_2 = (__pyx_t_10 < __pyx_t_11);
+        if (__pyx_t_2) {
+          __pyx_t_12 = __pyx_t_10;
+        } else {
+          __pyx_t_12 = __pyx_t_11;
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":166
+ *                     buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                     # There can be not enough data in buffer.
+ *                     self.position = min(             # <<<<<<<<<<<<<<
+ *                         self.position, self.current_buffer_size
+ *                     )
+ */
+        __pyx_v_self->position = __pyx_t_12;
+
+        /* "clickhouse_driver/bufferedreader.pyx":169
+ *                         self.position, self.current_buffer_size
+ *                     )
+ *                     if c_encoding:             # <<<<<<<<<<<<<<
+ *                         memcpy(
+ *                             &c_string[bytes_read], buffer_ptr, self.position
+ */
+        __pyx_t_2 = (__pyx_v_c_encoding != 0);
+        if (__pyx_t_2) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":170
+ *                     )
+ *                     if c_encoding:
+ *                         memcpy(             # <<<<<<<<<<<<<<
+ *                             &c_string[bytes_read], buffer_ptr, self.position
+ *                         )
+ */
+          (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), __pyx_v_buffer_ptr, __pyx_v_self->position));
+
+          /* "clickhouse_driver/bufferedreader.pyx":169
+ *                         self.position, self.current_buffer_size
+ *                     )
+ *                     if c_encoding:             # <<<<<<<<<<<<<<
+ *                         memcpy(
+ *                             &c_string[bytes_read], buffer_ptr, self.position
+ */
+          goto __pyx_L18;
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":174
+ *                         )
+ *                     else:
+ *                         rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                             buffer_ptr, self.position
+ *                         )
+ */
+        /*else*/ {
+
+          /* "clickhouse_driver/bufferedreader.pyx":175
+ *                     else:
+ *                         rv += PyBytes_FromStringAndSize(
+ *                             buffer_ptr, self.position             # <<<<<<<<<<<<<<
+ *                         )
+ *                     bytes_read += self.position
+ */
+          __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_buffer_ptr, __pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+
+          /* "clickhouse_driver/bufferedreader.pyx":174
+ *                         )
+ *                     else:
+ *                         rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                             buffer_ptr, self.position
+ *                         )
+ */
+          __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_rv, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 174, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
+          __pyx_t_3 = 0;
+        }
+        __pyx_L18:;
+
+        /* "clickhouse_driver/bufferedreader.pyx":177
+ *                             buffer_ptr, self.position
+ *                         )
+ *                     bytes_read += self.position             # <<<<<<<<<<<<<<
+ * 
+ *             else:
+ */
+        __pyx_v_bytes_read = (__pyx_v_bytes_read + __pyx_v_self->position);
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":147
+ *             # We need to copy it into buffer for adding null symbol at the end.
+ *             # In ClickHouse block there is no null
+ *             if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                 if c_encoding:
+ *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
+ */
+      goto __pyx_L14;
+    }
+
+    /* "clickhouse_driver/bufferedreader.pyx":180
+ * 
+ *             else:
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     memcpy(c_string, &buffer_ptr[self.position], size)
+ *                 else:
+ */
+    /*else*/ {
+      __pyx_t_2 = (__pyx_v_c_encoding != 0);
+      if (__pyx_t_2) {
+
+        /* "clickhouse_driver/bufferedreader.pyx":181
+ *             else:
+ *                 if c_encoding:
+ *                     memcpy(c_string, &buffer_ptr[self.position], size)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     rv = PyBytes_FromStringAndSize(
+ */
+        (void)(memcpy(__pyx_v_c_string, (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size));
+
+        /* "clickhouse_driver/bufferedreader.pyx":180
+ * 
+ *             else:
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     memcpy(c_string, &buffer_ptr[self.position], size)
+ *                 else:
+ */
+        goto __pyx_L19;
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":183
+ *                     memcpy(c_string, &buffer_ptr[self.position], size)
+ *                 else:
+ *                     rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                         &buffer_ptr[self.position], size
+ *                     )
+ */
+      /*else*/ {
+
+        /* "clickhouse_driver/bufferedreader.pyx":184
+ *                 else:
+ *                     rv = PyBytes_FromStringAndSize(
+ *                         &buffer_ptr[self.position], size             # <<<<<<<<<<<<<<
+ *                     )
+ *                 self.position = right
+ */
+        __pyx_t_3 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 183, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
+        __pyx_t_3 = 0;
+      }
+      __pyx_L19:;
+
+      /* "clickhouse_driver/bufferedreader.pyx":186
+ *                         &buffer_ptr[self.position], size
+ *                     )
+ *                 self.position = right             # <<<<<<<<<<<<<<
+ * 
+ *             if c_encoding:
+ */
+      __pyx_v_self->position = __pyx_v_right;
+    }
+    __pyx_L14:;
+
+    /* "clickhouse_driver/bufferedreader.pyx":188
+ *                 self.position = right
+ * 
+ *             if c_encoding:             # <<<<<<<<<<<<<<
+ *                 try:
+ *                     rv = c_string[:size].decode(c_encoding)
+ */
+    __pyx_t_2 = (__pyx_v_c_encoding != 0);
+    if (__pyx_t_2) {
+
+      /* "clickhouse_driver/bufferedreader.pyx":189
+ * 
+ *             if c_encoding:
+ *                 try:             # <<<<<<<<<<<<<<
+ *                     rv = c_string[:size].decode(c_encoding)
+ *                 except UnicodeDecodeError:
+ */
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
+        __Pyx_XGOTREF(__pyx_t_13);
+        __Pyx_XGOTREF(__pyx_t_14);
+        __Pyx_XGOTREF(__pyx_t_15);
+        /*try:*/ {
+
+          /* "clickhouse_driver/bufferedreader.pyx":190
+ *             if c_encoding:
+ *                 try:
+ *                     rv = c_string[:size].decode(c_encoding)             # <<<<<<<<<<<<<<
+ *                 except UnicodeDecodeError:
+ *                     rv = PyBytes_FromStringAndSize(c_string, size)
+ */
+          __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_c_string, 0, __pyx_v_size, __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 190, __pyx_L21_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":189
+ * 
+ *             if c_encoding:
+ *                 try:             # <<<<<<<<<<<<<<
+ *                     rv = c_string[:size].decode(c_encoding)
+ *                 except UnicodeDecodeError:
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+        goto __pyx_L28_try_end;
+        __pyx_L21_error:;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+        /* "clickhouse_driver/bufferedreader.pyx":191
+ *                 try:
+ *                     rv = c_string[:size].decode(c_encoding)
+ *                 except UnicodeDecodeError:             # <<<<<<<<<<<<<<
+ *                     rv = PyBytes_FromStringAndSize(c_string, size)
+ * 
+ */
+        __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeDecodeError);
+        if (__pyx_t_5) {
+          __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_1, &__pyx_t_4) < 0) __PYX_ERR(0, 191, __pyx_L23_except_error)
+          __Pyx_XGOTREF(__pyx_t_3);
+          __Pyx_XGOTREF(__pyx_t_1);
+          __Pyx_XGOTREF(__pyx_t_4);
+
+          /* "clickhouse_driver/bufferedreader.pyx":192
+ *                     rv = c_string[:size].decode(c_encoding)
+ *                 except UnicodeDecodeError:
+ *                     rv = PyBytes_FromStringAndSize(c_string, size)             # <<<<<<<<<<<<<<
+ * 
+ *             Py_INCREF(rv)
+ */
+          __pyx_t_16 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_size); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 192, __pyx_L23_except_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_16);
+          __pyx_t_16 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          goto __pyx_L22_exception_handled;
+        }
+        goto __pyx_L23_except_error;
+
+        /* "clickhouse_driver/bufferedreader.pyx":189
+ * 
+ *             if c_encoding:
+ *                 try:             # <<<<<<<<<<<<<<
+ *                     rv = c_string[:size].decode(c_encoding)
+ *                 except UnicodeDecodeError:
+ */
+        __pyx_L23_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+        goto __pyx_L1_error;
+        __pyx_L22_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+        __pyx_L28_try_end:;
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":188
+ *                 self.position = right
+ * 
+ *             if c_encoding:             # <<<<<<<<<<<<<<
+ *                 try:
+ *                     rv = c_string[:size].decode(c_encoding)
+ */
+    }
+
+    /* "clickhouse_driver/bufferedreader.pyx":194
+ *                     rv = PyBytes_FromStringAndSize(c_string, size)
+ * 
+ *             Py_INCREF(rv)             # <<<<<<<<<<<<<<
+ *             PyTuple_SET_ITEM(items, i, rv)
+ * 
+ */
+    Py_INCREF(__pyx_v_rv);
+
+    /* "clickhouse_driver/bufferedreader.pyx":195
+ * 
+ *             Py_INCREF(rv)
+ *             PyTuple_SET_ITEM(items, i, rv)             # <<<<<<<<<<<<<<
+ * 
+ *         if c_string:
+ */
+    PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_rv);
+  }
+
+  /* "clickhouse_driver/bufferedreader.pyx":197
+ *             PyTuple_SET_ITEM(items, i, rv)
+ * 
+ *         if c_string:             # <<<<<<<<<<<<<<
+ *             PyMem_Free(c_string)
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_c_string != 0);
+  if (__pyx_t_2) {
+
+    /* "clickhouse_driver/bufferedreader.pyx":198
+ * 
+ *         if c_string:
+ *             PyMem_Free(c_string)             # <<<<<<<<<<<<<<
+ * 
+ *         return items
+ */
+    PyMem_Free(__pyx_v_c_string);
+
+    /* "clickhouse_driver/bufferedreader.pyx":197
+ *             PyTuple_SET_ITEM(items, i, rv)
+ * 
+ *         if c_string:             # <<<<<<<<<<<<<<
+ *             PyMem_Free(c_string)
+ * 
+ */
+  }
+
+  /* "clickhouse_driver/bufferedreader.pyx":200
+ *             PyMem_Free(c_string)
+ * 
+ *         return items             # <<<<<<<<<<<<<<
+ * 
+ *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_items);
+  __pyx_r = __pyx_v_items;
+  goto __pyx_L0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":85
+ *         return rv
+ * 
+ *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Python has great overhead between function calls.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_items);
+  __Pyx_XDECREF(__pyx_v_rv);
+  __Pyx_XDECREF(__pyx_v_encoding);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "clickhouse_driver/bufferedreader.pyx":202
+ *         return items
+ * 
+ *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
+ *                                     Py_ssize_t length):
+ *         cdef Py_ssize_t i
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings_as_bytes(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings_as_bytes = {"read_fixed_strings_as_bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings_as_bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings_as_bytes(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  Py_ssize_t __pyx_v_n_items;
+  Py_ssize_t __pyx_v_length;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("read_fixed_strings_as_bytes (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_length,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_items)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_length)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, 1); __PYX_ERR(0, 202, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_fixed_strings_as_bytes") < 0)) __PYX_ERR(0, 202, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+    }
+    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 202, __pyx_L3_error)
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 202, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings_as_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings_as_bytes(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings_as_bytes(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length) {
+  Py_ssize_t __pyx_v_i;
+  PyObject *__pyx_v_data = NULL;
+  char *__pyx_v_data_ptr;
+  PyObject *__pyx_v_items = NULL;
+  PyObject *__pyx_v_item = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  char *__pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_fixed_strings_as_bytes", 1);
+
+  /* "clickhouse_driver/bufferedreader.pyx":205
+ *                                     Py_ssize_t length):
+ *         cdef Py_ssize_t i
+ *         data = self.read(length * n_items)             # <<<<<<<<<<<<<<
+ *         cdef char* data_ptr = PyBytes_AsString(data)
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 205, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 205, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_v_data = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":206
+ *         cdef Py_ssize_t i
+ *         data = self.read(length * n_items)
+ *         cdef char* data_ptr = PyBytes_AsString(data)             # <<<<<<<<<<<<<<
+ * 
+ *         items = PyTuple_New(n_items)
+ */
+  __pyx_t_6 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_6 == ((char *)NULL))) __PYX_ERR(0, 206, __pyx_L1_error)
+  __pyx_v_data_ptr = __pyx_t_6;
+
+  /* "clickhouse_driver/bufferedreader.pyx":208
+ *         cdef char* data_ptr = PyBytes_AsString(data)
+ * 
+ *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
+ *         for i in range(n_items):
+ *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
+ */
+  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_items = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":209
+ * 
+ *         items = PyTuple_New(n_items)
+ *         for i in range(n_items):             # <<<<<<<<<<<<<<
+ *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
+ *             Py_INCREF(item)
+ */
+  __pyx_t_7 = __pyx_v_n_items;
+  __pyx_t_8 = __pyx_t_7;
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_i = __pyx_t_9;
+
+    /* "clickhouse_driver/bufferedreader.pyx":210
+ *         items = PyTuple_New(n_items)
+ *         for i in range(n_items):
+ *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)             # <<<<<<<<<<<<<<
+ *             Py_INCREF(item)
+ *             PyTuple_SET_ITEM(items, i, item)
+ */
+    __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_data_ptr[(__pyx_v_i * __pyx_v_length)])), __pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_item, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "clickhouse_driver/bufferedreader.pyx":211
+ *         for i in range(n_items):
+ *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
+ *             Py_INCREF(item)             # <<<<<<<<<<<<<<
+ *             PyTuple_SET_ITEM(items, i, item)
+ *         return items
+ */
+    Py_INCREF(__pyx_v_item);
+
+    /* "clickhouse_driver/bufferedreader.pyx":212
+ *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
+ *             Py_INCREF(item)
+ *             PyTuple_SET_ITEM(items, i, item)             # <<<<<<<<<<<<<<
+ *         return items
+ * 
+ */
+    PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_item);
+  }
+
+  /* "clickhouse_driver/bufferedreader.pyx":213
+ *             Py_INCREF(item)
+ *             PyTuple_SET_ITEM(items, i, item)
+ *         return items             # <<<<<<<<<<<<<<
+ * 
+ *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_items);
+  __pyx_r = __pyx_v_items;
+  goto __pyx_L0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":202
+ *         return items
+ * 
+ *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
+ *                                     Py_ssize_t length):
+ *         cdef Py_ssize_t i
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings_as_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XDECREF(__pyx_v_items);
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "clickhouse_driver/bufferedreader.pyx":215
+ *         return items
+ * 
+ *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
+ *                            encoding=None):
+ *         if encoding is None:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15read_fixed_strings(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_15read_fixed_strings = {"read_fixed_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15read_fixed_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15read_fixed_strings(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  Py_ssize_t __pyx_v_n_items;
+  Py_ssize_t __pyx_v_length;
+  PyObject *__pyx_v_encoding = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("read_fixed_strings (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_length,&__pyx_n_s_encoding,0};
+
+    /* "clickhouse_driver/bufferedreader.pyx":216
+ * 
+ *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
+ *                            encoding=None):             # <<<<<<<<<<<<<<
+ *         if encoding is None:
+ *             return self.read_fixed_strings_as_bytes(n_items, length)
+ */
+    values[2] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_n_items)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 215, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_length)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 215, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, 1); __PYX_ERR(0, 215, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
+          if (value) { values[2] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 215, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_fixed_strings") < 0)) __PYX_ERR(0, 215, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 215, __pyx_L3_error)
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 215, __pyx_L3_error)
+    __pyx_v_encoding = values[2];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, __pyx_nargs); __PYX_ERR(0, 215, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_14read_fixed_strings(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length, __pyx_v_encoding);
+
+  /* "clickhouse_driver/bufferedreader.pyx":215
+ *         return items
+ * 
+ *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
+ *                            encoding=None):
+ *         if encoding is None:
+ */
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_14read_fixed_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  char *__pyx_v_c_encoding;
+  PyObject *__pyx_v_data = NULL;
+  char *__pyx_v_data_ptr;
+  char *__pyx_v_c_string;
+  PyObject *__pyx_v_items = NULL;
+  PyObject *__pyx_v_item = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  char *__pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_fixed_strings", 0);
+  __Pyx_INCREF(__pyx_v_encoding);
 
-          /* "clickhouse_driver/bufferedreader.pyx":152
- *                     else:
- *                         rv += PyBytes_FromStringAndSize(
- *                             buffer_ptr, self.position             # <<<<<<<<<<<<<<
- *                         )
- *                     bytes_read += self.position
+  /* "clickhouse_driver/bufferedreader.pyx":217
+ *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
+ *                            encoding=None):
+ *         if encoding is None:             # <<<<<<<<<<<<<<
+ *             return self.read_fixed_strings_as_bytes(n_items, length)
+ * 
  */
-          __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_buffer_ptr, __pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_1 = (__pyx_v_encoding == Py_None);
+  if (__pyx_t_1) {
 
-          /* "clickhouse_driver/bufferedreader.pyx":151
- *                         )
- *                     else:
- *                         rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                             buffer_ptr, self.position
- *                         )
+    /* "clickhouse_driver/bufferedreader.pyx":218
+ *                            encoding=None):
+ *         if encoding is None:
+ *             return self.read_fixed_strings_as_bytes(n_items, length)             # <<<<<<<<<<<<<<
+ * 
+ *         cdef Py_ssize_t i, j
  */
-          __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_rv, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
-          __pyx_t_3 = 0;
-        }
-        __pyx_L18:;
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_fixed_strings_as_bytes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 218, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_n_items); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 218, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 218, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = NULL;
+    __pyx_t_7 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_7 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[3] = {__pyx_t_6, __pyx_t_4, __pyx_t_5};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 218, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":154
- *                             buffer_ptr, self.position
- *                         )
- *                     bytes_read += self.position             # <<<<<<<<<<<<<<
+    /* "clickhouse_driver/bufferedreader.pyx":217
+ *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
+ *                            encoding=None):
+ *         if encoding is None:             # <<<<<<<<<<<<<<
+ *             return self.read_fixed_strings_as_bytes(n_items, length)
  * 
- *             else:
  */
-        __pyx_v_bytes_read = (__pyx_v_bytes_read + __pyx_v_self->position);
-      }
+  }
 
-      /* "clickhouse_driver/bufferedreader.pyx":124
- *             # We need to copy it into buffer for adding null symbol at the end.
- *             # In ClickHouse block there is no null
- *             if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 if c_encoding:
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
+  /* "clickhouse_driver/bufferedreader.pyx":221
+ * 
+ *         cdef Py_ssize_t i, j
+ *         encoding = encoding.encode('utf-8')             # <<<<<<<<<<<<<<
+ *         cdef char* c_encoding = encoding
+ *         data = self.read(length * n_items)
  */
-      goto __pyx_L14;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  __pyx_t_7 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_7 = 1;
     }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_kp_u_utf_8};
+    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 221, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_2);
+  __pyx_t_2 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":157
- * 
- *             else:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(c_string, &buffer_ptr[self.position], size)
- *                 else:
+  /* "clickhouse_driver/bufferedreader.pyx":222
+ *         cdef Py_ssize_t i, j
+ *         encoding = encoding.encode('utf-8')
+ *         cdef char* c_encoding = encoding             # <<<<<<<<<<<<<<
+ *         data = self.read(length * n_items)
+ *         cdef char* data_ptr = PyBytes_AsString(data)
  */
-    /*else*/ {
-      __pyx_t_2 = (__pyx_v_c_encoding != 0);
-      if (__pyx_t_2) {
+  __pyx_t_8 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L1_error)
+  __pyx_v_c_encoding = __pyx_t_8;
 
-        /* "clickhouse_driver/bufferedreader.pyx":158
- *             else:
- *                 if c_encoding:
- *                     memcpy(c_string, &buffer_ptr[self.position], size)             # <<<<<<<<<<<<<<
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(
+  /* "clickhouse_driver/bufferedreader.pyx":223
+ *         encoding = encoding.encode('utf-8')
+ *         cdef char* c_encoding = encoding
+ *         data = self.read(length * n_items)             # <<<<<<<<<<<<<<
+ *         cdef char* data_ptr = PyBytes_AsString(data)
+ * 
  */
-        (void)(memcpy(__pyx_v_c_string, (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size));
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = NULL;
+  __pyx_t_7 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_5};
+    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_v_data = __pyx_t_2;
+  __pyx_t_2 = 0;
 
-        /* "clickhouse_driver/bufferedreader.pyx":157
+  /* "clickhouse_driver/bufferedreader.pyx":224
+ *         cdef char* c_encoding = encoding
+ *         data = self.read(length * n_items)
+ *         cdef char* data_ptr = PyBytes_AsString(data)             # <<<<<<<<<<<<<<
  * 
- *             else:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(c_string, &buffer_ptr[self.position], size)
- *                 else:
+ *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
  */
-        goto __pyx_L19;
-      }
+  __pyx_t_8 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_8 == ((char *)NULL))) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_v_data_ptr = __pyx_t_8;
 
-      /* "clickhouse_driver/bufferedreader.pyx":160
- *                     memcpy(c_string, &buffer_ptr[self.position], size)
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                         &buffer_ptr[self.position], size
- *                     )
+  /* "clickhouse_driver/bufferedreader.pyx":226
+ *         cdef char* data_ptr = PyBytes_AsString(data)
+ * 
+ *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)             # <<<<<<<<<<<<<<
+ *         if not c_string:
+ *             raise MemoryError()
  */
-      /*else*/ {
+  __pyx_v_c_string = ((char *)PyMem_Malloc((__pyx_v_length + 1)));
 
-        /* "clickhouse_driver/bufferedreader.pyx":161
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(
- *                         &buffer_ptr[self.position], size             # <<<<<<<<<<<<<<
- *                     )
- *                 self.position = right
+  /* "clickhouse_driver/bufferedreader.pyx":227
+ * 
+ *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
+ *         if not c_string:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         c_string[length] = 0
  */
-        __pyx_t_3 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 160, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
-        __pyx_t_3 = 0;
-      }
-      __pyx_L19:;
+  __pyx_t_1 = (!(__pyx_v_c_string != 0));
+  if (unlikely(__pyx_t_1)) {
 
-      /* "clickhouse_driver/bufferedreader.pyx":163
- *                         &buffer_ptr[self.position], size
- *                     )
- *                 self.position = right             # <<<<<<<<<<<<<<
+    /* "clickhouse_driver/bufferedreader.pyx":228
+ *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
+ *         if not c_string:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         c_string[length] = 0
  * 
- *             if c_encoding:
  */
-      __pyx_v_self->position = __pyx_v_right;
-    }
-    __pyx_L14:;
+    PyErr_NoMemory(); __PYX_ERR(0, 228, __pyx_L1_error)
 
-    /* "clickhouse_driver/bufferedreader.pyx":165
- *                 self.position = right
+    /* "clickhouse_driver/bufferedreader.pyx":227
  * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)
+ *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
+ *         if not c_string:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         c_string[length] = 0
  */
-    __pyx_t_2 = (__pyx_v_c_encoding != 0);
-    if (__pyx_t_2) {
+  }
 
-      /* "clickhouse_driver/bufferedreader.pyx":166
+  /* "clickhouse_driver/bufferedreader.pyx":229
+ *         if not c_string:
+ *             raise MemoryError()
+ *         c_string[length] = 0             # <<<<<<<<<<<<<<
  * 
- *             if c_encoding:
- *                 try:             # <<<<<<<<<<<<<<
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
+ *         items = PyTuple_New(n_items)
  */
-      {
-        __Pyx_PyThreadState_declare
-        __Pyx_PyThreadState_assign
-        __Pyx_ExceptionSave(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
-        __Pyx_XGOTREF(__pyx_t_13);
-        __Pyx_XGOTREF(__pyx_t_14);
-        __Pyx_XGOTREF(__pyx_t_15);
-        /*try:*/ {
+  (__pyx_v_c_string[__pyx_v_length]) = 0;
 
-          /* "clickhouse_driver/bufferedreader.pyx":167
- *             if c_encoding:
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)             # <<<<<<<<<<<<<<
- *                 except UnicodeDecodeError:
- *                     rv = PyBytes_FromStringAndSize(c_string, size)
+  /* "clickhouse_driver/bufferedreader.pyx":231
+ *         c_string[length] = 0
+ * 
+ *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
+ *         for i in range(n_items):
+ *             memcpy(c_string, &data_ptr[i * length], length)
  */
-          __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_c_string, 0, __pyx_v_size, __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L21_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
-          __pyx_t_3 = 0;
+  __pyx_t_2 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_items = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-          /* "clickhouse_driver/bufferedreader.pyx":166
+  /* "clickhouse_driver/bufferedreader.pyx":232
+ * 
+ *         items = PyTuple_New(n_items)
+ *         for i in range(n_items):             # <<<<<<<<<<<<<<
+ *             memcpy(c_string, &data_ptr[i * length], length)
  * 
- *             if c_encoding:
- *                 try:             # <<<<<<<<<<<<<<
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
  */
-        }
-        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-        goto __pyx_L28_try_end;
-        __pyx_L21_error:;
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_9 = __pyx_v_n_items;
+  __pyx_t_10 = __pyx_t_9;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+    __pyx_v_i = __pyx_t_11;
 
-        /* "clickhouse_driver/bufferedreader.pyx":168
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:             # <<<<<<<<<<<<<<
- *                     rv = PyBytes_FromStringAndSize(c_string, size)
+    /* "clickhouse_driver/bufferedreader.pyx":233
+ *         items = PyTuple_New(n_items)
+ *         for i in range(n_items):
+ *             memcpy(c_string, &data_ptr[i * length], length)             # <<<<<<<<<<<<<<
  * 
+ *             # Get last non zero byte of string from the end.
  */
-        __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeDecodeError);
-        if (__pyx_t_5) {
-          __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_1, &__pyx_t_4) < 0) __PYX_ERR(0, 168, __pyx_L23_except_error)
-          __Pyx_XGOTREF(__pyx_t_3);
-          __Pyx_XGOTREF(__pyx_t_1);
-          __Pyx_XGOTREF(__pyx_t_4);
+    (void)(memcpy(__pyx_v_c_string, (&(__pyx_v_data_ptr[(__pyx_v_i * __pyx_v_length)])), __pyx_v_length));
 
-          /* "clickhouse_driver/bufferedreader.pyx":169
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
- *                     rv = PyBytes_FromStringAndSize(c_string, size)             # <<<<<<<<<<<<<<
+    /* "clickhouse_driver/bufferedreader.pyx":236
  * 
- *             Py_INCREF(rv)
+ *             # Get last non zero byte of string from the end.
+ *             j = length - 1             # <<<<<<<<<<<<<<
+ *             while j >= 0 and not c_string[j]:
+ *                 j -= 1
  */
-          __pyx_t_16 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_size); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 169, __pyx_L23_except_error)
-          __Pyx_GOTREF(__pyx_t_16);
-          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_16);
-          __pyx_t_16 = 0;
-          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          goto __pyx_L22_exception_handled;
-        }
-        goto __pyx_L23_except_error;
+    __pyx_v_j = (__pyx_v_length - 1);
 
-        /* "clickhouse_driver/bufferedreader.pyx":166
+    /* "clickhouse_driver/bufferedreader.pyx":237
+ *             # Get last non zero byte of string from the end.
+ *             j = length - 1
+ *             while j >= 0 and not c_string[j]:             # <<<<<<<<<<<<<<
+ *                 j -= 1
  * 
- *             if c_encoding:
- *                 try:             # <<<<<<<<<<<<<<
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
  */
-        __pyx_L23_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_13);
-        __Pyx_XGIVEREF(__pyx_t_14);
-        __Pyx_XGIVEREF(__pyx_t_15);
-        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
-        goto __pyx_L1_error;
-        __pyx_L22_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_13);
-        __Pyx_XGIVEREF(__pyx_t_14);
-        __Pyx_XGIVEREF(__pyx_t_15);
-        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
-        __pyx_L28_try_end:;
+    while (1) {
+      __pyx_t_12 = (__pyx_v_j >= 0);
+      if (__pyx_t_12) {
+      } else {
+        __pyx_t_1 = __pyx_t_12;
+        goto __pyx_L9_bool_binop_done;
       }
+      __pyx_t_12 = (!((__pyx_v_c_string[__pyx_v_j]) != 0));
+      __pyx_t_1 = __pyx_t_12;
+      __pyx_L9_bool_binop_done:;
+      if (!__pyx_t_1) break;
 
-      /* "clickhouse_driver/bufferedreader.pyx":165
- *                 self.position = right
+      /* "clickhouse_driver/bufferedreader.pyx":238
+ *             j = length - 1
+ *             while j >= 0 and not c_string[j]:
+ *                 j -= 1             # <<<<<<<<<<<<<<
  * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)
+ *             try:
  */
+      __pyx_v_j = (__pyx_v_j - 1);
     }
 
-    /* "clickhouse_driver/bufferedreader.pyx":171
- *                     rv = PyBytes_FromStringAndSize(c_string, size)
- * 
- *             Py_INCREF(rv)             # <<<<<<<<<<<<<<
- *             PyTuple_SET_ITEM(items, i, rv)
+    /* "clickhouse_driver/bufferedreader.pyx":240
+ *                 j -= 1
  * 
+ *             try:             # <<<<<<<<<<<<<<
+ *                 item = c_string[:j + 1].decode(c_encoding)
+ *             except UnicodeDecodeError:
  */
-    Py_INCREF(__pyx_v_rv);
+    {
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __Pyx_ExceptionSave(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_15);
+      /*try:*/ {
 
-    /* "clickhouse_driver/bufferedreader.pyx":172
+        /* "clickhouse_driver/bufferedreader.pyx":241
  * 
- *             Py_INCREF(rv)
- *             PyTuple_SET_ITEM(items, i, rv)             # <<<<<<<<<<<<<<
- * 
- *         if c_string:
+ *             try:
+ *                 item = c_string[:j + 1].decode(c_encoding)             # <<<<<<<<<<<<<<
+ *             except UnicodeDecodeError:
+ *                 item = PyBytes_FromStringAndSize(c_string, length)
  */
-    PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_rv);
-  }
+        __pyx_t_2 = __Pyx_decode_c_string(__pyx_v_c_string, 0, (__pyx_v_j + 1), __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 241, __pyx_L11_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_2);
+        __pyx_t_2 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":174
- *             PyTuple_SET_ITEM(items, i, rv)
+        /* "clickhouse_driver/bufferedreader.pyx":240
+ *                 j -= 1
  * 
- *         if c_string:             # <<<<<<<<<<<<<<
- *             PyMem_Free(c_string)
+ *             try:             # <<<<<<<<<<<<<<
+ *                 item = c_string[:j + 1].decode(c_encoding)
+ *             except UnicodeDecodeError:
+ */
+      }
+      __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+      goto __pyx_L18_try_end;
+      __pyx_L11_error:;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+      /* "clickhouse_driver/bufferedreader.pyx":242
+ *             try:
+ *                 item = c_string[:j + 1].decode(c_encoding)
+ *             except UnicodeDecodeError:             # <<<<<<<<<<<<<<
+ *                 item = PyBytes_FromStringAndSize(c_string, length)
+ *             Py_INCREF(item)
+ */
+      __pyx_t_7 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeDecodeError);
+      if (__pyx_t_7) {
+        __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+        if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_5) < 0) __PYX_ERR(0, 242, __pyx_L13_except_error)
+        __Pyx_XGOTREF(__pyx_t_2);
+        __Pyx_XGOTREF(__pyx_t_3);
+        __Pyx_XGOTREF(__pyx_t_5);
+
+        /* "clickhouse_driver/bufferedreader.pyx":243
+ *                 item = c_string[:j + 1].decode(c_encoding)
+ *             except UnicodeDecodeError:
+ *                 item = PyBytes_FromStringAndSize(c_string, length)             # <<<<<<<<<<<<<<
+ *             Py_INCREF(item)
+ *             PyTuple_SET_ITEM(items, i, item)
+ */
+        __pyx_t_4 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_length); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 243, __pyx_L13_except_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_4);
+        __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        goto __pyx_L12_exception_handled;
+      }
+      goto __pyx_L13_except_error;
+
+      /* "clickhouse_driver/bufferedreader.pyx":240
+ *                 j -= 1
  * 
+ *             try:             # <<<<<<<<<<<<<<
+ *                 item = c_string[:j + 1].decode(c_encoding)
+ *             except UnicodeDecodeError:
  */
-  __pyx_t_2 = (__pyx_v_c_string != 0);
-  if (__pyx_t_2) {
+      __pyx_L13_except_error:;
+      __Pyx_XGIVEREF(__pyx_t_13);
+      __Pyx_XGIVEREF(__pyx_t_14);
+      __Pyx_XGIVEREF(__pyx_t_15);
+      __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+      goto __pyx_L1_error;
+      __pyx_L12_exception_handled:;
+      __Pyx_XGIVEREF(__pyx_t_13);
+      __Pyx_XGIVEREF(__pyx_t_14);
+      __Pyx_XGIVEREF(__pyx_t_15);
+      __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+      __pyx_L18_try_end:;
+    }
 
-    /* "clickhouse_driver/bufferedreader.pyx":175
+    /* "clickhouse_driver/bufferedreader.pyx":244
+ *             except UnicodeDecodeError:
+ *                 item = PyBytes_FromStringAndSize(c_string, length)
+ *             Py_INCREF(item)             # <<<<<<<<<<<<<<
+ *             PyTuple_SET_ITEM(items, i, item)
  * 
- *         if c_string:
- *             PyMem_Free(c_string)             # <<<<<<<<<<<<<<
+ */
+    Py_INCREF(__pyx_v_item);
+
+    /* "clickhouse_driver/bufferedreader.pyx":245
+ *                 item = PyBytes_FromStringAndSize(c_string, length)
+ *             Py_INCREF(item)
+ *             PyTuple_SET_ITEM(items, i, item)             # <<<<<<<<<<<<<<
  * 
- *         return items
+ *         PyMem_Free(c_string)
  */
-    PyMem_Free(__pyx_v_c_string);
+    PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_item);
+  }
 
-    /* "clickhouse_driver/bufferedreader.pyx":174
- *             PyTuple_SET_ITEM(items, i, rv)
+  /* "clickhouse_driver/bufferedreader.pyx":247
+ *             PyTuple_SET_ITEM(items, i, item)
  * 
- *         if c_string:             # <<<<<<<<<<<<<<
- *             PyMem_Free(c_string)
+ *         PyMem_Free(c_string)             # <<<<<<<<<<<<<<
  * 
+ *         return items
  */
-  }
+  PyMem_Free(__pyx_v_c_string);
 
-  /* "clickhouse_driver/bufferedreader.pyx":177
- *             PyMem_Free(c_string)
+  /* "clickhouse_driver/bufferedreader.pyx":249
+ *         PyMem_Free(c_string)
  * 
  *         return items             # <<<<<<<<<<<<<<
  * 
- *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,
+ *     def read_strings_buffers(self, unsigned long long n_items):
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_items);
   __pyx_r = __pyx_v_items;
   goto __pyx_L0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":62
- *         return rv
+  /* "clickhouse_driver/bufferedreader.pyx":215
+ *         return items
  * 
- *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
- *         """
- *         Python has great overhead between function calls.
+ *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
+ *                            encoding=None):
+ *         if encoding is None:
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
   __Pyx_XDECREF(__pyx_v_items);
-  __Pyx_XDECREF(__pyx_v_rv);
+  __Pyx_XDECREF(__pyx_v_item);
   __Pyx_XDECREF(__pyx_v_encoding);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":179
+/* "clickhouse_driver/bufferedreader.pyx":251
  *         return items
  * 
- *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
- *                                     Py_ssize_t length):
- *         cdef Py_ssize_t i
+ *     def read_strings_buffers(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings into Arrow-compatible buffers without creating
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17read_strings_buffers(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes = {"read_fixed_strings_as_bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_16read_strings_buffers, "\n        Reads strings into Arrow-compatible buffers without creating\n        Python object for each string.\n\n        Returns ``n_items + 1`` int64 offsets as bytearray and bytes with\n        concatenated strings.\n        ");
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_17read_strings_buffers = {"read_strings_buffers", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17read_strings_buffers, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_16read_strings_buffers};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17read_strings_buffers(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  Py_ssize_t __pyx_v_n_items;
-  Py_ssize_t __pyx_v_length;
+  unsigned PY_LONG_LONG __pyx_v_n_items;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read_fixed_strings_as_bytes (wrapper)", 0);
+  __Pyx_RefNannySetupContext("read_strings_buffers (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -5741,12 +7090,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_length,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -5759,35 +7106,23 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 251, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_length)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, 1); __PYX_ERR(0, 179, __pyx_L3_error)
-        }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_fixed_strings_as_bytes") < 0)) __PYX_ERR(0, 179, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_strings_buffers") < 0)) __PYX_ERR(0, 251, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 2)) {
+    } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
     }
-    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L3_error)
-    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 180, __pyx_L3_error)
+    __pyx_v_n_items = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_n_items == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 251, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 179, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read_strings_buffers", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 251, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5797,11 +7132,11 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings_as_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings_buffers", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_fixed_strings_as_bytes(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length);
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_16read_strings_buffers(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items);
 
   /* function exit code */
   {
@@ -5814,205 +7149,688 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_fixed_strings_as_bytes(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length) {
-  Py_ssize_t __pyx_v_i;
-  PyObject *__pyx_v_data = NULL;
-  char *__pyx_v_data_ptr;
-  PyObject *__pyx_v_items = NULL;
-  PyObject *__pyx_v_item = NULL;
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_16read_strings_buffers(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items) {
+  PyObject *__pyx_v_offsets = NULL;
+  PY_LONG_LONG *__pyx_v_offsets_ptr;
+  unsigned PY_LONG_LONG __pyx_v_i;
+  char *__pyx_v_buffer_ptr;
+  unsigned PY_LONG_LONG __pyx_v_size;
+  unsigned PY_LONG_LONG __pyx_v_shift;
+  unsigned PY_LONG_LONG __pyx_v_b;
+  unsigned PY_LONG_LONG __pyx_v_chunk_size;
+  unsigned PY_LONG_LONG __pyx_v_data_size;
+  unsigned PY_LONG_LONG __pyx_v_data_capacity;
+  char *__pyx_v_data;
+  char *__pyx_v_new_data;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  char *__pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
+  int __pyx_t_3;
+  unsigned PY_LONG_LONG __pyx_t_4;
+  unsigned PY_LONG_LONG __pyx_t_5;
+  unsigned PY_LONG_LONG __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  unsigned PY_LONG_LONG __pyx_t_9;
+  unsigned PY_LONG_LONG __pyx_t_10;
+  unsigned PY_LONG_LONG __pyx_t_11;
+  int __pyx_t_12;
+  char const *__pyx_t_13;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("read_fixed_strings_as_bytes", 1);
+  __Pyx_RefNannySetupContext("read_strings_buffers", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":182
- *                                     Py_ssize_t length):
- *         cdef Py_ssize_t i
- *         data = self.read(length * n_items)             # <<<<<<<<<<<<<<
- *         cdef char* data_ptr = PyBytes_AsString(data)
- * 
+  /* "clickhouse_driver/bufferedreader.pyx":259
+ *         concatenated strings.
+ *         """
+ *         offsets = bytearray(8 * (n_items + 1))             # <<<<<<<<<<<<<<
+ *         cdef long long* offsets_ptr = \
+ *             <long long *> PyByteArray_AsString(offsets)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG((8 * (__pyx_v_n_items + 1))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 182, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = NULL;
-  __pyx_t_5 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_5 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 182, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_offsets = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":261
+ *         offsets = bytearray(8 * (n_items + 1))
+ *         cdef long long* offsets_ptr = \
+ *             <long long *> PyByteArray_AsString(offsets)             # <<<<<<<<<<<<<<
+ *         offsets_ptr[0] = 0
+ * 
+ */
+  __pyx_v_offsets_ptr = ((PY_LONG_LONG *)PyByteArray_AsString(__pyx_v_offsets));
+
+  /* "clickhouse_driver/bufferedreader.pyx":262
+ *         cdef long long* offsets_ptr = \
+ *             <long long *> PyByteArray_AsString(offsets)
+ *         offsets_ptr[0] = 0             # <<<<<<<<<<<<<<
+ * 
+ *         cdef unsigned long long i
+ */
+  (__pyx_v_offsets_ptr[0]) = 0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":265
+ * 
+ *         cdef unsigned long long i
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long size, shift, b, chunk_size
+ * 
+ */
+  __pyx_t_2 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":268
+ *         cdef unsigned long long size, shift, b, chunk_size
+ * 
+ *         cdef unsigned long long data_size = 0             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long data_capacity = 4096
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
+ */
+  __pyx_v_data_size = 0;
+
+  /* "clickhouse_driver/bufferedreader.pyx":269
+ * 
+ *         cdef unsigned long long data_size = 0
+ *         cdef unsigned long long data_capacity = 4096             # <<<<<<<<<<<<<<
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
+ *         cdef char* new_data
+ */
+  __pyx_v_data_capacity = 0x1000;
+
+  /* "clickhouse_driver/bufferedreader.pyx":270
+ *         cdef unsigned long long data_size = 0
+ *         cdef unsigned long long data_capacity = 4096
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)             # <<<<<<<<<<<<<<
+ *         cdef char* new_data
+ *         if data is NULL:
+ */
+  __pyx_v_data = ((char *)PyMem_Malloc(__pyx_v_data_capacity));
+
+  /* "clickhouse_driver/bufferedreader.pyx":272
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
+ *         cdef char* new_data
+ *         if data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ * 
+ */
+  __pyx_t_3 = (__pyx_v_data == NULL);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "clickhouse_driver/bufferedreader.pyx":273
+ *         cdef char* new_data
+ *         if data is NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *         try:
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 273, __pyx_L1_error)
+
+    /* "clickhouse_driver/bufferedreader.pyx":272
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
+ *         cdef char* new_data
+ *         if data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ * 
+ */
   }
-  __pyx_v_data = __pyx_t_1;
-  __pyx_t_1 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":183
- *         cdef Py_ssize_t i
- *         data = self.read(length * n_items)
- *         cdef char* data_ptr = PyBytes_AsString(data)             # <<<<<<<<<<<<<<
+  /* "clickhouse_driver/bufferedreader.pyx":275
+ *             raise MemoryError()
  * 
- *         items = PyTuple_New(n_items)
+ *         try:             # <<<<<<<<<<<<<<
+ *             for i in range(n_items):
+ *                 shift = size = 0
  */
-  __pyx_t_6 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_6 == ((char *)NULL))) __PYX_ERR(0, 183, __pyx_L1_error)
-  __pyx_v_data_ptr = __pyx_t_6;
+  /*try:*/ {
 
-  /* "clickhouse_driver/bufferedreader.pyx":185
- *         cdef char* data_ptr = PyBytes_AsString(data)
+    /* "clickhouse_driver/bufferedreader.pyx":276
+ * 
+ *         try:
+ *             for i in range(n_items):             # <<<<<<<<<<<<<<
+ *                 shift = size = 0
  * 
- *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
- *         for i in range(n_items):
- *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
  */
-  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_items = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+    __pyx_t_4 = __pyx_v_n_items;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
 
-  /* "clickhouse_driver/bufferedreader.pyx":186
+      /* "clickhouse_driver/bufferedreader.pyx":277
+ *         try:
+ *             for i in range(n_items):
+ *                 shift = size = 0             # <<<<<<<<<<<<<<
  * 
- *         items = PyTuple_New(n_items)
- *         for i in range(n_items):             # <<<<<<<<<<<<<<
- *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
- *             Py_INCREF(item)
+ *                 # Read string size
  */
-  __pyx_t_7 = __pyx_v_n_items;
-  __pyx_t_8 = __pyx_t_7;
-  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-    __pyx_v_i = __pyx_t_9;
+      __pyx_v_shift = 0;
+      __pyx_v_size = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":187
- *         items = PyTuple_New(n_items)
- *         for i in range(n_items):
- *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)             # <<<<<<<<<<<<<<
- *             Py_INCREF(item)
- *             PyTuple_SET_ITEM(items, i, item)
+      /* "clickhouse_driver/bufferedreader.pyx":280
+ * 
+ *                 # Read string size
+ *                 while True:             # <<<<<<<<<<<<<<
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()
  */
-    __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_data_ptr[(__pyx_v_i * __pyx_v_length)])), __pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_XDECREF_SET(__pyx_v_item, ((PyObject*)__pyx_t_1));
-    __pyx_t_1 = 0;
+      while (1) {
 
-    /* "clickhouse_driver/bufferedreader.pyx":188
- *         for i in range(n_items):
- *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
- *             Py_INCREF(item)             # <<<<<<<<<<<<<<
- *             PyTuple_SET_ITEM(items, i, item)
- *         return items
+        /* "clickhouse_driver/bufferedreader.pyx":281
+ *                 # Read string size
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ */
+        __pyx_t_3 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
+        if (__pyx_t_3) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":282
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+          __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 282, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_t_7 = NULL;
+          __pyx_t_8 = 0;
+          #if CYTHON_UNPACK_METHODS
+          if (likely(PyMethod_Check(__pyx_t_1))) {
+            __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
+            if (likely(__pyx_t_7)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+              __Pyx_INCREF(__pyx_t_7);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_1, function);
+              __pyx_t_8 = 1;
+            }
+          }
+          #endif
+          {
+            PyObject *__pyx_callargs[2] = {__pyx_t_7, NULL};
+            __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_1, __pyx_callargs+1-__pyx_t_8, 0+__pyx_t_8);
+            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+            if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_2);
+            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":284
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                         self.position = 0
+ * 
+ */
+          __pyx_t_2 = __pyx_v_self->buffer;
+          __Pyx_INCREF(__pyx_t_2);
+          __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":285
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *                     b = buffer_ptr[self.position]
+ */
+          __pyx_v_self->position = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":281
+ *                 # Read string size
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":287
+ *                         self.position = 0
+ * 
+ *                     b = buffer_ptr[self.position]             # <<<<<<<<<<<<<<
+ *                     self.position += 1
+ * 
+ */
+        __pyx_v_b = (__pyx_v_buffer_ptr[__pyx_v_self->position]);
+
+        /* "clickhouse_driver/bufferedreader.pyx":288
+ * 
+ *                     b = buffer_ptr[self.position]
+ *                     self.position += 1             # <<<<<<<<<<<<<<
+ * 
+ *                     size |= (b & 0x7f) << shift
+ */
+        __pyx_v_self->position = (__pyx_v_self->position + 1);
+
+        /* "clickhouse_driver/bufferedreader.pyx":290
+ *                     self.position += 1
+ * 
+ *                     size |= (b & 0x7f) << shift             # <<<<<<<<<<<<<<
+ *                     if b < 0x80:
+ *                         break
+ */
+        __pyx_v_size = (__pyx_v_size | ((__pyx_v_b & 0x7f) << __pyx_v_shift));
+
+        /* "clickhouse_driver/bufferedreader.pyx":291
+ * 
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+ */
+        __pyx_t_3 = (__pyx_v_b < 0x80);
+        if (__pyx_t_3) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":292
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:
+ *                         break             # <<<<<<<<<<<<<<
+ * 
+ *                     shift += 7
+ */
+          goto __pyx_L10_break;
+
+          /* "clickhouse_driver/bufferedreader.pyx":291
+ * 
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":294
+ *                         break
+ * 
+ *                     shift += 7             # <<<<<<<<<<<<<<
+ * 
+ *                 if data_size + size > data_capacity:
+ */
+        __pyx_v_shift = (__pyx_v_shift + 7);
+      }
+      __pyx_L10_break:;
+
+      /* "clickhouse_driver/bufferedreader.pyx":296
+ *                     shift += 7
+ * 
+ *                 if data_size + size > data_capacity:             # <<<<<<<<<<<<<<
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ */
+      __pyx_t_3 = ((__pyx_v_data_size + __pyx_v_size) > __pyx_v_data_capacity);
+      if (__pyx_t_3) {
+
+        /* "clickhouse_driver/bufferedreader.pyx":297
+ * 
+ *                 if data_size + size > data_capacity:
+ *                     data_capacity = max(data_capacity * 2, data_size + size)             # <<<<<<<<<<<<<<
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:
+ */
+        __pyx_t_9 = (__pyx_v_data_size + __pyx_v_size);
+        __pyx_t_10 = (__pyx_v_data_capacity * 2);
+        __pyx_t_3 = (__pyx_t_9 > __pyx_t_10);
+        if (__pyx_t_3) {
+          __pyx_t_11 = __pyx_t_9;
+        } else {
+          __pyx_t_11 = __pyx_t_10;
+        }
+        __pyx_v_data_capacity = __pyx_t_11;
+
+        /* "clickhouse_driver/bufferedreader.pyx":298
+ *                 if data_size + size > data_capacity:
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)             # <<<<<<<<<<<<<<
+ *                     if new_data is NULL:
+ *                         raise MemoryError()
+ */
+        __pyx_v_new_data = ((char *)PyMem_Realloc(__pyx_v_data, __pyx_v_data_capacity));
+
+        /* "clickhouse_driver/bufferedreader.pyx":299
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                     data = new_data
+ */
+        __pyx_t_3 = (__pyx_v_new_data == NULL);
+        if (unlikely(__pyx_t_3)) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":300
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:
+ *                         raise MemoryError()             # <<<<<<<<<<<<<<
+ *                     data = new_data
+ * 
+ */
+          PyErr_NoMemory(); __PYX_ERR(0, 300, __pyx_L5_error)
+
+          /* "clickhouse_driver/bufferedreader.pyx":299
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                     data = new_data
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":301
+ *                     if new_data is NULL:
+ *                         raise MemoryError()
+ *                     data = new_data             # <<<<<<<<<<<<<<
+ * 
+ *                 # String can be split between several buffers.
+ */
+        __pyx_v_data = __pyx_v_new_data;
+
+        /* "clickhouse_driver/bufferedreader.pyx":296
+ *                     shift += 7
+ * 
+ *                 if data_size + size > data_capacity:             # <<<<<<<<<<<<<<
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ */
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":304
+ * 
+ *                 # String can be split between several buffers.
+ *                 while size > 0:             # <<<<<<<<<<<<<<
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()
+ */
+      while (1) {
+        __pyx_t_3 = (__pyx_v_size > 0);
+        if (!__pyx_t_3) break;
+
+        /* "clickhouse_driver/bufferedreader.pyx":305
+ *                 # String can be split between several buffers.
+ *                 while size > 0:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+        __pyx_t_3 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
+        if (__pyx_t_3) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":306
+ *                 while size > 0:
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         self.position = 0
+ */
+          __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_t_7 = NULL;
+          __pyx_t_8 = 0;
+          #if CYTHON_UNPACK_METHODS
+          if (likely(PyMethod_Check(__pyx_t_1))) {
+            __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
+            if (likely(__pyx_t_7)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+              __Pyx_INCREF(__pyx_t_7);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_1, function);
+              __pyx_t_8 = 1;
+            }
+          }
+          #endif
+          {
+            PyObject *__pyx_callargs[2] = {__pyx_t_7, NULL};
+            __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_1, __pyx_callargs+1-__pyx_t_8, 0+__pyx_t_8);
+            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+            if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_2);
+            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":307
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                         self.position = 0
+ * 
+ */
+          __pyx_t_2 = __pyx_v_self->buffer;
+          __Pyx_INCREF(__pyx_t_2);
+          __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":308
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *                     chunk_size = min(
+ */
+          __pyx_v_self->position = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":305
+ *                 # String can be split between several buffers.
+ *                 while size > 0:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":311
+ * 
+ *                     chunk_size = min(
+ *                         size, self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
+ *                     )
+ *                     memcpy(&data[data_size], &buffer_ptr[self.position],
+ */
+        __pyx_t_11 = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+        __pyx_t_9 = __pyx_v_size;
+        __pyx_t_3 = (__pyx_t_11 < __pyx_t_9);
+        if (__pyx_t_3) {
+          __pyx_t_10 = __pyx_t_11;
+        } else {
+          __pyx_t_10 = __pyx_t_9;
+        }
+        __pyx_v_chunk_size = __pyx_t_10;
+
+        /* "clickhouse_driver/bufferedreader.pyx":313
+ *                         size, self.current_buffer_size - self.position
+ *                     )
+ *                     memcpy(&data[data_size], &buffer_ptr[self.position],             # <<<<<<<<<<<<<<
+ *                            chunk_size)
+ *                     self.position += chunk_size
+ */
+        (void)(memcpy((&(__pyx_v_data[__pyx_v_data_size])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_chunk_size));
+
+        /* "clickhouse_driver/bufferedreader.pyx":315
+ *                     memcpy(&data[data_size], &buffer_ptr[self.position],
+ *                            chunk_size)
+ *                     self.position += chunk_size             # <<<<<<<<<<<<<<
+ *                     data_size += chunk_size
+ *                     size -= chunk_size
+ */
+        __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_chunk_size);
+
+        /* "clickhouse_driver/bufferedreader.pyx":316
+ *                            chunk_size)
+ *                     self.position += chunk_size
+ *                     data_size += chunk_size             # <<<<<<<<<<<<<<
+ *                     size -= chunk_size
+ * 
+ */
+        __pyx_v_data_size = (__pyx_v_data_size + __pyx_v_chunk_size);
+
+        /* "clickhouse_driver/bufferedreader.pyx":317
+ *                     self.position += chunk_size
+ *                     data_size += chunk_size
+ *                     size -= chunk_size             # <<<<<<<<<<<<<<
+ * 
+ *                 offsets_ptr[i + 1] = data_size
+ */
+        __pyx_v_size = (__pyx_v_size - __pyx_v_chunk_size);
+      }
+
+      /* "clickhouse_driver/bufferedreader.pyx":319
+ *                     size -= chunk_size
+ * 
+ *                 offsets_ptr[i + 1] = data_size             # <<<<<<<<<<<<<<
+ * 
+ *             return offsets, PyBytes_FromStringAndSize(data, data_size)
  */
-    Py_INCREF(__pyx_v_item);
+      (__pyx_v_offsets_ptr[(__pyx_v_i + 1)]) = __pyx_v_data_size;
+    }
 
-    /* "clickhouse_driver/bufferedreader.pyx":189
- *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
- *             Py_INCREF(item)
- *             PyTuple_SET_ITEM(items, i, item)             # <<<<<<<<<<<<<<
- *         return items
+    /* "clickhouse_driver/bufferedreader.pyx":321
+ *                 offsets_ptr[i + 1] = data_size
  * 
+ *             return offsets, PyBytes_FromStringAndSize(data, data_size)             # <<<<<<<<<<<<<<
+ * 
+ *         finally:
  */
-    PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_item);
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = PyBytes_FromStringAndSize(__pyx_v_data, __pyx_v_data_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 321, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 321, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_offsets);
+    __Pyx_GIVEREF(__pyx_v_offsets);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_offsets)) __PYX_ERR(0, 321, __pyx_L5_error);
+    __Pyx_GIVEREF(__pyx_t_2);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2)) __PYX_ERR(0, 321, __pyx_L5_error);
+    __pyx_t_2 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L4_return;
   }
 
-  /* "clickhouse_driver/bufferedreader.pyx":190
- *             Py_INCREF(item)
- *             PyTuple_SET_ITEM(items, i, item)
- *         return items             # <<<<<<<<<<<<<<
+  /* "clickhouse_driver/bufferedreader.pyx":324
+ * 
+ *         finally:
+ *             PyMem_Free(data)             # <<<<<<<<<<<<<<
+ * 
  * 
- *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_items);
-  __pyx_r = __pyx_v_items;
-  goto __pyx_L0;
+  /*finally:*/ {
+    __pyx_L5_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_17, &__pyx_t_18, &__pyx_t_19);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16) < 0)) __Pyx_ErrFetch(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __Pyx_XGOTREF(__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_18);
+      __Pyx_XGOTREF(__pyx_t_19);
+      __pyx_t_8 = __pyx_lineno; __pyx_t_12 = __pyx_clineno; __pyx_t_13 = __pyx_filename;
+      {
+        PyMem_Free(__pyx_v_data);
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_17);
+        __Pyx_XGIVEREF(__pyx_t_18);
+        __Pyx_XGIVEREF(__pyx_t_19);
+        __Pyx_ExceptionReset(__pyx_t_17, __pyx_t_18, __pyx_t_19);
+      }
+      __Pyx_XGIVEREF(__pyx_t_14);
+      __Pyx_XGIVEREF(__pyx_t_15);
+      __Pyx_XGIVEREF(__pyx_t_16);
+      __Pyx_ErrRestore(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+      __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+      __pyx_lineno = __pyx_t_8; __pyx_clineno = __pyx_t_12; __pyx_filename = __pyx_t_13;
+      goto __pyx_L1_error;
+    }
+    __pyx_L4_return: {
+      __pyx_t_19 = __pyx_r;
+      __pyx_r = 0;
+      PyMem_Free(__pyx_v_data);
+      __pyx_r = __pyx_t_19;
+      __pyx_t_19 = 0;
+      goto __pyx_L0;
+    }
+  }
 
-  /* "clickhouse_driver/bufferedreader.pyx":179
+  /* "clickhouse_driver/bufferedreader.pyx":251
  *         return items
  * 
- *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
- *                                     Py_ssize_t length):
- *         cdef Py_ssize_t i
+ *     def read_strings_buffers(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings into Arrow-compatible buffers without creating
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings_as_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings_buffers", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_data);
-  __Pyx_XDECREF(__pyx_v_items);
-  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_XDECREF(__pyx_v_offsets);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":192
- *         return items
+/* "clickhouse_driver/bufferedreader.pyx":327
  * 
- *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
- *                            encoding=None):
- *         if encoding is None:
+ * 
+ *     def read_strings_raw(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings as is: with varint sizes and without decoding.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_19read_strings_raw(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings = {"read_fixed_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_18read_strings_raw, "\n        Reads strings as is: with varint sizes and without decoding.\n        Returns bytes in wire format.\n        ");
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_19read_strings_raw = {"read_strings_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_19read_strings_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_18read_strings_raw};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_19read_strings_raw(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  Py_ssize_t __pyx_v_n_items;
-  Py_ssize_t __pyx_v_length;
-  PyObject *__pyx_v_encoding = 0;
+  unsigned PY_LONG_LONG __pyx_v_n_items;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read_fixed_strings (wrapper)", 0);
+  __Pyx_RefNannySetupContext("read_strings_raw (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -6022,23 +7840,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_length,&__pyx_n_s_encoding,0};
-
-    /* "clickhouse_driver/bufferedreader.pyx":193
- * 
- *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
- *                            encoding=None):             # <<<<<<<<<<<<<<
- *         if encoding is None:
- *             return self.read_fixed_strings_as_bytes(n_items, length)
- */
-    values[2] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
         case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
@@ -6051,47 +7856,23 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 327, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_length)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, 1); __PYX_ERR(0, 192, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
-          if (value) { values[2] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
-        }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_fixed_strings") < 0)) __PYX_ERR(0, 192, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_strings_raw") < 0)) __PYX_ERR(0, 327, __pyx_L3_error)
       }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      switch (__pyx_nargs) {
-        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
-    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
-    __pyx_v_encoding = values[2];
+    __pyx_v_n_items = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_n_items == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 327, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, __pyx_nargs); __PYX_ERR(0, 192, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read_strings_raw", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 327, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6101,19 +7882,11 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
       __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length, __pyx_v_encoding);
-
-  /* "clickhouse_driver/bufferedreader.pyx":192
- *         return items
- * 
- *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
- *                            encoding=None):
- *         if encoding is None:
- */
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_18read_strings_raw(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items);
 
   /* function exit code */
   {
@@ -6126,476 +7899,691 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding) {
-  Py_ssize_t __pyx_v_i;
-  Py_ssize_t __pyx_v_j;
-  char *__pyx_v_c_encoding;
-  PyObject *__pyx_v_data = NULL;
-  char *__pyx_v_data_ptr;
-  char *__pyx_v_c_string;
-  PyObject *__pyx_v_items = NULL;
-  PyObject *__pyx_v_item = NULL;
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_18read_strings_raw(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items) {
+  CYTHON_UNUSED unsigned PY_LONG_LONG __pyx_v_i;
+  char *__pyx_v_buffer_ptr;
+  unsigned PY_LONG_LONG __pyx_v_size;
+  unsigned PY_LONG_LONG __pyx_v_shift;
+  unsigned PY_LONG_LONG __pyx_v_b;
+  unsigned PY_LONG_LONG __pyx_v_chunk_size;
+  unsigned PY_LONG_LONG __pyx_v_data_size;
+  unsigned PY_LONG_LONG __pyx_v_data_capacity;
+  char *__pyx_v_data;
+  char *__pyx_v_new_data;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  unsigned PY_LONG_LONG __pyx_t_3;
+  unsigned PY_LONG_LONG __pyx_t_4;
+  unsigned PY_LONG_LONG __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  char *__pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  Py_ssize_t __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  unsigned PY_LONG_LONG __pyx_t_9;
+  unsigned PY_LONG_LONG __pyx_t_10;
+  unsigned PY_LONG_LONG __pyx_t_11;
   int __pyx_t_12;
-  PyObject *__pyx_t_13 = NULL;
+  char const *__pyx_t_13;
   PyObject *__pyx_t_14 = NULL;
   PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("read_fixed_strings", 0);
-  __Pyx_INCREF(__pyx_v_encoding);
+  __Pyx_RefNannySetupContext("read_strings_raw", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":194
- *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
- *                            encoding=None):
- *         if encoding is None:             # <<<<<<<<<<<<<<
- *             return self.read_fixed_strings_as_bytes(n_items, length)
+  /* "clickhouse_driver/bufferedreader.pyx":333
+ *         """
+ *         cdef unsigned long long i
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long size, shift, b, chunk_size
  * 
  */
-  __pyx_t_1 = (__pyx_v_encoding == Py_None);
-  if (__pyx_t_1) {
+  __pyx_t_1 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":195
- *                            encoding=None):
- *         if encoding is None:
- *             return self.read_fixed_strings_as_bytes(n_items, length)             # <<<<<<<<<<<<<<
+  /* "clickhouse_driver/bufferedreader.pyx":336
+ *         cdef unsigned long long size, shift, b, chunk_size
  * 
- *         cdef Py_ssize_t i, j
+ *         cdef unsigned long long data_size = 0             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long data_capacity = 4096
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
  */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_fixed_strings_as_bytes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_n_items); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 195, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = NULL;
-    __pyx_t_7 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_6)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_6);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_7 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_6, __pyx_t_4, __pyx_t_5};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 195, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    goto __pyx_L0;
+  __pyx_v_data_size = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":194
- *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
- *                            encoding=None):
- *         if encoding is None:             # <<<<<<<<<<<<<<
- *             return self.read_fixed_strings_as_bytes(n_items, length)
+  /* "clickhouse_driver/bufferedreader.pyx":337
+ * 
+ *         cdef unsigned long long data_size = 0
+ *         cdef unsigned long long data_capacity = 4096             # <<<<<<<<<<<<<<
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
+ *         cdef char* new_data
+ */
+  __pyx_v_data_capacity = 0x1000;
+
+  /* "clickhouse_driver/bufferedreader.pyx":338
+ *         cdef unsigned long long data_size = 0
+ *         cdef unsigned long long data_capacity = 4096
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)             # <<<<<<<<<<<<<<
+ *         cdef char* new_data
+ *         if data is NULL:
+ */
+  __pyx_v_data = ((char *)PyMem_Malloc(__pyx_v_data_capacity));
+
+  /* "clickhouse_driver/bufferedreader.pyx":340
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
+ *         cdef char* new_data
+ *         if data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
  * 
  */
-  }
+  __pyx_t_2 = (__pyx_v_data == NULL);
+  if (unlikely(__pyx_t_2)) {
 
-  /* "clickhouse_driver/bufferedreader.pyx":198
+    /* "clickhouse_driver/bufferedreader.pyx":341
+ *         cdef char* new_data
+ *         if data is NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *         try:
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 341, __pyx_L1_error)
+
+    /* "clickhouse_driver/bufferedreader.pyx":340
+ *         cdef char* data = <char *> PyMem_Malloc(data_capacity)
+ *         cdef char* new_data
+ *         if data is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
  * 
- *         cdef Py_ssize_t i, j
- *         encoding = encoding.encode('utf-8')             # <<<<<<<<<<<<<<
- *         cdef char* c_encoding = encoding
- *         data = self.read(length * n_items)
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_kp_u_utf_8};
-    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 198, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
-  __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_2);
-  __pyx_t_2 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":199
- *         cdef Py_ssize_t i, j
- *         encoding = encoding.encode('utf-8')
- *         cdef char* c_encoding = encoding             # <<<<<<<<<<<<<<
- *         data = self.read(length * n_items)
- *         cdef char* data_ptr = PyBytes_AsString(data)
+  /* "clickhouse_driver/bufferedreader.pyx":343
+ *             raise MemoryError()
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             for i in range(n_items):
+ *                 shift = size = 0
+ */
+  /*try:*/ {
+
+    /* "clickhouse_driver/bufferedreader.pyx":344
+ * 
+ *         try:
+ *             for i in range(n_items):             # <<<<<<<<<<<<<<
+ *                 shift = size = 0
+ * 
+ */
+    __pyx_t_3 = __pyx_v_n_items;
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_i = __pyx_t_5;
+
+      /* "clickhouse_driver/bufferedreader.pyx":345
+ *         try:
+ *             for i in range(n_items):
+ *                 shift = size = 0             # <<<<<<<<<<<<<<
+ * 
+ *                 # Read string size. Varint takes at most 10 bytes.
+ */
+      __pyx_v_shift = 0;
+      __pyx_v_size = 0;
+
+      /* "clickhouse_driver/bufferedreader.pyx":348
+ * 
+ *                 # Read string size. Varint takes at most 10 bytes.
+ *                 if data_size + 10 > data_capacity:             # <<<<<<<<<<<<<<
+ *                     data_capacity = data_capacity * 2
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ */
+      __pyx_t_2 = ((__pyx_v_data_size + 10) > __pyx_v_data_capacity);
+      if (__pyx_t_2) {
+
+        /* "clickhouse_driver/bufferedreader.pyx":349
+ *                 # Read string size. Varint takes at most 10 bytes.
+ *                 if data_size + 10 > data_capacity:
+ *                     data_capacity = data_capacity * 2             # <<<<<<<<<<<<<<
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:
+ */
+        __pyx_v_data_capacity = (__pyx_v_data_capacity * 2);
+
+        /* "clickhouse_driver/bufferedreader.pyx":350
+ *                 if data_size + 10 > data_capacity:
+ *                     data_capacity = data_capacity * 2
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)             # <<<<<<<<<<<<<<
+ *                     if new_data is NULL:
+ *                         raise MemoryError()
+ */
+        __pyx_v_new_data = ((char *)PyMem_Realloc(__pyx_v_data, __pyx_v_data_capacity));
+
+        /* "clickhouse_driver/bufferedreader.pyx":351
+ *                     data_capacity = data_capacity * 2
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                     data = new_data
+ */
+        __pyx_t_2 = (__pyx_v_new_data == NULL);
+        if (unlikely(__pyx_t_2)) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":352
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:
+ *                         raise MemoryError()             # <<<<<<<<<<<<<<
+ *                     data = new_data
+ * 
  */
-  __pyx_t_8 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 199, __pyx_L1_error)
-  __pyx_v_c_encoding = __pyx_t_8;
+          PyErr_NoMemory(); __PYX_ERR(0, 352, __pyx_L5_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":200
- *         encoding = encoding.encode('utf-8')
- *         cdef char* c_encoding = encoding
- *         data = self.read(length * n_items)             # <<<<<<<<<<<<<<
- *         cdef char* data_ptr = PyBytes_AsString(data)
+          /* "clickhouse_driver/bufferedreader.pyx":351
+ *                     data_capacity = data_capacity * 2
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                     data = new_data
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":353
+ *                     if new_data is NULL:
+ *                         raise MemoryError()
+ *                     data = new_data             # <<<<<<<<<<<<<<
  * 
+ *                 while True:
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 200, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = NULL;
-  __pyx_t_7 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_7 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_5};
-    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __pyx_v_data = __pyx_t_2;
-  __pyx_t_2 = 0;
+        __pyx_v_data = __pyx_v_new_data;
 
-  /* "clickhouse_driver/bufferedreader.pyx":201
- *         cdef char* c_encoding = encoding
- *         data = self.read(length * n_items)
- *         cdef char* data_ptr = PyBytes_AsString(data)             # <<<<<<<<<<<<<<
+        /* "clickhouse_driver/bufferedreader.pyx":348
  * 
- *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
+ *                 # Read string size. Varint takes at most 10 bytes.
+ *                 if data_size + 10 > data_capacity:             # <<<<<<<<<<<<<<
+ *                     data_capacity = data_capacity * 2
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
  */
-  __pyx_t_8 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_8 == ((char *)NULL))) __PYX_ERR(0, 201, __pyx_L1_error)
-  __pyx_v_data_ptr = __pyx_t_8;
+      }
 
-  /* "clickhouse_driver/bufferedreader.pyx":203
- *         cdef char* data_ptr = PyBytes_AsString(data)
+      /* "clickhouse_driver/bufferedreader.pyx":355
+ *                     data = new_data
  * 
- *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)             # <<<<<<<<<<<<<<
- *         if not c_string:
- *             raise MemoryError()
+ *                 while True:             # <<<<<<<<<<<<<<
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()
  */
-  __pyx_v_c_string = ((char *)PyMem_Malloc((__pyx_v_length + 1)));
+      while (1) {
 
-  /* "clickhouse_driver/bufferedreader.pyx":204
+        /* "clickhouse_driver/bufferedreader.pyx":356
  * 
- *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
- *         if not c_string:             # <<<<<<<<<<<<<<
- *             raise MemoryError()
- *         c_string[length] = 0
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
  */
-  __pyx_t_1 = (!(__pyx_v_c_string != 0));
-  if (unlikely(__pyx_t_1)) {
+        __pyx_t_2 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
+        if (__pyx_t_2) {
 
-    /* "clickhouse_driver/bufferedreader.pyx":205
- *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
- *         if not c_string:
- *             raise MemoryError()             # <<<<<<<<<<<<<<
- *         c_string[length] = 0
+          /* "clickhouse_driver/bufferedreader.pyx":357
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+          __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 357, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_7 = NULL;
+          __pyx_t_8 = 0;
+          #if CYTHON_UNPACK_METHODS
+          if (likely(PyMethod_Check(__pyx_t_6))) {
+            __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+            if (likely(__pyx_t_7)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+              __Pyx_INCREF(__pyx_t_7);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_6, function);
+              __pyx_t_8 = 1;
+            }
+          }
+          #endif
+          {
+            PyObject *__pyx_callargs[2] = {__pyx_t_7, NULL};
+            __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_8, 0+__pyx_t_8);
+            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+            if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 357, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_1);
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":359
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                         self.position = 0
  * 
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 205, __pyx_L1_error)
+          __pyx_t_1 = __pyx_v_self->buffer;
+          __Pyx_INCREF(__pyx_t_1);
+          __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":204
+          /* "clickhouse_driver/bufferedreader.pyx":360
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         self.position = 0             # <<<<<<<<<<<<<<
  * 
- *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
- *         if not c_string:             # <<<<<<<<<<<<<<
- *             raise MemoryError()
- *         c_string[length] = 0
+ *                     b = <unsigned char> buffer_ptr[self.position]
  */
-  }
+          __pyx_v_self->position = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":206
- *         if not c_string:
- *             raise MemoryError()
- *         c_string[length] = 0             # <<<<<<<<<<<<<<
+          /* "clickhouse_driver/bufferedreader.pyx":356
  * 
- *         items = PyTuple_New(n_items)
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
  */
-  (__pyx_v_c_string[__pyx_v_length]) = 0;
+        }
 
-  /* "clickhouse_driver/bufferedreader.pyx":208
- *         c_string[length] = 0
+        /* "clickhouse_driver/bufferedreader.pyx":362
+ *                         self.position = 0
+ * 
+ *                     b = <unsigned char> buffer_ptr[self.position]             # <<<<<<<<<<<<<<
+ *                     self.position += 1
  * 
- *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
- *         for i in range(n_items):
- *             memcpy(c_string, &data_ptr[i * length], length)
  */
-  __pyx_t_2 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 208, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_v_items = ((PyObject*)__pyx_t_2);
-  __pyx_t_2 = 0;
+        __pyx_v_b = ((unsigned char)(__pyx_v_buffer_ptr[__pyx_v_self->position]));
 
-  /* "clickhouse_driver/bufferedreader.pyx":209
+        /* "clickhouse_driver/bufferedreader.pyx":363
  * 
- *         items = PyTuple_New(n_items)
- *         for i in range(n_items):             # <<<<<<<<<<<<<<
- *             memcpy(c_string, &data_ptr[i * length], length)
+ *                     b = <unsigned char> buffer_ptr[self.position]
+ *                     self.position += 1             # <<<<<<<<<<<<<<
  * 
+ *                     data[data_size] = <char> b
  */
-  __pyx_t_9 = __pyx_v_n_items;
-  __pyx_t_10 = __pyx_t_9;
-  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
-    __pyx_v_i = __pyx_t_11;
+        __pyx_v_self->position = (__pyx_v_self->position + 1);
 
-    /* "clickhouse_driver/bufferedreader.pyx":210
- *         items = PyTuple_New(n_items)
- *         for i in range(n_items):
- *             memcpy(c_string, &data_ptr[i * length], length)             # <<<<<<<<<<<<<<
+        /* "clickhouse_driver/bufferedreader.pyx":365
+ *                     self.position += 1
+ * 
+ *                     data[data_size] = <char> b             # <<<<<<<<<<<<<<
+ *                     data_size += 1
  * 
- *             # Get last non zero byte of string from the end.
  */
-    (void)(memcpy(__pyx_v_c_string, (&(__pyx_v_data_ptr[(__pyx_v_i * __pyx_v_length)])), __pyx_v_length));
+        (__pyx_v_data[__pyx_v_data_size]) = ((char)__pyx_v_b);
 
-    /* "clickhouse_driver/bufferedreader.pyx":213
+        /* "clickhouse_driver/bufferedreader.pyx":366
  * 
- *             # Get last non zero byte of string from the end.
- *             j = length - 1             # <<<<<<<<<<<<<<
- *             while j >= 0 and not c_string[j]:
- *                 j -= 1
+ *                     data[data_size] = <char> b
+ *                     data_size += 1             # <<<<<<<<<<<<<<
+ * 
+ *                     size |= (b & 0x7f) << shift
  */
-    __pyx_v_j = (__pyx_v_length - 1);
+        __pyx_v_data_size = (__pyx_v_data_size + 1);
 
-    /* "clickhouse_driver/bufferedreader.pyx":214
- *             # Get last non zero byte of string from the end.
- *             j = length - 1
- *             while j >= 0 and not c_string[j]:             # <<<<<<<<<<<<<<
- *                 j -= 1
+        /* "clickhouse_driver/bufferedreader.pyx":368
+ *                     data_size += 1
  * 
+ *                     size |= (b & 0x7f) << shift             # <<<<<<<<<<<<<<
+ *                     if b < 0x80:
+ *                         break
  */
-    while (1) {
-      __pyx_t_12 = (__pyx_v_j >= 0);
-      if (__pyx_t_12) {
-      } else {
-        __pyx_t_1 = __pyx_t_12;
-        goto __pyx_L9_bool_binop_done;
-      }
-      __pyx_t_12 = (!((__pyx_v_c_string[__pyx_v_j]) != 0));
-      __pyx_t_1 = __pyx_t_12;
-      __pyx_L9_bool_binop_done:;
-      if (!__pyx_t_1) break;
+        __pyx_v_size = (__pyx_v_size | ((__pyx_v_b & 0x7f) << __pyx_v_shift));
 
-      /* "clickhouse_driver/bufferedreader.pyx":215
- *             j = length - 1
- *             while j >= 0 and not c_string[j]:
- *                 j -= 1             # <<<<<<<<<<<<<<
+        /* "clickhouse_driver/bufferedreader.pyx":369
+ * 
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:             # <<<<<<<<<<<<<<
+ *                         break
  * 
- *             try:
  */
-      __pyx_v_j = (__pyx_v_j - 1);
-    }
+        __pyx_t_2 = (__pyx_v_b < 0x80);
+        if (__pyx_t_2) {
 
-    /* "clickhouse_driver/bufferedreader.pyx":217
- *                 j -= 1
+          /* "clickhouse_driver/bufferedreader.pyx":370
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:
+ *                         break             # <<<<<<<<<<<<<<
  * 
- *             try:             # <<<<<<<<<<<<<<
- *                 item = c_string[:j + 1].decode(c_encoding)
- *             except UnicodeDecodeError:
+ *                     shift += 7
  */
-    {
-      __Pyx_PyThreadState_declare
-      __Pyx_PyThreadState_assign
-      __Pyx_ExceptionSave(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
-      __Pyx_XGOTREF(__pyx_t_13);
-      __Pyx_XGOTREF(__pyx_t_14);
-      __Pyx_XGOTREF(__pyx_t_15);
-      /*try:*/ {
+          goto __pyx_L12_break;
 
-        /* "clickhouse_driver/bufferedreader.pyx":218
+          /* "clickhouse_driver/bufferedreader.pyx":369
+ * 
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:             # <<<<<<<<<<<<<<
+ *                         break
  * 
- *             try:
- *                 item = c_string[:j + 1].decode(c_encoding)             # <<<<<<<<<<<<<<
- *             except UnicodeDecodeError:
- *                 item = PyBytes_FromStringAndSize(c_string, length)
  */
-        __pyx_t_2 = __Pyx_decode_c_string(__pyx_v_c_string, 0, (__pyx_v_j + 1), __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 218, __pyx_L11_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_2);
-        __pyx_t_2 = 0;
+        }
 
-        /* "clickhouse_driver/bufferedreader.pyx":217
- *                 j -= 1
+        /* "clickhouse_driver/bufferedreader.pyx":372
+ *                         break
  * 
- *             try:             # <<<<<<<<<<<<<<
- *                 item = c_string[:j + 1].decode(c_encoding)
- *             except UnicodeDecodeError:
+ *                     shift += 7             # <<<<<<<<<<<<<<
+ * 
+ *                 if data_size + size > data_capacity:
  */
+        __pyx_v_shift = (__pyx_v_shift + 7);
       }
-      __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-      goto __pyx_L18_try_end;
-      __pyx_L11_error:;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_L12_break:;
 
-      /* "clickhouse_driver/bufferedreader.pyx":219
- *             try:
- *                 item = c_string[:j + 1].decode(c_encoding)
- *             except UnicodeDecodeError:             # <<<<<<<<<<<<<<
- *                 item = PyBytes_FromStringAndSize(c_string, length)
- *             Py_INCREF(item)
+      /* "clickhouse_driver/bufferedreader.pyx":374
+ *                     shift += 7
+ * 
+ *                 if data_size + size > data_capacity:             # <<<<<<<<<<<<<<
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
  */
-      __pyx_t_7 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeDecodeError);
-      if (__pyx_t_7) {
-        __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
-        if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_5) < 0) __PYX_ERR(0, 219, __pyx_L13_except_error)
-        __Pyx_XGOTREF(__pyx_t_2);
-        __Pyx_XGOTREF(__pyx_t_3);
-        __Pyx_XGOTREF(__pyx_t_5);
+      __pyx_t_2 = ((__pyx_v_data_size + __pyx_v_size) > __pyx_v_data_capacity);
+      if (__pyx_t_2) {
 
-        /* "clickhouse_driver/bufferedreader.pyx":220
- *                 item = c_string[:j + 1].decode(c_encoding)
- *             except UnicodeDecodeError:
- *                 item = PyBytes_FromStringAndSize(c_string, length)             # <<<<<<<<<<<<<<
- *             Py_INCREF(item)
- *             PyTuple_SET_ITEM(items, i, item)
+        /* "clickhouse_driver/bufferedreader.pyx":375
+ * 
+ *                 if data_size + size > data_capacity:
+ *                     data_capacity = max(data_capacity * 2, data_size + size)             # <<<<<<<<<<<<<<
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:
+ */
+        __pyx_t_9 = (__pyx_v_data_size + __pyx_v_size);
+        __pyx_t_10 = (__pyx_v_data_capacity * 2);
+        __pyx_t_2 = (__pyx_t_9 > __pyx_t_10);
+        if (__pyx_t_2) {
+          __pyx_t_11 = __pyx_t_9;
+        } else {
+          __pyx_t_11 = __pyx_t_10;
+        }
+        __pyx_v_data_capacity = __pyx_t_11;
+
+        /* "clickhouse_driver/bufferedreader.pyx":376
+ *                 if data_size + size > data_capacity:
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)             # <<<<<<<<<<<<<<
+ *                     if new_data is NULL:
+ *                         raise MemoryError()
+ */
+        __pyx_v_new_data = ((char *)PyMem_Realloc(__pyx_v_data, __pyx_v_data_capacity));
+
+        /* "clickhouse_driver/bufferedreader.pyx":377
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                     data = new_data
+ */
+        __pyx_t_2 = (__pyx_v_new_data == NULL);
+        if (unlikely(__pyx_t_2)) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":378
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:
+ *                         raise MemoryError()             # <<<<<<<<<<<<<<
+ *                     data = new_data
+ * 
+ */
+          PyErr_NoMemory(); __PYX_ERR(0, 378, __pyx_L5_error)
+
+          /* "clickhouse_driver/bufferedreader.pyx":377
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
+ *                     if new_data is NULL:             # <<<<<<<<<<<<<<
+ *                         raise MemoryError()
+ *                     data = new_data
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":379
+ *                     if new_data is NULL:
+ *                         raise MemoryError()
+ *                     data = new_data             # <<<<<<<<<<<<<<
+ * 
+ *                 # String can be split between several buffers.
+ */
+        __pyx_v_data = __pyx_v_new_data;
+
+        /* "clickhouse_driver/bufferedreader.pyx":374
+ *                     shift += 7
+ * 
+ *                 if data_size + size > data_capacity:             # <<<<<<<<<<<<<<
+ *                     data_capacity = max(data_capacity * 2, data_size + size)
+ *                     new_data = <char *> PyMem_Realloc(data, data_capacity)
  */
-        __pyx_t_4 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_length); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 220, __pyx_L13_except_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        goto __pyx_L12_exception_handled;
       }
-      goto __pyx_L13_except_error;
 
-      /* "clickhouse_driver/bufferedreader.pyx":217
- *                 j -= 1
+      /* "clickhouse_driver/bufferedreader.pyx":382
  * 
- *             try:             # <<<<<<<<<<<<<<
- *                 item = c_string[:j + 1].decode(c_encoding)
- *             except UnicodeDecodeError:
+ *                 # String can be split between several buffers.
+ *                 while size > 0:             # <<<<<<<<<<<<<<
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()
  */
-      __pyx_L13_except_error:;
-      __Pyx_XGIVEREF(__pyx_t_13);
-      __Pyx_XGIVEREF(__pyx_t_14);
-      __Pyx_XGIVEREF(__pyx_t_15);
-      __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
-      goto __pyx_L1_error;
-      __pyx_L12_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_t_13);
-      __Pyx_XGIVEREF(__pyx_t_14);
-      __Pyx_XGIVEREF(__pyx_t_15);
-      __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
-      __pyx_L18_try_end:;
-    }
+      while (1) {
+        __pyx_t_2 = (__pyx_v_size > 0);
+        if (!__pyx_t_2) break;
+
+        /* "clickhouse_driver/bufferedreader.pyx":383
+ *                 # String can be split between several buffers.
+ *                 while size > 0:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+        __pyx_t_2 = (__pyx_v_self->position == __pyx_v_self->current_buffer_size);
+        if (__pyx_t_2) {
+
+          /* "clickhouse_driver/bufferedreader.pyx":384
+ *                 while size > 0:
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         self.position = 0
+ */
+          __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 384, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_7 = NULL;
+          __pyx_t_8 = 0;
+          #if CYTHON_UNPACK_METHODS
+          if (likely(PyMethod_Check(__pyx_t_6))) {
+            __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+            if (likely(__pyx_t_7)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+              __Pyx_INCREF(__pyx_t_7);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_6, function);
+              __pyx_t_8 = 1;
+            }
+          }
+          #endif
+          {
+            PyObject *__pyx_callargs[2] = {__pyx_t_7, NULL};
+            __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_8, 0+__pyx_t_8);
+            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+            if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_1);
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+          /* "clickhouse_driver/bufferedreader.pyx":385
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                         self.position = 0
+ * 
+ */
+          __pyx_t_1 = __pyx_v_self->buffer;
+          __Pyx_INCREF(__pyx_t_1);
+          __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":221
- *             except UnicodeDecodeError:
- *                 item = PyBytes_FromStringAndSize(c_string, length)
- *             Py_INCREF(item)             # <<<<<<<<<<<<<<
- *             PyTuple_SET_ITEM(items, i, item)
+          /* "clickhouse_driver/bufferedreader.pyx":386
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         self.position = 0             # <<<<<<<<<<<<<<
  * 
+ *                     chunk_size = min(
  */
-    Py_INCREF(__pyx_v_item);
+          __pyx_v_self->position = 0;
 
-    /* "clickhouse_driver/bufferedreader.pyx":222
- *                 item = PyBytes_FromStringAndSize(c_string, length)
- *             Py_INCREF(item)
- *             PyTuple_SET_ITEM(items, i, item)             # <<<<<<<<<<<<<<
+          /* "clickhouse_driver/bufferedreader.pyx":383
+ *                 # String can be split between several buffers.
+ *                 while size > 0:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+        }
+
+        /* "clickhouse_driver/bufferedreader.pyx":389
  * 
- *         PyMem_Free(c_string)
+ *                     chunk_size = min(
+ *                         size, self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
+ *                     )
+ *                     memcpy(&data[data_size], &buffer_ptr[self.position],
  */
-    PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_item);
-  }
+        __pyx_t_11 = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+        __pyx_t_9 = __pyx_v_size;
+        __pyx_t_2 = (__pyx_t_11 < __pyx_t_9);
+        if (__pyx_t_2) {
+          __pyx_t_10 = __pyx_t_11;
+        } else {
+          __pyx_t_10 = __pyx_t_9;
+        }
+        __pyx_v_chunk_size = __pyx_t_10;
 
-  /* "clickhouse_driver/bufferedreader.pyx":224
- *             PyTuple_SET_ITEM(items, i, item)
+        /* "clickhouse_driver/bufferedreader.pyx":391
+ *                         size, self.current_buffer_size - self.position
+ *                     )
+ *                     memcpy(&data[data_size], &buffer_ptr[self.position],             # <<<<<<<<<<<<<<
+ *                            chunk_size)
+ *                     self.position += chunk_size
+ */
+        (void)(memcpy((&(__pyx_v_data[__pyx_v_data_size])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_chunk_size));
+
+        /* "clickhouse_driver/bufferedreader.pyx":393
+ *                     memcpy(&data[data_size], &buffer_ptr[self.position],
+ *                            chunk_size)
+ *                     self.position += chunk_size             # <<<<<<<<<<<<<<
+ *                     data_size += chunk_size
+ *                     size -= chunk_size
+ */
+        __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_chunk_size);
+
+        /* "clickhouse_driver/bufferedreader.pyx":394
+ *                            chunk_size)
+ *                     self.position += chunk_size
+ *                     data_size += chunk_size             # <<<<<<<<<<<<<<
+ *                     size -= chunk_size
  * 
- *         PyMem_Free(c_string)             # <<<<<<<<<<<<<<
+ */
+        __pyx_v_data_size = (__pyx_v_data_size + __pyx_v_chunk_size);
+
+        /* "clickhouse_driver/bufferedreader.pyx":395
+ *                     self.position += chunk_size
+ *                     data_size += chunk_size
+ *                     size -= chunk_size             # <<<<<<<<<<<<<<
  * 
- *         return items
+ *             return PyBytes_FromStringAndSize(data, data_size)
  */
-  PyMem_Free(__pyx_v_c_string);
+        __pyx_v_size = (__pyx_v_size - __pyx_v_chunk_size);
+      }
+    }
 
-  /* "clickhouse_driver/bufferedreader.pyx":226
- *         PyMem_Free(c_string)
+    /* "clickhouse_driver/bufferedreader.pyx":397
+ *                     size -= chunk_size
  * 
- *         return items             # <<<<<<<<<<<<<<
+ *             return PyBytes_FromStringAndSize(data, data_size)             # <<<<<<<<<<<<<<
+ * 
+ *         finally:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_data, __pyx_v_data_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L4_return;
+  }
+
+  /* "clickhouse_driver/bufferedreader.pyx":400
  * 
+ *         finally:
+ *             PyMem_Free(data)             # <<<<<<<<<<<<<<
  * 
+ * cdef class BufferedSocketReader(BufferedReader):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_items);
-  __pyx_r = __pyx_v_items;
-  goto __pyx_L0;
+  /*finally:*/ {
+    __pyx_L5_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_17, &__pyx_t_18, &__pyx_t_19);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16) < 0)) __Pyx_ErrFetch(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __Pyx_XGOTREF(__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_18);
+      __Pyx_XGOTREF(__pyx_t_19);
+      __pyx_t_8 = __pyx_lineno; __pyx_t_12 = __pyx_clineno; __pyx_t_13 = __pyx_filename;
+      {
+        PyMem_Free(__pyx_v_data);
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_17);
+        __Pyx_XGIVEREF(__pyx_t_18);
+        __Pyx_XGIVEREF(__pyx_t_19);
+        __Pyx_ExceptionReset(__pyx_t_17, __pyx_t_18, __pyx_t_19);
+      }
+      __Pyx_XGIVEREF(__pyx_t_14);
+      __Pyx_XGIVEREF(__pyx_t_15);
+      __Pyx_XGIVEREF(__pyx_t_16);
+      __Pyx_ErrRestore(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+      __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+      __pyx_lineno = __pyx_t_8; __pyx_clineno = __pyx_t_12; __pyx_filename = __pyx_t_13;
+      goto __pyx_L1_error;
+    }
+    __pyx_L4_return: {
+      __pyx_t_19 = __pyx_r;
+      __pyx_r = 0;
+      PyMem_Free(__pyx_v_data);
+      __pyx_r = __pyx_t_19;
+      __pyx_t_19 = 0;
+      goto __pyx_L0;
+    }
+  }
 
-  /* "clickhouse_driver/bufferedreader.pyx":192
- *         return items
+  /* "clickhouse_driver/bufferedreader.pyx":327
  * 
- *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
- *                            encoding=None):
- *         if encoding is None:
+ * 
+ *     def read_strings_raw(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings as is: with varint sizes and without decoding.
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("clickhouse_driver.bufferedreader.BufferedReader.read_strings_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_data);
-  __Pyx_XDECREF(__pyx_v_items);
-  __Pyx_XDECREF(__pyx_v_item);
-  __Pyx_XDECREF(__pyx_v_encoding);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":11
+/* "clickhouse_driver/bufferedreader.pyx":14
  * 
  * cdef class BufferedReader(object):
  *     cdef public unsigned long long position, current_buffer_size             # <<<<<<<<<<<<<<
@@ -6627,7 +8615,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6665,7 +8653,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_8posit
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L1_error)
   __pyx_v_self->position = __pyx_t_1;
 
   /* function exit code */
@@ -6702,7 +8690,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->current_buffer_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->current_buffer_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6740,7 +8728,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_19curr
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L1_error)
   __pyx_v_self->current_buffer_size = __pyx_t_1;
 
   /* function exit code */
@@ -6753,7 +8741,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_19curr
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":12
+/* "clickhouse_driver/bufferedreader.pyx":15
  * cdef class BufferedReader(object):
  *     cdef public unsigned long long position, current_buffer_size
  *     cdef public bytearray buffer             # <<<<<<<<<<<<<<
@@ -6815,7 +8803,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6buffe
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 1);
-  if (!(likely(PyByteArray_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytearray", __pyx_v_value))) __PYX_ERR(0, 12, __pyx_L1_error)
+  if (!(likely(PyByteArray_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytearray", __pyx_v_value))) __PYX_ERR(0, 15, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -6874,15 +8862,15 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_6buffe
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -6907,14 +8895,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
-  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_14__reduce_cython__(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_20__reduce_cython__(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_14__reduce_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_20__reduce_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
   PyObject *__pyx_v_state = 0;
   PyObject *__pyx_v__dict = 0;
   int __pyx_v_use_setstate;
@@ -7144,15 +9132,15 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7226,7 +9214,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_16__setstate_cython__(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_22__setstate_cython__(((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v___pyx_state);
 
   /* function exit code */
   {
@@ -7239,7 +9227,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_16__setstate_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_22__setstate_cython__(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -7278,7 +9266,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_14BufferedReader_
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":232
+/* "clickhouse_driver/bufferedreader.pyx":405
  *     cdef object sock
  * 
  *     def __init__(self, sock, bufsize):             # <<<<<<<<<<<<<<
@@ -7325,7 +9313,7 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_
           (void)__Pyx_Arg_NewRef_VARARGS(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 232, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 405, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -7333,14 +9321,14 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_
           (void)__Pyx_Arg_NewRef_VARARGS(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 232, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 405, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 232, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 405, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 232, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 405, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -7353,7 +9341,7 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 232, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 405, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7392,7 +9380,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":233
+  /* "clickhouse_driver/bufferedreader.pyx":406
  * 
  *     def __init__(self, sock, bufsize):
  *         self.sock = sock             # <<<<<<<<<<<<<<
@@ -7405,25 +9393,25 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_
   __Pyx_DECREF(__pyx_v_self->sock);
   __pyx_v_self->sock = __pyx_v_sock;
 
-  /* "clickhouse_driver/bufferedreader.pyx":234
+  /* "clickhouse_driver/bufferedreader.pyx":407
  *     def __init__(self, sock, bufsize):
  *         self.sock = sock
  *         super(BufferedSocketReader, self).__init__(bufsize)             # <<<<<<<<<<<<<<
  * 
  *     def read_into_buffer(self):
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader);
   __Pyx_GIVEREF((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader))) __PYX_ERR(0, 234, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader))) __PYX_ERR(0, 407, __pyx_L1_error);
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_GIVEREF((PyObject *)__pyx_v_self);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 234, __pyx_L1_error);
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 234, __pyx_L1_error)
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 407, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 407, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -7444,13 +9432,13 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_
     PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_bufsize};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 407, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":232
+  /* "clickhouse_driver/bufferedreader.pyx":405
  *     cdef object sock
  * 
  *     def __init__(self, sock, bufsize):             # <<<<<<<<<<<<<<
@@ -7472,7 +9460,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":236
+/* "clickhouse_driver/bufferedreader.pyx":409
  *         super(BufferedSocketReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -7535,14 +9523,14 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketR
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_into_buffer", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":237
+  /* "clickhouse_driver/bufferedreader.pyx":410
  * 
  *     def read_into_buffer(self):
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)             # <<<<<<<<<<<<<<
  * 
  *         if self.current_buffer_size == 0:
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->sock, __pyx_n_s_recv_into); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->sock, __pyx_n_s_recv_into); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 410, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   __pyx_t_4 = 0;
@@ -7562,15 +9550,15 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketR
     PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_self->__pyx_base.buffer};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 410, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  __pyx_t_5 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_5 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_5 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 410, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_self->__pyx_base.current_buffer_size = __pyx_t_5;
 
-  /* "clickhouse_driver/bufferedreader.pyx":239
+  /* "clickhouse_driver/bufferedreader.pyx":412
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -7580,20 +9568,20 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketR
   __pyx_t_6 = (__pyx_v_self->__pyx_base.current_buffer_size == 0);
   if (unlikely(__pyx_t_6)) {
 
-    /* "clickhouse_driver/bufferedreader.pyx":240
+    /* "clickhouse_driver/bufferedreader.pyx":413
  * 
  *         if self.current_buffer_size == 0:
  *             raise EOFError('Unexpected EOF while reading bytes')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 240, __pyx_L1_error)
+    __PYX_ERR(0, 413, __pyx_L1_error)
 
-    /* "clickhouse_driver/bufferedreader.pyx":239
+    /* "clickhouse_driver/bufferedreader.pyx":412
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -7602,7 +9590,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketR
  */
   }
 
-  /* "clickhouse_driver/bufferedreader.pyx":236
+  /* "clickhouse_driver/bufferedreader.pyx":409
  *         super(BufferedSocketReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -8048,7 +10036,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_20BufferedSocketR
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":246
+/* "clickhouse_driver/bufferedreader.pyx":419
  *     cdef object read_block
  * 
  *     def __init__(self, read_block, bufsize):             # <<<<<<<<<<<<<<
@@ -8095,7 +10083,7 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_24CompressedBufferedRea
           (void)__Pyx_Arg_NewRef_VARARGS(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 419, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -8103,14 +10091,14 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_24CompressedBufferedRea
           (void)__Pyx_Arg_NewRef_VARARGS(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 419, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 419, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 246, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 419, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -8123,7 +10111,7 @@ static int __pyx_pw_17clickhouse_driver_14bufferedreader_24CompressedBufferedRea
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 246, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 419, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8162,7 +10150,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBufferedRea
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":247
+  /* "clickhouse_driver/bufferedreader.pyx":420
  * 
  *     def __init__(self, read_block, bufsize):
  *         self.read_block = read_block             # <<<<<<<<<<<<<<
@@ -8175,25 +10163,25 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBufferedRea
   __Pyx_DECREF(__pyx_v_self->read_block);
   __pyx_v_self->read_block = __pyx_v_read_block;
 
-  /* "clickhouse_driver/bufferedreader.pyx":248
+  /* "clickhouse_driver/bufferedreader.pyx":421
  *     def __init__(self, read_block, bufsize):
  *         self.read_block = read_block
  *         super(CompressedBufferedReader, self).__init__(bufsize)             # <<<<<<<<<<<<<<
  * 
  *     def read_into_buffer(self):
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 421, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader);
   __Pyx_GIVEREF((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader))) __PYX_ERR(0, 248, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader))) __PYX_ERR(0, 421, __pyx_L1_error);
   __Pyx_INCREF((PyObject *)__pyx_v_self);
   __Pyx_GIVEREF((PyObject *)__pyx_v_self);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 248, __pyx_L1_error);
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 248, __pyx_L1_error)
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self))) __PYX_ERR(0, 421, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 421, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 421, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -8214,13 +10202,13 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBufferedRea
     PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_bufsize};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 421, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":246
+  /* "clickhouse_driver/bufferedreader.pyx":419
  *     cdef object read_block
  * 
  *     def __init__(self, read_block, bufsize):             # <<<<<<<<<<<<<<
@@ -8242,7 +10230,7 @@ static int __pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBufferedRea
   return __pyx_r;
 }
 
-/* "clickhouse_driver/bufferedreader.pyx":250
+/* "clickhouse_driver/bufferedreader.pyx":423
  *         super(CompressedBufferedReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -8305,7 +10293,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBuffe
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_into_buffer", 1);
 
-  /* "clickhouse_driver/bufferedreader.pyx":251
+  /* "clickhouse_driver/bufferedreader.pyx":424
  * 
  *     def read_into_buffer(self):
  *         self.buffer = bytearray(self.read_block())             # <<<<<<<<<<<<<<
@@ -8331,11 +10319,11 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBuffe
     PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 0+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 424, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 424, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_GIVEREF(__pyx_t_2);
@@ -8344,7 +10332,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBuffe
   __pyx_v_self->__pyx_base.buffer = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "clickhouse_driver/bufferedreader.pyx":252
+  /* "clickhouse_driver/bufferedreader.pyx":425
  *     def read_into_buffer(self):
  *         self.buffer = bytearray(self.read_block())
  *         self.current_buffer_size = len(self.buffer)             # <<<<<<<<<<<<<<
@@ -8355,13 +10343,13 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBuffe
   __Pyx_INCREF(__pyx_t_2);
   if (unlikely(__pyx_t_2 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 252, __pyx_L1_error)
+    __PYX_ERR(0, 425, __pyx_L1_error)
   }
-  __pyx_t_5 = __Pyx_PyByteArray_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 252, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyByteArray_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 425, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_self->__pyx_base.current_buffer_size = __pyx_t_5;
 
-  /* "clickhouse_driver/bufferedreader.pyx":254
+  /* "clickhouse_driver/bufferedreader.pyx":427
  *         self.current_buffer_size = len(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -8370,18 +10358,18 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBuffe
   __pyx_t_6 = (__pyx_v_self->__pyx_base.current_buffer_size == 0);
   if (unlikely(__pyx_t_6)) {
 
-    /* "clickhouse_driver/bufferedreader.pyx":255
+    /* "clickhouse_driver/bufferedreader.pyx":428
  * 
  *         if self.current_buffer_size == 0:
  *             raise EOFError('Unexpected EOF while reading bytes')             # <<<<<<<<<<<<<<
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 428, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 255, __pyx_L1_error)
+    __PYX_ERR(0, 428, __pyx_L1_error)
 
-    /* "clickhouse_driver/bufferedreader.pyx":254
+    /* "clickhouse_driver/bufferedreader.pyx":427
  *         self.current_buffer_size = len(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -8389,7 +10377,7 @@ static PyObject *__pyx_pf_17clickhouse_driver_14bufferedreader_24CompressedBuffe
  */
   }
 
-  /* "clickhouse_driver/bufferedreader.pyx":250
+  /* "clickhouse_driver/bufferedreader.pyx":423
  *         super(CompressedBufferedReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -10245,6 +12233,7 @@ static PyObject *__pyx_f_17clickhouse_driver_14bufferedreader___pyx_unpickle_Com
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+static struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader __pyx_vtable_17clickhouse_driver_14bufferedreader_BufferedReader;
 
 static PyObject *__pyx_tp_new_17clickhouse_driver_14bufferedreader_BufferedReader(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *p;
@@ -10261,6 +12250,7 @@ static PyObject *__pyx_tp_new_17clickhouse_driver_14bufferedreader_BufferedReade
   if (unlikely(!o)) return 0;
   #endif
   p = ((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *)o);
+  p->__pyx_vtab = __pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedReader;
   p->buffer = ((PyObject*)Py_None); Py_INCREF(Py_None);
   return o;
 }
@@ -10329,12 +12319,15 @@ static int __pyx_setprop_17clickhouse_driver_14bufferedreader_14BufferedReader_b
 static PyMethodDef __pyx_methods_17clickhouse_driver_14bufferedreader_BufferedReader[] = {
   {"read_into_buffer", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_3read_into_buffer, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {"read", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_5read, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"read_one", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7read_one, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"read_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_8read_strings},
-  {"read_fixed_strings_as_bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"read_fixed_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"readinto", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_7readinto, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_6readinto},
+  {"read_one", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_one, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"read_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_10read_strings},
+  {"read_fixed_strings_as_bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings_as_bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"read_fixed_strings", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_15read_fixed_strings, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"read_strings_buffers", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_17read_strings_buffers, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_16read_strings_buffers},
+  {"read_strings_raw", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_19read_strings_raw, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_17clickhouse_driver_14bufferedreader_14BufferedReader_18read_strings_raw},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_17clickhouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {0, 0, 0, 0}
 };
 
@@ -10443,12 +12436,14 @@ static PyTypeObject __pyx_type_17clickhouse_driver_14bufferedreader_BufferedRead
   #endif
 };
 #endif
+static struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedSocketReader __pyx_vtable_17clickhouse_driver_14bufferedreader_BufferedSocketReader;
 
 static PyObject *__pyx_tp_new_17clickhouse_driver_14bufferedreader_BufferedSocketReader(PyTypeObject *t, PyObject *a, PyObject *k) {
   struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedSocketReader *p;
   PyObject *o = __pyx_tp_new_17clickhouse_driver_14bufferedreader_BufferedReader(t, a, k);
   if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedSocketReader *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader*)__pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedSocketReader;
   p->sock = Py_None; Py_INCREF(Py_None);
   return o;
 }
@@ -10593,12 +12588,14 @@ static PyTypeObject __pyx_type_17clickhouse_driver_14bufferedreader_BufferedSock
   #endif
 };
 #endif
+static struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_CompressedBufferedReader __pyx_vtable_17clickhouse_driver_14bufferedreader_CompressedBufferedReader;
 
 static PyObject *__pyx_tp_new_17clickhouse_driver_14bufferedreader_CompressedBufferedReader(PyTypeObject *t, PyObject *a, PyObject *k) {
   struct __pyx_obj_17clickhouse_driver_14bufferedreader_CompressedBufferedReader *p;
   PyObject *o = __pyx_tp_new_17clickhouse_driver_14bufferedreader_BufferedReader(t, a, k);
   if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_17clickhouse_driver_14bufferedreader_CompressedBufferedReader *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_17clickhouse_driver_14bufferedreader_BufferedReader*)__pyx_vtabptr_17clickhouse_driver_14bufferedreader_CompressedBufferedReader;
   p->read_block = Py_None; Py_INCREF(Py_None);
   return o;
 }
@@ -10769,6 +12766,9 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_BufferedReader_read_into_buffer, __pyx_k_BufferedReader_read_into_buffer, sizeof(__pyx_k_BufferedReader_read_into_buffer), 0, 0, 1, 1},
     {&__pyx_n_s_BufferedReader_read_one, __pyx_k_BufferedReader_read_one, sizeof(__pyx_k_BufferedReader_read_one), 0, 0, 1, 1},
     {&__pyx_n_s_BufferedReader_read_strings, __pyx_k_BufferedReader_read_strings, sizeof(__pyx_k_BufferedReader_read_strings), 0, 0, 1, 1},
+    {&__pyx_n_s_BufferedReader_read_strings_buff, __pyx_k_BufferedReader_read_strings_buff, sizeof(__pyx_k_BufferedReader_read_strings_buff), 0, 0, 1, 1},
+    {&__pyx_n_s_BufferedReader_read_strings_raw, __pyx_k_BufferedReader_read_strings_raw, sizeof(__pyx_k_BufferedReader_read_strings_raw), 0, 0, 1, 1},
+    {&__pyx_n_s_BufferedReader_readinto, __pyx_k_BufferedReader_readinto, sizeof(__pyx_k_BufferedReader_readinto), 0, 0, 1, 1},
     {&__pyx_n_s_BufferedSocketReader, __pyx_k_BufferedSocketReader, sizeof(__pyx_k_BufferedSocketReader), 0, 0, 1, 1},
     {&__pyx_n_s_BufferedSocketReader___reduce_cy, __pyx_k_BufferedSocketReader___reduce_cy, sizeof(__pyx_k_BufferedSocketReader___reduce_cy), 0, 0, 1, 1},
     {&__pyx_n_s_BufferedSocketReader___setstate, __pyx_k_BufferedSocketReader___setstate, sizeof(__pyx_k_BufferedSocketReader___setstate), 0, 0, 1, 1},
@@ -10787,7 +12787,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_u_Unexpected_EOF_while_reading_byt, __pyx_k_Unexpected_EOF_while_reading_byt, sizeof(__pyx_k_Unexpected_EOF_while_reading_byt), 0, 1, 0, 0},
     {&__pyx_n_s_UnicodeDecodeError, __pyx_k_UnicodeDecodeError, sizeof(__pyx_k_UnicodeDecodeError), 0, 0, 1, 1},
     {&__pyx_kp_u__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0, 0},
-    {&__pyx_n_s__33, __pyx_k__33, sizeof(__pyx_k__33), 0, 0, 1, 1},
+    {&__pyx_n_s__39, __pyx_k__39, sizeof(__pyx_k__39), 0, 0, 1, 1},
     {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
     {&__pyx_n_s_b, __pyx_k_b, sizeof(__pyx_k_b), 0, 0, 1, 1},
     {&__pyx_n_s_buffer_ptr, __pyx_k_buffer_ptr, sizeof(__pyx_k_buffer_ptr), 0, 0, 1, 1},
@@ -10796,11 +12796,14 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_c_encoding, __pyx_k_c_encoding, sizeof(__pyx_k_c_encoding), 0, 0, 1, 1},
     {&__pyx_n_s_c_string, __pyx_k_c_string, sizeof(__pyx_k_c_string), 0, 0, 1, 1},
     {&__pyx_n_s_c_string_size, __pyx_k_c_string_size, sizeof(__pyx_k_c_string_size), 0, 0, 1, 1},
+    {&__pyx_n_s_chunk_size, __pyx_k_chunk_size, sizeof(__pyx_k_chunk_size), 0, 0, 1, 1},
     {&__pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_k_clickhouse_driver_bufferedreader, sizeof(__pyx_k_clickhouse_driver_bufferedreader), 0, 0, 1, 0},
     {&__pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_k_clickhouse_driver_bufferedreader_2, sizeof(__pyx_k_clickhouse_driver_bufferedreader_2), 0, 0, 1, 1},
     {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
     {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+    {&__pyx_n_s_data_capacity, __pyx_k_data_capacity, sizeof(__pyx_k_data_capacity), 0, 0, 1, 1},
     {&__pyx_n_s_data_ptr, __pyx_k_data_ptr, sizeof(__pyx_k_data_ptr), 0, 0, 1, 1},
+    {&__pyx_n_s_data_size, __pyx_k_data_size, sizeof(__pyx_k_data_size), 0, 0, 1, 1},
     {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
     {&__pyx_n_s_dict_2, __pyx_k_dict_2, sizeof(__pyx_k_dict_2), 0, 0, 1, 1},
     {&__pyx_kp_u_disable, __pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0, 0},
@@ -10822,8 +12825,12 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_n_items, __pyx_k_n_items, sizeof(__pyx_k_n_items), 0, 0, 1, 1},
     {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
     {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+    {&__pyx_n_s_new_data, __pyx_k_new_data, sizeof(__pyx_k_new_data), 0, 0, 1, 1},
     {&__pyx_n_s_next_position, __pyx_k_next_position, sizeof(__pyx_k_next_position), 0, 0, 1, 1},
     {&__pyx_n_s_object, __pyx_k_object, sizeof(__pyx_k_object), 0, 0, 1, 1},
+    {&__pyx_n_s_offsets, __pyx_k_offsets, sizeof(__pyx_k_offsets), 0, 0, 1, 1},
+    {&__pyx_n_s_offsets_ptr, __pyx_k_offsets_ptr, sizeof(__pyx_k_offsets_ptr), 0, 0, 1, 1},
+    {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
     {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
@@ -10833,15 +12840,18 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_pyx_unpickle_BufferedReader, __pyx_k_pyx_unpickle_BufferedReader, sizeof(__pyx_k_pyx_unpickle_BufferedReader), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_unpickle_BufferedSocketRea, __pyx_k_pyx_unpickle_BufferedSocketRea, sizeof(__pyx_k_pyx_unpickle_BufferedSocketRea), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_unpickle_CompressedBuffere, __pyx_k_pyx_unpickle_CompressedBuffere, sizeof(__pyx_k_pyx_unpickle_CompressedBuffere), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
     {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
     {&__pyx_n_s_read, __pyx_k_read, sizeof(__pyx_k_read), 0, 0, 1, 1},
     {&__pyx_n_s_read_block, __pyx_k_read_block, sizeof(__pyx_k_read_block), 0, 0, 1, 1},
-    {&__pyx_n_s_read_bytes, __pyx_k_read_bytes, sizeof(__pyx_k_read_bytes), 0, 0, 1, 1},
     {&__pyx_n_s_read_fixed_strings, __pyx_k_read_fixed_strings, sizeof(__pyx_k_read_fixed_strings), 0, 0, 1, 1},
     {&__pyx_n_s_read_fixed_strings_as_bytes, __pyx_k_read_fixed_strings_as_bytes, sizeof(__pyx_k_read_fixed_strings_as_bytes), 0, 0, 1, 1},
     {&__pyx_n_s_read_into_buffer, __pyx_k_read_into_buffer, sizeof(__pyx_k_read_into_buffer), 0, 0, 1, 1},
     {&__pyx_n_s_read_one, __pyx_k_read_one, sizeof(__pyx_k_read_one), 0, 0, 1, 1},
     {&__pyx_n_s_read_strings, __pyx_k_read_strings, sizeof(__pyx_k_read_strings), 0, 0, 1, 1},
+    {&__pyx_n_s_read_strings_buffers, __pyx_k_read_strings_buffers, sizeof(__pyx_k_read_strings_buffers), 0, 0, 1, 1},
+    {&__pyx_n_s_read_strings_raw, __pyx_k_read_strings_raw, sizeof(__pyx_k_read_strings_raw), 0, 0, 1, 1},
+    {&__pyx_n_s_readinto, __pyx_k_readinto, sizeof(__pyx_k_readinto), 0, 0, 1, 1},
     {&__pyx_n_s_recv_into, __pyx_k_recv_into, sizeof(__pyx_k_recv_into), 0, 0, 1, 1},
     {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
@@ -10857,25 +12867,25 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_state, __pyx_k_state, sizeof(__pyx_k_state), 0, 0, 1, 1},
     {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
     {&__pyx_n_s_super, __pyx_k_super, sizeof(__pyx_k_super), 0, 0, 1, 1},
-    {&__pyx_n_s_t, __pyx_k_t, sizeof(__pyx_k_t), 0, 0, 1, 1},
     {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
     {&__pyx_n_s_unread, __pyx_k_unread, sizeof(__pyx_k_unread), 0, 0, 1, 1},
     {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
     {&__pyx_n_s_use_setstate, __pyx_k_use_setstate, sizeof(__pyx_k_use_setstate), 0, 0, 1, 1},
     {&__pyx_kp_u_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 1, 0, 0},
+    {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
     {0, 0, 0, 0, 0, 0, 0}
   };
   return __Pyx_InitStrings(__pyx_string_tab);
 }
 /* #### Code section: cached_builtins ### */
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 20, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 23, __pyx_L1_error)
-  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_n_s_object); if (!__pyx_builtin_object) __PYX_ERR(0, 85, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 90, __pyx_L1_error)
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 117, __pyx_L1_error)
-  __pyx_builtin_UnicodeDecodeError = __Pyx_GetBuiltinName(__pyx_n_s_UnicodeDecodeError); if (!__pyx_builtin_UnicodeDecodeError) __PYX_ERR(0, 168, __pyx_L1_error)
-  __pyx_builtin_EOFError = __Pyx_GetBuiltinName(__pyx_n_s_EOFError); if (!__pyx_builtin_EOFError) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_n_s_object); if (!__pyx_builtin_object) __PYX_ERR(0, 108, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 113, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_builtin_UnicodeDecodeError = __Pyx_GetBuiltinName(__pyx_n_s_UnicodeDecodeError); if (!__pyx_builtin_UnicodeDecodeError) __PYX_ERR(0, 191, __pyx_L1_error)
+  __pyx_builtin_EOFError = __Pyx_GetBuiltinName(__pyx_n_s_EOFError); if (!__pyx_builtin_EOFError) __PYX_ERR(0, 413, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -10886,14 +12896,14 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "clickhouse_driver/bufferedreader.pyx":240
+  /* "clickhouse_driver/bufferedreader.pyx":413
  * 
  *         if self.current_buffer_size == 0:
  *             raise EOFError('Unexpected EOF while reading bytes')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Unexpected_EOF_while_reading_byt); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Unexpected_EOF_while_reading_byt); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 413, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
@@ -10914,90 +12924,126 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
-  /* "clickhouse_driver/bufferedreader.pyx":22
+  /* "clickhouse_driver/bufferedreader.pyx":25
  *         super(BufferedReader, self).__init__()
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
  *         raise NotImplementedError
  * 
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
-  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_into_buffer, 22, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_into_buffer, 25, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 25, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":25
+  /* "clickhouse_driver/bufferedreader.pyx":28
  *         raise NotImplementedError
  * 
  *     def read(self, unsigned long long unread):             # <<<<<<<<<<<<<<
  *         # When the buffer is large enough bytes read are almost
  *         # always hit the buffer.
  */
-  __pyx_tuple__8 = PyTuple_Pack(7, __pyx_n_s_self, __pyx_n_s_unread, __pyx_n_s_next_position, __pyx_n_s_t, __pyx_n_s_buffer_ptr, __pyx_n_s_read_bytes, __pyx_n_s_rv); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __pyx_tuple__8 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_unread, __pyx_n_s_next_position, __pyx_n_s_buffer_ptr, __pyx_n_s_rv); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 28, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
-  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read, 25, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read, 28, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 28, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":53
+  /* "clickhouse_driver/bufferedreader.pyx":42
  *         return rv
  * 
+ *     def readinto(self, out):             # <<<<<<<<<<<<<<
+ *         """
+ *         Fills writable buffer with next bytes. Unlike :meth:`read` there is
+ */
+  __pyx_tuple__10 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_out, __pyx_n_s_view); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_readinto, 42, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 42, __pyx_L1_error)
+
+  /* "clickhouse_driver/bufferedreader.pyx":76
+ *             unread -= read_bytes
+ * 
  *     def read_one(self):             # <<<<<<<<<<<<<<
  *         if self.position == self.current_buffer_size:
  *             self.read_into_buffer()
  */
-  __pyx_tuple__10 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_rv); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 53, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
-  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_one, 53, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_tuple__12 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_rv); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_one, 76, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 76, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":62
+  /* "clickhouse_driver/bufferedreader.pyx":85
  *         return rv
  * 
  *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
  *         """
  *         Python has great overhead between function calls.
  */
-  __pyx_tuple__12 = PyTuple_Pack(15, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_encoding, __pyx_n_s_items, __pyx_n_s_i, __pyx_n_s_buffer_ptr, __pyx_n_s_right, __pyx_n_s_size, __pyx_n_s_shift, __pyx_n_s_bytes_read, __pyx_n_s_b, __pyx_n_s_c_string, __pyx_n_s_c_string_size, __pyx_n_s_c_encoding, __pyx_n_s_rv); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 62, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 15, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_strings, 62, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 62, __pyx_L1_error)
-  __pyx_tuple__14 = PyTuple_Pack(1, Py_None); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __pyx_tuple__14 = PyTuple_Pack(15, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_encoding, __pyx_n_s_items, __pyx_n_s_i, __pyx_n_s_buffer_ptr, __pyx_n_s_right, __pyx_n_s_size, __pyx_n_s_shift, __pyx_n_s_bytes_read, __pyx_n_s_b, __pyx_n_s_c_string, __pyx_n_s_c_string_size, __pyx_n_s_c_encoding, __pyx_n_s_rv); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__14);
   __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 15, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_strings, 85, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_tuple__16 = PyTuple_Pack(1, Py_None); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
 
-  /* "clickhouse_driver/bufferedreader.pyx":179
+  /* "clickhouse_driver/bufferedreader.pyx":202
  *         return items
  * 
  *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
  *                                     Py_ssize_t length):
  *         cdef Py_ssize_t i
  */
-  __pyx_tuple__15 = PyTuple_Pack(8, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_length, __pyx_n_s_i, __pyx_n_s_data, __pyx_n_s_data_ptr, __pyx_n_s_items, __pyx_n_s_item); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 179, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_fixed_strings_as_bytes, 179, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __pyx_tuple__17 = PyTuple_Pack(8, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_length, __pyx_n_s_i, __pyx_n_s_data, __pyx_n_s_data_ptr, __pyx_n_s_items, __pyx_n_s_item); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_fixed_strings_as_bytes, 202, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 202, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":192
+  /* "clickhouse_driver/bufferedreader.pyx":215
  *         return items
  * 
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
  *                            encoding=None):
  *         if encoding is None:
  */
-  __pyx_tuple__17 = PyTuple_Pack(12, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_length, __pyx_n_s_encoding, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_c_encoding, __pyx_n_s_data, __pyx_n_s_data_ptr, __pyx_n_s_c_string, __pyx_n_s_items, __pyx_n_s_item); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 192, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
-  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_fixed_strings, 192, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __pyx_tuple__19 = PyTuple_Pack(12, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_length, __pyx_n_s_encoding, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_c_encoding, __pyx_n_s_data, __pyx_n_s_data_ptr, __pyx_n_s_c_string, __pyx_n_s_items, __pyx_n_s_item); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_fixed_strings, 215, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 215, __pyx_L1_error)
+
+  /* "clickhouse_driver/bufferedreader.pyx":251
+ *         return items
+ * 
+ *     def read_strings_buffers(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings into Arrow-compatible buffers without creating
+ */
+  __pyx_tuple__21 = PyTuple_Pack(14, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_offsets, __pyx_n_s_offsets_ptr, __pyx_n_s_i, __pyx_n_s_buffer_ptr, __pyx_n_s_size, __pyx_n_s_shift, __pyx_n_s_b, __pyx_n_s_chunk_size, __pyx_n_s_data_size, __pyx_n_s_data_capacity, __pyx_n_s_data, __pyx_n_s_new_data); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 14, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_strings_buffers, 251, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 251, __pyx_L1_error)
+
+  /* "clickhouse_driver/bufferedreader.pyx":327
+ * 
+ * 
+ *     def read_strings_raw(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings as is: with varint sizes and without decoding.
+ */
+  __pyx_tuple__23 = PyTuple_Pack(12, __pyx_n_s_self, __pyx_n_s_n_items, __pyx_n_s_i, __pyx_n_s_buffer_ptr, __pyx_n_s_size, __pyx_n_s_shift, __pyx_n_s_b, __pyx_n_s_chunk_size, __pyx_n_s_data_size, __pyx_n_s_data_capacity, __pyx_n_s_data, __pyx_n_s_new_data); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 327, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_strings_raw, 327, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 327, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_tuple__19 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_state, __pyx_n_s_dict_2, __pyx_n_s_use_setstate); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
-  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_tuple__25 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_state, __pyx_n_s_dict_2, __pyx_n_s_use_setstate); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(2, 1, __pyx_L1_error)
 
   /* "(tree fragment)":16
  *     else:
@@ -11005,26 +13051,26 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedReader__set_state(self, __pyx_state)
  */
-  __pyx_tuple__21 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(2, 16, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__21);
-  __Pyx_GIVEREF(__pyx_tuple__21);
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __pyx_tuple__27 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(2, 16, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":236
+  /* "clickhouse_driver/bufferedreader.pyx":409
  *         super(BufferedSocketReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)
  * 
  */
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_into_buffer, 236, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_into_buffer, 409, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 409, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(2, 1, __pyx_L1_error)
 
   /* "(tree fragment)":16
  *     else:
@@ -11032,23 +13078,23 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedSocketReader__set_state(self, __pyx_state)
  */
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(2, 16, __pyx_L1_error)
 
-  /* "clickhouse_driver/bufferedreader.pyx":250
+  /* "clickhouse_driver/bufferedreader.pyx":423
  *         super(CompressedBufferedReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
  *         self.buffer = bytearray(self.read_block())
  *         self.current_buffer_size = len(self.buffer)
  */
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_into_buffer, 250, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_clickhouse_driver_bufferedreader, __pyx_n_s_read_into_buffer, 423, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 423, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(2, 1, __pyx_L1_error)
 
   /* "(tree fragment)":16
  *     else:
@@ -11056,19 +13102,19 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_CompressedBufferedReader__set_state(self, __pyx_state)
  */
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(2, 16, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_BufferedReader(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__29 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedReader, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedSocketRea, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_CompressedBuffere, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_tuple__35 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedReader, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedSocketRea, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_CompressedBuffere, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -11139,16 +13185,18 @@ static int __Pyx_modinit_type_init_code(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
+  __pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedReader = &__pyx_vtable_17clickhouse_driver_14bufferedreader_BufferedReader;
+  __pyx_vtable_17clickhouse_driver_14bufferedreader_BufferedReader.copy_into = (PyObject *(*)(struct __pyx_obj_17clickhouse_driver_14bufferedreader_BufferedReader *, char *, unsigned PY_LONG_LONG))__pyx_f_17clickhouse_driver_14bufferedreader_14BufferedReader_copy_into;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_17clickhouse_driver_14bufferedreader_BufferedReader_spec, NULL); if (unlikely(!__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader)) __PYX_ERR(0, 10, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_17clickhouse_driver_14bufferedreader_BufferedReader_spec, __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_17clickhouse_driver_14bufferedreader_BufferedReader_spec, NULL); if (unlikely(!__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader)) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_17clickhouse_driver_14bufferedreader_BufferedReader_spec, __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
   #else
   __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader = &__pyx_type_17clickhouse_driver_14bufferedreader_BufferedReader;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader->tp_print = 0;
@@ -11158,17 +13206,23 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader->tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedReader, (PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_MergeVtables(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedReader, (PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
   #endif
+  __pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedSocketReader = &__pyx_vtable_17clickhouse_driver_14bufferedreader_BufferedSocketReader;
+  __pyx_vtable_17clickhouse_driver_14bufferedreader_BufferedSocketReader.__pyx_base = *__pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedReader;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 402, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_17clickhouse_driver_14bufferedreader_BufferedSocketReader_spec, __pyx_t_1);
   __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader)) __PYX_ERR(0, 229, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_17clickhouse_driver_14bufferedreader_BufferedSocketReader_spec, __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (unlikely(!__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader)) __PYX_ERR(0, 402, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_17clickhouse_driver_14bufferedreader_BufferedSocketReader_spec, __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 402, __pyx_L1_error)
   #else
   __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader = &__pyx_type_17clickhouse_driver_14bufferedreader_BufferedSocketReader;
   #endif
@@ -11176,7 +13230,7 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader->tp_base = __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader;
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 402, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader->tp_print = 0;
@@ -11186,17 +13240,23 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader->tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedSocketReader, (PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader, __pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 402, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_MergeVtables(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 402, __pyx_L1_error)
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedSocketReader, (PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 402, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 402, __pyx_L1_error)
   #endif
+  __pyx_vtabptr_17clickhouse_driver_14bufferedreader_CompressedBufferedReader = &__pyx_vtable_17clickhouse_driver_14bufferedreader_CompressedBufferedReader;
+  __pyx_vtable_17clickhouse_driver_14bufferedreader_CompressedBufferedReader.__pyx_base = *__pyx_vtabptr_17clickhouse_driver_14bufferedreader_BufferedReader;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 243, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 416, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_17clickhouse_driver_14bufferedreader_CompressedBufferedReader_spec, __pyx_t_1);
   __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader)) __PYX_ERR(0, 243, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_17clickhouse_driver_14bufferedreader_CompressedBufferedReader_spec, __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  if (unlikely(!__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader)) __PYX_ERR(0, 416, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_17clickhouse_driver_14bufferedreader_CompressedBufferedReader_spec, __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 416, __pyx_L1_error)
   #else
   __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader = &__pyx_type_17clickhouse_driver_14bufferedreader_CompressedBufferedReader;
   #endif
@@ -11204,7 +13264,7 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader->tp_base = __pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader;
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 416, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader->tp_print = 0;
@@ -11214,9 +13274,13 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader->tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CompressedBufferedReader, (PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader, __pyx_vtabptr_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 416, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_MergeVtables(__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 416, __pyx_L1_error)
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CompressedBufferedReader, (PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 416, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 416, __pyx_L1_error)
   #endif
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -11556,83 +13620,122 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "clickhouse_driver/bufferedreader.pyx":22
+  /* "clickhouse_driver/bufferedreader.pyx":25
  *         super(BufferedReader, self).__init__()
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
  *         raise NotImplementedError
  * 
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_3read_into_buffer, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_into_buffer, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_3read_into_buffer, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_into_buffer, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_into_buffer, __pyx_t_2) < 0) __PYX_ERR(0, 22, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_into_buffer, __pyx_t_2) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
 
-  /* "clickhouse_driver/bufferedreader.pyx":25
+  /* "clickhouse_driver/bufferedreader.pyx":28
  *         raise NotImplementedError
  * 
  *     def read(self, unsigned long long unread):             # <<<<<<<<<<<<<<
  *         # When the buffer is large enough bytes read are almost
  *         # always hit the buffer.
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_5read, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_5read, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 28, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read, __pyx_t_2) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read, __pyx_t_2) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
 
-  /* "clickhouse_driver/bufferedreader.pyx":53
+  /* "clickhouse_driver/bufferedreader.pyx":42
  *         return rv
  * 
+ *     def readinto(self, out):             # <<<<<<<<<<<<<<
+ *         """
+ *         Fills writable buffer with next bytes. Unlike :meth:`read` there is
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_7readinto, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_readinto, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_readinto, __pyx_t_2) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
+
+  /* "clickhouse_driver/bufferedreader.pyx":76
+ *             unread -= read_bytes
+ * 
  *     def read_one(self):             # <<<<<<<<<<<<<<
  *         if self.position == self.current_buffer_size:
  *             self.read_into_buffer()
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_7read_one, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_one, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__11)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_one, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_one, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_one, __pyx_t_2) < 0) __PYX_ERR(0, 53, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_one, __pyx_t_2) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
 
-  /* "clickhouse_driver/bufferedreader.pyx":62
+  /* "clickhouse_driver/bufferedreader.pyx":85
  *         return rv
  * 
  *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
  *         """
  *         Python has great overhead between function calls.
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_9read_strings, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_strings, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__13)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_strings, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_strings, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__15)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__14);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_strings, __pyx_t_2) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__16);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_strings, __pyx_t_2) < 0) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
 
-  /* "clickhouse_driver/bufferedreader.pyx":179
+  /* "clickhouse_driver/bufferedreader.pyx":202
  *         return items
  * 
  *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
  *                                     Py_ssize_t length):
  *         cdef Py_ssize_t i
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_fixed_string, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings_as_bytes, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_fixed_string, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 202, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_fixed_strings_as_bytes, __pyx_t_2) < 0) __PYX_ERR(0, 179, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_fixed_strings_as_bytes, __pyx_t_2) < 0) __PYX_ERR(0, 202, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
 
-  /* "clickhouse_driver/bufferedreader.pyx":192
+  /* "clickhouse_driver/bufferedreader.pyx":215
  *         return items
  * 
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
  *                            encoding=None):
  *         if encoding is None:
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_fixed_string_2, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_15read_fixed_strings, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_fixed_string_2, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__16);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_fixed_strings, __pyx_t_2) < 0) __PYX_ERR(0, 215, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
+
+  /* "clickhouse_driver/bufferedreader.pyx":251
+ *         return items
+ * 
+ *     def read_strings_buffers(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings into Arrow-compatible buffers without creating
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_17read_strings_buffers, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_strings_buff, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_strings_buffers, __pyx_t_2) < 0) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
+
+  /* "clickhouse_driver/bufferedreader.pyx":327
+ * 
+ * 
+ *     def read_strings_raw(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads strings as is: with varint sizes and without decoding.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_19read_strings_raw, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader_read_strings_raw, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 327, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__14);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_fixed_strings, __pyx_t_2) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_read_strings_raw, __pyx_t_2) < 0) __PYX_ERR(0, 327, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
 
@@ -11641,7 +13744,7 @@ if (!__Pyx_RefNanny) {
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader___reduce_cython, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader___reduce_cython, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -11653,22 +13756,22 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedReader__set_state(self, __pyx_state)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader___setstate_cython, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedReader___setstate_cython, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(2, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedReader);
 
-  /* "clickhouse_driver/bufferedreader.pyx":236
+  /* "clickhouse_driver/bufferedreader.pyx":409
  *         super(BufferedSocketReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)
  * 
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_3read_into_buffer, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedSocketReader_read_into_b, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_3read_into_buffer, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedSocketReader_read_into_b, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 409, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader, __pyx_n_s_read_into_buffer, __pyx_t_2) < 0) __PYX_ERR(0, 236, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader, __pyx_n_s_read_into_buffer, __pyx_t_2) < 0) __PYX_ERR(0, 409, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader);
 
@@ -11677,7 +13780,7 @@ if (!__Pyx_RefNanny) {
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_5__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedSocketReader___reduce_cy, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_5__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedSocketReader___reduce_cy, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -11689,22 +13792,22 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedSocketReader__set_state(self, __pyx_state)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_7__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedSocketReader___setstate, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_20BufferedSocketReader_7__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_BufferedSocketReader___setstate, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(2, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_BufferedSocketReader);
 
-  /* "clickhouse_driver/bufferedreader.pyx":250
+  /* "clickhouse_driver/bufferedreader.pyx":423
  *         super(CompressedBufferedReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
  *         self.buffer = bytearray(self.read_block())
  *         self.current_buffer_size = len(self.buffer)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_24CompressedBufferedReader_3read_into_buffer, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_CompressedBufferedReader_read_in, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_24CompressedBufferedReader_3read_into_buffer, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_CompressedBufferedReader_read_in, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 423, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader, __pyx_n_s_read_into_buffer, __pyx_t_2) < 0) __PYX_ERR(0, 250, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader, __pyx_n_s_read_into_buffer, __pyx_t_2) < 0) __PYX_ERR(0, 423, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader);
 
@@ -11713,7 +13816,7 @@ if (!__Pyx_RefNanny) {
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_24CompressedBufferedReader_5__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_CompressedBufferedReader___reduc, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_24CompressedBufferedReader_5__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_CompressedBufferedReader___reduc, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -11725,7 +13828,7 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_CompressedBufferedReader__set_state(self, __pyx_state)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_24CompressedBufferedReader_7__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_CompressedBufferedReader___setst, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_24CompressedBufferedReader_7__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_CompressedBufferedReader___setst, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_17clickhouse_driver_14bufferedreader_CompressedBufferedReader, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(2, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -11736,7 +13839,7 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_1__pyx_unpickle_BufferedReader, 0, __pyx_n_s_pyx_unpickle_BufferedReader, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__30)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_1__pyx_unpickle_BufferedReader, 0, __pyx_n_s_pyx_unpickle_BufferedReader, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__36)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_BufferedReader, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -11748,7 +13851,7 @@ if (!__Pyx_RefNanny) {
  *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
  *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_3__pyx_unpickle_BufferedSocketReader, 0, __pyx_n_s_pyx_unpickle_BufferedSocketRea, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_3__pyx_unpickle_BufferedSocketReader, 0, __pyx_n_s_pyx_unpickle_BufferedSocketRea, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__37)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_BufferedSocketRea, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -11758,15 +13861,15 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_5__pyx_unpickle_CompressedBufferedReader, 0, __pyx_n_s_pyx_unpickle_CompressedBuffere, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_17clickhouse_driver_14bufferedreader_5__pyx_unpickle_CompressedBufferedReader, 0, __pyx_n_s_pyx_unpickle_CompressedBuffere, NULL, __pyx_n_s_clickhouse_driver_bufferedreader_2, __pyx_d, ((PyObject *)__pyx_codeobj__38)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_CompressedBuffere, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "clickhouse_driver/bufferedreader.pyx":1
  * from cpython cimport Py_INCREF, PyBytes_FromStringAndSize, PyBytes_AsString             # <<<<<<<<<<<<<<
- * from cpython.bytearray cimport PyByteArray_AsString
- * # Using python's versions of pure c memory management functions for
+ * from cpython.buffer cimport (
+ *     PyBUF_SIMPLE, PyBUF_WRITABLE, PyBuffer_Release, PyObject_GetBuffer
  */
   __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
@@ -12904,151 +15007,12 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
         PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
         Py_INCREF(tb);
         PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#endif
-    }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
-}
-#endif
-
-/* PyObjectCallNoArg */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-    PyObject *arg[2] = {NULL, NULL};
-    return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
-}
-
-/* GetItemIntByteArray */
-static CYTHON_INLINE int __Pyx_GetItemInt_ByteArray_Fast(PyObject* string, Py_ssize_t i,
-                                                         int wraparound, int boundscheck) {
-    Py_ssize_t length;
-    if (wraparound | boundscheck) {
-        length = PyByteArray_GET_SIZE(string);
-        if (wraparound & unlikely(i < 0)) i += length;
-        if ((!boundscheck) || likely(__Pyx_is_valid_index(i, length))) {
-            return (unsigned char) (PyByteArray_AS_STRING(string)[i]);
-        } else {
-            PyErr_SetString(PyExc_IndexError, "bytearray index out of range");
-            return -1;
-        }
-    } else {
-        return (unsigned char) (PyByteArray_AS_STRING(string)[i]);
-    }
-}
-
-/* decode_c_string */
-static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
-         const char* cstring, Py_ssize_t start, Py_ssize_t stop,
-         const char* encoding, const char* errors,
-         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors)) {
-    Py_ssize_t length;
-    if (unlikely((start < 0) | (stop < 0))) {
-        size_t slen = strlen(cstring);
-        if (unlikely(slen > (size_t) PY_SSIZE_T_MAX)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "c-string too long to convert to Python");
-            return NULL;
-        }
-        length = (Py_ssize_t) slen;
-        if (start < 0) {
-            start += length;
-            if (start < 0)
-                start = 0;
-        }
-        if (stop < 0)
-            stop += length;
-    }
-    if (unlikely(stop <= start))
-        return __Pyx_NewRef(__pyx_empty_unicode);
-    length = stop - start;
-    cstring += start;
-    if (decode_func) {
-        return decode_func(cstring, length, errors);
-    } else {
-        return PyUnicode_Decode(cstring, length, encoding, errors);
-    }
-}
-
-/* GetTopmostException */
-#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
-static _PyErr_StackItem *
-__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
-{
-    _PyErr_StackItem *exc_info = tstate->exc_info;
-    while ((exc_info->exc_value == NULL || exc_info->exc_value == Py_None) &&
-           exc_info->previous_item != NULL)
-    {
-        exc_info = exc_info->previous_item;
-    }
-    return exc_info;
-}
-#endif
-
-/* SaveResetException */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
-    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
-    PyObject *exc_value = exc_info->exc_value;
-    if (exc_value == NULL || exc_value == Py_None) {
-        *value = NULL;
-        *type = NULL;
-        *tb = NULL;
-    } else {
-        *value = exc_value;
-        Py_INCREF(*value);
-        *type = (PyObject*) Py_TYPE(exc_value);
-        Py_INCREF(*type);
-        *tb = PyException_GetTraceback(exc_value);
+        Py_XDECREF(tmp_tb);
+#endif
     }
-  #elif CYTHON_USE_EXC_INFO_STACK
-    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
-    *type = exc_info->exc_type;
-    *value = exc_info->exc_value;
-    *tb = exc_info->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-  #else
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-  #endif
-}
-static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
-    _PyErr_StackItem *exc_info = tstate->exc_info;
-    PyObject *tmp_value = exc_info->exc_value;
-    exc_info->exc_value = value;
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-  #else
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    #if CYTHON_USE_EXC_INFO_STACK
-    _PyErr_StackItem *exc_info = tstate->exc_info;
-    tmp_type = exc_info->exc_type;
-    tmp_value = exc_info->exc_value;
-    tmp_tb = exc_info->exc_traceback;
-    exc_info->exc_type = type;
-    exc_info->exc_value = value;
-    exc_info->exc_traceback = tb;
-    #else
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    #endif
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-  #endif
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
 #endif
 
@@ -13147,6 +15111,199 @@ bad:
     return -1;
 }
 
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_value = exc_info->exc_value;
+    exc_info->exc_value = *value;
+    if (tmp_value == NULL || tmp_value == Py_None) {
+        Py_XDECREF(tmp_value);
+        tmp_value = NULL;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+    } else {
+        tmp_type = (PyObject*) Py_TYPE(tmp_value);
+        Py_INCREF(tmp_type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        tmp_tb = ((PyBaseExceptionObject*) tmp_value)->traceback;
+        Py_XINCREF(tmp_tb);
+        #else
+        tmp_tb = PyException_GetTraceback(tmp_value);
+        #endif
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+  #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+  #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_value == NULL || exc_info->exc_value == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    PyObject *exc_value = exc_info->exc_value;
+    if (exc_value == NULL || exc_value == Py_None) {
+        *value = NULL;
+        *type = NULL;
+        *tb = NULL;
+    } else {
+        *value = exc_value;
+        Py_INCREF(*value);
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        *tb = PyException_GetTraceback(exc_value);
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #endif
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    PyObject *tmp_value = exc_info->exc_value;
+    exc_info->exc_value = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+  #else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+  #endif
+}
+#endif
+
+/* GetItemIntByteArray */
+static CYTHON_INLINE int __Pyx_GetItemInt_ByteArray_Fast(PyObject* string, Py_ssize_t i,
+                                                         int wraparound, int boundscheck) {
+    Py_ssize_t length;
+    if (wraparound | boundscheck) {
+        length = PyByteArray_GET_SIZE(string);
+        if (wraparound & unlikely(i < 0)) i += length;
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(i, length))) {
+            return (unsigned char) (PyByteArray_AS_STRING(string)[i]);
+        } else {
+            PyErr_SetString(PyExc_IndexError, "bytearray index out of range");
+            return -1;
+        }
+    } else {
+        return (unsigned char) (PyByteArray_AS_STRING(string)[i]);
+    }
+}
+
+/* PyObjectCallNoArg */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+    PyObject *arg[2] = {NULL, NULL};
+    return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* decode_c_string */
+static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
+         const char* cstring, Py_ssize_t start, Py_ssize_t stop,
+         const char* encoding, const char* errors,
+         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors)) {
+    Py_ssize_t length;
+    if (unlikely((start < 0) | (stop < 0))) {
+        size_t slen = strlen(cstring);
+        if (unlikely(slen > (size_t) PY_SSIZE_T_MAX)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "c-string too long to convert to Python");
+            return NULL;
+        }
+        length = (Py_ssize_t) slen;
+        if (start < 0) {
+            start += length;
+            if (start < 0)
+                start = 0;
+        }
+        if (stop < 0)
+            stop += length;
+    }
+    if (unlikely(stop <= start))
+        return __Pyx_NewRef(__pyx_empty_unicode);
+    length = stop - start;
+    cstring += start;
+    if (decode_func) {
+        return decode_func(cstring, length, errors);
+    } else {
+        return PyUnicode_Decode(cstring, length, encoding, errors);
+    }
+}
+
 /* RaiseUnexpectedTypeError */
 static int
 __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
@@ -13922,6 +16079,97 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 }
 #endif
 
+/* SetVTable */
+static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    if (unlikely(!ob))
+        goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_n_s_pyx_vtable, ob) < 0))
+#else
+    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_n_s_pyx_vtable, ob) < 0))
+#endif
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyTypeObject *type) {
+    void* ptr;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_n_s_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_n_s_pyx_vtable);
+#endif
+    if (!ob)
+        goto bad;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* MergeVTables */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_MergeVtables(PyTypeObject *type) {
+    int i;
+    void** base_vtables;
+    __Pyx_TypeName tp_base_name;
+    __Pyx_TypeName base_name;
+    void* unknown = (void*)-1;
+    PyObject* bases = type->tp_bases;
+    int base_depth = 0;
+    {
+        PyTypeObject* base = type->tp_base;
+        while (base) {
+            base_depth += 1;
+            base = base->tp_base;
+        }
+    }
+    base_vtables = (void**) malloc(sizeof(void*) * (size_t)(base_depth + 1));
+    base_vtables[0] = unknown;
+    for (i = 1; i < PyTuple_GET_SIZE(bases); i++) {
+        void* base_vtable = __Pyx_GetVtable(((PyTypeObject*)PyTuple_GET_ITEM(bases, i)));
+        if (base_vtable != NULL) {
+            int j;
+            PyTypeObject* base = type->tp_base;
+            for (j = 0; j < base_depth; j++) {
+                if (base_vtables[j] == unknown) {
+                    base_vtables[j] = __Pyx_GetVtable(base);
+                    base_vtables[j + 1] = unknown;
+                }
+                if (base_vtables[j] == base_vtable) {
+                    break;
+                } else if (base_vtables[j] == NULL) {
+                    goto bad;
+                }
+                base = base->tp_base;
+            }
+        }
+    }
+    PyErr_Clear();
+    free(base_vtables);
+    return 0;
+bad:
+    tp_base_name = __Pyx_PyType_GetName(type->tp_base);
+    base_name = __Pyx_PyType_GetName((PyTypeObject*)PyTuple_GET_ITEM(bases, i));
+    PyErr_Format(PyExc_TypeError,
+        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base_name, base_name);
+    __Pyx_DECREF_TypeName(tp_base_name);
+    __Pyx_DECREF_TypeName(base_name);
+    free(base_vtables);
+    return -1;
+}
+#endif
+
 /* SetupReduce */
 #if !CYTHON_COMPILING_IN_LIMITED_API
 static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
@@ -16377,7 +18625,7 @@ __Pyx_PyType_GetName(PyTypeObject* tp)
     if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
         PyErr_Clear();
         Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__33);
+        name = __Pyx_NewRef(__pyx_n_s__39);
     }
     return name;
 }
@@ -1,4 +1,7 @@
 from cpython cimport Py_INCREF, PyBytes_FromStringAndSize, PyBytes_AsString
+from cpython.buffer cimport (
+    PyBUF_SIMPLE, PyBUF_WRITABLE, PyBuffer_Release, PyObject_GetBuffer
+)
 from cpython.bytearray cimport PyByteArray_AsString
 # Using python's versions of pure c memory management functions for
 # proper memory statistics count.
@@ -26,14 +29,37 @@ cdef class BufferedReader(object):
         # When the buffer is large enough bytes read are almost
         # always hit the buffer.
         cdef unsigned long long next_position = unread + self.position
+        cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
         if next_position < self.current_buffer_size:
-            t = self.position
+            rv = PyBytes_FromStringAndSize(&buffer_ptr[self.position], unread)
             self.position = next_position
-            return bytes(self.buffer[t:self.position])
+            return rv
+
+        rv = PyBytes_FromStringAndSize(NULL, unread)
+        self.copy_into(PyBytes_AsString(rv), unread)
+        return rv
+
+    def readinto(self, out):
+        """
+        Fills writable buffer with next bytes. Unlike :meth:`read` there is
+        no intermediate bytes object: data is copied from reader buffer
+        straight into ``out``, for example, into preallocated NumPy array.
+
+        :param out: object supporting writable buffer protocol.
+        :return: number of bytes read.
+        """
+        cdef Py_buffer view
+        PyObject_GetBuffer(out, &view, PyBUF_SIMPLE | PyBUF_WRITABLE)
+        try:
+            self.copy_into(<char *> view.buf, view.len)
+        finally:
+            PyBuffer_Release(&view)
 
+        return view.len
+
+    cdef copy_into(self, char* out, unsigned long long unread):
         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
         cdef unsigned long long read_bytes
-        rv = bytes()
 
         while unread > 0:
             if self.position == self.current_buffer_size:
@@ -42,14 +68,11 @@ cdef class BufferedReader(object):
                 self.position = 0
 
             read_bytes = min(unread, self.current_buffer_size - self.position)
-            rv += PyBytes_FromStringAndSize(
-                &buffer_ptr[self.position], read_bytes
-            )
+            memcpy(out, &buffer_ptr[self.position], read_bytes)
+            out += read_bytes
             self.position += read_bytes
             unread -= read_bytes
 
-        return rv
-
     def read_one(self):
         if self.position == self.current_buffer_size:
             self.read_into_buffer()
@@ -225,6 +248,156 @@ cdef class BufferedReader(object):
 
         return items
 
+    def read_strings_buffers(self, unsigned long long n_items):
+        """
+        Reads strings into Arrow-compatible buffers without creating
+        Python object for each string.
+
+        Returns ``n_items + 1`` int64 offsets as bytearray and bytes with
+        concatenated strings.
+        """
+        offsets = bytearray(8 * (n_items + 1))
+        cdef long long* offsets_ptr = \
+            <long long *> PyByteArray_AsString(offsets)
+        offsets_ptr[0] = 0
+
+        cdef unsigned long long i
+        cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+        cdef unsigned long long size, shift, b, chunk_size
+
+        cdef unsigned long long data_size = 0
+        cdef unsigned long long data_capacity = 4096
+        cdef char* data = <char *> PyMem_Malloc(data_capacity)
+        cdef char* new_data
+        if data is NULL:
+            raise MemoryError()
+
+        try:
+            for i in range(n_items):
+                shift = size = 0
+
+                # Read string size
+                while True:
+                    if self.position == self.current_buffer_size:
+                        self.read_into_buffer()
+                        # `read_into_buffer` can override buffer
+                        buffer_ptr = PyByteArray_AsString(self.buffer)
+                        self.position = 0
+
+                    b = buffer_ptr[self.position]
+                    self.position += 1
+
+                    size |= (b & 0x7f) << shift
+                    if b < 0x80:
+                        break
+
+                    shift += 7
+
+                if data_size + size > data_capacity:
+                    data_capacity = max(data_capacity * 2, data_size + size)
+                    new_data = <char *> PyMem_Realloc(data, data_capacity)
+                    if new_data is NULL:
+                        raise MemoryError()
+                    data = new_data
+
+                # String can be split between several buffers.
+                while size > 0:
+                    if self.position == self.current_buffer_size:
+                        self.read_into_buffer()
+                        buffer_ptr = PyByteArray_AsString(self.buffer)
+                        self.position = 0
+
+                    chunk_size = min(
+                        size, self.current_buffer_size - self.position
+                    )
+                    memcpy(&data[data_size], &buffer_ptr[self.position],
+                           chunk_size)
+                    self.position += chunk_size
+                    data_size += chunk_size
+                    size -= chunk_size
+
+                offsets_ptr[i + 1] = data_size
+
+            return offsets, PyBytes_FromStringAndSize(data, data_size)
+
+        finally:
+            PyMem_Free(data)
+
+
+    def read_strings_raw(self, unsigned long long n_items):
+        """
+        Reads strings as is: with varint sizes and without decoding.
+        Returns bytes in wire format.
+        """
+        cdef unsigned long long i
+        cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+        cdef unsigned long long size, shift, b, chunk_size
+
+        cdef unsigned long long data_size = 0
+        cdef unsigned long long data_capacity = 4096
+        cdef char* data = <char *> PyMem_Malloc(data_capacity)
+        cdef char* new_data
+        if data is NULL:
+            raise MemoryError()
+
+        try:
+            for i in range(n_items):
+                shift = size = 0
+
+                # Read string size. Varint takes at most 10 bytes.
+                if data_size + 10 > data_capacity:
+                    data_capacity = data_capacity * 2
+                    new_data = <char *> PyMem_Realloc(data, data_capacity)
+                    if new_data is NULL:
+                        raise MemoryError()
+                    data = new_data
+
+                while True:
+                    if self.position == self.current_buffer_size:
+                        self.read_into_buffer()
+                        # `read_into_buffer` can override buffer
+                        buffer_ptr = PyByteArray_AsString(self.buffer)
+                        self.position = 0
+
+                    b = <unsigned char> buffer_ptr[self.position]
+                    self.position += 1
+
+                    data[data_size] = <char> b
+                    data_size += 1
+
+                    size |= (b & 0x7f) << shift
+                    if b < 0x80:
+                        break
+
+                    shift += 7
+
+                if data_size + size > data_capacity:
+                    data_capacity = max(data_capacity * 2, data_size + size)
+                    new_data = <char *> PyMem_Realloc(data, data_capacity)
+                    if new_data is NULL:
+                        raise MemoryError()
+                    data = new_data
+
+                # String can be split between several buffers.
+                while size > 0:
+                    if self.position == self.current_buffer_size:
+                        self.read_into_buffer()
+                        buffer_ptr = PyByteArray_AsString(self.buffer)
+                        self.position = 0
+
+                    chunk_size = min(
+                        size, self.current_buffer_size - self.position
+                    )
+                    memcpy(&data[data_size], &buffer_ptr[self.position],
+                           chunk_size)
+                    self.position += chunk_size
+                    data_size += chunk_size
+                    size -= chunk_size
+
+            return PyBytes_FromStringAndSize(data, data_size)
+
+        finally:
+            PyMem_Free(data)
 
 cdef class BufferedSocketReader(BufferedReader):
     cdef object sock
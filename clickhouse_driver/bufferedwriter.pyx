@@ -1,3 +1,5 @@
+from cpython.buffer cimport PyBUF_SIMPLE, PyBuffer_Release, \
+    PyObject_GetBuffer
 from cpython cimport PyMem_Malloc, PyMem_Free, PyBytes_AsString, \
     PyBytes_Check, PyBytes_FromStringAndSize, PyBytes_AS_STRING, \
     PyBytes_GET_SIZE
@@ -28,9 +30,10 @@ cdef class BufferedWriter(object):
         raise NotImplementedError
 
     cpdef write(self, data):
+        self.write_raw(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+
+    cdef write_raw(self, const char* c_data, unsigned long long data_len):
         cdef unsigned long long size, written = 0
-        cdef unsigned long long data_len = PyBytes_GET_SIZE(data)
-        cdef char* c_data = PyBytes_AS_STRING(data)
 
         while written < data_len:
             size = min(data_len - written, self.buffer_size - self.position)
@@ -45,6 +48,70 @@ cdef class BufferedWriter(object):
     def flush(self):
         self.write_into_stream()
 
+    def write_buffer(self, data):
+        """
+        Writes object supporting buffer protocol without intermediate bytes.
+        """
+        cdef Py_buffer view
+
+        PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+        try:
+            self.write_raw(<const char*> view.buf, view.len)
+        finally:
+            PyBuffer_Release(&view)
+
+    def write_strings_buffers(self, offsets, data,
+                              Py_ssize_t start, Py_ssize_t n_items):
+        """
+        Writes strings given by Arrow-like int64 offsets and data buffers.
+        Item ``i`` is ``data[offsets[start + i]:offsets[start + i + 1]]``.
+        """
+        cdef Py_buffer offsets_view, data_view
+        cdef const long long* c_offsets
+        cdef const char* c_data
+        cdef Py_ssize_t i
+        cdef unsigned long long length
+        cdef unsigned char num_buf[10]
+        cdef unsigned char num_len
+
+        PyObject_GetBuffer(offsets, &offsets_view, PyBUF_SIMPLE)
+        try:
+            PyObject_GetBuffer(data, &data_view, PyBUF_SIMPLE)
+        except Exception:
+            PyBuffer_Release(&offsets_view)
+            raise
+
+        try:
+            if <size_t> offsets_view.len < \
+                    (start + n_items + 1) * sizeof(long long):
+                raise ValueError('Offsets buffer is too small')
+
+            c_offsets = (<const long long*> offsets_view.buf) + start
+            c_data = <const char*> data_view.buf
+
+            for i in range(n_items):
+                length = c_offsets[i + 1] - c_offsets[i]
+
+                # Inlined LEB128 of item size.
+                num_len = 0
+                while True:
+                    num_buf[num_len] = length & 0x7f
+                    length >>= 7
+                    if length:
+                        num_buf[num_len] |= 0x80
+                        num_len += 1
+                    else:
+                        num_len += 1
+                        break
+                self.write_raw(<const char*> num_buf, num_len)
+
+                length = c_offsets[i + 1] - c_offsets[i]
+                if length:
+                    self.write_raw(&c_data[c_offsets[i]], length)
+        finally:
+            PyBuffer_Release(&data_view)
+            PyBuffer_Release(&offsets_view)
+
     def write_strings(self, items, encoding=None):
         cdef int do_encode = encoding is not None
 
@@ -0,0 +1,243 @@
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from time import time
+
+from .util.compat import threading
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCache(object):
+    """
+    In-memory cache of ``SELECT`` query results for
+    :meth:`~clickhouse_driver.Client.execute`.
+
+    Results are stored as blocks in Native format as they were received from
+    the server and decoded on each cache hit. Blocks are kept compressed if
+    client uses compression. Entries are keyed by query with substituted
+    parameters, query settings, database, user and server hosts. Cache can be
+    shared between clients.
+
+    :param ttl: time in seconds while entry is valid. Defaults to ``60``.
+    :param max_size: maximum total size of cached blocks in bytes. Least
+                     recently used entries are evicted on overflow.
+                     Defaults to ``64 MiB``.
+    """
+
+    def __init__(self, ttl=60, max_size=64 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+        super(QueryCache, self).__init__()
+
+    @staticmethod
+    def make_key(query, settings, database, params=None, user=None,
+                 hosts=None):
+        settings = repr(sorted((settings or {}).items()))
+        if params is not None:
+            params = repr(sorted(params.items()))
+        if hosts is not None:
+            hosts = tuple(sorted(hosts))
+        return query, settings, database, params, user, hosts
+
+    @staticmethod
+    def get_blocks_size(blocks):
+        return sum(len(block.data) for block in blocks)
+
+    def get(self, key):
+        """
+        :param key: entry key.
+        :return: list of cached blocks or ``None``.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            expires, blocks, size = entry
+            if expires < time():
+                self._remove(key)
+                return None
+
+            self.entries.move_to_end(key)
+            return blocks
+
+    def set(self, key, blocks):
+        size = self.get_blocks_size(blocks)
+        if size > self.max_size:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+            self.entries[key] = (time() + self.ttl, blocks, size)
+            self.size += size
+
+            while self.size > self.max_size:
+                self._remove(next(iter(self.entries)))
+
+    def invalidate(self, query=None):
+        """
+        Removes cached results of the query with all settings and databases.
+        Removes all entries if query is not specified.
+
+        :param query: query with substituted parameters.
+        """
+        with self.lock:
+            if query is None:
+                self.entries.clear()
+                self.size = 0
+                return
+
+            for key in [x for x in self.entries if x[0] == query]:
+                self._remove(key)
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        self.invalidate()
+
+    def _remove(self, key):
+        _, _, size = self.entries.pop(key)
+        self.size -= size
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class DiskQueryCache(QueryCache):
+    """
+    Cache of ``SELECT`` query results stored on disk. Each entry is stored
+    in separate file in specified directory. Entries are evicted by last
+    access time.
+
+    :param path: cache directory. Temporary directory is created if not
+                 specified.
+    :param ttl: time in seconds while entry is valid. Defaults to ``60``.
+    :param max_size: maximum total size of cache files in bytes.
+                     Defaults to ``1 GiB``.
+    """
+
+    suffix = '.cache'
+
+    def __init__(self, path=None, ttl=60, max_size=1024 * 1024 * 1024):
+        if path is None:
+            path = tempfile.mkdtemp(prefix='clickhouse-driver-cache-')
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+
+        super(DiskQueryCache, self).__init__(ttl=ttl, max_size=max_size)
+
+    @staticmethod
+    def hash(value):
+        return hashlib.sha1(repr(value).encode('utf-8')).hexdigest()
+
+    def get_filename(self, key):
+        # Query hash prefix is used for invalidation by query.
+        name = '{}-{}{}'.format(self.hash(key[0]), self.hash(key), self.suffix)
+        return os.path.join(self.path, name)
+
+    def get(self, key):
+        filename = self.get_filename(key)
+
+        try:
+            with open(filename, 'rb') as f:
+                entry_key, expires, blocks = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning('Failed to read cache entry %s: %s', filename, e)
+            self._remove_file(filename)
+            return None
+
+        if entry_key != key:
+            return None
+
+        if expires < time():
+            self._remove_file(filename)
+            return None
+
+        # Modification time is used as last access time.
+        try:
+            os.utime(filename)
+        except FileNotFoundError:
+            pass
+
+        return blocks
+
+    def set(self, key, blocks):
+        if self.get_blocks_size(blocks) > self.max_size:
+            return
+
+        filename = self.get_filename(key)
+        data = pickle.dumps(
+            (key, time() + self.ttl, blocks), protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        # Entry is written atomically.
+        fd, tmp_filename = tempfile.mkstemp(dir=self.path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_filename, filename)
+        except Exception:
+            self._remove_file(tmp_filename)
+            raise
+
+        with self.lock:
+            self._evict()
+
+    def invalidate(self, query=None):
+        """
+        Removes cached results of the query with all settings and databases.
+        Removes all entries if query is not specified.
+
+        :param query: query with substituted parameters.
+        """
+        prefix = self.hash(query) + '-' if query is not None else ''
+
+        for entry in self._scan():
+            if entry.name.startswith(prefix):
+                self._remove_file(entry.path)
+
+    def _scan(self):
+        with os.scandir(self.path) as it:
+            return [x for x in it if x.name.endswith(self.suffix)]
+
+    def _evict(self):
+        files = []
+        for entry in self._scan():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(x[1] for x in files)
+        files.sort()
+
+        for _, file_size, filename in files:
+            if size <= self.max_size:
+                break
+
+            self._remove_file(filename)
+            size -= file_size
+
+    def _remove_file(self, filename):
+        try:
+            os.remove(filename)
+        except FileNotFoundError:
+            pass
+
+    def __len__(self):
+        return len(self._scan())
@@ -0,0 +1,131 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import chain
+
+from .flatcolumn import FlatColumn, concat_flat_columns
+
+
+columnar_formats = ('tuple', 'array', 'chunked')
+
+# Types which items can be stored in typed array without losing type.
+array_typecodes = {
+    'Int8': 'b',
+    'UInt8': 'B',
+    'Int16': 'h',
+    'UInt16': 'H',
+    'Int32': 'i',
+    'UInt32': 'I',
+    'Int64': 'q',
+    'UInt64': 'Q',
+    'Float32': 'f',
+    'Float64': 'd'
+}
+
+
+class ChunkedColumn(Sequence):
+    """
+    Read-only sequence over column chunks of received blocks.
+    Chunks are not copied: items are taken from the corresponding chunk
+    on access.
+
+    :param chunks: list of column chunks.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = [chunk for chunk in chunks if len(chunk)]
+
+        # Starting item number of each chunk.
+        self._offsets = []
+        n_items = 0
+        for chunk in self._chunks:
+            self._offsets.append(n_items)
+            n_items += len(chunk)
+        self._n_items = n_items
+
+        super(ChunkedColumn, self).__init__()
+
+    @property
+    def chunks(self):
+        return self._chunks
+
+    def __len__(self):
+        return self._n_items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n_items))]
+
+        if index < 0:
+            index += self._n_items
+        if not 0 <= index < self._n_items:
+            raise IndexError('column index out of range')
+
+        i = bisect_right(self._offsets, index) - 1
+        return self._chunks[i][index - self._offsets[i]]
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+    def __eq__(self, other):
+        if isinstance(other, (ChunkedColumn, list, tuple)):
+            return len(self) == len(other) and \
+                all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+def concat_chunks(chunks, columnar_format='tuple', spec=None):
+    """
+    Concatenates column chunks into single column. Chunks list is emptied
+    as items are copied to release blocks memory early.
+
+    :param chunks: list of column chunks.
+    :param columnar_format: ``'tuple'``, ``'array'`` or ``'chunked'``.
+    :param spec: column type. Used for choosing array typecode.
+    :return: column.
+    """
+    if columnar_format not in columnar_formats:
+        raise ValueError(
+            'Unknown columnar_format {}. Expected one of: {}'.format(
+                columnar_format, ', '.join(columnar_formats)
+            )
+        )
+
+    if columnar_format == 'chunked':
+        return ChunkedColumn(chunks)
+
+    # Chunks are read as flat values and offsets with flat_arrays setting.
+    if chunks and all(isinstance(chunk, FlatColumn) for chunk in chunks):
+        column = concat_flat_columns(chunks)
+        del chunks[:]
+        return column
+
+    # Chunks are already read into arrays with columns_as_arrays setting.
+    if chunks and all(isinstance(chunk, array) for chunk in chunks):
+        typecode = chunks[0].typecode
+    else:
+        typecode = array_typecodes.get(spec)
+        if columnar_format != 'array':
+            typecode = None
+
+    if typecode:
+        if len(chunks) == 1 and isinstance(chunks[0], array):
+            return chunks.pop()
+
+        column = array(typecode)
+        while chunks:
+            column.extend(chunks.pop(0))
+        return column
+
+    if len(chunks) == 1:
+        # No copy for single tuple chunk.
+        return tuple(chunks.pop())
+
+    column = tuple(chain.from_iterable(chunks))
+    del chunks[:]
+    return column
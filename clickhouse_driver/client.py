@@ -1,20 +1,27 @@
+import logging
 import re
+import socket
 from collections import deque
 from contextlib import contextmanager
-from time import time
+from time import sleep, time
 import types
 from urllib.parse import urlparse
 
 from . import errors, defines
-from .block import ColumnOrientedBlock, RowOrientedBlock
-from .connection import Connection
+from .block import ColumnOrientedBlock, RawBlock, RowOrientedBlock
+from .connection import Connection, Packet
 from .log import log_block
 from .protocol import ServerPacketTypes
 from .result import (
-    IterQueryResult, ProgressQueryResult, QueryResult, QueryInfo
+    IterBlocksQueryResult, IterQueryResult, ProgressQueryResult, QueryResult,
+    QueryInfo, RawBlocksQueryResult
 )
+from .retry import is_read_query
+from .util.compat import threading
 from .util.escape import escape_params
-from .util.helpers import column_chunks, chunks, parse_url
+from .util.helpers import column_chunks, chunks, parse_url, prefetch
+
+logger = logging.getLogger(__name__)
 
 
 class Client(object):
@@ -27,6 +34,12 @@ class Client(object):
                      (no additional settings). See all available settings in
                      `ClickHouse docs
                      <https://clickhouse.com/docs/en/operations/settings/settings/>`_.
+    :param retry_policy: :py:class:`~clickhouse_driver.retry.RetryPolicy`
+                         for retrying ``execute`` on transient errors.
+                         Defaults to ``None`` (no retries).
+    :param query_cache: :py:class:`~clickhouse_driver.cache.QueryCache`
+                        for caching results of ``SELECT`` queries executed
+                        by ``execute``. Defaults to ``None`` (no caching).
     :param \\**kwargs: All other args are passed to the
                        :py:class:`~clickhouse_driver.connection.Connection`
                        constructor.
@@ -67,6 +80,54 @@ class Client(object):
                            Default: False. Means that parameters are rendered
                            on driver's side.
                            New in version *0.2.7*.
+        * ``lazy_rows`` -- Return rows of ``SELECT`` queries as lazy
+                           :py:class:`~clickhouse_driver.rowview.RowView`
+                           over received columns instead of tuples.
+                           Default: False.
+        * ``columnar_format`` -- Type of columns returned with
+                           ``columnar=True``: ``'tuple'``, ``'array'`` for
+                           typed :py:class:`array.array` of numeric columns
+                           or ``'chunked'`` for
+                           :py:class:`~clickhouse_driver.chunkedcolumn.ChunkedColumn`
+                           over received blocks without copying.
+                           Ignored with ``use_numpy``. Default: 'tuple'.
+        * ``max_result_memory`` -- Approximate size in bytes of rows of
+                           ``SELECT`` result kept in memory. Rows beyond
+                           this size are spilled to temporary file and
+                           :py:class:`~clickhouse_driver.spill.SpilledRows`
+                           is returned. Default: 0, no limit.
+        * ``columns_as_arrays`` -- Read ``Int*``, ``UInt*`` and
+                           ``Float*`` columns into :py:class:`array.array`
+                           instead of tuples. Such columns are returned as
+                           arrays with ``columnar=True``. Values of
+                           ``Int128``/``Int256`` and nullable columns are
+                           still read into tuples. Default: False.
+        * ``uuid_format`` -- Type of ``UUID`` column values: ``'uuid'``
+                           for :py:class:`uuid.UUID`, ``'bytes'`` for
+                           16-byte :py:class:`bytes` as in
+                           :py:attr:`uuid.UUID.bytes` or ``'str'``. With
+                           ``use_numpy`` ``'bytes'`` gives ``S16`` arrays.
+                           Default: 'uuid'.
+        * ``decimal_format`` -- Type of ``Decimal`` column values:
+                           ``'decimal'`` for :py:class:`decimal.Decimal`,
+                           ``'float'`` or ``'int'`` for integers scaled by
+                           ``10 ** scale`` as stored by server. With
+                           ``use_numpy`` ``'float'`` gives ``float64``
+                           arrays. Affects only reading.
+                           Default: 'decimal'.
+        * ``datetime_format`` -- Type of ``DateTime`` and ``DateTime64``
+                           column values: ``'datetime'`` for
+                           :py:class:`datetime.datetime` or ``'int'`` for
+                           timestamps as stored by server. Affects only
+                           reading without ``use_numpy``.
+                           Default: 'datetime'.
+        * ``flat_arrays`` -- Read ``Array`` and ``Map`` columns into
+                           :py:class:`~clickhouse_driver.flatcolumn.FlatColumn`
+                           of flat values and row end offsets instead of
+                           lists and dicts for each row. Values of
+                           one-dimensional numeric arrays are read into
+                           :py:class:`array.array`. Ignored with
+                           ``use_numpy``. Default: False.
     """
 
     available_client_settings = (
@@ -79,7 +140,20 @@ class Client(object):
         'quota_key',
         'input_format_null_as_default',
         'namedtuple_as_json',
-        'server_side_params'
+        'server_side_params',
+        'lazy_rows',
+        'columnar_format',
+        'max_result_memory',
+        'columns_as_arrays',
+        'uuid_format',
+        'decimal_format',
+        'datetime_format',
+        'flat_arrays'
+    )
+
+    # Errors that are considered as host failures.
+    host_errors = (
+        errors.NetworkError, errors.SocketTimeoutError, socket.error, EOFError
     )
 
     def __init__(self, *args, **kwargs):
@@ -115,6 +189,30 @@ class Client(object):
             ),
             'server_side_params': self.settings.pop(
                 'server_side_params', False
+            ),
+            'lazy_rows': self.settings.pop(
+                'lazy_rows', False
+            ),
+            'columnar_format': self.settings.pop(
+                'columnar_format', 'tuple'
+            ),
+            'max_result_memory': int(self.settings.pop(
+                'max_result_memory', 0
+            )),
+            'columns_as_arrays': self.settings.pop(
+                'columns_as_arrays', False
+            ),
+            'uuid_format': self.settings.pop(
+                'uuid_format', 'uuid'
+            ),
+            'decimal_format': self.settings.pop(
+                'decimal_format', 'decimal'
+            ),
+            'datetime_format': self.settings.pop(
+                'datetime_format', 'datetime'
+            ),
+            'flat_arrays': self.settings.pop(
+                'flat_arrays', False
             )
         }
 
@@ -134,6 +232,11 @@ class Client(object):
             self.iter_query_result_cls = IterQueryResult
             self.progress_query_result_cls = ProgressQueryResult
 
+        self.host_selector = kwargs.get('host_selector')
+
+        self.retry_policy = kwargs.pop('retry_policy', None)
+        self.query_cache = kwargs.pop('query_cache', None)
+
         round_robin = kwargs.pop('round_robin', False)
         self.connections = deque([Connection(*args, **kwargs)])
 
@@ -170,16 +273,66 @@ class Client(object):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.disconnect()
 
-    def get_connection(self):
+    def get_connection(self, exclude=()):
         if hasattr(self, 'connection'):
             self.connections.append(self.connection)
 
+        if self.host_selector is not None:
+            # Pick connection to the most preferred host. Connection's
+            # current host is always the first one in its hosts list.
+            candidates = [
+                x for x in self.connections if x not in exclude
+            ] or list(self.connections)
+            hosts = [x.hosts[0] for x in candidates]
+            best = candidates[hosts.index(self.host_selector.sort(hosts)[0])]
+            self.connections.rotate(-self.connections.index(best))
+
         connection = self.connections.popleft()
 
         connection.context.settings = self.settings
         connection.context.client_settings = self.client_settings
         return connection
 
+    def warmup(self, n=None):
+        """
+        Establishes client's connections in parallel threads before the first
+        query. Connections that are already established are left untouched.
+        With ``round_robin`` every connection to ``alt_hosts`` is warmed up.
+
+        :param n: number of connections to establish.
+                  Defaults to ``None`` (all client's connections).
+        :return: number of established connections.
+        """
+        connections = [self.connection] + list(self.connections)
+        if n is not None:
+            connections = connections[:n]
+
+        errors_ = []
+
+        def connect(connection):
+            connection.context.settings = self.settings
+            connection.context.client_settings = self.client_settings
+            try:
+                if not connection.connected:
+                    connection.connect()
+            except (errors.SocketTimeoutError, errors.NetworkError) as e:
+                errors_.append(e)
+
+        threads = [
+            threading.Thread(target=connect, args=(connection, ))
+            for connection in connections
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        num_connected = sum(x.connected for x in connections)
+        if errors_ and not num_connected:
+            raise errors_[0]
+
+        return num_connected
+
     def disconnect(self):
         self.disconnect_connection()
         for connection in self.connections:
@@ -196,33 +349,59 @@ class Client(object):
         self.last_query = None
 
     def receive_result(self, with_column_types=False, progress=False,
-                       columnar=False):
+                       columnar=False, packet_generator=None,
+                       row_factory=None):
 
-        gen = self.packet_generator()
+        gen = packet_generator
+        if gen is None:
+            gen = self.packet_generator()
+        client_settings = self.connection.context.client_settings
+        kwargs = {
+            'lazy_rows': client_settings['lazy_rows'],
+            'columnar_format': client_settings['columnar_format'],
+            'max_result_memory': client_settings['max_result_memory'],
+            'row_factory': row_factory
+        }
 
         if progress:
             return self.progress_query_result_cls(
-                gen, with_column_types=with_column_types, columnar=columnar
+                gen, with_column_types=with_column_types, columnar=columnar,
+                **kwargs
             )
 
         else:
             result = self.query_result_cls(
-                gen, with_column_types=with_column_types, columnar=columnar
+                gen, with_column_types=with_column_types, columnar=columnar,
+                **kwargs
             )
             return result.get_result()
 
-    def iter_receive_result(self, with_column_types=False):
+    def iter_receive_result(self, with_column_types=False, prefetch_blocks=0):
         gen = self.packet_generator()
+        if prefetch_blocks:
+            gen = prefetch(gen, prefetch_blocks)
 
+        client_settings = self.connection.context.client_settings
         result = self.iter_query_result_cls(
-            gen, with_column_types=with_column_types
+            gen, with_column_types=with_column_types,
+            lazy_rows=client_settings['lazy_rows']
         )
 
         for rows in result:
             for row in rows:
                 yield row
 
+    def iter_receive_blocks(self, prefetch_blocks=0):
+        gen = self.packet_generator()
+        if prefetch_blocks:
+            gen = prefetch(gen, prefetch_blocks)
+
+        return IterBlocksQueryResult(gen)
+
     def packet_generator(self):
+        # Nothing is written into connection after this point.
+        self.connection.set_receiving(True)
+
         while True:
             try:
                 packet = self.receive_packet()
@@ -282,6 +461,8 @@ class Client(object):
         query_settings = self.settings.copy()
         query_settings.update(settings)
         self.connection.context.settings = query_settings
+        self.connection.context.low_cardinality_dictionaries.clear()
+        self.connection.context.low_cardinality_position = 0
 
     def track_current_database(self, query):
         query = query.strip('; ')
@@ -293,37 +474,54 @@ class Client(object):
         if hasattr(self, 'connection'):
             num_connections += 1
 
+        failed = []
         for i in range(num_connections):
             try:
-                self.connection = self.get_connection()
+                self.connection = self.get_connection(exclude=failed)
                 self.make_query_settings(settings)
                 self.connection.force_connect()
+                self.enable_raw(enabled=False)
                 self.last_query = QueryInfo()
 
             except (errors.SocketTimeoutError, errors.NetworkError):
                 if i < num_connections - 1:
+                    failed.append(self.connection)
                     continue
                 raise
 
             return
 
     @contextmanager
-    def disconnect_on_error(self, query, settings):
+    def disconnect_on_error(self, query, settings, record_latency=True):
+        # Streamed results are received after exit, so query latency is
+        # not recorded for them.
+        started = None
         try:
             self.establish_connection(settings)
             self.connection.server_info.session_timezone = None
 
+            host, port = self.connection.host, self.connection.port
+            started = time()
             yield
 
             self.track_current_database(query)
 
-        except (Exception, KeyboardInterrupt):
+            if self.host_selector is not None and record_latency:
+                self.host_selector.record_query(host, port, time() - started)
+
+        except (Exception, KeyboardInterrupt) as e:
+            # Connection errors are already recorded on connect.
+            if self.host_selector is not None and started is not None and \
+                    isinstance(e, self.host_errors):
+                self.host_selector.record_error(host, port)
+
             self.disconnect()
             raise
 
     def execute(self, query, params=None, with_column_types=False,
                 external_tables=None, query_id=None, settings=None,
-                types_check=False, columnar=False):
+                types_check=False, columnar=False, cache=True,
+                row_factory=None):
         """
         Executes query.
 
@@ -352,6 +550,14 @@ class Client(object):
                          returned in column-oriented form.
                          It also allows to INSERT data in columnar form.
                          Defaults to ``False`` (row-like form).
+        :param cache: use client's query cache for SELECT queries if it is
+                      configured. Defaults to ``True``.
+        :param row_factory: callable that takes columns names with types and
+                            returns function for building list of rows from
+                            columns of each block. Built-in factories are
+                            in :mod:`clickhouse_driver.rowfactory`.
+                            Ignored with ``columnar=True``.
+                            Defaults to ``None`` (rows are tuples).
 
         :return: * number of inserted rows for INSERT queries with data.
                    Returning rows count from INSERT FROM SELECT is not
@@ -367,26 +573,89 @@ class Client(object):
 
         start_time = time()
 
-        with self.disconnect_on_error(query, settings):
-            # INSERT queries can use list/tuple/generator of list/tuples/dicts.
-            # For SELECT parameters can be passed in only in dict right now.
-            is_insert = isinstance(params, (list, tuple, types.GeneratorType))
-
-            if is_insert:
-                rv = self.process_insert_query(
-                    query, params, external_tables=external_tables,
-                    query_id=query_id, types_check=types_check,
-                    columnar=columnar
-                )
-            else:
-                rv = self.process_ordinary_query(
-                    query, params=params, with_column_types=with_column_types,
-                    external_tables=external_tables,
-                    query_id=query_id, types_check=types_check,
-                    columnar=columnar
+        # INSERT queries can use list/tuple/generator of list/tuples/dicts.
+        # For SELECT parameters can be passed in only in dict right now.
+        is_insert = isinstance(params, (list, tuple, types.GeneratorType))
+
+        use_cache = cache and self.query_cache is not None and \
+            not is_insert and not external_tables and is_read_query(query)
+
+        if use_cache:
+            rv = self.receive_cached_result(
+                query, params=params, settings=settings,
+                with_column_types=with_column_types, columnar=columnar,
+                row_factory=row_factory
+            )
+            if rv is not None:
+                self.last_query.store_elapsed(time() - start_time)
+                return rv
+
+        attempt = 0
+        while True:
+            try:
+                with self.disconnect_on_error(query, settings):
+                    if is_insert:
+                        rv = self.process_insert_query(
+                            query, params, external_tables=external_tables,
+                            query_id=query_id, types_check=types_check,
+                            columnar=columnar
+                        )
+                    elif use_cache:
+                        rv = self.process_cached_query(
+                            query, params=params,
+                            with_column_types=with_column_types,
+                            query_id=query_id, columnar=columnar,
+                            row_factory=row_factory
+                        )
+                    else:
+                        rv = self.process_ordinary_query(
+                            query, params=params,
+                            with_column_types=with_column_types,
+                            external_tables=external_tables,
+                            query_id=query_id, types_check=types_check,
+                            columnar=columnar, row_factory=row_factory
+                        )
+                    self.last_query.store_elapsed(time() - start_time)
+                    return rv
+
+            except Exception as e:
+                attempt += 1
+                if not self.should_retry(e, attempt, query, params, settings):
+                    raise
+
+                delay = self.retry_policy.get_delay(attempt)
+                logger.warning(
+                    'Query failed on attempt %s: %s. Retrying in %.2f sec.',
+                    attempt, e, delay
                 )
-            self.last_query.store_elapsed(time() - start_time)
-            return rv
+                self.failover()
+                sleep(delay)
+
+    def should_retry(self, exc, attempt, query, params, settings):
+        policy = self.retry_policy
+        if policy is None or attempt >= policy.max_attempts:
+            return False
+
+        if not policy.is_transient(exc):
+            return False
+
+        if isinstance(params, types.GeneratorType):
+            # Data can't be replayed.
+            return False
+
+        elif isinstance(params, (list, tuple)):
+            token = 'insert_deduplication_token'
+            return token in (settings or {}) or token in self.settings
+
+        return is_read_query(query)
+
+    def failover(self):
+        """
+        Moves failed host to the end of the hosts list. Next connection
+        attempt will go to another host from ``alt_hosts``.
+        """
+        if self.connection.host_selector is None:
+            self.connection.hosts.rotate(-1)
 
     def execute_with_progress(
             self, query, params=None, with_column_types=False,
@@ -418,7 +687,8 @@ class Client(object):
         :return: :ref:`progress-query-result` proxy.
         """
 
-        with self.disconnect_on_error(query, settings):
+        with self.disconnect_on_error(query, settings,
+                                      record_latency=False):
             return self.process_ordinary_query_with_progress(
                 query, params=params, with_column_types=with_column_types,
                 external_tables=external_tables, query_id=query_id,
@@ -428,7 +698,7 @@ class Client(object):
     def execute_iter(
             self, query, params=None, with_column_types=False,
             external_tables=None, query_id=None, settings=None,
-            types_check=False, chunk_size=1):
+            types_check=False, chunk_size=1, prefetch=0):
         """
         *New in version 0.0.14.*
 
@@ -451,16 +721,62 @@ class Client(object):
         :param types_check: enables type checking of data for INSERT queries.
                             Causes additional overhead. Defaults to ``False``.
         :param chunk_size: chunk query results.
+        :param prefetch: number of blocks to read and decode ahead in
+                         background thread while rows are consumed.
+                         Defaults to ``0`` (no prefetching).
         :return: :ref:`iter-query-result` proxy.
         """
-        with self.disconnect_on_error(query, settings):
+        with self.disconnect_on_error(query, settings,
+                                      record_latency=False):
             rv = self.iter_process_ordinary_query(
                 query, params=params, with_column_types=with_column_types,
                 external_tables=external_tables,
-                query_id=query_id, types_check=types_check
+                query_id=query_id, types_check=types_check,
+                prefetch=prefetch
             )
             return chunks(rv, chunk_size) if chunk_size > 1 else rv
 
+    def execute_iter_blocks(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None, types_check=False, prefetch=0):
+        """
+        Executes SELECT query with results streaming by blocks.
+        Blocks are returned in columnar form as they are received from the
+        server without transposing into rows. See, :ref:`execute-iter`.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :param types_check: enables type checking of data for external
+                            tables. Causes additional overhead.
+                            Defaults to ``False``.
+        :param prefetch: number of blocks to read and decode ahead in
+                         background thread while blocks are consumed.
+                         Defaults to ``0`` (no prefetching).
+        :return: :ref:`iter-blocks-query-result` proxy. Each item is a
+                 tuple of columns names with types and columns. Columns
+                 are NumPy arrays with ``use_numpy`` setting.
+        """
+        with self.disconnect_on_error(query, settings,
+                                      record_latency=False):
+            if params is not None:
+                query = self.substitute_params(
+                    query, params, self.connection.context
+                )
+
+            self.connection.send_query(query, query_id=query_id,
+                                       params=params)
+            self.connection.send_external_tables(external_tables,
+                                                 types_check=types_check)
+
+            return self.iter_receive_blocks(prefetch_blocks=prefetch)
+
     def query_dataframe(
             self, query, params=None, external_tables=None, query_id=None,
             settings=None, replace_nonwords=True):
@@ -549,6 +865,292 @@ class Client(object):
             self.last_query.store_elapsed(time() - start_time)
             return rv
 
+    def query_arrow(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Queries ``pyarrow.Table`` with specified SELECT query.
+        Columns data is read from the wire directly into Arrow buffers
+        without intermediate Python objects.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: pyarrow Table.
+        """
+
+        try:
+            from .arrow.result import ArrowQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        start_time = time()
+
+        with self.disconnect_on_error(query, settings):
+            self.send_arrow_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id
+            )
+            result = ArrowQueryResult(
+                self.packet_generator(), self.connection.context
+            )
+            rv = result.get_result()
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    def iter_arrow_batches(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Executes SELECT query with results streaming by
+        ``pyarrow.RecordBatch`` per received block.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: iterator of pyarrow RecordBatches.
+        """
+
+        try:
+            from .arrow.result import ArrowIterQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        with self.disconnect_on_error(query, settings,
+                                      record_latency=False):
+            self.send_arrow_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id
+            )
+            return ArrowIterQueryResult(self.packet_generator())
+
+    def insert_arrow(
+            self, query, table, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Inserts ``pyarrow.Table`` with specified query.
+        Columns data is written from Arrow buffers without intermediate
+        Python objects. Blocks are zero-copy slices of the table.
+
+        :param query: query that will be send to server.
+        :param table: pyarrow Table or RecordBatch. Objects with
+                      ``to_arrow`` method (e.g. Polars DataFrame) are also
+                      accepted.
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: number of inserted rows.
+        """
+
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        if hasattr(table, 'to_arrow'):
+            table = table.to_arrow()
+
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+
+        start_time = time()
+
+        with self.disconnect_on_error(query, settings):
+            self.connection.send_query(query, query_id=query_id)
+            self.connection.send_external_tables(external_tables)
+
+            sample_block = self.receive_sample_block()
+            rv = None
+            if sample_block:
+                columns = [x[0] for x in sample_block.columns_with_types]
+                # raise if any columns are missing from the table
+                diff = set(columns) - set(table.column_names)
+                if len(diff):
+                    msg = "Table missing required columns: {}"
+                    raise ValueError(msg.format(list(diff)))
+
+                self.enable_arrow()
+                rv = self.send_data(
+                    sample_block, table.select(columns), columnar=True
+                )
+                self.receive_end_of_query()
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    def send_arrow_query(self, query, params=None, external_tables=None,
+                         query_id=None):
+        if params is not None:
+            query = self.substitute_params(
+                query, params, self.connection.context
+            )
+
+        self.connection.send_query(query, query_id=query_id, params=params)
+        self.connection.send_external_tables(external_tables)
+        self.enable_arrow()
+
+    def enable_arrow(self):
+        # External tables are sent before and are not affected.
+        context = self.connection.context
+        client_settings = context.client_settings
+        client_settings['use_arrow'] = True
+        context.client_settings = client_settings
+
+    def execute_raw(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None, compressed=False):
+        """
+        Executes SELECT query and returns received blocks in Native format
+        without decoding columns data. Blocks can be inserted into another
+        server with :meth:`insert_raw`.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :param compressed: keep blocks compressed as they were received.
+                           Takes effect only with enabled compression.
+                           Defaults to ``False``.
+        :return: list of :class:`~clickhouse_driver.block.RawBlock`.
+        """
+
+        start_time = time()
+
+        with self.disconnect_on_error(query, settings):
+            self.send_raw_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id, compressed=compressed
+            )
+            rv = list(RawBlocksQueryResult(self.packet_generator()))
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    def iter_raw_blocks(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None, compressed=False):
+        """
+        Executes SELECT query with results streaming by blocks in Native
+        format without decoding columns data.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :param compressed: keep blocks compressed as they were received.
+                           Takes effect only with enabled compression.
+                           Defaults to ``False``.
+        :return: iterator of :class:`~clickhouse_driver.block.RawBlock`.
+        """
+
+        with self.disconnect_on_error(query, settings,
+                                      record_latency=False):
+            self.send_raw_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id, compressed=compressed
+            )
+            return RawBlocksQueryResult(self.packet_generator())
+
+    def insert_raw(
+            self, query, blocks, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Inserts blocks in Native format received by :meth:`execute_raw` or
+        :meth:`iter_raw_blocks` as is. Compressed blocks require enabled
+        compression. Blocks should be received from server with the same
+        protocol revision.
+
+        :param query: query that will be send to server.
+        :param blocks: iterable of :class:`~clickhouse_driver.block.RawBlock`.
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: number of inserted rows.
+        """
+
+        start_time = time()
+
+        with self.disconnect_on_error(query, settings):
+            self.connection.send_query(query, query_id=query_id)
+            self.connection.send_external_tables(external_tables)
+
+            sample_block = self.receive_sample_block()
+            rv = None
+            if sample_block:
+                rv = self.send_raw_data(blocks)
+                self.receive_end_of_insert_query()
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    def send_raw_query(self, query, params=None, external_tables=None,
+                       query_id=None, compressed=False):
+        if params is not None:
+            query = self.substitute_params(
+                query, params, self.connection.context
+            )
+
+        self.connection.send_query(query, query_id=query_id, params=params)
+        self.connection.send_external_tables(external_tables)
+        self.enable_raw(compressed=compressed)
+
+    def enable_raw(self, compressed=False, enabled=True):
+        # External tables are sent before and are not affected. Raw mode is
+        # reset before each query.
+        block_in = self.connection.block_in
+        block_in.raw = enabled
+        block_in.raw_compressed = compressed
+
+    def send_raw_data(self, blocks):
+        inserted_rows = 0
+
+        for block in blocks:
+            if not block.num_rows:
+                continue
+
+            self.connection.send_raw_data(block)
+            inserted_rows += block.num_rows
+
+            # Starting from the specific revision there are profile events
+            # sent by server in response to each inserted block
+            self.receive_profile_events()
+
+        # Empty block means end of data.
+        self.connection.send_data(RowOrientedBlock())
+        # If enabled by revision profile events are also sent after empty block
+        self.receive_profile_events()
+
+        return inserted_rows
+
     def process_ordinary_query_with_progress(
             self, query, params=None, with_column_types=False,
             external_tables=None, query_id=None,
@@ -568,7 +1170,7 @@ class Client(object):
     def process_ordinary_query(
             self, query, params=None, with_column_types=False,
             external_tables=None, query_id=None,
-            types_check=False, columnar=False):
+            types_check=False, columnar=False, row_factory=None):
 
         if params is not None:
             query = self.substitute_params(
@@ -578,12 +1180,98 @@ class Client(object):
         self.connection.send_external_tables(external_tables,
                                              types_check=types_check)
         return self.receive_result(with_column_types=with_column_types,
-                                   columnar=columnar)
+                                   columnar=columnar, row_factory=row_factory)
+
+    def process_cached_query(
+            self, query, params=None, with_column_types=False,
+            query_id=None, columnar=False, row_factory=None):
+
+        if params is not None:
+            query = self.substitute_params(
+                query, params, self.connection.context
+            )
+
+        key = self.make_cache_key(query, params=params)
+        self.connection.send_query(query, query_id=query_id, params=params)
+        self.connection.send_external_tables(None)
+
+        # Blocks are received compressed if compression is enabled.
+        self.enable_raw(compressed=True)
+        try:
+            blocks = [
+                packet.block for packet in self.packet_generator()
+                if packet.block is not None
+            ]
+        finally:
+            self.enable_raw(enabled=False)
+
+        # Totals and extremes are decoded on receive.
+        if all(isinstance(block, RawBlock) for block in blocks):
+            self.query_cache.set(key, blocks)
+
+        return self.receive_result(
+            with_column_types=with_column_types, columnar=columnar,
+            packet_generator=self.iter_cached_packets(blocks),
+            row_factory=row_factory
+        )
+
+    def receive_cached_result(
+            self, query, params=None, settings=None, with_column_types=False,
+            columnar=False, row_factory=None):
+        """
+        Returns cached result without connecting to the server or ``None``
+        if query isn't cached. Blocks are decoded with server info received
+        on the last connect.
+        """
+        context = self.connection.context
+        if context.server_info is None:
+            return None
+
+        self.make_query_settings(settings)
+        if params is not None:
+            query = self.substitute_params(query, params, context)
+
+        blocks = self.query_cache.get(self.make_cache_key(query, params))
+        if blocks is None:
+            return None
+
+        context.server_info.session_timezone = None
+        self.last_query = QueryInfo()
+        return self.receive_result(
+            with_column_types=with_column_types, columnar=columnar,
+            packet_generator=self.iter_cached_packets(blocks),
+            row_factory=row_factory
+        )
+
+    def make_cache_key(self, query, params=None):
+        connection = self.connection
+        context = connection.context
+        server_side_params = context.client_settings['server_side_params']
+
+        # Hosts are known before connect.
+        return self.query_cache.make_key(
+            query, context.settings, connection.database,
+            params=params if server_side_params else None,
+            user=connection.user, hosts=connection.hosts
+        )
+
+    def iter_cached_packets(self, blocks):
+        from .streams.raw import decode_raw_block
+
+        context = self.connection.context
+        for block in blocks:
+            if isinstance(block, RawBlock):
+                block = decode_raw_block(block, context)
+
+            packet = Packet()
+            packet.type = ServerPacketTypes.DATA
+            packet.block = block
+            yield packet
 
     def iter_process_ordinary_query(
             self, query, params=None, with_column_types=False,
             external_tables=None, query_id=None,
-            types_check=False):
+            types_check=False, prefetch=0):
 
         if params is not None:
             query = self.substitute_params(
@@ -593,7 +1281,8 @@ class Client(object):
         self.connection.send_query(query, query_id=query_id, params=params)
         self.connection.send_external_tables(external_tables,
                                              types_check=types_check)
-        return self.iter_receive_result(with_column_types=with_column_types)
+        return self.iter_receive_result(with_column_types=with_column_types,
+                                        prefetch_blocks=prefetch)
 
     def process_insert_query(self, query_without_data, data,
                              external_tables=None, query_id=None,
@@ -637,7 +1326,11 @@ class Client(object):
         client_settings = self.connection.context.client_settings
         block_cls = ColumnOrientedBlock if columnar else RowOrientedBlock
 
-        if client_settings['use_numpy']:
+        if client_settings.get('use_arrow'):
+            from .arrow.helpers import column_chunks as arrow_column_chunks
+            slicer = arrow_column_chunks
+
+        elif client_settings['use_numpy']:
             try:
                 from .numpy.helpers import column_chunks as numpy_column_chunks
 
@@ -672,6 +1365,8 @@ class Client(object):
         return inserted_rows
 
     def receive_end_of_query(self):
+        self.connection.set_receiving(True)
+
         while True:
             packet = self.connection.receive_packet()
 
@@ -701,6 +1396,8 @@ class Client(object):
                 raise errors.UnexpectedPacketFromServerError(message)
 
     def receive_end_of_insert_query(self):
+        self.connection.set_receiving(True)
+
         while True:
             packet = self.connection.receive_packet()
 
@@ -0,0 +1,158 @@
+from cpython cimport Py_INCREF
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.dict cimport PyDict_New, PyDict_Next, PyDict_SetItem
+from cpython.list cimport PyList_Append, PyList_New, PyList_SET_ITEM
+from cpython.object cimport PyObject
+
+# Array and Map columns are stored as flat items after offsets. Offset is
+# the end of the row items: offsets of rows [[1, 2], [], [3]] are 2, 2, 3.
+# Offsets are little-endian UInt64 numbers.
+
+
+cdef extern from "Python.h":
+    object PySequence_Fast(object o, const char *m)
+    Py_ssize_t PySequence_Fast_GET_SIZE(object o)
+    void *PySequence_Fast_GET_ITEM(object o, Py_ssize_t i)
+
+
+cdef inline void write_uint64(unsigned char *out, unsigned long long value):
+    cdef int k
+    for k in range(8):
+        out[k] = <unsigned char> (value >> (8 * k))
+
+
+def split_by_offsets(data, offsets):
+    """
+    :param data: sequence of flat items.
+    :param offsets: sequence of n + 1 offsets starting with 0.
+    :return: list of n lists of ``data`` items.
+    """
+    seq = PySequence_Fast(data, 'data must be a sequence')
+    offsets_seq = PySequence_Fast(offsets, 'offsets must be a sequence')
+    cdef Py_ssize_t i, j, begin, end
+    cdef Py_ssize_t n_items = PySequence_Fast_GET_SIZE(offsets_seq) - 1
+    cdef Py_ssize_t n_data = PySequence_Fast_GET_SIZE(seq)
+    cdef object value
+
+    if n_items < 0:
+        raise ValueError('Offsets must start with 0')
+
+    rv = PyList_New(n_items)
+    begin = <object> PySequence_Fast_GET_ITEM(offsets_seq, 0)
+    for i in range(n_items):
+        end = <object> PySequence_Fast_GET_ITEM(offsets_seq, i + 1)
+        if not 0 <= begin <= end <= n_data:
+            raise ValueError('Offset {} is out of range'.format(end))
+
+        item = PyList_New(end - begin)
+        for j in range(begin, end):
+            value = <object> PySequence_Fast_GET_ITEM(seq, j)
+            Py_INCREF(value)
+            PyList_SET_ITEM(item, j - begin, value)
+
+        Py_INCREF(item)
+        PyList_SET_ITEM(rv, i, item)
+        begin = end
+
+    return rv
+
+
+def dicts_from_offsets(keys, values, offsets):
+    """
+    :param keys: sequence of flat keys.
+    :param values: sequence of flat values.
+    :param offsets: sequence of row end offsets.
+    :return: list of dicts.
+    """
+    keys_seq = PySequence_Fast(keys, 'keys must be a sequence')
+    values_seq = PySequence_Fast(values, 'values must be a sequence')
+    offsets_seq = PySequence_Fast(offsets, 'offsets must be a sequence')
+
+    cdef Py_ssize_t i, j, begin = 0, end
+    cdef Py_ssize_t n_items = PySequence_Fast_GET_SIZE(offsets_seq)
+    cdef Py_ssize_t n_keys = min(
+        PySequence_Fast_GET_SIZE(keys_seq),
+        PySequence_Fast_GET_SIZE(values_seq)
+    )
+
+    rv = PyList_New(n_items)
+    for i in range(n_items):
+        end = <object> PySequence_Fast_GET_ITEM(offsets_seq, i)
+        if not begin <= end <= n_keys:
+            raise ValueError('Offset {} is out of range'.format(end))
+
+        item = PyDict_New()
+        for j in range(begin, end):
+            PyDict_SetItem(
+                item,
+                <object> PySequence_Fast_GET_ITEM(keys_seq, j),
+                <object> PySequence_Fast_GET_ITEM(values_seq, j)
+            )
+
+        Py_INCREF(item)
+        PyList_SET_ITEM(rv, i, item)
+        begin = end
+
+    return rv
+
+
+def flatten_items(items):
+    """
+    :param items: sequence of sequences.
+    :return: tuple of packed row end offsets and list of flat items.
+    """
+    seq = PySequence_Fast(items, 'items must be a sequence')
+    cdef Py_ssize_t i, j, n_nested, n_items = PySequence_Fast_GET_SIZE(seq)
+    cdef unsigned long long offset = 0
+
+    offsets = PyBytes_FromStringAndSize(NULL, 8 * n_items)
+    cdef unsigned char *out = <unsigned char *> PyBytes_AS_STRING(offsets)
+    cdef list flat = []
+
+    for i in range(n_items):
+        nested = PySequence_Fast(
+            <object> PySequence_Fast_GET_ITEM(seq, i),
+            'items must be sequences'
+        )
+        n_nested = PySequence_Fast_GET_SIZE(nested)
+        for j in range(n_nested):
+            PyList_Append(flat, <object> PySequence_Fast_GET_ITEM(nested, j))
+
+        offset += n_nested
+        write_uint64(out + 8 * i, offset)
+
+    return offsets, flat
+
+
+def flatten_dicts(items):
+    """
+    :param items: sequence of dicts.
+    :return: tuple of packed row end offsets, list of flat keys and list of
+             flat values.
+    """
+    seq = PySequence_Fast(items, 'items must be a sequence')
+    cdef Py_ssize_t i, pos, n_items = PySequence_Fast_GET_SIZE(seq)
+    cdef unsigned long long offset = 0
+    cdef PyObject *key
+    cdef PyObject *value
+
+    offsets = PyBytes_FromStringAndSize(NULL, 8 * n_items)
+    cdef unsigned char *out = <unsigned char *> PyBytes_AS_STRING(offsets)
+    cdef list keys = [], values = []
+
+    for i in range(n_items):
+        item = <object> PySequence_Fast_GET_ITEM(seq, i)
+        if isinstance(item, dict):
+            pos = 0
+            while PyDict_Next(item, &pos, &key, &value):
+                PyList_Append(keys, <object> key)
+                PyList_Append(values, <object> value)
+        else:
+            for k, v in item.items():
+                PyList_Append(keys, k)
+                PyList_Append(values, v)
+
+        offset += len(item)
+        write_uint64(out + 8 * i, offset)
+
+    return offsets, keys, values
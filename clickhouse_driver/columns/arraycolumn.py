@@ -1,9 +1,13 @@
+from array import array
 from itertools import chain
 from struct import Struct
 
-from .base import Column
+from ..flatcolumn import FlatColumn
+from .arraycodec import flatten_items, split_by_offsets
+from .base import Column, FormatColumn
 from .intcolumn import UInt64Column
-from ..util.helpers import pairwise
+
+size_struct = Struct('<Q')
 
 
 class ArrayColumn(Column):
@@ -24,13 +28,21 @@ class ArrayColumn(Column):
     3) size of array 2 plus size of all array before in depth=1: 2 + 2 = 4
 
     After sizes info comes flatten data: 3 -> 4 -> 5 -> 6
+
+    Top level arrays are not built with ``read_flat``: column is read as
+    :class:`~clickhouse_driver.flatcolumn.FlatColumn` of items of all rows
+    and offsets.
     """
     py_types = (list, tuple)
 
+    read_flat = False
+
     def __init__(self, nested_column, **kwargs):
         self.init_kwargs = kwargs
         self.size_column = UInt64Column(**kwargs)
         self.nested_column = nested_column
+        # Column is wrapped into another ArrayColumn on reading and writing.
+        self.inner_column = nested_column
         self._write_depth_0_size = True
         super(ArrayColumn, self).__init__(**kwargs)
         self.null_value = []
@@ -58,7 +70,9 @@ class ArrayColumn(Column):
         nulls_map = []
 
         column = self
-        sizes = [len(value)] if self._write_depth_0_size else []
+        sizes = []
+        if self._write_depth_0_size:
+            sizes.append(size_struct.pack(len(value)))
 
         while True:
             nested_column = column.nested_column
@@ -67,21 +81,14 @@ class ArrayColumn(Column):
                     nulls_map = [x is None for x in value]
                 break
 
-            offset = 0
-            new_value = []
-            for x in value:
-                offset += len(x)
-                sizes.append(offset)
-                new_value.extend(x)
-
-            value = new_value
+            offsets, value = flatten_items(value)
+            sizes.append(offsets)
             column = nested_column
 
         if nulls_map:
             self._write_nulls_map(nulls_map, buf)
 
-        ns = Struct('<{}Q'.format(len(sizes)))
-        buf.write(ns.pack(*sizes))
+        buf.write(b''.join(sizes))
 
     def _write_data(self, value, buf):
         if self.nullable:
@@ -120,6 +127,17 @@ class ArrayColumn(Column):
 
         self.nested_column.write_state_prefix(buf)
 
+    def reset(self):
+        super(ArrayColumn, self).reset()
+
+        if self.nested_column is not self.inner_column:
+            # Unwrap and restore nullable flag moved to wrapper.
+            self.nullable = self.nested_column.nullable
+            self.nested_column = self.inner_column
+            self._write_depth_0_size = True
+
+        self.nested_column.reset()
+
     def _read(self, size, buf):
         slices_series = [[0, size]]
         nested_column = self.nested_column
@@ -143,15 +161,29 @@ class ArrayColumn(Column):
         if nested_column.nullable:
             nulls_map = self._read_nulls_map(n_items, buf)
 
+        # Values of one-dimensional numeric arrays are read into typed array.
+        read_as_array = False
+        if isinstance(nested_column, FormatColumn):
+            read_as_array = self.read_flat and len(slices_series) == 2 and \
+                nested_column.can_read_as_array()
+            nested_column.read_as_array = read_as_array
+
         data = []
         if n_items:
-            data = list(nested_column._read_data(
+            data = nested_column._read_data(
                 n_items, buf, nulls_map=nulls_map
-            ))
+            )
+
+        if self.read_flat:
+            # First slices are the ones of wrapper array.
+            for slices in reversed(slices_series[2:]):
+                data = split_by_offsets(data, slices)
+            offsets = array('Q', slices_series[1][1:])
+            return (FlatColumn(data, offsets), )
 
         # Build nested structure.
         for slices in reversed(slices_series):
-            data = [data[begin:end] for begin, end in pairwise(slices)]
+            data = split_by_offsets(data, slices)
 
         return tuple(data)
 
@@ -0,0 +1,187 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def apply_null_map(array, null_map):
+    """
+    Sets validity of array from ClickHouse null map: byte 1 means NULL.
+    """
+    if b'\x01' not in null_map:
+        return array
+
+    if pa.types.is_dictionary(array.type):
+        indices = apply_null_map(array.indices, null_map)
+        return pa.DictionaryArray.from_arrays(indices, array.dictionary)
+
+    nulls = pa.Array.from_buffers(
+        pa.uint8(), len(array), [None, pa.py_buffer(null_map)]
+    )
+    validity = pc.equal(nulls, 0)
+
+    if array.offset or array.type.num_fields:
+        return pc.if_else(validity, array, pa.scalar(None, array.type))
+
+    buffers = array.buffers()
+    buffers[0] = validity.buffers()[1]
+    return pa.Array.from_buffers(array.type, len(array), buffers)
+
+
+def write_array_buffer(array, item_size, buf):
+    """
+    Writes values buffer of fixed-width array respecting array slicing.
+    """
+    if not len(array):
+        return
+
+    start = array.offset * item_size
+    data = memoryview(array.buffers()[1])
+    buf.write_buffer(data[start:start + len(array) * item_size])
+
+
+class ArrowColumn(object):
+    """
+    Reads column data into ``pyarrow.Array`` and writes it from
+    ``pyarrow.Array``.
+    """
+    arrow_type = None
+
+    null_value = 0
+
+    def __init__(self, context=None, **kwargs):
+        self.context = context
+        self.nullable = False
+        self.input_null_as_default = False
+        if context is not None:
+            self.input_null_as_default = context.client_settings \
+                .get('input_format_null_as_default', False)
+        super(ArrowColumn, self).__init__()
+
+    def read_state_prefix(self, buf):
+        pass
+
+    def read_data(self, n_items, buf):
+        raise NotImplementedError
+
+    def write_state_prefix(self, buf):
+        pass
+
+    def write_data(self, array, buf):
+        array = self.prepare_data(array)
+
+        if array.null_count:
+            if not (self.nullable or self.input_null_as_default):
+                raise ValueError('NULL value in non-Nullable column')
+            array = self.fill_nulls(array)
+
+        self._write_data(array, buf)
+
+    def prepare_data(self, array):
+        """
+        Casts array into type that is written.
+        """
+        return array
+
+    def fill_nulls(self, array):
+        null_value = pa.scalar(self.null_value, type=array.type)
+        return pc.if_else(pc.is_valid(array), array, null_value)
+
+    def _write_data(self, array, buf):
+        raise NotImplementedError
+
+
+class FixedWidthArrowColumn(ArrowColumn):
+    """
+    Column with fixed-size items. Items are read as single buffer.
+    """
+    # Type of items as they are serialized.
+    raw_type = None
+
+    def __init__(self, **kwargs):
+        super(FixedWidthArrowColumn, self).__init__(**kwargs)
+        if self.arrow_type is None:
+            self.arrow_type = self.raw_type
+
+    @property
+    def item_size(self):
+        return self.raw_type.bit_width // 8
+
+    def read_data(self, n_items, buf):
+        data = buf.read(n_items * self.item_size)
+        raw = pa.Array.from_buffers(
+            self.raw_type, n_items, [None, pa.py_buffer(data)]
+        )
+        return self.from_raw(raw)
+
+    def from_raw(self, raw):
+        return raw
+
+    def prepare_data(self, array):
+        if pa.types.is_dictionary(array.type):
+            array = array.dictionary_decode()
+        return self.to_raw(array)
+
+    def to_raw(self, array):
+        return array.cast(self.raw_type)
+
+    def _write_data(self, array, buf):
+        write_array_buffer(array, self.item_size, buf)
+
+
+class ArrowInt8Column(FixedWidthArrowColumn):
+    ch_type = 'Int8'
+    raw_type = pa.int8()
+
+
+class ArrowInt16Column(FixedWidthArrowColumn):
+    ch_type = 'Int16'
+    raw_type = pa.int16()
+
+
+class ArrowInt32Column(FixedWidthArrowColumn):
+    ch_type = 'Int32'
+    raw_type = pa.int32()
+
+
+class ArrowInt64Column(FixedWidthArrowColumn):
+    ch_type = 'Int64'
+    raw_type = pa.int64()
+
+
+class ArrowUInt8Column(FixedWidthArrowColumn):
+    ch_type = 'UInt8'
+    raw_type = pa.uint8()
+
+
+class ArrowUInt16Column(FixedWidthArrowColumn):
+    ch_type = 'UInt16'
+    raw_type = pa.uint16()
+
+
+class ArrowUInt32Column(FixedWidthArrowColumn):
+    ch_type = 'UInt32'
+    raw_type = pa.uint32()
+
+
+class ArrowUInt64Column(FixedWidthArrowColumn):
+    ch_type = 'UInt64'
+    raw_type = pa.uint64()
+
+
+class ArrowFloat32Column(FixedWidthArrowColumn):
+    ch_type = 'Float32'
+    raw_type = pa.float32()
+
+
+class ArrowFloat64Column(FixedWidthArrowColumn):
+    ch_type = 'Float64'
+    raw_type = pa.float64()
+
+
+class ArrowBoolColumn(FixedWidthArrowColumn):
+    ch_type = 'Bool'
+    raw_type = pa.uint8()
+    arrow_type = pa.bool_()
+
+    def from_raw(self, raw):
+        # Arrow booleans are bit-packed.
+        return raw.cast(self.arrow_type)
@@ -0,0 +1,113 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ...util.compat import get_localzone_name_compat
+from .base import FixedWidthArrowColumn
+
+
+def date_to_days(array):
+    """
+    Integers are treated as days since epoch.
+    """
+    if pa.types.is_integer(array.type):
+        return array.cast(pa.int32())
+    return array.cast(pa.date32(), safe=False).view(pa.int32())
+
+
+def timestamp_to_int(array, unit):
+    """
+    Integers are treated as timestamps in given unit.
+    Timezone-aware timestamps are stored in UTC and written as is.
+    """
+    if pa.types.is_integer(array.type):
+        return array.cast(pa.int64())
+
+    tz = getattr(array.type, 'tz', None)
+    return array.cast(pa.timestamp(unit, tz=tz), safe=False) \
+        .view(pa.int64())
+
+
+class ArrowDateColumn(FixedWidthArrowColumn):
+    ch_type = 'Date'
+    raw_type = pa.uint16()
+    arrow_type = pa.date32()
+
+    def from_raw(self, raw):
+        return raw.cast(pa.int32()).view(self.arrow_type)
+
+    def to_raw(self, array):
+        return date_to_days(array).cast(self.raw_type)
+
+
+class ArrowDate32Column(FixedWidthArrowColumn):
+    ch_type = 'Date32'
+    raw_type = pa.date32()
+
+    def to_raw(self, array):
+        return date_to_days(array)
+
+
+class ArrowDateTimeColumn(FixedWidthArrowColumn):
+    raw_type = pa.uint32()
+
+    def __init__(self, timezone=None, **kwargs):
+        self.arrow_type = pa.timestamp('s', tz=timezone)
+        super(ArrowDateTimeColumn, self).__init__(**kwargs)
+
+    def from_raw(self, raw):
+        return raw.cast(pa.int64()).view(self.arrow_type)
+
+    def to_raw(self, array):
+        return timestamp_to_int(array, 's').cast(self.raw_type)
+
+
+class ArrowDateTime64Column(FixedWidthArrowColumn):
+    raw_type = pa.int64()
+    units = ((0, 's'), (3, 'ms'), (6, 'us'), (9, 'ns'))
+
+    def __init__(self, scale=0, timezone=None, **kwargs):
+        # Pick the most coarse Arrow unit that fits the scale.
+        for unit_scale, unit in self.units:
+            if scale <= unit_scale:
+                break
+
+        self.multiplier = 10 ** (unit_scale - scale)
+        self.arrow_type = pa.timestamp(unit, tz=timezone)
+        super(ArrowDateTime64Column, self).__init__(**kwargs)
+
+    def from_raw(self, raw):
+        if self.multiplier != 1:
+            raw = pc.multiply(raw, self.multiplier)
+        return raw.view(self.arrow_type)
+
+    def to_raw(self, array):
+        raw = timestamp_to_int(array, self.arrow_type.unit)
+        if self.multiplier != 1 and not pa.types.is_integer(array.type):
+            raw = pc.divide(raw, self.multiplier)
+        return raw.cast(self.raw_type)
+
+
+def create_arrow_datetime_column(spec, column_options):
+    if spec.startswith('DateTime64'):
+        cls = ArrowDateTime64Column
+        spec = spec[11:-1]
+        params = spec.split(',', 1)
+        column_options['scale'] = int(params[0])
+        if len(params) > 1:
+            spec = params[1].strip() + ')'
+    else:
+        cls = ArrowDateTimeColumn
+        spec = spec[9:]
+
+    context = column_options['context']
+
+    # Arrow timestamps are always stored in UTC. Timezone is used only for
+    # representation.
+    if spec and spec[-1] == ')':
+        tz_name = spec[1:-2]
+    elif context.settings.get('use_client_time_zone', False):
+        tz_name = get_localzone_name_compat()
+    else:
+        tz_name = context.server_info.get_timezone()
+
+    return cls(timezone=tz_name, **column_options)
@@ -0,0 +1,85 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ... import errors
+from ..enumcolumn import _parse_options
+from .base import FixedWidthArrowColumn
+
+
+class ArrowEnumColumn(FixedWidthArrowColumn):
+    """
+    Enum is read as dictionary array with names as dictionary values.
+    """
+
+    def __init__(self, name_by_value, **kwargs):
+        self.name_by_value = name_by_value
+        values = sorted(name_by_value)
+        self.values = pa.array(values, type=self.raw_type)
+        self.names = pa.array(
+            [name_by_value[x] for x in values], type=pa.string()
+        )
+        self.arrow_type = pa.dictionary(pa.int32(), pa.string())
+        super(ArrowEnumColumn, self).__init__(**kwargs)
+
+    def from_raw(self, raw):
+        indices = pc.index_in(raw, value_set=self.values)
+        return pa.DictionaryArray.from_arrays(indices, self.names)
+
+    def prepare_data(self, array):
+        # Only dictionary is mapped for dictionary arrays.
+        if pa.types.is_dictionary(array.type):
+            raw = self.to_raw(array.dictionary).take(array.indices)
+        else:
+            raw = self.to_raw(array)
+
+        unknown = pc.and_(pc.is_valid(array), pc.is_null(raw))
+        if pc.any(unknown).as_py():
+            choices = ', '.join(
+                "'{}' = {}".format(name.replace("'", r"\'"), value)
+                for value, name in sorted(self.name_by_value.items())
+            )
+            enum_str = '{}({})'.format(self.ch_type, choices)
+
+            raise errors.LogicalError(
+                "Unknown element '{}' for type {}"
+                .format(array.filter(unknown)[0].as_py(), enum_str)
+            )
+
+        return raw
+
+    def to_raw(self, array):
+        """
+        Unknown names and values are mapped to NULL.
+        """
+        if pa.types.is_integer(array.type):
+            indices = pc.index_in(
+                array.cast(pa.int64()), value_set=self.values.cast(pa.int64())
+            )
+        else:
+            indices = pc.index_in(
+                array.cast(pa.string()), value_set=self.names
+            )
+        return self.values.take(indices)
+
+
+class ArrowEnum8Column(ArrowEnumColumn):
+    ch_type = 'Enum8'
+    raw_type = pa.int8()
+
+
+class ArrowEnum16Column(ArrowEnumColumn):
+    ch_type = 'Enum16'
+    raw_type = pa.int16()
+
+
+def create_arrow_enum_column(spec, column_options):
+    if spec.startswith('Enum8'):
+        params = spec[6:-1]
+        cls = ArrowEnum8Column
+    else:
+        params = spec[7:-1]
+        cls = ArrowEnum16Column
+
+    name_by_value, _ = _parse_options(params)
+
+    return cls(name_by_value, **column_options)
@@ -0,0 +1,194 @@
+from math import log
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ...reader import read_binary_uint64
+from ...writer import write_binary_int64
+from ..lowcardinalitycolumn import LowCardinalityColumn
+from .base import ArrowColumn, apply_null_map, write_array_buffer
+
+
+class ArrowNullableColumn(ArrowColumn):
+    """
+    Null map is read first and turned into validity bitmap of nested column
+    data.
+    """
+
+    def __init__(self, nested_column, **kwargs):
+        self.nested_column = nested_column
+        self.arrow_type = nested_column.arrow_type
+        super(ArrowNullableColumn, self).__init__(**kwargs)
+        self.nested_column.nullable = True
+
+    def read_state_prefix(self, buf):
+        self.nested_column.read_state_prefix(buf)
+
+    def read_data(self, n_items, buf):
+        null_map = buf.read(n_items)
+        array = self.nested_column.read_data(n_items, buf)
+        return apply_null_map(array, null_map)
+
+    def write_state_prefix(self, buf):
+        self.nested_column.write_state_prefix(buf)
+
+    def write_data(self, array, buf):
+        null_map = pc.is_null(array).cast(pa.uint8())
+        write_array_buffer(null_map, 1, buf)
+        self.nested_column.write_data(array, buf)
+
+
+class ArrowArrayColumn(ArrowColumn):
+    """
+    Array offsets are read as is and used as large list offsets.
+    """
+
+    null_value = []
+
+    def __init__(self, nested_column, **kwargs):
+        self.nested_column = nested_column
+        self.arrow_type = pa.large_list(nested_column.arrow_type)
+        super(ArrowArrayColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        self.nested_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        self.nested_column.write_state_prefix(buf)
+
+    def read_data(self, n_items, buf):
+        # ClickHouse offsets are ends of arrays. Prepend zero start.
+        data = b'\x00' * 8 + buf.read(n_items * 8)
+        offsets = pa.Array.from_buffers(
+            pa.int64(), n_items + 1, [None, pa.py_buffer(data)]
+        )
+        values = self.nested_column.read_data(
+            offsets[n_items].as_py(), buf
+        )
+        return pa.LargeListArray.from_arrays(offsets, values)
+
+    def prepare_data(self, array):
+        if not pa.types.is_large_list(array.type):
+            array = array.cast(pa.large_list(array.type.value_type))
+        return array
+
+    def _write_data(self, array, buf):
+        # Offsets of sliced array are not started from zero.
+        offsets = array.offsets
+        start = offsets[0].as_py()
+        end = offsets[-1].as_py()
+
+        ends = offsets[1:]
+        if start:
+            ends = pc.subtract(ends, start)
+        write_array_buffer(ends, 8, buf)
+
+        values = array.values.slice(start, end - start)
+        self.nested_column.write_data(values, buf)
+
+
+class ArrowLowCardinalityColumn(ArrowColumn):
+    """
+    Dictionary and keys are read as dictionary array.
+    Index of the first dictionary item is used for NULL in Nullable columns.
+    """
+    key_types = [pa.uint8(), pa.uint16(), pa.uint32(), pa.uint64()]
+
+    serialization_type = LowCardinalityColumn.serialization_type
+
+    def __init__(self, nested_column, **kwargs):
+        super(ArrowLowCardinalityColumn, self).__init__(**kwargs)
+        self.nested_column = nested_column
+
+        self.nullable = isinstance(nested_column, ArrowNullableColumn)
+        if self.nullable:
+            # Dictionary is written without null map.
+            self.nested_column = nested_column.nested_column
+
+        self.arrow_type = pa.dictionary(
+            pa.int32(), self.nested_column.arrow_type
+        )
+
+    def read_state_prefix(self, buf):
+        read_binary_uint64(buf)
+
+    def read_data(self, n_items, buf):
+        if not n_items:
+            return pa.array([], type=self.arrow_type)
+
+        serialization_type = read_binary_uint64(buf)
+
+        # Lowest byte contains info about key type.
+        key_type = self.key_types[serialization_type & 0xf]
+
+        index_size = read_binary_uint64(buf)
+        dictionary = self.nested_column.read_data(index_size, buf)
+
+        read_binary_uint64(buf)  # number of keys
+        data = buf.read(n_items * key_type.bit_width // 8)
+        keys = pa.Array.from_buffers(
+            key_type, n_items, [None, pa.py_buffer(data)]
+        )
+
+        indices = keys.cast(pa.int32())
+        if self.nullable:
+            indices = pc.if_else(
+                pc.equal(indices, 0), pa.scalar(None, pa.int32()), indices
+            )
+        return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+    def write_state_prefix(self, buf):
+        # KeysSerializationVersion. See ClickHouse docs.
+        write_binary_int64(1, buf)
+
+    def write_data(self, array, buf):
+        if not pa.types.is_dictionary(array.type):
+            array = pc.dictionary_encode(array)
+
+        n_items = len(array)
+        has_nulls = bool(array.null_count)
+        if has_nulls and not (self.nullable or self.input_null_as_default):
+            raise ValueError('NULL value in non-Nullable column')
+
+        index = self.nested_column.prepare_data(array.dictionary)
+        keys = array.indices
+
+        if self.nullable or has_nulls:
+            # First element represents NULL or default value.
+            null_value = pa.array(
+                [self.nested_column.null_value], type=index.type
+            )
+            index = pa.concat_arrays([null_value, index])
+            keys = pc.add(keys.cast(pa.int64()), 1).fill_null(0)
+
+        # Do not write anything for empty column.
+        # May happen while writing empty arrays.
+        if not len(index):
+            return
+
+        int_type = int(log(len(index), 2) / 8)
+        key_type = self.key_types[int_type]
+
+        write_binary_int64(self.serialization_type | int_type, buf)
+        write_binary_int64(len(index), buf)
+        self.nested_column._write_data(index, buf)
+
+        write_binary_int64(n_items, buf)
+        write_array_buffer(keys.cast(key_type), key_type.bit_width // 8, buf)
+
+
+def create_arrow_nullable_column(spec, column_by_spec_getter):
+    return ArrowNullableColumn(column_by_spec_getter(spec[9:-1]))
+
+
+def create_arrow_array_column(spec, column_by_spec_getter, column_options):
+    return ArrowArrayColumn(
+        column_by_spec_getter(spec[6:-1]), **column_options
+    )
+
+
+def create_arrow_low_cardinality_column(spec, column_by_spec_getter,
+                                        column_options):
+    return ArrowLowCardinalityColumn(
+        column_by_spec_getter(spec[15:-1]), **column_options
+    )
@@ -0,0 +1,190 @@
+import logging
+
+import pyarrow as pa
+
+from ... import errors
+from ...context import Context
+from ..service import aliases, get_column_by_spec, write_column
+from .base import (
+    ArrowBoolColumn, ArrowFloat32Column, ArrowFloat64Column,
+    ArrowInt8Column, ArrowInt16Column, ArrowInt32Column, ArrowInt64Column,
+    ArrowUInt8Column, ArrowUInt16Column, ArrowUInt32Column, ArrowUInt64Column
+)
+from .datecolumn import (
+    ArrowDateColumn, ArrowDate32Column, create_arrow_datetime_column
+)
+from .enumcolumn import create_arrow_enum_column
+from .nestedcolumns import (
+    create_arrow_array_column, create_arrow_low_cardinality_column,
+    create_arrow_nullable_column
+)
+from .stringcolumn import create_arrow_string_column
+
+logger = logging.getLogger(__name__)
+
+column_by_type = {c.ch_type: c for c in [
+    ArrowDateColumn, ArrowDate32Column,
+    ArrowFloat32Column, ArrowFloat64Column,
+    ArrowInt8Column, ArrowInt16Column, ArrowInt32Column, ArrowInt64Column,
+    ArrowUInt8Column, ArrowUInt16Column, ArrowUInt32Column, ArrowUInt64Column,
+    ArrowBoolColumn
+]}
+
+# Python objects of these types can't be converted to Arrow as is.
+str_types = ('UUID', 'IPv4', 'IPv6')
+
+
+def get_arrow_column_by_spec(spec, column_options):
+    def create_column_with_options(x):
+        return get_arrow_column_by_spec(x, column_options)
+
+    if spec == 'String' or spec.startswith('FixedString'):
+        return create_arrow_string_column(spec, column_options)
+
+    elif spec.startswith('DateTime'):
+        return create_arrow_datetime_column(spec, column_options)
+
+    elif spec.startswith('Enum'):
+        return create_arrow_enum_column(spec, column_options)
+
+    elif spec.startswith('Nullable'):
+        return create_arrow_nullable_column(spec, create_column_with_options)
+
+    elif spec.startswith('Array'):
+        return create_arrow_array_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('LowCardinality'):
+        return create_arrow_low_cardinality_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('SimpleAggregateFunction'):
+        return create_column_with_options(
+            spec[24:-1].split(',', 1)[1].strip()
+        )
+
+    else:
+        for alias, primitive in aliases:
+            if spec.startswith(alias):
+                return create_column_with_options(
+                    primitive + spec[len(alias):]
+                )
+
+        if spec in column_by_type:
+            cls = column_by_type[spec]
+            return cls(**column_options)
+
+        raise errors.UnknownTypeError('Unknown type {}'.format(spec))
+
+
+def get_generic_arrow_type(spec):
+    """
+    Returns Arrow type for column read by generic column or ``None`` if type
+    should be inferred from items.
+    """
+    if spec.startswith('Nullable'):
+        spec = spec[9:-1]
+
+    if spec in str_types:
+        return pa.string()
+
+    elif spec.startswith('Decimal('):
+        precision, scale = spec[8:-1].split(',')
+        precision, scale = int(precision), int(scale)
+        if precision <= 38:
+            return pa.decimal128(precision, scale)
+        return pa.decimal256(precision, scale)
+
+    return None
+
+
+def get_arrow_type(context, column_spec):
+    column_options = {'context': context}
+    try:
+        return get_arrow_column_by_spec(column_spec, column_options).arrow_type
+    except errors.UnknownTypeError:
+        return get_generic_arrow_type(column_spec) or pa.null()
+
+
+def to_arrow_array(column_spec, items):
+    arrow_type = get_generic_arrow_type(column_spec)
+
+    if arrow_type == pa.string():
+        items = [str(x) if x is not None else None for x in items]
+
+    return pa.array(items, type=arrow_type)
+
+
+# Generic columns items are converted with Arrow types inferred for default
+# Python types.
+default_formats = {
+    'uuid_format': 'uuid',
+    'decimal_format': 'decimal',
+    'datetime_format': 'datetime'
+}
+
+
+def get_generic_context(context):
+    client_settings = context.client_settings
+    if all(client_settings.get(k, v) == v for k, v in default_formats.items()):
+        return context
+
+    generic_context = Context()
+    generic_context.server_info = context.server_info
+    generic_context.settings = context.settings
+
+    client_settings.update(default_formats)
+    generic_context.client_settings = client_settings
+    return generic_context
+
+
+def read_arrow_column(context, column_spec, n_items, buf,
+                      has_custom_serialization=False):
+    column_options = {
+        'context': context,
+        'has_custom_serialization': has_custom_serialization
+    }
+
+    if not has_custom_serialization:
+        try:
+            col = get_arrow_column_by_spec(column_spec, column_options)
+        except errors.UnknownTypeError:
+            logger.debug('Arrow support is not implemented for %s. '
+                         'Using generic column', column_spec)
+        else:
+            col.read_state_prefix(buf)
+            return col.read_data(n_items, buf)
+
+    # Generic column items are converted into Arrow with type inference.
+    column_options['context'] = get_generic_context(context)
+    col = get_column_by_spec(column_spec, column_options, use_numpy=False)
+    col.read_state_prefix(buf)
+    return to_arrow_array(column_spec, col.read_data(n_items, buf))
+
+
+def write_arrow_column(context, column_name, column_spec, array, buf,
+                       types_check=False):
+    column_options = {'context': context}
+
+    try:
+        column = get_arrow_column_by_spec(column_spec, column_options)
+    except errors.UnknownTypeError:
+        logger.debug('Arrow support is not implemented for %s. '
+                     'Using generic column', column_spec)
+        write_column(context, column_name, column_spec, array.to_pylist(),
+                     buf, types_check=types_check)
+        return
+
+    try:
+        column.write_state_prefix(buf)
+        column.write_data(array, buf)
+
+    except (pa.ArrowException, ValueError) as e:
+        raise errors.TypeMismatchError(
+            'Type mismatch in VALUES section. '
+            'Expected {} got {} for column "{}": {}'.format(
+                column_spec, array.type, column_name, e
+            )
+        )
@@ -0,0 +1,91 @@
+import pyarrow as pa
+
+from ... import defines, errors
+from .base import ArrowColumn, FixedWidthArrowColumn
+
+
+class ArrowStringColumn(ArrowColumn):
+    ch_type = 'String'
+    arrow_type = pa.large_string()
+    check_utf8 = True
+
+    null_value = b''
+
+    def read_data(self, n_items, buf):
+        offsets, data = buf.read_strings_buffers(n_items)
+        array = pa.Array.from_buffers(
+            self.arrow_type, n_items,
+            [None, pa.py_buffer(offsets), pa.py_buffer(data)]
+        )
+        if self.check_utf8:
+            # Data isn't checked by Arrow on construction.
+            array.validate(full=True)
+        return array
+
+    def prepare_data(self, array):
+        if pa.types.is_dictionary(array.type):
+            array = array.dictionary_decode()
+        # Strings and binaries share layout. Offsets are widened if needed.
+        return array.cast(pa.large_binary())
+
+    def _write_data(self, array, buf):
+        if not len(array):
+            return
+
+        offsets, data = array.buffers()[1:3]
+        buf.write_strings_buffers(
+            offsets, data or b'', array.offset, len(array)
+        )
+
+
+class ArrowByteStringColumn(ArrowStringColumn):
+    arrow_type = pa.large_binary()
+    check_utf8 = False
+
+
+class ArrowFixedStringColumn(FixedWidthArrowColumn):
+    def __init__(self, length, **kwargs):
+        self.raw_type = pa.binary(length)
+        super(ArrowFixedStringColumn, self).__init__(**kwargs)
+
+    @property
+    def item_size(self):
+        return self.raw_type.byte_width
+
+    @property
+    def null_value(self):
+        return b'\x00' * self.item_size
+
+    def to_raw(self, array):
+        if array.type == self.raw_type:
+            return array
+        # Shorter items are padded on write.
+        return array.cast(pa.large_binary())
+
+    def _write_data(self, array, buf):
+        if array.type == self.raw_type:
+            super(ArrowFixedStringColumn, self)._write_data(array, buf)
+        else:
+            buf.write_fixed_strings(array.to_pylist(), self.item_size)
+
+
+def create_arrow_string_column(spec, column_options):
+    client_settings = column_options['context'].client_settings
+    strings_as_bytes = client_settings['strings_as_bytes']
+    encoding = client_settings.get(
+        'strings_encoding', defines.STRINGS_ENCODING
+    )
+
+    if spec == 'String':
+        if strings_as_bytes:
+            return ArrowByteStringColumn(**column_options)
+
+        if encoding.replace('-', '').lower() != 'utf8':
+            raise errors.UnknownTypeError(
+                'Arrow strings must be in UTF-8, got {}'.format(encoding)
+            )
+        return ArrowStringColumn(**column_options)
+
+    else:
+        length = int(spec[12:-1])
+        return ArrowFixedStringColumn(length, **column_options)
@@ -1,6 +1,9 @@
-from struct import Struct, error as struct_error
+from array import array
+from struct import Struct, calcsize, error as struct_error
+import sys
 
 from . import exceptions
+from .nullsmap import apply_nulls_map, make_nulls_map
 from ..varint import read_varint
 
 
@@ -88,13 +91,15 @@ class Column(object):
         return Struct('<{}B'.format(n_items))
 
     def _read_nulls_map(self, n_items, buf):
-        s = self.make_null_struct(n_items)
-        return s.unpack(buf.read(s.size))
+        # Nulls map is kept as bytes. None is returned for block without
+        # nulls, so items are not touched at all.
+        nulls_map = buf.read(n_items)
+        if 1 not in nulls_map:
+            return None
+        return nulls_map
 
     def _write_nulls_map(self, items, buf):
-        s = self.make_null_struct(len(items))
-        items = [x is None for x in items]
-        buf.write(s.pack(*items))
+        buf.write(make_nulls_map(items))
 
     def check_item_type(self, value):
         if not isinstance(value, self.py_types):
@@ -168,10 +173,7 @@ class Column(object):
         if self.after_read_items:
             return self.after_read_items(items, nulls_map)
         elif nulls_map is not None:
-            return tuple(
-                (None if is_null else items[i])
-                for i, is_null in enumerate(nulls_map)
-            )
+            return apply_nulls_map(items, nulls_map)
         return items
 
     def read_items(self, n_items, buf):
@@ -186,6 +188,13 @@ class Column(object):
     def write_state_prefix(self, buf):
         pass
 
+    def reset(self):
+        """
+        Drops state left by reading or writing of block. Called before
+        reusing cached column.
+        """
+        self.serialization = CommonSerialization(self)
+
 
 class FormatColumn(Column):
     """
@@ -194,6 +203,9 @@ class FormatColumn(Column):
 
     format = None
 
+    # Items are read into array.array instead of tuple.
+    read_as_array = False
+
     def make_struct(self, n_items):
         return Struct('<{}{}'.format(n_items, self.format))
 
@@ -206,9 +218,34 @@ class FormatColumn(Column):
             raise exceptions.StructPackException(e)
 
     def read_items(self, n_items, buf):
+        if self.read_as_array:
+            return self.read_array(n_items, buf)
+
         s = self.make_struct(n_items)
         return s.unpack(buf.read(s.size))
 
+    def can_read_as_array(self):
+        """
+        Checks that items can be read into typed array as is: array item has
+        the same size and no conversion is made after reading.
+        """
+        if self.nullable or self.after_read_items or \
+                self.format not in array_typecodes:
+            return False
+
+        return array(self.format).itemsize == calcsize('<' + self.format)
+
+    def read_array(self, n_items, buf):
+        items = array(self.format)
+        items.frombytes(buf.read(items.itemsize * n_items))
+        if sys.byteorder == 'big':
+            items.byteswap()
+        return items
+
+
+# Struct formats that are also array typecodes.
+array_typecodes = 'bBhHiIqQfd'
+
 
 # How to write new column?
 # - Check ClickHouse documentation for column
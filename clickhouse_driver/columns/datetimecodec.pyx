@@ -0,0 +1,246 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+from cpython cimport Py_INCREF
+from cpython.datetime cimport import_datetime, datetime_new
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+
+# DateTime is stored as seconds since epoch and DateTime64 as ticks of
+# 10 ** -scale seconds since epoch. Timestamps are shifted by UTC offset
+# taken from timezone transition table and broken down into date and time
+# without calling tzinfo methods for each item. Integer division of C
+# numbers rounds towards negative infinity as in Python.
+
+import_datetime()
+
+
+cdef extern from "Python.h":
+    object PySequence_Fast(object o, const char *m)
+    Py_ssize_t PySequence_Fast_GET_SIZE(object o)
+    void *PySequence_Fast_GET_ITEM(object o, Py_ssize_t i)
+
+
+cdef enum:
+    SECONDS_PER_DAY = 86400
+    MAX_SCALE = 18
+
+cdef object EPOCH = datetime(1970, 1, 1)
+cdef object ONE_SECOND = timedelta(seconds=1)
+cdef object fromtimestamp = datetime.fromtimestamp
+cdef long long MIN_TIMESTAMP = -2 ** 62
+
+cdef long long powers_of_ten[MAX_SCALE + 1]
+cdef int n
+powers_of_ten[0] = 1
+for n in range(1, MAX_SCALE + 1):
+    powers_of_ten[n] = powers_of_ten[n - 1] * 10
+
+cdef dict transition_tables = {}
+
+
+def get_transition_table(tz):
+    """
+    Transition table is built once per timezone.
+
+    :param tz: pytz timezone or timezone with fixed offset.
+    :return: tuple of lists: UTC timestamps of transitions, UTC offsets in
+             seconds and tzinfo objects of offset-aware datetimes.
+             ``None`` if timezone has no transition table.
+    """
+    try:
+        return transition_tables[tz]
+    except KeyError:
+        pass
+
+    transition_times = getattr(tz, '_utc_transition_times', None)
+
+    if transition_times is not None:
+        # pytz timezone with DST. Offset of the first transition is used for
+        # all preceding timestamps as in DstTzInfo.fromutc.
+        infos = tz._transition_info
+        table = (
+            [(x - EPOCH) // ONE_SECOND for x in transition_times],
+            [x[0] // ONE_SECOND for x in infos],
+            [tz._tzinfos[x] for x in infos]
+        )
+
+    else:
+        offset = tz.utcoffset(None)
+        if offset is None:
+            table = None
+        else:
+            table = ([MIN_TIMESTAMP], [offset // ONE_SECOND], [tz])
+
+    transition_tables[tz] = table
+    return table
+
+
+cdef inline void civil_from_days(long long days, int *year, int *month,
+                                 int *day):
+    # Gregorian calendar date from days since 1970-01-01.
+    # http://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    cdef long long z = days + 719468
+    cdef long long era = z // 146097
+    cdef long long doe = z - era * 146097
+    cdef long long yoe = (doe - doe // 1460 + doe // 36524 -
+                          doe // 146096) // 365
+    cdef long long doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    cdef long long mp = (5 * doy + 2) // 153
+
+    day[0] = <int> (doy - (153 * mp + 2) // 5 + 1)
+    month[0] = <int> (mp + 3 if mp < 10 else mp - 9)
+    year[0] = <int> (yoe + era * 400 + (month[0] <= 2))
+
+
+def datetimes_from_ints(items, tz, int scale=0, bint offset_naive=True,
+                        bint local_time=False, nulls_map=None):
+    """
+    Offset-aware datetimes are equal to ``datetime.fromtimestamp(x, tz)``.
+    Fractional part of DateTime64 with scale greater than 6 is rounded to
+    microseconds half to even.
+
+    :param items: sequence of timestamps.
+    :param tz: timezone supported by :func:`get_transition_table`.
+    :param scale: DateTime64 scale. 0 for DateTime.
+    :param offset_naive: return datetimes without tzinfo.
+    :param local_time: ``tz`` is system local timezone. Naive datetimes are
+                       equal to ``datetime.fromtimestamp(x)`` including
+                       ``fold`` attribute.
+    :param nulls_map: optional nulls map.
+    :return: tuple of :class:`~datetime.datetime`.
+    """
+    seq = PySequence_Fast(items, 'items must be a sequence')
+    cdef Py_ssize_t i, n_items = PySequence_Fast_GET_SIZE(seq)
+    cdef const unsigned char *nulls = NULL
+    cdef bytes nulls_bytes
+
+    if not 0 <= scale <= MAX_SCALE:
+        raise ValueError('Unsupported scale {}'.format(scale))
+
+    table = get_transition_table(tz)
+    if table is None:
+        raise ValueError('Timezone {} has no transition table'.format(tz))
+
+    if nulls_map is not None:
+        nulls_bytes = bytes(nulls_map)
+        if len(nulls_bytes) < n_items:
+            raise ValueError('Not enough items in nulls map')
+        nulls = nulls_bytes
+
+    cdef long long factor = powers_of_ten[scale]
+    cdef long long us_factor = powers_of_ten[6 - scale] if scale <= 6 else 0
+    cdef long long us_divisor = powers_of_ten[scale - 6] if scale > 6 else 0
+    cdef long long value, seconds, frac, rem, local, days, time
+    cdef long long min_value = 0, max_value = 0
+    cdef bint has_values = False
+    cdef int year, month, day, microsecond, item_fold
+    cdef Py_ssize_t lo, hi, mid, k, first, n_transitions, last = -1
+    cdef object item, tzinfo = None
+
+    # Only transitions within the block's range are copied. Usually there
+    # are one or two of them.
+    for i in range(n_items):
+        if nulls != NULL and nulls[i]:
+            continue
+        value = <object> PySequence_Fast_GET_ITEM(seq, i)
+        if not has_values:
+            min_value = max_value = value
+            has_values = True
+        elif value < min_value:
+            min_value = value
+        elif value > max_value:
+            max_value = value
+
+    starts, offsets, tzinfos = table
+    first = max(0, bisect_right(starts, min_value // factor) - 1)
+    n_transitions = max(
+        0, bisect_right(starts, max_value // factor + 1) - 1
+    ) - first + 1
+
+    cdef long long *c_starts = <long long *> PyMem_Malloc(
+        3 * n_transitions * sizeof(long long)
+    )
+    if c_starts == NULL:
+        raise MemoryError()
+
+    cdef long long *c_offsets = c_starts + n_transitions
+    # Wall times before this timestamp were already shown before backward
+    # transition.
+    cdef long long *c_fold_ends = c_offsets + n_transitions
+
+    # System rules of local timezone are used after the end of the table.
+    # Table continues with the last offset.
+    if local_time and len(starts) > 1 and \
+            first + n_transitions == len(starts):
+        last = n_transitions - 1
+
+    try:
+        for k in range(n_transitions):
+            c_starts[k] = starts[first + k]
+            c_offsets[k] = offsets[first + k]
+            c_fold_ends[k] = c_starts[k]
+            if first + k > 0 and offsets[first + k - 1] > c_offsets[k]:
+                c_fold_ends[k] += offsets[first + k - 1] - c_offsets[k]
+
+        rv = PyTuple_New(n_items)
+        for i in range(n_items):
+            if nulls != NULL and nulls[i]:
+                item = None
+                Py_INCREF(item)
+                PyTuple_SET_ITEM(rv, i, item)
+                continue
+
+            value = <object> PySequence_Fast_GET_ITEM(seq, i)
+            seconds = value // factor
+            frac = value - seconds * factor
+
+            if scale <= 6:
+                microsecond = <int> (frac * us_factor)
+            else:
+                microsecond = <int> (frac // us_divisor)
+                rem = 2 * (frac % us_divisor)
+                if rem > us_divisor or (rem == us_divisor and
+                                        microsecond % 2):
+                    microsecond += 1
+                    if microsecond == 1000000:
+                        microsecond = 0
+                        seconds += 1
+
+            # Last transition that is not after timestamp.
+            lo = 0
+            hi = n_transitions
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if c_starts[mid] <= seconds:
+                    lo = mid
+                else:
+                    hi = mid
+
+            if lo == last:
+                item = fromtimestamp(seconds).replace(microsecond=microsecond)
+                Py_INCREF(item)
+                PyTuple_SET_ITEM(rv, i, item)
+                continue
+
+            local = seconds + c_offsets[lo]
+            days = local // SECONDS_PER_DAY
+            time = local - days * SECONDS_PER_DAY
+            civil_from_days(days, &year, &month, &day)
+
+            item_fold = local_time and c_starts[lo] <= seconds < c_fold_ends[lo]
+            if not offset_naive:
+                tzinfo = tzinfos[first + lo]
+
+            item = datetime_new(
+                year, month, day, <int> (time // 3600),
+                <int> (time // 60 % 60), <int> (time % 60), microsecond,
+                tzinfo, item_fold
+            )
+            Py_INCREF(item)
+            PyTuple_SET_ITEM(rv, i, item)
+
+    finally:
+        PyMem_Free(c_starts)
+
+    return rv
@@ -3,21 +3,49 @@ from datetime import datetime
 from pytz import timezone as get_timezone, utc
 from ..util.compat import get_localzone_name_compat
 from .base import FormatColumn
+from .datetimecodec import datetimes_from_ints, get_transition_table
 
 EPOCH = datetime(1970, 1, 1, tzinfo=utc)
 
+# Values of ``datetime_format`` client setting.
+datetime_formats = ('datetime', 'int')
+
 
 class DateTimeColumn(FormatColumn):
     ch_type = 'DateTime'
     py_types = (datetime, int)
     format = 'I'
 
+    scale = 0
+
     def __init__(self, timezone=None, offset_naive=True, **kwargs):
         self.timezone = timezone
         self.offset_naive = offset_naive
         super(DateTimeColumn, self).__init__(**kwargs)
 
+        # Timestamps are returned as is with ``datetime_format='int'``.
+        if get_datetime_format(self.context) == 'int':
+            self.after_read_items = None
+
+        # Timezone which transition table is used for decoding. Local time
+        # is decoded by table of local timezone if its name is known.
+        lut_timezone = timezone or get_local_timezone()
+        if lut_timezone is not None and \
+                get_transition_table(lut_timezone) is None:
+            lut_timezone = None
+        self.lut_timezone = lut_timezone
+
     def after_read_items(self, items, nulls_map=None):
+        if self.lut_timezone is not None:
+            return datetimes_from_ints(
+                items, self.lut_timezone, scale=self.scale,
+                offset_naive=self.offset_naive,
+                local_time=self.timezone is None, nulls_map=nulls_map
+            )
+
+        return self.items_from_timestamps(items, nulls_map=nulls_map)
+
+    def items_from_timestamps(self, items, nulls_map=None):
         tz = self.timezone
         fromts = datetime.fromtimestamp
 
@@ -94,7 +122,7 @@ class DateTime64Column(DateTimeColumn):
         self.scale = scale
         super(DateTime64Column, self).__init__(**kwargs)
 
-    def after_read_items(self, items, nulls_map=None):
+    def items_from_timestamps(self, items, nulls_map=None):
         scale = float(10 ** self.scale)
 
         tz = self.timezone
@@ -169,6 +197,26 @@ class DateTime64Column(DateTimeColumn):
             )
 
 
+def get_datetime_format(context):
+    datetime_format = context.client_settings.get(
+        'datetime_format', 'datetime'
+    )
+    if datetime_format not in datetime_formats:
+        raise ValueError(
+            'Unknown datetime_format {}. Expected one of: {}'.format(
+                datetime_format, ', '.join(datetime_formats)
+            )
+        )
+    return datetime_format
+
+
+def get_local_timezone():
+    try:
+        return get_timezone(get_localzone_name_compat())
+    except Exception:
+        return None
+
+
 def create_datetime_column(spec, column_options):
     if spec.startswith('DateTime64'):
         cls = DateTime64Column
@@ -0,0 +1,155 @@
+from decimal import Decimal
+
+from cpython cimport Py_INCREF
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+
+# Decimals are stored as integers scaled by 10 ** scale.
+
+
+cdef extern from "Python.h":
+    object PySequence_Fast(object o, const char *m)
+    Py_ssize_t PySequence_Fast_GET_SIZE(object o)
+    void *PySequence_Fast_GET_ITEM(object o, Py_ssize_t i)
+    long long PyLong_AsLongLongAndOverflow(object o,
+                                           int *overflow) except? -1
+
+
+# Doubles represent powers of 10 up to 10 ** 22 and integers up to 2 ** 53
+# exactly. Division of such numbers is correctly rounded.
+cdef enum:
+    MAX_EXACT_SCALE = 22
+
+cdef long long MAX_EXACT_INT = 2 ** 53
+
+cdef double powers_of_ten[MAX_EXACT_SCALE + 1]
+cdef int n
+powers_of_ten[0] = 1.0
+for n in range(1, MAX_EXACT_SCALE + 1):
+    powers_of_ten[n] = powers_of_ten[n - 1] * 10.0
+
+cdef object decimal_type = Decimal
+
+
+cdef bytes prepare_nulls_map(object nulls_map, Py_ssize_t n_items):
+    if nulls_map is None:
+        return None
+
+    if type(nulls_map) is not bytes:
+        nulls_map = bytes(nulls_map)
+    if len(nulls_map) < n_items:
+        raise ValueError('Not enough items in nulls map')
+
+    return nulls_map
+
+
+def decimals_from_ints(items, int scale, nulls_map=None):
+    """
+    Decimals are divided within current decimal context. Its precision
+    should be enough for column values.
+
+    :param items: sequence of scaled integers.
+    :param scale: decimal scale.
+    :param nulls_map: optional nulls map.
+    :return: tuple of :class:`~decimal.Decimal`.
+    """
+    seq = PySequence_Fast(items, 'items must be a sequence')
+    cdef Py_ssize_t i, n_items = PySequence_Fast_GET_SIZE(seq)
+    cdef bytes nulls_bytes = prepare_nulls_map(nulls_map, n_items)
+    cdef const unsigned char *nulls = NULL
+    cdef object item
+    cdef object factor = decimal_type((<object> 10) ** scale)
+
+    if nulls_bytes is not None:
+        nulls = nulls_bytes
+
+    rv = PyTuple_New(n_items)
+    for i in range(n_items):
+        if nulls != NULL and nulls[i]:
+            item = None
+        else:
+            item = decimal_type(<object> PySequence_Fast_GET_ITEM(seq, i))
+            if scale:
+                item = item / factor
+
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(rv, i, item)
+
+    return rv
+
+
+def floats_from_ints(items, int scale, nulls_map=None):
+    """
+    :param items: sequence of scaled integers.
+    :param scale: decimal scale.
+    :param nulls_map: optional nulls map.
+    :return: tuple of :class:`float`.
+    """
+    seq = PySequence_Fast(items, 'items must be a sequence')
+    cdef Py_ssize_t i, n_items = PySequence_Fast_GET_SIZE(seq)
+    cdef bytes nulls_bytes = prepare_nulls_map(nulls_map, n_items)
+    cdef const unsigned char *nulls = NULL
+    cdef object item, factor = (<object> 10) ** scale
+    cdef long long value
+    cdef int overflow
+    cdef bint exact_scale = scale <= MAX_EXACT_SCALE
+    cdef double divisor = powers_of_ten[scale] if exact_scale else 0
+
+    if nulls_bytes is not None:
+        nulls = nulls_bytes
+
+    rv = PyTuple_New(n_items)
+    for i in range(n_items):
+        if nulls != NULL and nulls[i]:
+            item = None
+        else:
+            item = <object> PySequence_Fast_GET_ITEM(seq, i)
+            value = PyLong_AsLongLongAndOverflow(item, &overflow)
+
+            if exact_scale and not overflow and \
+                    -MAX_EXACT_INT <= value <= MAX_EXACT_INT:
+                item = <double> value / divisor
+            else:
+                # Python division of integers is correctly rounded.
+                item = item / factor
+
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(rv, i, item)
+
+    return rv
+
+
+def decimals_to_ints(items, int scale, nulls_map=None, null_value=0):
+    """
+    Replaces items of list with integers scaled by ``10 ** scale``.
+    Fractional digits beyond scale are truncated.
+
+    :param items: list of :class:`~decimal.Decimal`, :class:`float` or
+                  :class:`int`.
+    :param scale: decimal scale.
+    :param nulls_map: optional nulls map. Null items are replaced with
+                      ``null_value``.
+    :param null_value: value for null items.
+    """
+    cdef Py_ssize_t i, n_items = len(items)
+    cdef bytes nulls_bytes = prepare_nulls_map(nulls_map, n_items)
+    cdef const unsigned char *nulls = NULL
+    cdef object item, factor = (<object> 10) ** scale
+    cdef object decimal_factor = Decimal(factor)
+
+    if nulls_bytes is not None:
+        nulls = nulls_bytes
+
+    for i in range(n_items):
+        if nulls != NULL and nulls[i]:
+            items[i] = null_value
+            continue
+
+        item = items[i]
+        if type(item) is int:
+            items[i] = item * factor
+        elif type(item) is Decimal:
+            items[i] = int(item * decimal_factor)
+        else:
+            # Floats are converted by shortest repr to avoid binary
+            # representation error.
+            items[i] = int(Decimal(str(item)) * decimal_factor)
@@ -1,6 +1,9 @@
 from decimal import Decimal, localcontext
 
 from .base import FormatColumn
+from .decimalcodec import (
+    decimals_from_ints, decimals_to_ints, floats_from_ints
+)
 from .exceptions import ColumnTypeMismatchException
 from .intcolumn import Int128Column, Int256Column
 
@@ -9,11 +12,24 @@ class DecimalColumn(FormatColumn):
     py_types = (Decimal, float, int)
     max_precision = None
 
+    # Items are converted into type specified by ``decimal_format`` client
+    # setting. Scaled integers are returned as is for 'int'.
+    readers = {
+        'decimal': decimals_from_ints,
+        'float': floats_from_ints,
+        'int': None
+    }
+
     def __init__(self, precision, scale, types_check=False, **kwargs):
         self.precision = precision
         self.scale = scale
         super(DecimalColumn, self).__init__(**kwargs)
 
+        decimal_format = get_decimal_format(self.context)
+        self.read_decimals = self.readers[decimal_format]
+        if self.read_decimals is None:
+            self.after_read_items = None
+
         if types_check:
             def check_item(value):
                 parts = str(value).split('.')
@@ -25,43 +41,12 @@ class DecimalColumn(FormatColumn):
             self.check_item = check_item
 
     def after_read_items(self, items, nulls_map=None):
-        if self.scale >= 1:
-            scale = 10 ** self.scale
-
-            if nulls_map is None:
-                return tuple(Decimal(item) / scale for item in items)
-            else:
-                return tuple(
-                    (None if is_null else Decimal(items[i]) / scale)
-                    for i, is_null in enumerate(nulls_map)
-                )
-        else:
-            if nulls_map is None:
-                return tuple(Decimal(item) for item in items)
-            else:
-                return tuple(
-                    (None if is_null else Decimal(items[i]))
-                    for i, is_null in enumerate(nulls_map)
-                )
+        return self.read_decimals(items, self.scale, nulls_map=nulls_map)
 
     def before_write_items(self, items, nulls_map=None):
-        null_value = self.null_value
-
-        if self.scale >= 1:
-            scale = 10 ** self.scale
-
-            for i, item in enumerate(items):
-                if nulls_map and nulls_map[i]:
-                    items[i] = null_value
-                else:
-                    items[i] = int(Decimal(str(item)) * scale)
-
-        else:
-            for i, item in enumerate(items):
-                if nulls_map and nulls_map[i]:
-                    items[i] = null_value
-                else:
-                    items[i] = int(Decimal(str(item)))
+        decimals_to_ints(
+            items, self.scale, nulls_map=nulls_map, null_value=self.null_value
+        )
 
     # Override default precision to the maximum supported by underlying type.
     def _write_data(self, items, buf):
@@ -95,9 +80,24 @@ class Decimal256Column(DecimalColumn, Int256Column):
     max_precision = 76
 
 
-def create_decimal_column(spec, column_options):
+def get_decimal_format(context):
+    decimal_format = context.client_settings.get('decimal_format', 'decimal')
+    if decimal_format not in DecimalColumn.readers:
+        raise ValueError(
+            'Unknown decimal_format {}. Expected one of: {}'.format(
+                decimal_format, ', '.join(DecimalColumn.readers)
+            )
+        )
+    return decimal_format
+
+
+def parse_decimal_spec(spec):
     precision, scale = spec[8:-1].split(',')
-    precision, scale = int(precision), int(scale)
+    return int(precision), int(scale)
+
+
+def create_decimal_column(spec, column_options):
+    precision, scale = parse_decimal_spec(spec)
 
     # Maximum precisions for underlying types are:
     # Int32    10**9
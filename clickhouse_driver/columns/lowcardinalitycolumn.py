@@ -9,13 +9,18 @@ from .intcolumn import UInt8Column, UInt16Column, UInt32Column, UInt64Column
 def create_low_cardinality_column(spec, column_by_spec_getter, column_options):
     inner = spec[15:-1]
     nested = column_by_spec_getter(inner)
-    return LowCardinalityColumn(nested, **column_options)
+    return LowCardinalityColumn(nested, spec=spec, **column_options)
 
 
 class LowCardinalityColumn(Column):
     """
     Stores column as index (unique elements) and keys.
     Good for de-duplication of large values with low cardinality.
+
+    Dictionaries are kept in context by column position in block until the
+    end of the query. Decoded dictionary is reused when the next block has
+    the same dictionary. Written dictionary is extended by the following
+    blocks.
     """
     int_types = {
         0: UInt8Column,
@@ -34,30 +39,107 @@ class LowCardinalityColumn(Column):
 
     serialization_type = has_additional_keys_bit | need_update_dictionary
 
-    def __init__(self, nested_column, **kwargs):
+    # Written dictionary is started over after this size.
+    max_dictionary_size = 8192
+
+    def __init__(self, nested_column, spec=None, **kwargs):
         self.init_kwargs = kwargs
         self.nested_column = nested_column
+        self.spec = spec
+        self.dictionary_key = None
+        # Nested column nullable flag is reset on reading and writing.
+        self.nested_nullable = nested_column.nullable
         super(LowCardinalityColumn, self).__init__(**kwargs)
 
     def read_state_prefix(self, buf):
         super(LowCardinalityColumn, self).read_state_prefix(buf)
+        self.take_dictionary_key()
 
         read_binary_uint64(buf)
 
     def write_state_prefix(self, buf):
         super(LowCardinalityColumn, self).write_state_prefix(buf)
+        self.take_dictionary_key()
 
         # KeysSerializationVersion. See ClickHouse docs.
         write_binary_int64(1, buf)
 
+    def reset(self):
+        super(LowCardinalityColumn, self).reset()
+
+        self.nested_column.nullable = self.nested_nullable
+        self.nested_column.reset()
+        self.dictionary_key = None
+
+    def take_dictionary_key(self):
+        # State prefixes of all LowCardinality columns are read and written
+        # in the same order in each block, even for empty nested arrays.
+        # Position in this order identifies column across blocks.
+        if self.spec is None:
+            return
+
+        context = self.context
+        self.dictionary_key = (context.low_cardinality_position, self.spec)
+        context.low_cardinality_position += 1
+
+    def get_dictionary(self, kind):
+        if self.dictionary_key is None:
+            return None
+        return self.context.low_cardinality_dictionaries.get(
+            (kind, ) + self.dictionary_key
+        )
+
+    def set_dictionary(self, kind, dictionary):
+        if self.dictionary_key is not None:
+            key = (kind, ) + self.dictionary_key
+            self.context.low_cardinality_dictionaries[key] = dictionary
+
+    def index_equals(self, index, other):
+        return index == other
+
+    def decode_index(self, index, nullable):
+        if nullable:
+            return (None, ) + index[1:]
+        return index
+
+    def read_index(self, serialization_type, nullable, buf):
+        dictionary = self.get_dictionary('read')
+
+        # Dictionary of previous granule is used if new one is not sent.
+        if dictionary is not None and \
+                not serialization_type & self.serialization_type:
+            return dictionary[1]
+
+        index_size = read_binary_uint64(buf)
+        index = self.nested_column.read_data(index_size, buf)
+
+        if dictionary is not None and self.index_equals(dictionary[0], index):
+            return dictionary[1]
+
+        decoded = self.decode_index(index, nullable)
+        self.set_dictionary('read', (index, decoded))
+        return decoded
+
     def _write_data(self, items, buf):
-        index, keys = [], []
-        key_by_index_element = {}
+        # Do not write anything for empty column.
+        # May happen while writing empty arrays.
+        if not len(items) and not self.nested_column.nullable:
+            return
+
+        keys = []
+        dictionary = self.get_dictionary('write')
+        if dictionary is None or \
+                len(dictionary[1]) > self.max_dictionary_size:
+            dictionary = ({}, [])
+            self.set_dictionary('write', dictionary)
+
+        key_by_index_element, index = dictionary
         nested_is_nullable = False
 
         if self.nested_column.nullable:
             # First element represents NULL if column is nullable.
-            index.append(self.nested_column.null_value)
+            if not index:
+                index.append(self.nested_column.null_value)
             # Prevent null map writing. Reset nested column nullable flag.
             self.nested_column.nullable = False
             nested_is_nullable = True
@@ -88,11 +170,6 @@ class LowCardinalityColumn(Column):
 
                 keys.append(key)
 
-        # Do not write anything for empty column.
-        # May happen while writing empty arrays.
-        if not len(index):
-            return
-
         int_type = int(log(len(index), 2) / 8)
         int_column = self.int_types[int_type](**self.init_kwargs)
 
@@ -113,7 +190,8 @@ class LowCardinalityColumn(Column):
             index_to_write = index[1:]
             self.nested_column.write_data(index_to_write, buf)
         else:
-            self.nested_column.write_data(index, buf)
+            # Items are converted in place. Index is kept for next blocks.
+            self.nested_column.write_data(list(index), buf)
         write_binary_int64(len(items), buf)
         int_column.write_items(keys, buf)
 
@@ -131,10 +209,7 @@ class LowCardinalityColumn(Column):
         # Prevent null map reading. Reset nested column nullable flag.
         self.nested_column.nullable = False
 
-        index_size = read_binary_uint64(buf)
-        index = self.nested_column.read_data(index_size, buf)
-        if nullable:
-            index = (None, ) + index[1:]
+        index = self.read_index(serialization_type, nullable, buf)
 
         read_binary_uint64(buf)  # number of keys
         keys = keys_column.read_data(n_items, buf)
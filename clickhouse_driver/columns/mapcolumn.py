@@ -1,17 +1,27 @@
 import re
+from array import array
+
+from ..flatcolumn import FlatColumn
+from .arraycodec import dicts_from_offsets, flatten_dicts
 from .base import Column
 from .intcolumn import UInt64Column
-from ..util.helpers import pairwise
 
 
 comma_re = re.compile(r',(?![^()]*\))')
 
 
 class MapColumn(Column):
+    """
+    Keys and values are stored as flat arrays after offsets. Column is read
+    as :class:`~clickhouse_driver.flatcolumn.FlatColumn` of keys, values
+    and offsets without building dicts with ``read_flat``.
+    """
     py_types = (dict, )
 
     null_value = {}
 
+    read_flat = False
+
     def __init__(self, key_column, value_column, **kwargs):
         self.offset_column = UInt64Column(**kwargs)
         self.key_column = key_column
@@ -30,35 +40,32 @@ class MapColumn(Column):
         self.key_column.write_state_prefix(buf)
         self.value_column.write_state_prefix(buf)
 
+    def reset(self):
+        super(MapColumn, self).reset()
+
+        self.key_column.reset()
+        self.value_column.reset()
+
     def read_items(self, n_items, buf):
         if not n_items:
+            if self.read_flat:
+                return FlatColumn([], array('Q'), keys=[])
             return [{}]
 
-        offsets = list(self.offset_column.read_items(n_items, buf))
+        offsets = self.offset_column.read_items(n_items, buf)
         last_offset = offsets[-1]
         keys = self.key_column.read_data(last_offset, buf)
         values = self.value_column.read_data(last_offset, buf)
 
-        offsets.insert(0, 0)
+        if self.read_flat:
+            return FlatColumn(values, array('Q', offsets), keys=keys)
 
-        return [
-            dict(zip(keys[begin:end], values[begin:end]))
-            for begin, end in pairwise(offsets)
-        ]
+        return dicts_from_offsets(keys, values, offsets)
 
     def write_items(self, items, buf):
-        offsets = []
-        keys = []
-        values = []
-
-        total = 0
-        for x in items:
-            total += len(x)
-            offsets.append(total)
-            keys.extend(x.keys())
-            values.extend(x.values())
-
-        self.offset_column.write_items(offsets, buf)
+        offsets, keys, values = flatten_dicts(items)
+
+        buf.write(offsets)
         self.key_column.write_data(keys, buf)
         self.value_column.write_data(values, buf)
 
@@ -0,0 +1,56 @@
+from cpython cimport Py_INCREF
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+
+
+cdef extern from "Python.h":
+    object PySequence_Fast(object o, const char *m)
+    Py_ssize_t PySequence_Fast_GET_SIZE(object o)
+    void *PySequence_Fast_GET_ITEM(object o, Py_ssize_t i)
+
+
+def apply_nulls_map(items, bytes nulls_map):
+    """
+    Replaces items with None where nulls map byte is set.
+
+    :param items: sequence of items.
+    :param nulls_map: bytes with 1 for null and 0 for not null items.
+    :return: tuple of items.
+    """
+    cdef Py_ssize_t i, n_items = len(nulls_map)
+    cdef const unsigned char *data = <const unsigned char *> \
+        PyBytes_AS_STRING(nulls_map)
+    cdef object item
+
+    seq = PySequence_Fast(items, 'items must be a sequence')
+    if PySequence_Fast_GET_SIZE(seq) < n_items:
+        raise ValueError('Not enough items for nulls map')
+
+    rv = PyTuple_New(n_items)
+    for i in range(n_items):
+        if data[i]:
+            item = None
+        else:
+            item = <object> PySequence_Fast_GET_ITEM(seq, i)
+
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(rv, i, item)
+
+    return rv
+
+
+def make_nulls_map(items):
+    """
+    :param items: sequence of items.
+    :return: bytes with 1 for None items and 0 for others.
+    """
+    seq = PySequence_Fast(items, 'items must be a sequence')
+    cdef Py_ssize_t i, n_items = PySequence_Fast_GET_SIZE(seq)
+
+    rv = PyBytes_FromStringAndSize(NULL, n_items)
+    cdef char *data = PyBytes_AS_STRING(rv)
+
+    for i in range(n_items):
+        data[i] = PySequence_Fast_GET_ITEM(seq, i) == <void *> None
+
+    return rv
@@ -0,0 +1,75 @@
+import numpy as np
+
+from ...util.helpers import pairwise
+from .base import NumpyColumn
+
+
+def read_offsets(n_items, buf):
+    # ClickHouse offsets are ends of arrays. Prepend zero start.
+    ends = np.empty(n_items, '<u8')
+    buf.readinto(ends)
+    return [0] + ends.tolist()
+
+
+def write_offsets(lengths, buf):
+    buf.write(np.cumsum(lengths, dtype='<u8').tobytes())
+
+
+def to_object_array(items):
+    # Items can be sequences themselves. Assigning by one prevents
+    # broadcasting them into extra dimension.
+    rv = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        rv[i] = item
+    return rv
+
+
+class NumpyArrayColumn(NumpyColumn):
+    """
+    Arrays are read into object array of slices of nested column values.
+    Slices of NumPy arrays are views, so values are not copied per row.
+    """
+
+    def __init__(self, nested_column, **kwargs):
+        self.nested_column = nested_column
+        super(NumpyArrayColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        super(NumpyArrayColumn, self).read_state_prefix(buf)
+
+        self.nested_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        super(NumpyArrayColumn, self).write_state_prefix(buf)
+
+        self.nested_column.write_state_prefix(buf)
+
+    def reset(self):
+        super(NumpyArrayColumn, self).reset()
+
+        self.nested_column.reset()
+
+    def read_data(self, n_items, buf):
+        offsets = read_offsets(n_items, buf)
+        values = self.nested_column.read_data(offsets[-1], buf)
+
+        rv = np.empty(n_items, dtype=object)
+        for i, (begin, end) in enumerate(pairwise(offsets)):
+            rv[i] = values[begin:end]
+        return rv
+
+    def write_data(self, items, buf):
+        write_offsets([len(x) for x in items], buf)
+        self.nested_column.write_data(self.flatten(items), buf)
+
+    def flatten(self, items):
+        parts = [x for x in items if len(x)]
+        if parts and all(isinstance(x, np.ndarray) for x in parts):
+            return np.concatenate(parts)
+
+        return to_object_array([y for x in parts for y in x])
+
+
+def create_numpy_array_column(spec, column_by_spec_getter, column_options):
+    inner = spec[6:-1]
+    return NumpyArrayColumn(column_by_spec_getter(inner), **column_options)
@@ -10,8 +10,10 @@ class NumpyColumn(Column):
     normalize_null_value = True
 
     def read_items(self, n_items, buf):
-        data = buf.read(n_items * self.dtype.itemsize)
-        return np.frombuffer(data, self.dtype.newbyteorder('<'), n_items)
+        # Data is copied from reader buffer straight into writable array.
+        items = np.empty(n_items, self.dtype.newbyteorder('<'))
+        buf.readinto(items)
+        return items
 
     def write_items(self, items, buf):
         buf.write(items.astype(self.dtype.newbyteorder('<')).tobytes())
@@ -24,6 +26,11 @@ class NumpyColumn(Column):
     def _get_nulls_map(self, items):
         return [bool(x) for x in pd.isnull(items)]
 
+    def _read_nulls_map(self, n_items, buf):
+        # Items of nullable column are always objects regardless of
+        # nulls presence in block.
+        return np.frombuffer(buf.read(n_items), dtype=np.bool_)
+
     def _read_data(self, n_items, buf, nulls_map=None):
         items = self.read_items(n_items, buf)
 
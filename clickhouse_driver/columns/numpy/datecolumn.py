@@ -17,3 +17,8 @@ class NumpyDateColumn(NumpyColumn):
         super(NumpyDateColumn, self).write_items(
             items.astype('datetime64[D]'), buf
         )
+
+
+class NumpyDate32Column(NumpyDateColumn):
+    dtype = np.dtype(np.int32)
+    ch_type = 'Date32'
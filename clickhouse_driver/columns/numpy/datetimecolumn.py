@@ -82,9 +82,10 @@ class NumpyDateTime64Column(NumpyDateTimeColumnBase):
         # Since 0 <= scale <= 9, multiply by the integer 10^(9 - scale).
         items = super(NumpyDateTime64Column, self).read_items(n_items, buf)
 
-        tmp = np.copy(items)
-        tmp *= 10 ** (9 - self.scale)
-        dt = tmp.view(dtype='datetime64[ns]')
+        # Items are not shared with reader and are converted in place.
+        if self.scale < 9:
+            items *= 10 ** (9 - self.scale)
+        dt = items.view(dtype='datetime64[ns]')
 
         return self.apply_timezones_after_read(dt)
 
@@ -0,0 +1,133 @@
+from decimal import localcontext
+from struct import Struct
+
+import numpy as np
+
+from ..decimalcodec import decimals_from_ints, decimals_to_ints
+from ..decimalcolumn import get_decimal_format, parse_decimal_spec
+from ..largeint import (
+    int128_from_quads, int128_to_quads, int256_from_quads, int256_to_quads
+)
+from .base import NumpyColumn
+
+
+class NumpyDecimalColumn(NumpyColumn):
+    """
+    Decimals are read into ``float64`` array with ``decimal_format='float'``,
+    into array of scaled integers with ``decimal_format='int'`` and into
+    object array of :class:`~decimal.Decimal` otherwise.
+    """
+
+    int_dtype = None
+    max_precision = None
+
+    def __init__(self, precision, scale, **kwargs):
+        self.precision = precision
+        self.scale = scale
+        super(NumpyDecimalColumn, self).__init__(**kwargs)
+
+        self.decimal_format = get_decimal_format(self.context)
+        if self.decimal_format == 'float':
+            self.dtype = np.dtype(np.float64)
+        elif self.decimal_format == 'int' and self.int_dtype is not None:
+            self.dtype = self.int_dtype
+        else:
+            self.dtype = np.dtype(object)
+
+    def read_ints(self, n_items, buf):
+        items = np.empty(n_items, self.int_dtype.newbyteorder('<'))
+        buf.readinto(items)
+        return items
+
+    def write_ints(self, ints, buf):
+        items = np.array(ints, dtype=self.int_dtype.newbyteorder('<'))
+        buf.write(items.tobytes())
+
+    def read_items(self, n_items, buf):
+        ints = self.read_ints(n_items, buf)
+
+        if self.decimal_format == 'float':
+            if isinstance(ints, np.ndarray):
+                return ints / 10.0 ** self.scale
+            # Python division of large integers is correctly rounded.
+            factor = 10 ** self.scale
+            return np.array([x / factor for x in ints], dtype=self.dtype)
+
+        elif self.decimal_format == 'int':
+            if isinstance(ints, np.ndarray):
+                return ints
+            items = np.empty(n_items, dtype=self.dtype)
+            items[:] = ints
+            return items
+
+        if isinstance(ints, np.ndarray):
+            ints = ints.tolist()
+        items = np.empty(n_items, dtype=self.dtype)
+        with localcontext() as ctx:
+            ctx.prec = self.max_precision
+            items[:] = decimals_from_ints(ints, self.scale)
+        return items
+
+    def write_items(self, items, buf):
+        ints = items.tolist()
+        with localcontext() as ctx:
+            ctx.prec = self.max_precision
+            decimals_to_ints(ints, self.scale)
+
+        self.write_ints(ints, buf)
+
+
+class NumpyDecimal32Column(NumpyDecimalColumn):
+    int_dtype = np.dtype(np.int32)
+    max_precision = 9
+
+
+class NumpyDecimal64Column(NumpyDecimalColumn):
+    int_dtype = np.dtype(np.int64)
+    max_precision = 18
+
+
+class NumpyLargeDecimalColumn(NumpyDecimalColumn):
+    factor = None
+
+    to_quads = None
+    from_quads = None
+
+    def read_ints(self, n_items, buf):
+        s = Struct('<{}Q'.format(self.factor * n_items))
+        return self.from_quads(s.unpack(buf.read(s.size)), n_items)
+
+    def write_ints(self, ints, buf):
+        s = Struct('<{}Q'.format(self.factor * len(ints)))
+        buf.write(s.pack(*self.to_quads(ints, len(ints))))
+
+
+class NumpyDecimal128Column(NumpyLargeDecimalColumn):
+    max_precision = 38
+    factor = 2
+
+    to_quads = int128_to_quads
+    from_quads = int128_from_quads
+
+
+class NumpyDecimal256Column(NumpyLargeDecimalColumn):
+    max_precision = 76
+    factor = 4
+
+    to_quads = int256_to_quads
+    from_quads = int256_from_quads
+
+
+def create_numpy_decimal_column(spec, column_options):
+    precision, scale = parse_decimal_spec(spec)
+
+    if precision <= 9:
+        cls = NumpyDecimal32Column
+    elif precision <= 18:
+        cls = NumpyDecimal64Column
+    elif precision <= 38:
+        cls = NumpyDecimal128Column
+    else:
+        cls = NumpyDecimal256Column
+
+    return cls(precision, scale, **column_options)
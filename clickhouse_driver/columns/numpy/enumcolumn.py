@@ -0,0 +1,101 @@
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+
+from ... import errors
+from ..enumcolumn import _parse_options
+from .base import NumpyColumn
+
+
+class NumpyEnumColumn(NumpyColumn):
+    """
+    Enum is read into :class:`pandas.Categorical` with names as categories
+    ordered by values. Names, values, :class:`~enum.Enum` members and
+    categoricals can be inserted.
+    """
+
+    # Nulls are skipped on names mapping.
+    normalize_null_value = False
+
+    def __init__(self, name_by_value, value_by_name, **kwargs):
+        self.name_by_value = name_by_value
+        self.value_by_name = value_by_name
+
+        self.values = np.array(sorted(name_by_value), dtype=self.dtype)
+        self.categories = [name_by_value[x] for x in self.values.tolist()]
+
+        # Both names and values are accepted on insert.
+        self.value_by_item = dict(value_by_name)
+        self.value_by_item.update((x, x) for x in name_by_value)
+        super(NumpyEnumColumn, self).__init__(**kwargs)
+
+    def after_read_items(self, items, nulls_map=None):
+        codes = np.searchsorted(self.values, items)
+        if nulls_map is not None:
+            codes[nulls_map] = -1
+        return pd.Categorical.from_codes(codes, self.categories)
+
+    def write_items(self, items, buf):
+        # Categorical is converted into array of names.
+        items = np.asarray(items)
+
+        if np.issubdtype(items.dtype, np.integer):
+            values = items
+            unknown = ~np.isin(items, self.values)
+
+        else:
+            value_by_item = self.value_by_item
+            nulls = pd.isnull(items)
+            values = np.zeros(len(items), dtype=self.dtype)
+            unknown = np.zeros(len(items), dtype=np.bool_)
+
+            for i, item in enumerate(items):
+                if nulls[i]:
+                    continue
+
+                if isinstance(item, Enum):
+                    item = item.name
+
+                value = value_by_item.get(item)
+                if value is None:
+                    unknown[i] = True
+                else:
+                    values[i] = value
+
+        if unknown.any():
+            choices = ', '.join(
+                "'{}' = {}".format(name.replace("'", r"\'"), value)
+                for name, value in self.value_by_name.items()
+            )
+            enum_str = '{}({})'.format(self.ch_type, choices)
+
+            raise errors.LogicalError(
+                "Unknown element '{}' for type {}"
+                .format(items[unknown][0], enum_str)
+            )
+
+        super(NumpyEnumColumn, self).write_items(values, buf)
+
+
+class NumpyEnum8Column(NumpyEnumColumn):
+    ch_type = 'Enum8'
+    dtype = np.dtype(np.int8)
+
+
+class NumpyEnum16Column(NumpyEnumColumn):
+    ch_type = 'Enum16'
+    dtype = np.dtype(np.int16)
+
+
+def create_numpy_enum_column(spec, column_options):
+    if spec.startswith('Enum8'):
+        params = spec[6:-1]
+        cls = NumpyEnum8Column
+    else:
+        params = spec[7:-1]
+        cls = NumpyEnum16Column
+
+    name_by_value, value_by_name = _parse_options(params)
+
+    return cls(name_by_value, value_by_name, **column_options)
@@ -0,0 +1,68 @@
+from ipaddress import IPv4Address, IPv6Address, AddressValueError
+
+import numpy as np
+
+from ... import errors
+from .base import NumpyColumn
+
+
+class NumpyIPv4Column(NumpyColumn):
+    """
+    IPv4 addresses are read into ``uint32`` array. Integers, strings and
+    :class:`~ipaddress.IPv4Address` can be inserted.
+    """
+
+    ch_type = 'IPv4'
+    dtype = np.dtype(np.uint32)
+
+    def write_items(self, items, buf):
+        if not np.issubdtype(items.dtype, np.integer):
+            values = np.empty(len(items), dtype=self.dtype)
+            for i, item in enumerate(items):
+                try:
+                    values[i] = int(IPv4Address(item))
+                except AddressValueError:
+                    raise errors.CannotParseDomainError(
+                        "Cannot parse IPv4 '{}'".format(item)
+                    )
+            items = values
+
+        super(NumpyIPv4Column, self).write_items(items, buf)
+
+
+class NumpyIPv6Column(NumpyColumn):
+    """
+    IPv6 addresses are read into ``S16`` array of packed addresses.
+    16-byte strings, strings and :class:`~ipaddress.IPv6Address` can be
+    inserted.
+    """
+
+    ch_type = 'IPv6'
+    dtype = np.dtype('S16')
+
+    null_value = bytes(16)
+
+    def write_items(self, items, buf):
+        # Converting of S16 array to list loses trailing zero bytes.
+        if items.dtype.kind == 'S':
+            buf.write(items.astype(self.dtype).tobytes())
+            return
+
+        packed = []
+        for item in items:
+            if not isinstance(item, bytes):
+                try:
+                    item = IPv6Address(item).packed
+                except AddressValueError:
+                    raise errors.CannotParseDomainError(
+                        "Cannot parse IPv6 '{}'".format(item)
+                    )
+
+            elif len(item) != 16:
+                raise errors.CannotParseDomainError(
+                    "Cannot parse IPv6 '{}'".format(item)
+                )
+
+            packed.append(item)
+
+        buf.write(b''.join(packed))
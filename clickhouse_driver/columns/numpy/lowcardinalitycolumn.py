@@ -12,6 +12,11 @@ from .intcolumn import (
 
 
 class NumpyLowCardinalityColumn(LowCardinalityColumn):
+    """
+    Reused dictionary keeps the same categories dtype for all blocks of the
+    query.
+    """
+
     int_types = {
         0: NumpyUInt8Column,
         1: NumpyUInt16Column,
@@ -23,6 +28,38 @@ class NumpyLowCardinalityColumn(LowCardinalityColumn):
         super(NumpyLowCardinalityColumn, self).__init__(nested_column,
                                                         **kwargs)
 
+    def index_equals(self, index, other):
+        return np.array_equal(index, other)
+
+    def decode_index(self, index, nullable):
+        if nullable:
+            # Drop first index element. It is used for NULL.
+            index = index[1:]
+        return pd.CategoricalDtype(index)
+
+    def make_index(self, items):
+        c = pd.Categorical(items)
+        categories = self.get_dictionary('write')
+        if categories is None or \
+                len(categories) > self.max_dictionary_size:
+            self.set_dictionary('write', c.categories)
+            return c.categories, c.codes
+
+        # Codes are remapped to categories of previous blocks.
+        indexer = categories.get_indexer(c.categories)
+        new = indexer == -1
+        if new.any():
+            indexer[new] = np.arange(
+                len(categories), len(categories) + new.sum()
+            )
+            categories = categories.append(c.categories[new])
+            self.set_dictionary('write', categories)
+
+        codes = indexer[c.codes]
+        # Keep "No value" code for nulls.
+        codes[c.codes == -1] = -1
+        return categories, codes
+
     def _write_data(self, items, buf):
         # Do not write anything for empty column.
         # May happen while writing empty arrays.
@@ -34,15 +71,7 @@ class NumpyLowCardinalityColumn(LowCardinalityColumn):
             nulls = pd.isnull(items)
             items = np.where(nulls, self.nested_column.null_value, items)
 
-        c = pd.Categorical(items)
-
-        int_type = int(log(len(c.codes), 2) / 8)
-        int_column = self.int_types[int_type](**self.init_kwargs)
-
-        serialization_type = self.serialization_type | int_type
-
-        index = c.categories
-        keys = c.codes
+        index, keys = self.make_index(items)
 
         if self.nested_column.nullable:
             # First element represents NULL if column is nullable.
@@ -51,6 +80,12 @@ class NumpyLowCardinalityColumn(LowCardinalityColumn):
             # Prevent null map writing. Reset nested column nullable flag.
             self.nested_column.nullable = False
 
+        # Dictionary may be larger than block.
+        int_type = int(log(max(len(index), len(keys)), 2) / 8)
+        int_column = self.int_types[int_type](**self.init_kwargs)
+
+        serialization_type = self.serialization_type | int_type
+
         write_binary_int64(serialization_type, buf)
         write_binary_int64(len(index), buf)
 
@@ -72,25 +107,23 @@ class NumpyLowCardinalityColumn(LowCardinalityColumn):
         # Prevent null map reading. Reset nested column nullable flag.
         self.nested_column.nullable = False
 
-        index_size = read_binary_uint64(buf)
-        index = self.nested_column.read_data(index_size, buf)
+        dtype = self.read_index(serialization_type, nullable, buf)
 
         read_binary_uint64(buf)  # number of keys
         keys = keys_column.read_data(n_items, buf)
 
         if nullable:
             # Shift all codes by one ("No value" code is -1 for pandas
-            # categorical) and drop corresponding first index
+            # categorical). First index element is dropped from categories
             # this is analog of original operation:
             # index = (None, ) + index[1:]
             keys = np.array(keys, dtype='int64')  # deal with possible overflow
             keys = keys - 1
-            index = index[1:]
-        return pd.Categorical.from_codes(keys, index)
+        return pd.Categorical.from_codes(keys, dtype=dtype)
 
 
 def create_numpy_low_cardinality_column(spec, column_by_spec_getter,
                                         column_options):
     inner = spec[15:-1]
     nested = column_by_spec_getter(inner)
-    return NumpyLowCardinalityColumn(nested, **column_options)
+    return NumpyLowCardinalityColumn(nested, spec=spec, **column_options)
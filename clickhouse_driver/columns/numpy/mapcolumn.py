@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from ..arraycodec import dicts_from_offsets
+from ..mapcolumn import comma_re
+from .arraycolumn import read_offsets, to_object_array, write_offsets
+from .base import NumpyColumn
+
+
+def to_python_list(items):
+    # Dicts hold Python objects as in non-NumPy Map columns.
+    if isinstance(items, np.ndarray) and items.dtype == 'datetime64[ns]':
+        # Nanoseconds are converted into ints by tolist().
+        return list(pd.DatetimeIndex(items))
+    return items.tolist()
+
+
+class NumpyMapColumn(NumpyColumn):
+    """
+    Maps are read into object array of dicts. Keys and values of all rows
+    are read by NumPy columns at once.
+    """
+
+    def __init__(self, key_column, value_column, **kwargs):
+        self.key_column = key_column
+        self.value_column = value_column
+        super(NumpyMapColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        super(NumpyMapColumn, self).read_state_prefix(buf)
+
+        self.key_column.read_state_prefix(buf)
+        self.value_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        super(NumpyMapColumn, self).write_state_prefix(buf)
+
+        self.key_column.write_state_prefix(buf)
+        self.value_column.write_state_prefix(buf)
+
+    def reset(self):
+        super(NumpyMapColumn, self).reset()
+
+        self.key_column.reset()
+        self.value_column.reset()
+
+    def read_data(self, n_items, buf):
+        offsets = read_offsets(n_items, buf)
+        keys = to_python_list(self.key_column.read_data(offsets[-1], buf))
+        values = to_python_list(
+            self.value_column.read_data(offsets[-1], buf)
+        )
+
+        rv = np.empty(n_items, dtype=object)
+        rv[:] = dicts_from_offsets(keys, values, offsets[1:])
+        return rv
+
+    def write_data(self, items, buf):
+        write_offsets([len(x) for x in items], buf)
+
+        keys = to_object_array([k for x in items for k in x.keys()])
+        values = to_object_array([v for x in items for v in x.values()])
+        self.key_column.write_data(keys, buf)
+        self.value_column.write_data(values, buf)
+
+
+def create_numpy_map_column(spec, column_by_spec_getter, column_options):
+    key, value = comma_re.split(spec[4:-1])
+    key_column = column_by_spec_getter(key.strip())
+    value_column = column_by_spec_getter(value.strip())
+
+    return NumpyMapColumn(key_column, value_column, **column_options)
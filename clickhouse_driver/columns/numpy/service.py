@@ -1,24 +1,30 @@
 from ..service import aliases
 from ... import errors
-from .datecolumn import NumpyDateColumn
+from .arraycolumn import create_numpy_array_column
+from .datecolumn import NumpyDateColumn, NumpyDate32Column
 from .datetimecolumn import create_numpy_datetime_column
+from .decimalcolumn import create_numpy_decimal_column
+from .enumcolumn import create_numpy_enum_column
 from .floatcolumn import NumpyFloat32Column, NumpyFloat64Column
 from .intcolumn import (
     NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
     NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
 )
 from .boolcolumn import NumpyBoolColumn
+from .ipcolumn import NumpyIPv4Column, NumpyIPv6Column
 from .lowcardinalitycolumn import create_numpy_low_cardinality_column
+from .mapcolumn import create_numpy_map_column
 from .stringcolumn import create_string_column
 from .tuplecolumn import create_tuple_column
+from .uuidcolumn import NumpyUUIDColumn
 from ..nullablecolumn import create_nullable_column
 
 column_by_type = {c.ch_type: c for c in [
-    NumpyDateColumn,
+    NumpyDateColumn, NumpyDate32Column,
     NumpyFloat32Column, NumpyFloat64Column,
     NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
     NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column,
-    NumpyBoolColumn
+    NumpyBoolColumn, NumpyUUIDColumn, NumpyIPv4Column, NumpyIPv6Column
 ]}
 
 
@@ -29,9 +35,25 @@ def get_numpy_column_by_spec(spec, column_options):
     if spec == 'String' or spec.startswith('FixedString'):
         return create_string_column(spec, column_options)
 
+    elif spec.startswith('Enum'):
+        return create_numpy_enum_column(spec, column_options)
+
     elif spec.startswith('DateTime'):
         return create_numpy_datetime_column(spec, column_options)
 
+    elif spec.startswith('Decimal'):
+        return create_numpy_decimal_column(spec, column_options)
+
+    elif spec.startswith('Array'):
+        return create_numpy_array_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec.startswith('Map'):
+        return create_numpy_map_column(
+            spec, create_column_with_options, column_options
+        )
+
     elif spec.startswith('Tuple'):
         return create_tuple_column(
             spec, create_column_with_options, column_options
@@ -0,0 +1,56 @@
+import numpy as np
+
+from ..uuidcodec import write_uuids
+from ..uuidcolumn import UUIDColumn
+from .base import NumpyColumn
+
+
+class NumpyUUIDColumn(NumpyColumn):
+    """
+    UUIDs are read into ``S16`` array with ``uuid_format='bytes'`` and into
+    object array of UUIDs or strings otherwise.
+    """
+
+    ch_type = 'UUID'
+
+    def __init__(self, **kwargs):
+        super(NumpyUUIDColumn, self).__init__(**kwargs)
+
+        uuid_format = self.context.client_settings.get('uuid_format', 'uuid')
+        if uuid_format not in UUIDColumn.readers:
+            raise ValueError(
+                'Unknown uuid_format {}. Expected one of: {}'.format(
+                    uuid_format, ', '.join(UUIDColumn.readers)
+                )
+            )
+
+        self.as_bytes = uuid_format == 'bytes'
+        self.dtype = np.dtype('S16' if self.as_bytes else object)
+        self.read_uuids = UUIDColumn.readers[uuid_format]
+        self.null_value = UUIDColumn.null_values[uuid_format]
+
+    @staticmethod
+    def swap_halves(data, n_items):
+        # Halves are stored as little-endian numbers. Reversing of each half
+        # gives big-endian UUID bytes and vice versa.
+        quads = np.frombuffer(data, dtype=np.uint8).reshape(n_items, 2, 8)
+        return quads[:, :, ::-1].tobytes()
+
+    def read_items(self, n_items, buf):
+        data = buf.read(16 * n_items)
+
+        if self.as_bytes:
+            data = self.swap_halves(data, n_items)
+            return np.frombuffer(data, dtype=self.dtype, count=n_items)
+
+        items = np.empty(n_items, dtype=self.dtype)
+        items[:] = self.read_uuids(data, n_items)
+        return items
+
+    def write_items(self, items, buf):
+        # Converting of S16 array to list loses trailing zero bytes.
+        if items.dtype.kind == 'S':
+            data = items.astype('S16').tobytes()
+            buf.write(self.swap_halves(data, len(items)))
+        else:
+            buf.write(write_uuids(items.tolist()))
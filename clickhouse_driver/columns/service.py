@@ -1,23 +1,23 @@
 import logging
 
 from .. import errors
-from .arraycolumn import create_array_column
+from .arraycolumn import ArrayColumn, create_array_column
 from .boolcolumn import BoolColumn
 from .datecolumn import DateColumn, Date32Column
 from .datetimecolumn import create_datetime_column
 from .decimalcolumn import create_decimal_column
 from . import exceptions as column_exceptions
 from .enumcolumn import create_enum_column
-from .floatcolumn import Float32Column, Float64Column
+from .floatcolumn import FloatColumn, Float32Column, Float64Column
 from .intcolumn import (
-    Int8Column, Int16Column, Int32Column, Int64Column,
+    IntColumn, Int8Column, Int16Column, Int32Column, Int64Column,
     Int128Column, UInt128Column, Int256Column, UInt256Column,
     UInt8Column, UInt16Column, UInt32Column, UInt64Column
 )
 from .lowcardinalitycolumn import create_low_cardinality_column
 from .jsoncolumn import create_json_column
 from .newjsoncolumn import create_newjson_column
-from .mapcolumn import create_map_column
+from .mapcolumn import MapColumn, create_map_column
 from .nothingcolumn import NothingColumn
 from .nullcolumn import NullColumn
 from .nullablecolumn import create_nullable_column
@@ -28,6 +28,7 @@ from .stringcolumn import create_string_column
 from .tuplecolumn import create_tuple_column
 from .nestedcolumn import create_nested_column
 from .uuidcolumn import UUIDColumn
+from .variantcolumn import create_dynamic_column, create_variant_column
 from .intervalcolumn import (
     IntervalYearColumn, IntervalMonthColumn, IntervalWeekColumn,
     IntervalDayColumn, IntervalHourColumn, IntervalMinuteColumn,
@@ -124,6 +125,16 @@ def get_column_by_spec(spec, column_options, use_numpy=None):
             spec, create_column_with_options, column_options
         )
 
+    elif spec.startswith('Variant'):
+        return create_variant_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif spec == 'Dynamic' or spec.startswith('Dynamic('):
+        return create_dynamic_column(
+            spec, create_column_with_options, column_options
+        )
+
     elif spec.startswith("Object('json')"):
         return create_json_column(
             spec, create_column_with_options, column_options
@@ -149,13 +160,109 @@ def get_column_by_spec(spec, column_options, use_numpy=None):
             raise errors.UnknownTypeError('Unknown type {}'.format(spec))
 
 
+class ColumnFactory(object):
+    """
+    Per-connection cache of columns by type spec. Spec is parsed and columns
+    tree is built once. Cached column is reset before reuse to drop state
+    left by reading or writing of previous block.
+
+    Cache is cleared by context on server info change. Settings columns are
+    built with are a part of the key, so queries with different settings
+    share the cache. Session timezone is changed in server info in place, so
+    effective timezone is a part of the key too.
+
+    :param max_size: maximum number of cached columns. Cache is cleared on
+                     overflow.
+    """
+
+    # Columns with dynamic structure are created for each block.
+    not_cached_types = ("Object('json')", 'JSON', 'Dynamic')
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.columns = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        super(ColumnFactory, self).__init__()
+
+    def is_cacheable(self, spec):
+        return not any(x in spec for x in self.not_cached_types)
+
+    def get_column(self, spec, column_options, use_numpy=None):
+        if use_numpy is None:
+            use_numpy = column_options['context'].client_settings['use_numpy']
+
+        # NumPy columns are not cached.
+        if use_numpy or not self.is_cacheable(spec):
+            return get_column_by_spec(
+                spec, column_options, use_numpy=use_numpy
+            )
+
+        context = column_options['context']
+        server_info = context.server_info
+        key = (
+            spec,
+            column_options.get('types_check', False),
+            column_options.get('has_custom_serialization', False),
+            server_info.get_timezone() if server_info else None,
+            context.columns_key
+        )
+        column = self.columns.get(key)
+
+        if column is None:
+            self.misses += 1
+            column = get_column_by_spec(spec, column_options, use_numpy=False)
+
+            if len(self.columns) >= self.max_size:
+                self.columns.clear()
+            self.columns[key] = column
+
+        else:
+            self.hits += 1
+            column.reset()
+
+        return column
+
+    def clear(self):
+        self.columns.clear()
+
+    @property
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.columns)
+        }
+
+
+def get_column(context, spec, column_options, use_numpy=None):
+    if context.column_factory is not None:
+        return context.column_factory.get_column(
+            spec, column_options, use_numpy=use_numpy
+        )
+
+    return get_column_by_spec(spec, column_options, use_numpy=use_numpy)
+
+
 def read_column(context, column_spec, n_items, buf, use_numpy=None,
                 has_custom_serialization=False):
     column_options = {
         'context': context,
         'has_custom_serialization': has_custom_serialization
     }
-    col = get_column_by_spec(column_spec, column_options, use_numpy=use_numpy)
+    col = get_column(context, column_spec, column_options, use_numpy=use_numpy)
+
+    # Only top level columns. Nested columns items are sliced into tuples.
+    if isinstance(col, (IntColumn, FloatColumn)):
+        col.read_as_array = \
+            bool(context.client_settings.get('columns_as_arrays')) and \
+            col.can_read_as_array()
+
+    if isinstance(col, (ArrayColumn, MapColumn)):
+        col.read_flat = bool(context.client_settings.get('flat_arrays'))
+
     col.read_state_prefix(buf)
     return col.read_data(n_items, buf)
 
@@ -166,7 +273,7 @@ def write_column(context, column_name, column_spec, items, buf,
         'context': context,
         'types_check': types_check
     }
-    column = get_column_by_spec(column_spec, column_options)
+    column = get_column(context, column_spec, column_options)
 
     try:
         column.write_state_prefix(buf)
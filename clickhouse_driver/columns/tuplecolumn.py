@@ -53,6 +53,12 @@ class TupleColumn(Column):
         for x in self.nested_columns:
             x.write_state_prefix(buf)
 
+    def reset(self):
+        super(TupleColumn, self).reset()
+
+        for x in self.nested_columns:
+            x.reset()
+
 
 def create_tuple_column(spec, column_by_spec_getter, column_options):
     inner_spec = get_inner_spec('Tuple', spec)
@@ -0,0 +1,247 @@
+import sys
+from types import MemberDescriptorType
+from uuid import UUID, SafeUUID
+
+from cpython cimport Py_INCREF
+from cpython.bytes cimport (
+    PyBytes_AS_STRING, PyBytes_FromStringAndSize, PyBytes_GET_SIZE
+)
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+
+from .. import errors
+from .. import writer
+from .exceptions import ColumnTypeMismatchException
+
+# UUID is stored by two little-endian uint64 numbers: high and low halves.
+
+cdef object MAX_UINT64 = writer.MAX_UINT64
+cdef object uuid_new = object.__new__
+cdef object safe_unknown = SafeUUID.unknown
+cdef object int_name = 'int'
+cdef object is_safe_name = 'is_safe'
+
+cdef object int_descr = UUID.__dict__.get(int_name)
+cdef object is_safe_descr = UUID.__dict__.get(is_safe_name)
+
+# UUID attributes are slots since Python 3.8. Slots are set directly through
+# their descriptors.
+cdef bint use_slots = (
+    sys.implementation.name == 'cpython' and
+    isinstance(int_descr, MemberDescriptorType) and
+    isinstance(is_safe_descr, MemberDescriptorType)
+)
+
+cdef char *hex_digits = b'0123456789abcdef'
+
+
+cdef extern from *:
+    """
+    static PyObject *make_uuid_from_slots(PyObject *type,
+                                         PyObject *int_descr,
+                                         PyObject *is_safe_descr,
+                                         PyObject *value,
+                                         PyObject *is_safe) {
+        PyTypeObject *tp = (PyTypeObject *) type;
+        PyObject *obj = tp->tp_alloc(tp, 0);
+        if (obj == NULL) {
+            return NULL;
+        }
+
+        if (Py_TYPE(int_descr)->tp_descr_set(int_descr, obj, value) < 0 ||
+                Py_TYPE(is_safe_descr)->tp_descr_set(
+                    is_safe_descr, obj, is_safe) < 0) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+
+        // UUID refers only to int and enum member and cannot be part of
+        // reference cycle. Untracked objects make GC passes on large
+        // results cheap.
+        PyObject_GC_UnTrack(obj);
+        return obj;
+    }
+    """
+    object make_uuid_from_slots(object type, object value_descr,
+                                object flag_descr, object value,
+                                object flag)
+
+
+cdef extern from "Python.h":
+    int PyObject_GenericSetAttr(object o, object name, object value) except -1
+    object PyUnicode_DecodeLatin1(const char *s, Py_ssize_t size,
+                                  const char *errors)
+    unsigned long long PyLong_AsUnsignedLongLong(object o) except? -1
+
+
+cdef inline unsigned long long read_uint64(const unsigned char *data):
+    cdef unsigned long long rv = 0
+    cdef int i
+
+    for i in range(7, -1, -1):
+        rv = (rv << 8) | data[i]
+    return rv
+
+
+cdef inline void write_uint64(unsigned long long value, unsigned char *data):
+    cdef int i
+
+    for i in range(8):
+        data[i] = value & 0xFF
+        value >>= 8
+
+
+cdef inline void to_uuid_bytes(const unsigned char *data, unsigned char *out):
+    # Each half is reversed to big-endian order used by UUID.bytes.
+    cdef int i
+
+    for i in range(8):
+        out[i] = data[7 - i]
+        out[8 + i] = data[15 - i]
+
+
+cdef const unsigned char *get_data(bytes data,
+                                   Py_ssize_t n_items) except NULL:
+    if PyBytes_GET_SIZE(data) < 16 * n_items:
+        raise ValueError('Not enough data for {} UUIDs'.format(n_items))
+    return <const unsigned char *> PyBytes_AS_STRING(data)
+
+
+def read_uuids(bytes data, Py_ssize_t n_items):
+    """
+    :param data: column data.
+    :param n_items: number of items.
+    :return: tuple of :class:`~uuid.UUID`.
+    """
+    cdef const unsigned char *ptr = get_data(data, n_items)
+    cdef Py_ssize_t i
+    cdef object value, item
+
+    items = PyTuple_New(n_items)
+
+    for i in range(n_items):
+        value = (<object> read_uint64(ptr)) << 64
+        value |= <object> read_uint64(ptr + 8)
+        ptr += 16
+
+        # UUID.__init__ is bypassed. It only validates arguments and sets
+        # these attributes.
+        if use_slots:
+            item = make_uuid_from_slots(
+                UUID, int_descr, is_safe_descr, value, safe_unknown
+            )
+        else:
+            item = uuid_new(UUID)
+            PyObject_GenericSetAttr(item, int_name, value)
+            PyObject_GenericSetAttr(item, is_safe_name, safe_unknown)
+
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(items, i, item)
+
+    return items
+
+
+def read_uuids_as_bytes(bytes data, Py_ssize_t n_items):
+    """
+    :param data: column data.
+    :param n_items: number of items.
+    :return: tuple of 16-byte :class:`bytes` as in :attr:`uuid.UUID.bytes`.
+    """
+    cdef const unsigned char *ptr = get_data(data, n_items)
+    cdef Py_ssize_t i
+    cdef object item
+
+    items = PyTuple_New(n_items)
+
+    for i in range(n_items):
+        item = PyBytes_FromStringAndSize(NULL, 16)
+        to_uuid_bytes(ptr, <unsigned char *> PyBytes_AS_STRING(item))
+        ptr += 16
+
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(items, i, item)
+
+    return items
+
+
+def read_uuids_as_str(bytes data, Py_ssize_t n_items):
+    """
+    :param data: column data.
+    :param n_items: number of items.
+    :return: tuple of :class:`str` in canonical form.
+    """
+    cdef const unsigned char *ptr = get_data(data, n_items)
+    cdef Py_ssize_t i
+    cdef int j, pos
+    cdef unsigned char uuid_bytes[16]
+    cdef char text[36]
+    cdef object item
+
+    items = PyTuple_New(n_items)
+
+    for i in range(n_items):
+        to_uuid_bytes(ptr, uuid_bytes)
+        ptr += 16
+
+        pos = 0
+        for j in range(16):
+            if j == 4 or j == 6 or j == 8 or j == 10:
+                text[pos] = b'-'
+                pos += 1
+            text[pos] = hex_digits[uuid_bytes[j] >> 4]
+            text[pos + 1] = hex_digits[uuid_bytes[j] & 0x0F]
+            pos += 2
+
+        item = PyUnicode_DecodeLatin1(text, 36, NULL)
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(items, i, item)
+
+    return items
+
+
+def write_uuids(items):
+    """
+    :param items: sequence of :class:`~uuid.UUID`, :class:`str` or 16-byte
+                  :class:`bytes`.
+    :return: column data.
+    """
+    cdef Py_ssize_t i, n_items = len(items)
+    cdef unsigned char *ptr
+    cdef unsigned long long high, low
+    cdef object item, value
+
+    rv = PyBytes_FromStringAndSize(NULL, 16 * n_items)
+    ptr = <unsigned char *> PyBytes_AS_STRING(rv)
+
+    for i in range(n_items):
+        item = items[i]
+
+        if type(item) is bytes:
+            if PyBytes_GET_SIZE(item) != 16:
+                raise errors.CannotParseUuidError(
+                    "Cannot parse uuid '{}'".format(item)
+                )
+            # Reversing of halves is symmetric.
+            to_uuid_bytes(
+                <const unsigned char *> PyBytes_AS_STRING(item), ptr
+            )
+
+        else:
+            if not isinstance(item, UUID):
+                try:
+                    item = UUID(item)
+                except ValueError:
+                    raise errors.CannotParseUuidError(
+                        "Cannot parse uuid '{}'".format(item)
+                    )
+                except (TypeError, AttributeError):
+                    raise ColumnTypeMismatchException(item)
+
+            value = item.int
+            high = PyLong_AsUnsignedLongLong(value >> 64)
+            low = PyLong_AsUnsignedLongLong(value & MAX_UINT64)
+            write_uint64(high, ptr)
+            write_uint64(low, ptr + 8)
+
+        ptr += 16
+
+    return rv
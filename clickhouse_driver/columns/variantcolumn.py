@@ -0,0 +1,209 @@
+from struct import Struct
+
+from .. import errors
+from ..reader import read_binary_str, read_binary_uint8, read_binary_uint64
+from ..varint import read_varint
+from ..writer import write_binary_uint64
+from . import exceptions
+from .base import Column
+from .stringcolumn import ByteString
+from .util import get_inner_columns, get_inner_spec
+
+
+class VariantColumn(Column):
+    """
+    Stores discriminator of variant for each row and then data of each
+    variant for rows of this variant only.
+
+    Discriminators are read at once. Each variant is read in bulk and values
+    are scattered back to rows by positions.
+    """
+
+    py_types = (object, )
+
+    null_discriminator = 255
+
+    # Discriminators serialization modes.
+    basic_mode = 0
+    compact_mode = 1
+
+    # Granule formats in compact mode.
+    plain_granule = 0
+    compact_granule = 1
+
+    null_value = None
+
+    def __init__(self, variant_columns, **kwargs):
+        self.variant_columns = variant_columns
+        self.mode = self.basic_mode
+        super(VariantColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        super(VariantColumn, self).read_state_prefix(buf)
+
+        self.mode = read_binary_uint64(buf)
+        for column in self.variant_columns:
+            column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        super(VariantColumn, self).write_state_prefix(buf)
+
+        write_binary_uint64(self.basic_mode, buf)
+        for column in self.variant_columns:
+            column.write_state_prefix(buf)
+
+    def read_discriminators(self, n_items, buf):
+        if self.mode == self.basic_mode:
+            return buf.read(n_items)
+
+        # Compact mode: rows are split into granules. Granule with single
+        # variant is stored as one discriminator.
+        parts = []
+        while n_items > 0:
+            n_rows = read_varint(buf)
+            granule_format = read_binary_uint8(buf)
+            if granule_format == self.compact_granule:
+                parts.append(bytes((read_binary_uint8(buf), )) * n_rows)
+            else:
+                parts.append(buf.read(n_rows))
+            n_items -= n_rows
+
+        return b''.join(parts)
+
+    def read_items(self, n_items, buf):
+        if not n_items:
+            return []
+
+        discriminators = self.read_discriminators(n_items, buf)
+
+        # Row positions of each variant.
+        positions = [[] for _ in self.variant_columns]
+        null_discriminator = self.null_discriminator
+        for i, discriminator in enumerate(discriminators):
+            if discriminator != null_discriminator:
+                positions[discriminator].append(i)
+
+        items = [None] * n_items
+        for column, variant_positions in zip(self.variant_columns, positions):
+            if not variant_positions:
+                continue
+
+            values = column.read_data(len(variant_positions), buf)
+            for i, value in zip(variant_positions, values):
+                items[i] = value
+
+        return items
+
+    def get_discriminator(self, value):
+        # Variant with value type as the main Python type is preferred,
+        # then variant accepting value type and then subclasses.
+        value_type = type(value)
+        checks = (
+            lambda py_types: py_types[0] is value_type,
+            lambda py_types: value_type in py_types,
+            lambda py_types: isinstance(value, py_types)
+        )
+        for check in checks:
+            for i, column in enumerate(self.variant_columns):
+                if column.py_types and check(column.py_types):
+                    return i
+
+        raise exceptions.ColumnTypeMismatchException(value)
+
+    def write_items(self, items, buf):
+        discriminators = []
+        values = [[] for _ in self.variant_columns]
+
+        for value in items:
+            if value is None:
+                discriminators.append(self.null_discriminator)
+            else:
+                discriminator = self.get_discriminator(value)
+                discriminators.append(discriminator)
+                values[discriminator].append(value)
+
+        s = Struct('<{}B'.format(len(discriminators)))
+        buf.write(s.pack(*discriminators))
+
+        for column, variant_values in zip(self.variant_columns, values):
+            if variant_values:
+                column.write_data(variant_values, buf)
+
+    def reset(self):
+        super(VariantColumn, self).reset()
+
+        self.mode = self.basic_mode
+        for column in self.variant_columns:
+            column.reset()
+
+
+class DynamicColumn(Column):
+    """
+    Column with types known only from state prefix. Data is stored as
+    Variant of these types and SharedVariant. Values of SharedVariant
+    are returned as bytes in binary encoding as is.
+    """
+
+    # Structure serialization versions.
+    v1 = 1
+    v2 = 2
+
+    shared_variant = 'SharedVariant'
+
+    py_types = (object, )
+    null_value = None
+
+    def __init__(self, column_by_spec_getter, **kwargs):
+        self.column_by_spec_getter = column_by_spec_getter
+        self.init_kwargs = kwargs
+        self.variant_column = None
+        super(DynamicColumn, self).__init__(**kwargs)
+
+    def get_variant_column(self, spec):
+        if spec == self.shared_variant:
+            return ByteString(**self.init_kwargs)
+        return self.column_by_spec_getter(spec)
+
+    def read_state_prefix(self, buf):
+        super(DynamicColumn, self).read_state_prefix(buf)
+
+        version = read_binary_uint64(buf)
+        if version not in (self.v1, self.v2):
+            raise errors.UnknownTypeError(
+                'Unsupported Dynamic serialization version {}'.format(version)
+            )
+
+        if version == self.v1:
+            read_varint(buf)  # max_types
+
+        n_types = read_varint(buf)
+        specs = [read_binary_str(buf) for _ in range(n_types)]
+
+        # Since V2 SharedVariant is always present and not listed.
+        if version == self.v2:
+            specs.append(self.shared_variant)
+
+        # Discriminators are indexes of variants sorted by name.
+        specs.sort()
+        columns = [self.get_variant_column(spec) for spec in specs]
+
+        self.variant_column = VariantColumn(columns, **self.init_kwargs)
+        self.variant_column.read_state_prefix(buf)
+
+    def read_items(self, n_items, buf):
+        return self.variant_column.read_items(n_items, buf)
+
+    def write_items(self, items, buf):
+        raise NotImplementedError(
+            'Writing of Dynamic columns is not supported'
+        )
+
+
+def create_variant_column(spec, column_by_spec_getter, column_options):
+    inner = get_inner_spec('Variant', spec)
+    columns = [column_by_spec_getter(x) for x in get_inner_columns(inner)]
+    return VariantColumn(columns, **column_options)
+
+
+def create_dynamic_column(spec, column_by_spec_getter, column_options):
+    return DynamicColumn(column_by_spec_getter, **column_options)
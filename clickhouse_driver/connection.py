@@ -14,6 +14,7 @@ from .blockstreamprofileinfo import BlockStreamProfileInfo
 from .bufferedreader import BufferedSocketReader
 from .bufferedwriter import BufferedSocketWriter
 from .clientinfo import ClientInfo
+from .columns.service import ColumnFactory
 from .compression import get_compressor_cls
 from .context import Context
 from .log import log_block
@@ -44,6 +45,46 @@ class Packet(object):
         super(Packet, self).__init__()
 
 
+class AddrInfoCache(object):
+    """
+    Caches ``socket.getaddrinfo`` results per host and port for given
+    number of seconds. Shared between all connections of the process.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        super(AddrInfoCache, self).__init__()
+
+    def get(self, host, port, ttl):
+        key = (host, port)
+        now = time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        addrinfo = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+
+        with self._lock:
+            self._entries[key] = (now + ttl, addrinfo)
+
+        return addrinfo
+
+    def invalidate(self, host, port):
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+addrinfo_cache = AddrInfoCache()
+
+
 class ServerInfo(object):
     def __init__(self, name, version_major, version_minor, version_patch,
                  revision, timezone, display_name, used_revision):
@@ -145,6 +186,14 @@ class Connection(object):
                               failed ``ping``, helpful when every reconnect
                               need to be caught in calling code.
                               Defaults to ``False``.
+    :param dns_cache_ttl: number of seconds resolved addresses of hosts are
+                          cached for. Cache is shared between connections.
+                          Defaults to ``None`` (no caching).
+    :param host_selector: ``HostSelector`` instance from
+                          :mod:`clickhouse_driver.hostselector`. If specified
+                          hosts are tried in order of their health and latency
+                          instead of the order they were passed.
+                          Defaults to ``None``.
     """
 
     def __init__(
@@ -167,6 +216,8 @@ class Connection(object):
             tcp_keepalive=False,
             client_revision=None,
             disable_reconnect=False,
+            dns_cache_ttl=None,
+            host_selector=None,
     ):
         if secure:
             default_port = defines.DEFAULT_SECURE_PORT
@@ -193,6 +244,8 @@ class Connection(object):
             client_revision or defines.CLIENT_REVISION, defines.CLIENT_REVISION
         )
         self.disable_reconnect = disable_reconnect
+        self.dns_cache_ttl = dns_cache_ttl
+        self.host_selector = host_selector
 
         self.secure_socket = secure
         self.verify_cert = verify
@@ -213,6 +266,11 @@ class Connection(object):
 
         self.server_hostname = server_hostname
 
+        # SSL context is created once per connection. It allows to resume
+        # TLS sessions on reconnects.
+        self.ssl_context = None
+        self.ssl_sessions = {}
+
         # Use LZ4 compression by default.
         if compression is True:
             compression = 'lz4'
@@ -235,6 +293,7 @@ class Connection(object):
         self.client_trace_context = None
         self.server_info = None
         self.context = Context()
+        self.context.column_factory = ColumnFactory()
 
         # Block writer/reader
         self.block_in = None
@@ -243,6 +302,11 @@ class Connection(object):
 
         self._lock = threading.Lock()
         self.is_query_executing = False
+        # Query and its data are sent, only server packets are expected.
+        self.is_receiving = False
+        # Called with connection and flag instead of setting is_receiving.
+        # Lets other thread write into connection only while receiving.
+        self.receiving_callback = None
 
         super(Connection, self).__init__()
 
@@ -287,8 +351,16 @@ class Connection(object):
             ssl_options = self.ssl_options.copy()
             ssl_options['cert_reqs'] = cert_reqs
 
+            if self.ssl_context is None:
+                self.ssl_context = self._create_ssl_context(ssl_options)
+
+        if self.dns_cache_ttl:
+            addrinfo = addrinfo_cache.get(host, port, self.dns_cache_ttl)
+        else:
+            addrinfo = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+
         err = None
-        for res in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM):
+        for res in addrinfo:
             af, socktype, proto, canonname, sa = res
             sock = None
             try:
@@ -296,9 +368,10 @@ class Connection(object):
                 sock.settimeout(self.connect_timeout)
 
                 if self.secure_socket:
-                    ssl_context = self._create_ssl_context(ssl_options)
-                    sock = ssl_context.wrap_socket(
-                        sock, server_hostname=self.server_hostname or host)
+                    sock = self.ssl_context.wrap_socket(
+                        sock, server_hostname=self.server_hostname or host,
+                        session=self.ssl_sessions.get((host, port))
+                    )
 
                 sock.connect(sa)
                 return sock
@@ -353,6 +426,11 @@ class Connection(object):
         self.send_hello()
         self.receive_hello()
 
+        if self.secure_socket:
+            # TLS 1.3 session tickets are sent after handshake, so session
+            # is taken after first server's response.
+            self.ssl_sessions[(host, port)] = self.socket.session
+
         revision = self.server_info.used_revision
         if revision >= defines.DBMS_MIN_PROTOCOL_VERSION_WITH_ADDENDUM:
             self.send_addendum()
@@ -401,13 +479,22 @@ class Connection(object):
             'Connecting. Database: %s. User: %s', self.database, self.user
         )
 
+        if self.host_selector is not None:
+            self.hosts = deque(self.host_selector.sort(self.hosts))
+
         err = None
         for i in range(len(self.hosts)):
             host, port = self.hosts[0]
             logger.debug('Connecting to %s:%s', host, port)
 
             try:
-                return self._init_connection(host, port)
+                started = time()
+                self._init_connection(host, port)
+                if self.host_selector is not None:
+                    self.host_selector.record_connect(
+                        host, port, time() - started
+                    )
+                return
 
             except socket.timeout as e:
                 self.disconnect()
@@ -425,6 +512,11 @@ class Connection(object):
                 err_str = self._format_connection_error(e, host, port)
                 err = errors.NetworkError(err_str)
 
+            # Host may have moved, resolve it again on next attempt.
+            addrinfo_cache.invalidate(host, port)
+            self.ssl_sessions.pop((host, port), None)
+            if self.host_selector is not None:
+                self.host_selector.record_error(host, port)
             self.hosts.rotate(-1)
 
         if err is not None:
@@ -447,6 +539,13 @@ class Connection(object):
         self.block_out = None
 
         self.is_query_executing = False
+        self.set_receiving(False)
+
+    def set_receiving(self, value):
+        if self.receiving_callback is not None:
+            self.receiving_callback(self, value)
+        else:
+            self.is_receiving = value
 
     def disconnect(self):
         """
@@ -592,6 +691,7 @@ class Connection(object):
 
         elif packet_type == ServerPacketTypes.EXCEPTION:
             packet.exception = self.receive_exception()
+            self.set_receiving(False)
 
         elif packet_type == ServerPacketTypes.PROGRESS:
             packet.progress = self.receive_progress()
@@ -611,6 +711,7 @@ class Connection(object):
 
         elif packet_type == ServerPacketTypes.END_OF_STREAM:
             self.is_query_executing = False
+            self.set_receiving(False)
             pass
 
         elif packet_type == ServerPacketTypes.TABLE_COLUMNS:
@@ -699,6 +800,24 @@ class Connection(object):
         self.block_out.write(block)
         logger.debug('Block "%s" send time: %f', table_name, time() - start)
 
+    def send_raw_data(self, block, table_name=''):
+        if block.compressed and not self.compression:
+            raise ValueError(
+                'Compressed raw blocks can be sent only with compression'
+            )
+
+        start = time()
+        write_varint(ClientPacketTypes.DATA, self.fout)
+
+        revision = self.server_info.used_revision
+        if revision >= defines.DBMS_MIN_REVISION_WITH_TEMPORARY_TABLES:
+            write_binary_str(table_name, self.fout)
+
+        self.block_out.write_raw(block)
+        logger.debug(
+            'Raw block "%s" send time: %f', table_name, time() - start
+        )
+
     def send_query(self, query, query_id=None, params=None):
         if not self.connected:
             self.connect()
@@ -800,5 +919,6 @@ class Connection(object):
         if self.is_query_executing:
             raise errors.PartiallyConsumedQueryError()
 
+        self.is_receiving = False
         self.is_query_executing = True
         self._lock.release()
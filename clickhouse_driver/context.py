@@ -1,17 +1,49 @@
 
 class Context(object):
+    # Settings columns are built with. Other settings don't affect columns.
+    column_client_settings = (
+        'use_numpy', 'strings_as_bytes', 'strings_encoding',
+        'input_format_null_as_default', 'namedtuple_as_json', 'uuid_format',
+        'decimal_format', 'datetime_format', 'server_side_params'
+    )
+    column_settings = (
+        'use_client_time_zone', 'allow_experimental_object_type'
+    )
+
     def __init__(self):
         self._server_info = None
         self._settings = None
         self._client_settings = None
+
+        # Cache of columns. Columns depend on server info and settings
+        # values in columns_key.
+        self.column_factory = None
+        self.columns_key = None
+        # LowCardinality dictionaries of current query by column position.
+        self.low_cardinality_dictionaries = {}
+        # Position of next LowCardinality column in current block.
+        self.low_cardinality_position = 0
         super(Context, self).__init__()
 
+    def _invalidate_columns(self, old, new):
+        if self.column_factory is not None and old != new:
+            self.column_factory.clear()
+
+    def _update_columns_key(self):
+        settings = self._settings or {}
+        client_settings = self._client_settings or {}
+
+        self.columns_key = tuple(
+            client_settings.get(x) for x in self.column_client_settings
+        ) + tuple(settings.get(x) for x in self.column_settings)
+
     @property
     def server_info(self):
         return self._server_info
 
     @server_info.setter
     def server_info(self, value):
+        self._invalidate_columns(self._server_info, value)
         self._server_info = value
 
     @property
@@ -21,6 +53,7 @@ class Context(object):
     @settings.setter
     def settings(self, value):
         self._settings = value.copy()
+        self._update_columns_key()
 
     @property
     def client_settings(self):
@@ -29,6 +62,7 @@ class Context(object):
     @client_settings.setter
     def client_settings(self, value):
         self._client_settings = value.copy()
+        self._update_columns_key()
 
     def __repr__(self):
         return '<Context(server_info=%s, client_settings=%s, settings=%s)>' % (
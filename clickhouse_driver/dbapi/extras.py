@@ -1,7 +1,4 @@
-import re
-from collections import namedtuple
-from functools import lru_cache
-
+from ..rowfactory import make_namedtuple
 from .cursor import Cursor
 
 
@@ -37,23 +34,9 @@ class NamedTupleCursor(Cursor):
     attributes.
     """
 
-    # ascii except alnum and underscore
-    _re_clean = re.compile(
-        '[' + re.escape(' !"#$%&\'()*+,-./:;<=>?@[\\]^`{|}~') + ']')
-
     @classmethod
-    @lru_cache(512)
     def _make_nt(self, key):
-        fields = []
-        for s in key:
-            s = self._re_clean.sub('_', s)
-            # Python identifier cannot start with numbers, namedtuple fields
-            # cannot start with underscore.
-            if s[0] == '_' or '0' <= s[0] <= '9':
-                s = 'f' + s
-            fields.append(s)
-
-        return namedtuple('Record', fields)
+        return make_namedtuple(key)
 
     def fetchone(self):
         rv = super(NamedTupleCursor, self).fetchone()
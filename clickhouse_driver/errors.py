@@ -430,6 +430,10 @@ class SocketTimeoutError(Error):
     code = ErrorCodes.SOCKET_TIMEOUT
 
 
+class DeadlineExceededError(Error):
+    code = ErrorCodes.TIMEOUT_EXCEEDED
+
+
 class UnexpectedPacketFromServerError(Error):
     code = ErrorCodes.UNEXPECTED_PACKET_FROM_SERVER
 
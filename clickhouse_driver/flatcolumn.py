@@ -0,0 +1,85 @@
+from array import array
+from collections.abc import Sequence
+from itertools import chain
+
+
+class FlatColumn(Sequence):
+    """
+    Read-only sequence of ``Array`` or ``Map`` column items stored as flat
+    values and row end offsets. Items are built on access.
+
+    :param values: flat values of all rows.
+    :param offsets: end offset of each row in ``values``.
+    :param keys: flat keys of all rows for ``Map`` columns. Items are dicts
+                 if keys are given and lists otherwise.
+    """
+
+    def __init__(self, values, offsets, keys=None):
+        self.values = values
+        self.offsets = offsets
+        self.keys = keys
+
+        super(FlatColumn, self).__init__()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('column index out of range')
+
+        begin = self.offsets[index - 1] if index else 0
+        end = self.offsets[index]
+
+        if self.keys is not None:
+            return dict(zip(self.keys[begin:end], self.values[begin:end]))
+        return list(self.values[begin:end])
+
+    def __eq__(self, other):
+        if isinstance(other, (FlatColumn, list, tuple)):
+            return len(self) == len(other) and \
+                all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+def concat_flat_columns(chunks):
+    """
+    Concatenates flat columns of received blocks. Offsets of each chunk are
+    shifted by the number of values before it.
+
+    :param chunks: list of :class:`FlatColumn`.
+    :return: :class:`FlatColumn`.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+
+    offsets = array('Q')
+    n_values = 0
+    for chunk in chunks:
+        offsets.extend(x + n_values for x in chunk.offsets)
+        n_values += len(chunk.values)
+
+    typecodes = {getattr(x.values, 'typecode', None) for x in chunks}
+    if len(typecodes) == 1 and None not in typecodes:
+        # Values are read into typed arrays.
+        values = array(typecodes.pop())
+        for chunk in chunks:
+            values.extend(chunk.values)
+    else:
+        values = list(chain.from_iterable(x.values for x in chunks))
+
+    keys = None
+    if chunks[0].keys is not None:
+        keys = list(chain.from_iterable(x.keys for x in chunks))
+
+    return FlatColumn(values, offsets, keys=keys)
@@ -0,0 +1,108 @@
+from time import time
+
+from .util.compat import threading
+
+
+class HostStats(object):
+    def __init__(self):
+        self.connect_latency = None
+        self.query_latency = None
+        self.error_rate = 0.0
+        self.broken_until = 0.0
+
+        super(HostStats, self).__init__()
+
+
+class HostSelector(object):
+    """
+    Tracks per-host latency and error rate and orders hosts from the fastest
+    healthy one to the slowest. Failing hosts are put to the end of the order
+    for cooldown period.
+
+    Single selector instance can be shared between several connections and
+    clients.
+
+    :param alpha: smoothing factor of exponentially weighted moving averages
+                  of latencies and error rate. Defaults to ``0.3``.
+    :param error_threshold: error rate at which host is considered
+                            unavailable. Defaults to ``0.5``.
+    :param cooldown: number of seconds unavailable host is put to the end of
+                     the order for. Defaults to ``30`` seconds.
+    """
+
+    def __init__(self, alpha=0.3, error_threshold=0.5, cooldown=30.0):
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+
+        self.stats = {}
+        self._lock = threading.Lock()
+
+        super(HostSelector, self).__init__()
+
+    def _get_stats(self, host, port):
+        key = (host, port)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = HostStats()
+        return stats
+
+    def _ewma(self, average, value):
+        if average is None:
+            return value
+        return average + self.alpha * (value - average)
+
+    def _record_success(self, stats):
+        stats.error_rate = self._ewma(stats.error_rate, 0.0)
+
+    def record_connect(self, host, port, elapsed):
+        with self._lock:
+            stats = self._get_stats(host, port)
+            stats.connect_latency = self._ewma(stats.connect_latency, elapsed)
+            self._record_success(stats)
+
+    def record_query(self, host, port, elapsed):
+        with self._lock:
+            stats = self._get_stats(host, port)
+            stats.query_latency = self._ewma(stats.query_latency, elapsed)
+            self._record_success(stats)
+
+    def record_error(self, host, port):
+        with self._lock:
+            stats = self._get_stats(host, port)
+            stats.error_rate = self._ewma(stats.error_rate, 1.0)
+            if stats.error_rate >= self.error_threshold:
+                stats.broken_until = time() + self.cooldown
+
+    def is_available(self, host, port):
+        with self._lock:
+            stats = self.stats.get((host, port))
+            return stats is None or stats.broken_until <= time()
+
+    def _sort_key(self, stats, now):
+        if stats is None:
+            # Unknown hosts go first to get their latency measured.
+            return False, 0.0
+
+        if stats.connect_latency is None and stats.query_latency is None:
+            # Host has only failed so far.
+            latency = float('inf')
+        else:
+            latency = (stats.connect_latency or 0.0) + \
+                (stats.query_latency or 0.0)
+            latency /= max(1.0 - stats.error_rate, 1e-3)
+
+        return stats.broken_until > now, latency
+
+    def sort(self, hosts):
+        """
+        Returns list of ``(host, port)`` pairs ordered from the most preferred
+        one. Hosts with equal scores keep their original order.
+        """
+        now = time()
+        with self._lock:
+            keys = {
+                host: self._sort_key(self.stats.get(host), now)
+                for host in hosts
+            }
+        return sorted(hosts, key=keys.__getitem__)
@@ -5,7 +5,8 @@ import pandas as pd
 from pandas.api.types import union_categoricals
 
 from ..progress import Progress
-from ..result import QueryResult
+from ..result import IterQueryResult, QueryResult
+from ..rowview import RowView
 
 
 class NumpyQueryResult(QueryResult):
@@ -13,21 +14,6 @@ class NumpyQueryResult(QueryResult):
     Stores query result from multiple blocks as numpy arrays.
     """
 
-    def store(self, packet):
-        block = getattr(packet, 'block', None)
-        if block is None:
-            return
-
-        # Header block contains no rows. Pick columns from it.
-        if block.num_rows:
-            if self.columnar:
-                self.data.append(block.get_columns())
-            else:
-                self.data.extend(block.get_rows())
-
-        elif not self.columns_with_types:
-            self.columns_with_types = block.columns_with_types
-
     def get_result(self):
         """
         :return: stored query result.
@@ -48,8 +34,10 @@ class NumpyQueryResult(QueryResult):
                 else:
                     column = tuple(chain.from_iterable(column_chunks))
                 data.append(column)
+        elif self.lazy_rows:
+            data = RowView(self.data, self.columns_with_types)
         else:
-            data = self.data
+            data = self.get_rows()
 
         if self.with_column_types:
             return data, self.columns_with_types
@@ -91,33 +79,7 @@ class NumpyProgressQueryResult(NumpyQueryResult):
         return super(NumpyProgressQueryResult, self).get_result()
 
 
-class NumpyIterQueryResult(object):
+class NumpyIterQueryResult(IterQueryResult):
     """
     Provides iteration over returned data by chunks (streaming by chunks).
     """
-
-    def __init__(
-            self, packet_generator,
-            with_column_types=False):
-        self.packet_generator = packet_generator
-        self.with_column_types = with_column_types
-
-        self.first_block = True
-        super(NumpyIterQueryResult, self).__init__()
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        packet = next(self.packet_generator)
-        block = getattr(packet, 'block', None)
-        if block is None:
-            return []
-
-        if self.first_block and self.with_column_types:
-            self.first_block = False
-            rv = [block.columns_with_types]
-            rv.extend(block.get_rows())
-            return rv
-        else:
-            return block.get_rows()
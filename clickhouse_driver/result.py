@@ -1,5 +1,9 @@
+from .block import RawBlock
 from .blockstreamprofileinfo import BlockStreamProfileInfo
+from .chunkedcolumn import concat_chunks
 from .progress import Progress
+from .rowview import RowView
+from .spill import SpilledRows, estimate_rows_size
 
 
 class QueryResult(object):
@@ -9,13 +13,26 @@ class QueryResult(object):
 
     def __init__(
             self, packet_generator,
-            with_column_types=False, columnar=False):
+            with_column_types=False, columnar=False, lazy_rows=False,
+            columnar_format='tuple', max_result_memory=0, row_factory=None):
         self.packet_generator = packet_generator
         self.with_column_types = with_column_types
 
         self.data = []
         self.columns_with_types = []
         self.columnar = columnar
+        # Explicitly passed row factory wins.
+        self.lazy_rows = lazy_rows and row_factory is None
+        self.columnar_format = columnar_format
+
+        # Rows constructor is made by row factory once per result.
+        self.row_factory = row_factory
+        self.make_rows = None
+
+        # Rows are spilled to temporary file after exceeding the limit.
+        self.max_result_memory = max_result_memory
+        self.memory_used = 0
+        self.spilled_rows = None
 
         super(QueryResult, self).__init__()
 
@@ -26,22 +43,43 @@ class QueryResult(object):
 
         # Header block contains no rows. Pick columns from it.
         if block.num_rows:
-            if self.columnar:
-                columns = block.get_columns()
-                if self.data:
-                    # Extend corresponding column.
-                    for i, column in enumerate(columns):
-                        self.data[i].extend(column)
-                else:
-                    # Cast tuples to lists for further extending.
-                    # Concatenating tuples produce new tuple. It's slow.
-                    self.data = [list(c) for c in columns]
+            if self.columnar or self.lazy_rows:
+                # Columns are kept as is. They are concatenated once
+                # on getting result or rows are created on access.
+                self.data.append(block.get_columns())
+            elif self.row_factory is not None:
+                if self.make_rows is None:
+                    self.make_rows = self.row_factory(
+                        block.columns_with_types
+                    )
+                self.store_rows(self.make_rows(block.get_columns()))
             else:
-                self.data.extend(block.get_rows())
+                self.store_rows(block.get_rows())
 
         elif not self.columns_with_types:
             self.columns_with_types = block.columns_with_types
 
+    def store_rows(self, rows):
+        if self.spilled_rows is not None:
+            self.spilled_rows.append(rows)
+            return
+
+        self.data.extend(rows)
+
+        if self.max_result_memory:
+            self.memory_used += estimate_rows_size(rows)
+            if self.memory_used > self.max_result_memory:
+                self.spilled_rows = SpilledRows()
+                self.spilled_rows.append(self.data)
+                self.data = []
+
+    def get_rows(self):
+        if self.spilled_rows is not None:
+            self.spilled_rows.finalize()
+            return self.spilled_rows
+
+        return self.data
+
     def get_result(self):
         """
         :return: stored query result.
@@ -50,15 +88,34 @@ class QueryResult(object):
         for packet in self.packet_generator:
             self.store(packet)
 
-        data = self.data
         if self.columnar:
-            data = [tuple(c) for c in self.data]
+            data = self.get_columns()
+        elif self.lazy_rows:
+            data = RowView(self.data, self.columns_with_types)
+        else:
+            data = self.get_rows()
 
         if self.with_column_types:
             return data, self.columns_with_types
         else:
             return data
 
+    def get_columns(self):
+        # Chunks of each column across all blocks.
+        columns_chunks = [list(c) for c in zip(*self.data)]
+        self.data = []
+
+        specs = [spec for _, spec in self.columns_with_types]
+        if len(specs) != len(columns_chunks):
+            specs = [None] * len(columns_chunks)
+
+        columns = []
+        for chunks, spec in zip(columns_chunks, specs):
+            columns.append(
+                concat_chunks(chunks, self.columnar_format, spec=spec)
+            )
+        return columns
+
 
 class ProgressQueryResult(QueryResult):
     """
@@ -100,9 +157,10 @@ class IterQueryResult(object):
 
     def __init__(
             self, packet_generator,
-            with_column_types=False):
+            with_column_types=False, lazy_rows=False):
         self.packet_generator = packet_generator
         self.with_column_types = with_column_types
+        self.lazy_rows = lazy_rows
 
         self.first_block = True
         super(IterQueryResult, self).__init__()
@@ -110,6 +168,14 @@ class IterQueryResult(object):
     def __iter__(self):
         return self
 
+    def get_rows(self, block):
+        if self.lazy_rows:
+            if not block.num_rows:
+                return []
+            return RowView([block.get_columns()], block.columns_with_types)
+
+        return block.get_rows()
+
     def __next__(self):
         packet = next(self.packet_generator)
         block = getattr(packet, 'block', None)
@@ -119,10 +185,56 @@ class IterQueryResult(object):
         if self.first_block and self.with_column_types:
             self.first_block = False
             rv = [block.columns_with_types]
-            rv.extend(block.get_rows())
+            rv.extend(self.get_rows(block))
             return rv
         else:
-            return block.get_rows()
+            return self.get_rows(block)
+
+
+class IterBlocksQueryResult(object):
+    """
+    Provides iteration over returned data by blocks in columnar form.
+    Each item is a tuple of columns names with types and block columns.
+    """
+
+    def __init__(self, packet_generator):
+        self.packet_generator = packet_generator
+        super(IterBlocksQueryResult, self).__init__()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            packet = next(self.packet_generator)
+            block = getattr(packet, 'block', None)
+
+            # Header block contains no rows.
+            if block is not None and block.num_rows:
+                return block.columns_with_types, block.get_columns()
+
+
+class RawBlocksQueryResult(object):
+    """
+    Provides iteration over returned data blocks in Native format.
+    Totals and extremes are skipped.
+    """
+
+    def __init__(self, packet_generator):
+        self.packet_generator = packet_generator
+        super(RawBlocksQueryResult, self).__init__()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            packet = next(self.packet_generator)
+            block = getattr(packet, 'block', None)
+
+            # Header block contains no rows.
+            if isinstance(block, RawBlock) and block.num_rows:
+                return block
 
 
 class QueryInfo(object):
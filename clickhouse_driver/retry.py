@@ -0,0 +1,76 @@
+import random
+import re
+import socket
+
+from . import errors
+
+read_query_re = re.compile(
+    r'^\s*(SELECT|WITH|SHOW|DESC|DESCRIBE|EXISTS|EXPLAIN)\b', re.IGNORECASE
+)
+
+
+def is_read_query(query):
+    return read_query_re.match(query) is not None
+
+
+class RetryPolicy(object):
+    """
+    Describes how failed queries are retried.
+
+    Only queries that can be safely replayed are retried: read-only queries
+    (``SELECT``, ``WITH``, ``SHOW``, etc.) and ``INSERT`` queries with data
+    passed as list or tuple and ``insert_deduplication_token`` setting.
+
+    :param max_attempts: total number of attempts including the first one.
+                         Defaults to ``3``.
+    :param backoff: delay before the first retry in seconds.
+                    Defaults to ``0.1``.
+    :param backoff_multiplier: delay multiplier for each next retry.
+                               Defaults to ``2``.
+    :param max_backoff: maximum delay between retries in seconds.
+                        Defaults to ``10``.
+    :param jitter: delay is picked randomly from ``[0, delay]`` range if
+                   specified. Defaults to ``True``.
+    :param retry_on: exception classes that are considered as transient.
+                     Defaults to network errors.
+    :param server_codes: error codes of
+                         :py:class:`~clickhouse_driver.errors.ServerException`
+                         that are considered as transient.
+                         Defaults to ``()``.
+    """
+
+    default_retry_on = (
+        errors.NetworkError, errors.SocketTimeoutError, socket.error, EOFError
+    )
+
+    def __init__(self, max_attempts=3, backoff=0.1, backoff_multiplier=2,
+                 max_backoff=10, jitter=True, retry_on=None,
+                 server_codes=()):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = retry_on or self.default_retry_on
+        self.server_codes = frozenset(server_codes)
+
+        super(RetryPolicy, self).__init__()
+
+    def is_transient(self, exc):
+        if isinstance(exc, errors.ServerException):
+            return exc.code in self.server_codes
+
+        return isinstance(exc, self.retry_on)
+
+    def get_delay(self, attempt):
+        """
+        Returns delay in seconds before retry after ``attempt`` failed
+        attempts.
+        """
+        delay = self.backoff * self.backoff_multiplier ** (attempt - 1)
+        delay = min(delay, self.max_backoff)
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
@@ -0,0 +1,111 @@
+import re
+from collections import namedtuple
+from dataclasses import fields, is_dataclass
+from functools import lru_cache, partial
+from itertools import starmap
+
+
+# ascii except alnum and underscore
+_re_clean = re.compile(
+    '[' + re.escape(' !"#$%&\'()*+,-./:;<=>?@[\\]^`{|}~') + ']')
+
+
+def _reduce_record(record):
+    # Class is created dynamically. It's recreated by column names on
+    # unpickling.
+    return _make_record, (record._column_names, tuple(record))
+
+
+def _make_record(column_names, values):
+    return make_namedtuple(column_names)._make(values)
+
+
+@lru_cache(512)
+def make_namedtuple(column_names):
+    """
+    Creates named tuple class with fields named after columns. Characters
+    that are not allowed in identifiers are replaced with underscores.
+
+    :param column_names: tuple of column names.
+    :return: named tuple class.
+    """
+    field_names = []
+    for s in column_names:
+        s = _re_clean.sub('_', s)
+        # Python identifier cannot start with numbers, namedtuple fields
+        # cannot start with underscore.
+        if s[0] == '_' or '0' <= s[0] <= '9':
+            s = 'f' + s
+        field_names.append(s)
+
+    cls = namedtuple('Record', field_names, rename=True)
+    cls._column_names = column_names
+    cls.__reduce__ = _reduce_record
+    return cls
+
+
+def namedtuple_row(columns_with_types):
+    """
+    Row factory that returns rows as named tuples. Named tuple class is
+    created once per query result.
+    """
+    cls = make_namedtuple(tuple(name for name, _ in columns_with_types))
+    make = cls._make
+
+    def make_rows(columns):
+        return list(map(make, zip(*columns)))
+
+    return make_rows
+
+
+def dict_row(columns_with_types):
+    """
+    Row factory that returns rows as dicts with column names as keys.
+    """
+    names = [name for name, _ in columns_with_types]
+    zip_names = partial(zip, names)
+
+    def make_rows(columns):
+        return list(map(dict, map(zip_names, zip(*columns))))
+
+    return make_rows
+
+
+def dataclass_row(cls):
+    """
+    Creates row factory that returns rows as instances of dataclass.
+    Columns are passed to the class by matching field names. If column
+    names differ from fields, columns are passed positionally in
+    query order.
+
+    :param cls: dataclass.
+    :return: row factory.
+    """
+    if not is_dataclass(cls):
+        raise TypeError('{} is not a dataclass'.format(cls))
+
+    field_names = [f.name for f in fields(cls) if f.init]
+
+    def factory(columns_with_types):
+        names = [name for name, _ in columns_with_types]
+
+        if set(field_names) <= set(names):
+            # Columns are reordered to match fields order.
+            positions = [names.index(name) for name in field_names]
+        elif len(field_names) == len(names):
+            positions = None
+        else:
+            raise ValueError(
+                'Columns {} do not match fields of {}: {}'.format(
+                    names, cls.__name__, field_names
+                )
+            )
+
+        def make_rows(columns):
+            if positions is not None:
+                columns = [columns[i] for i in positions]
+            return list(starmap(cls, zip(*columns)))
+
+        return make_rows
+
+    return factory
@@ -0,0 +1,116 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+
+
+class Row(object):
+    """
+    Lazy row of columnar block. Values are taken from block columns on
+    access. Row can be indexed by position or by column name and compares
+    equal to tuple with the same values.
+    """
+    __slots__ = ('_columns', '_index', '_names')
+
+    def __init__(self, columns, index, names):
+        self._columns = columns
+        self._index = index
+        self._names = names
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                key = self._names[key]
+            except KeyError:
+                raise KeyError('No column {}'.format(key))
+
+        elif isinstance(key, slice):
+            index = self._index
+            return tuple(c[index] for c in self._columns[key])
+
+        return self._columns[key][self._index]
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __iter__(self):
+        index = self._index
+        for column in self._columns:
+            yield column[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (Row, tuple, list)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+    def keys(self):
+        return list(self._names)
+
+    def as_dict(self):
+        return {name: self[name] for name in self._names}
+
+
+class RowView(Sequence):
+    """
+    Read-only sequence of rows over columns of received blocks.
+    Rows are not materialized: only :class:`Row` proxy is created on
+    access.
+
+    :param chunks: list of blocks columns. Each item is a list of columns of
+                   the same length.
+    :param columns_with_types: names and types of columns.
+    """
+
+    def __init__(self, chunks, columns_with_types=None):
+        self._chunks = [columns for columns in chunks if len(columns[0])]
+
+        # Starting row number of each chunk.
+        self._offsets = []
+        n_rows = 0
+        for columns in self._chunks:
+            self._offsets.append(n_rows)
+            n_rows += len(columns[0])
+        self._n_rows = n_rows
+
+        # The first column wins for duplicated names.
+        self._names = {}
+        for i, (name, _) in enumerate(columns_with_types or []):
+            self._names.setdefault(name, i)
+
+        super(RowView, self).__init__()
+
+    def __len__(self):
+        return self._n_rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n_rows))]
+
+        if index < 0:
+            index += self._n_rows
+        if not 0 <= index < self._n_rows:
+            raise IndexError('row index out of range')
+
+        i = bisect_right(self._offsets, index) - 1
+        return Row(self._chunks[i], index - self._offsets[i], self._names)
+
+    def __iter__(self):
+        names = self._names
+        for columns in self._chunks:
+            for index in range(len(columns[0])):
+                yield Row(columns, index, names)
+
+    def __eq__(self, other):
+        if isinstance(other, (RowView, list, tuple)):
+            return len(self) == len(other) and \
+                all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
@@ -0,0 +1,224 @@
+import logging
+from concurrent.futures import Future
+from functools import partial
+from itertools import count
+from queue import Empty, PriorityQueue
+from time import time
+
+from . import errors
+from .client import Client
+from .util.compat import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Job(object):
+    def __init__(self, query, params, deadline, kwargs):
+        self.query = query
+        self.params = params
+        self.deadline = deadline
+        self.kwargs = kwargs
+
+        self.future = Future()
+        self.lock = threading.Lock()
+        self.client = None
+        # Deadline is reached. Cancel is sent while result is received.
+        self.cancel_requested = False
+        self.expired = False
+
+        super(Job, self).__init__()
+
+
+class QueryScheduler(object):
+    """
+    Executes queries on the pool of clients in background threads.
+    Queries wait in the queue for free client. Query with lower ``priority``
+    value is picked first. Queries with the same priority are picked in order
+    of submission.
+
+    Query that is still running on its deadline is cancelled and its future
+    fails with :py:class:`~clickhouse_driver.errors.DeadlineExceededError`.
+    Cancel is sent once query and its data are sent.
+
+    :param workers: number of clients in the pool. It's the maximum number of
+                    concurrently executing queries. Defaults to ``4``.
+    :param \\**kwargs: All other args are passed to the
+                       :py:class:`~clickhouse_driver.Client` constructor.
+    """
+
+    def __init__(self, *args, **kwargs):
+        workers = kwargs.pop('workers', 4)
+
+        self.clients = [Client(*args, **kwargs) for _ in range(workers)]
+        self.queue = PriorityQueue()
+        self.counter = count()
+        self.closed = False
+
+        self.threads = [
+            threading.Thread(target=self._work, args=(client, ), daemon=True)
+            for client in self.clients
+        ]
+        for thread in self.threads:
+            thread.start()
+
+        super(QueryScheduler, self).__init__()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def submit(self, query, params=None, priority=0, timeout=None,
+               deadline=None, **kwargs):
+        """
+        Puts query into the queue.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+        :param priority: query with lower value is executed first.
+                         Defaults to ``0``.
+        :param timeout: number of seconds from submission query should be
+                        completed in. Defaults to ``None`` (no timeout).
+        :param deadline: UNIX timestamp query should be completed by.
+                         Defaults to ``None`` (no deadline).
+        :param \\**kwargs: All other args are passed to
+                           :py:meth:`~clickhouse_driver.Client.execute`.
+        :return: :py:class:`concurrent.futures.Future` with query result.
+        """
+        if self.closed:
+            raise RuntimeError('Scheduler is closed')
+
+        if timeout is not None:
+            timeout_deadline = time() + timeout
+            if deadline is None or timeout_deadline < deadline:
+                deadline = timeout_deadline
+
+        job = Job(query, params, deadline, kwargs)
+        self.queue.put((priority, next(self.counter), job))
+        return job.future
+
+    def execute(self, *args, **kwargs):
+        """
+        Submits query and waits for its result. Arguments are the same as in
+        :py:meth:`submit`.
+        """
+        return self.submit(*args, **kwargs).result()
+
+    def close(self):
+        """
+        Cancels queued queries, waits for running ones and disconnects
+        clients.
+        """
+        if self.closed:
+            return
+
+        self.closed = True
+
+        while True:
+            try:
+                _, _, job = self.queue.get_nowait()
+            except Empty:
+                break
+            job.future.cancel()
+
+        for _ in self.threads:
+            self.queue.put((float('inf'), next(self.counter), None))
+
+        for thread in self.threads:
+            thread.join()
+
+        for client in self.clients:
+            client.disconnect()
+
+    def _cancel(self, job):
+        with job.lock:
+            # Query can be already finished on the deadline.
+            client = job.client
+            if client is None:
+                return
+
+            job.cancel_requested = True
+            connection = client.connection
+            if connection.is_receiving:
+                self._send_cancel(job, connection)
+
+    def _set_receiving(self, job, connection, value):
+        # Worker stops receiving under the lock, so cancel is never sent
+        # after the end of result.
+        with job.lock:
+            connection.is_receiving = value
+
+            # Deadline was reached while query was sent.
+            if value and job.cancel_requested and not job.expired:
+                self._send_cancel(job, connection)
+
+    def _send_cancel(self, job, connection):
+        try:
+            connection.send_cancel()
+        except Exception as e:
+            logger.warning('Error on query cancel: %s', e)
+            return
+
+        job.expired = True
+
+    @staticmethod
+    def _set_receiving_callback(client, callback):
+        for connection in [client.connection] + list(client.connections):
+            connection.receiving_callback = callback
+
+    def _work(self, client):
+        while True:
+            _, _, job = self.queue.get()
+            if job is None:
+                break
+
+            if not job.future.set_running_or_notify_cancel():
+                continue
+
+            if job.deadline is not None and job.deadline <= time():
+                job.future.set_exception(errors.DeadlineExceededError(
+                    'Deadline exceeded while query was queued'
+                ))
+                continue
+
+            timer = None
+            if job.deadline is not None:
+                timer = threading.Timer(
+                    job.deadline - time(), self._cancel, args=(job, )
+                )
+                timer.daemon = True
+
+            with job.lock:
+                job.client = client
+
+            rv = error = None
+            try:
+                if timer is not None:
+                    self._set_receiving_callback(
+                        client, partial(self._set_receiving, job)
+                    )
+                    timer.start()
+                rv = client.execute(job.query, job.params, **job.kwargs)
+
+            except Exception as e:
+                error = e
+
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                    self._set_receiving_callback(client, None)
+                with job.lock:
+                    job.client = None
+
+            # Expired is set only if cancel was sent before the end of
+            # result. Cancelled query also ends successfully with truncated
+            # result.
+            if job.expired:
+                job.future.set_exception(errors.DeadlineExceededError(
+                    'Query was cancelled on deadline'
+                ))
+            elif error is not None:
+                job.future.set_exception(error)
+            else:
+                job.future.set_result(rv)
@@ -0,0 +1,124 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+import mmap
+import pickle
+import sys
+import tempfile
+
+
+def estimate_rows_size(rows):
+    """
+    Estimates memory taken by rows. Size of the first row is multiplied by
+    number of rows. It's rough but cheap.
+    """
+    if not len(rows):
+        return 0
+
+    row = rows[0]
+    row_size = sys.getsizeof(row) + sum(sys.getsizeof(x) for x in row)
+    # Pointer to row in resulting list.
+    return (row_size + 8) * len(rows)
+
+
+class SpilledRows(Sequence):
+    """
+    Read-only sequence of rows stored in temporary file. Rows are appended
+    by batches. Batches are read back from memory-mapped file on access.
+    Only the last accessed batch is kept in memory.
+
+    Temporary file is removed on :meth:`close` or on garbage collection.
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile(prefix='clickhouse-driver-')
+        self._mmap = None
+
+        # Starting row number, file position and length of each batch.
+        self._offsets = []
+        self._positions = []
+        self._n_rows = 0
+        self._size = 0
+
+        self._batch_index = None
+        self._batch = None
+
+        super(SpilledRows, self).__init__()
+
+    def append(self, rows):
+        if not len(rows):
+            return
+
+        data = pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(data)
+
+        self._offsets.append(self._n_rows)
+        self._positions.append((self._size, len(data)))
+        self._n_rows += len(rows)
+        self._size += len(data)
+
+    def finalize(self):
+        """
+        Finishes writing and maps file into memory for reading.
+        """
+        self._file.flush()
+        if self._size:
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+        self._batch_index = None
+        self._batch = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _read_batch(self, index):
+        if self._batch_index != index:
+            if self._mmap is None:
+                raise ValueError('Spilled rows are not readable')
+
+            position, length = self._positions[index]
+            self._batch = pickle.loads(
+                self._mmap[position:position + length]
+            )
+            self._batch_index = index
+
+        return self._batch
+
+    def __len__(self):
+        return self._n_rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n_rows))]
+
+        if index < 0:
+            index += self._n_rows
+        if not 0 <= index < self._n_rows:
+            raise IndexError('row index out of range')
+
+        i = bisect_right(self._offsets, index) - 1
+        return self._read_batch(i)[index - self._offsets[i]]
+
+    def __iter__(self):
+        for i in range(len(self._positions)):
+            yield from self._read_batch(i)
+
+    def __eq__(self, other):
+        if isinstance(other, (SpilledRows, list, tuple)):
+            return len(self) == len(other) and \
+                all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<SpilledRows: {} rows>'.format(self._n_rows)
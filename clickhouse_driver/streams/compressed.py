@@ -8,6 +8,7 @@ except ImportError:
     )
 
 from .native import BlockOutputStream, BlockInputStream
+from .raw import RecordingReader
 from ..bufferedreader import CompressedBufferedReader
 from ..bufferedwriter import CompressedBufferedWriter
 from ..compression import get_decompressor_cls
@@ -47,6 +48,14 @@ class CompressedBlockOutputStream(BlockOutputStream):
 
         self.raw_fout.flush()
 
+    def write_raw(self, block):
+        if not block.compressed:
+            return super(CompressedBlockOutputStream, self).write_raw(block)
+
+        # Frames are sent as is.
+        self.raw_fout.write(block.data)
+        self.raw_fout.flush()
+
     def get_compressed(self):
         compressed = BytesIO()
 
@@ -65,6 +74,8 @@ class CompressedBlockOutputStream(BlockOutputStream):
 class CompressedBlockInputStream(BlockInputStream):
     def __init__(self, fin, context):
         self.raw_fin = fin
+        # Compressed frames are recorded here while raw block is read.
+        self.frames = None
         fin = CompressedBufferedReader(self.read_block, BUFFER_SIZE)
         super(CompressedBlockInputStream, self).__init__(fin, context)
 
@@ -72,11 +83,15 @@ class CompressedBlockInputStream(BlockInputStream):
         return CityHash128(data)
 
     def read_block(self):
-        compressed_hash = read_binary_uint128(self.raw_fin)
-        method_byte = read_binary_uint8(self.raw_fin)
+        raw_fin = self.raw_fin
+        if self.frames is not None:
+            raw_fin = RecordingReader(raw_fin, self.frames)
+
+        compressed_hash = read_binary_uint128(raw_fin)
+        method_byte = read_binary_uint8(raw_fin)
 
         decompressor_cls = get_decompressor_cls(method_byte)
-        decompressor = decompressor_cls(self.raw_fin)
+        decompressor = decompressor_cls(raw_fin)
 
         if decompressor.method_byte is not None:
             extra_header_size = 1  # method
@@ -86,3 +101,25 @@ class CompressedBlockInputStream(BlockInputStream):
         return decompressor.get_decompressed_data(
             method_byte, compressed_hash, extra_header_size
         )
+
+    def read_raw(self):
+        if not self.raw_compressed:
+            return super(CompressedBlockInputStream, self).read_raw()
+
+        # Server flushes compressed buffer after each block. Block can be
+        # passed in compressed form only if it occupies whole frames.
+        starts_with_frame = self.fin.position == self.fin.current_buffer_size
+
+        self.frames = []
+        try:
+            block = super(CompressedBlockInputStream, self).read_raw()
+            frames = self.frames
+        finally:
+            self.frames = None
+
+        ends_with_frame = self.fin.position == self.fin.current_buffer_size
+        if starts_with_frame and ends_with_frame:
+            block.data = b''.join(frames)
+            block.compressed = True
+
+        return block
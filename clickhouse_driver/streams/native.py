@@ -26,8 +26,13 @@ class BlockOutputStream(object):
         n_columns = block.num_columns
         n_rows = block.num_rows
 
+        use_arrow = self.context.client_settings.get('use_arrow', False)
+        if use_arrow:
+            from ..columns.arrow.service import write_arrow_column
+
         write_varint(n_columns, self.fout)
         write_varint(n_rows, self.fout)
+        self.context.low_cardinality_position = 0
 
         for i, (col_name, col_type) in enumerate(block.columns_with_types):
             write_binary_str(col_name, self.fout)
@@ -45,9 +50,24 @@ class BlockOutputStream(object):
                     write_binary_uint8(0, self.fout)
 
                 logger.debug('Writing column %s', col_name)
-                write_column(self.context, col_name, col_type, items,
-                             self.fout, types_check=block.types_check)
+                if use_arrow:
+                    write_arrow_column(
+                        self.context, col_name, col_type, items, self.fout,
+                        types_check=block.types_check
+                    )
+                else:
+                    write_column(self.context, col_name, col_type, items,
+                                 self.fout, types_check=block.types_check)
+
+        self.finalize()
+
+    def write_raw(self, block):
+        if block.compressed:
+            raise ValueError(
+                'Compressed raw blocks can be sent only with compression'
+            )
 
+        self.fout.write(block.data)
         self.finalize()
 
     def finalize(self):
@@ -58,10 +78,17 @@ class BlockInputStream(object):
     def __init__(self, fin, context):
         self.fin = fin
         self.context = context
+        # Set by client for raw queries.
+        self.raw = False
+        self.raw_compressed = False
 
         super(BlockInputStream, self).__init__()
 
     def read(self, use_numpy=None):
+        # Raw blocks are used only for data packets of raw queries.
+        if use_numpy is not False and self.raw:
+            return self.read_raw()
+
         info = BlockInfo()
 
         revision = self.context.server_info.used_revision
@@ -70,9 +97,16 @@ class BlockInputStream(object):
 
         n_columns = read_varint(self.fin)
         n_rows = read_varint(self.fin)
+        self.context.low_cardinality_position = 0
 
         data, names, types = [], [], []
 
+        # Arrow is used only for data packets of Arrow queries.
+        use_arrow = use_numpy is not False and \
+            self.context.client_settings.get('use_arrow', False)
+        if use_arrow:
+            from ..columns.arrow.service import read_arrow_column
+
         for i in range(n_columns):
             column_name = read_binary_str(self.fin)
             column_type = read_binary_str(self.fin)
@@ -86,14 +120,20 @@ class BlockInputStream(object):
 
             if n_rows:
                 logger.debug('Reading column %s', column_name)
-                column = read_column(
-                    self.context, column_type, n_rows,
-                    self.fin, use_numpy=use_numpy,
-                    has_custom_serialization=has_custom_serialization
-                )
+                if use_arrow:
+                    column = read_arrow_column(
+                        self.context, column_type, n_rows, self.fin,
+                        has_custom_serialization=has_custom_serialization
+                    )
+                else:
+                    column = read_column(
+                        self.context, column_type, n_rows,
+                        self.fin, use_numpy=use_numpy,
+                        has_custom_serialization=has_custom_serialization
+                    )
                 data.append(column)
 
-        if self.context.client_settings['use_numpy']:
+        if self.context.client_settings['use_numpy'] and not use_arrow:
             from ..numpy.block import NumpyColumnOrientedBlock
             block_cls = NumpyColumnOrientedBlock
         else:
@@ -106,3 +146,8 @@ class BlockInputStream(object):
         )
 
         return block
+
+    def read_raw(self):
+        from .raw import read_raw_block
+
+        return read_raw_block(self.fin, self.context)
@@ -0,0 +1,295 @@
+from struct import Struct
+
+from ..block import BlockInfo, RawBlock
+from ..bufferedreader import CompressedBufferedReader
+from ..bufferedwriter import CompressedBufferedWriter
+from ..columns.service import get_column_by_spec
+from ..columns.util import get_inner_columns, get_inner_spec
+from ..context import Context
+from ..reader import read_binary_str, read_binary_uint8
+from ..varint import read_varint, write_varint
+from ..writer import write_binary_str, write_binary_uint8
+from .. import defines
+
+
+uint64_struct = Struct('<Q')
+
+fixed_sizes = {
+    'Nothing': 1,
+    'Bool': 1,
+    'Int8': 1,
+    'UInt8': 1,
+    'Int16': 2,
+    'UInt16': 2,
+    'Date': 2,
+    'Int32': 4,
+    'UInt32': 4,
+    'Float32': 4,
+    'Date32': 4,
+    'DateTime': 4,
+    'IPv4': 4,
+    'Int64': 8,
+    'UInt64': 8,
+    'Float64': 8,
+    'Int128': 16,
+    'UInt128': 16,
+    'UUID': 16,
+    'IPv6': 16,
+    'Int256': 32,
+    'UInt256': 32
+}
+
+fixed_size_prefixes = (
+    ('DateTime64(', 8),
+    ('DateTime(', 4),
+    ('Enum8(', 1),
+    ('Enum16(', 2),
+    ('Decimal32(', 4),
+    ('Decimal64(', 8),
+    ('Decimal128(', 16),
+    ('Decimal256(', 32)
+)
+
+
+class Parts(list):
+    """
+    List of bytes chunks with file-like write method.
+    """
+
+    def write(self, data):
+        self.append(data)
+
+
+class RecordingReader(object):
+    """
+    Records all bytes read from the wrapped file-like object.
+    """
+
+    def __init__(self, fin, parts):
+        self.fin = fin
+        self.parts = parts
+
+        super(RecordingReader, self).__init__()
+
+    def read(self, n):
+        rv = self.fin.read(n)
+        self.parts.append(rv)
+        return rv
+
+    def read_one(self):
+        rv = self.fin.read_one()
+        self.parts.append(bytes((rv, )))
+        return rv
+
+
+def get_decimal_size(spec):
+    precision = int(get_inner_spec('Decimal', spec).split(',')[0])
+
+    if precision <= 9:
+        return 4
+    elif precision <= 18:
+        return 8
+    elif precision <= 38:
+        return 16
+    return 32
+
+
+def get_fixed_size(spec):
+    size = fixed_sizes.get(spec)
+    if size is not None:
+        return size
+
+    for prefix, size in fixed_size_prefixes:
+        if spec.startswith(prefix):
+            return size
+
+    if spec.startswith('Decimal('):
+        return get_decimal_size(spec)
+
+    return None
+
+
+def is_raw_supported(spec):
+    """
+    Checks that column data can be copied without decoding. Only columns
+    without state prefix are supported.
+    """
+    if get_fixed_size(spec) or spec == 'String':
+        return True
+
+    elif spec.startswith('FixedString('):
+        return True
+
+    elif spec.startswith('Nullable('):
+        return is_raw_supported(get_inner_spec('Nullable', spec))
+
+    elif spec.startswith('Array('):
+        return is_raw_supported(get_inner_spec('Array', spec))
+
+    elif spec.startswith('Tuple('):
+        inner = get_inner_columns(get_inner_spec('Tuple', spec))
+        return all(is_raw_supported(x) for x in inner)
+
+    elif spec.startswith('Map('):
+        inner = get_inner_columns(get_inner_spec('Map', spec))
+        return all(is_raw_supported(x) for x in inner)
+
+    return False
+
+
+def read_offsets_raw(n_items, buf, parts):
+    data = buf.read(8 * n_items)
+    parts.append(data)
+
+    if not n_items:
+        return 0
+    return uint64_struct.unpack(data[-8:])[0]
+
+
+def read_column_raw(spec, n_items, buf, parts):
+    size = get_fixed_size(spec)
+    if size:
+        parts.append(buf.read(size * n_items))
+
+    elif spec == 'String':
+        parts.append(buf.read_strings_raw(n_items))
+
+    elif spec.startswith('FixedString('):
+        length = int(get_inner_spec('FixedString', spec))
+        parts.append(buf.read(length * n_items))
+
+    elif spec.startswith('Nullable('):
+        # Nulls map and then nested column.
+        parts.append(buf.read(n_items))
+        inner = get_inner_spec('Nullable', spec)
+        read_column_raw(inner, n_items, buf, parts)
+
+    elif spec.startswith('Array('):
+        n_nested = read_offsets_raw(n_items, buf, parts)
+        inner = get_inner_spec('Array', spec)
+        read_column_raw(inner, n_nested, buf, parts)
+
+    elif spec.startswith('Tuple('):
+        for inner in get_inner_columns(get_inner_spec('Tuple', spec)):
+            read_column_raw(inner, n_items, buf, parts)
+
+    elif spec.startswith('Map('):
+        n_nested = read_offsets_raw(n_items, buf, parts)
+        key, value = get_inner_columns(get_inner_spec('Map', spec))
+        read_column_raw(key, n_nested, buf, parts)
+        read_column_raw(value, n_nested, buf, parts)
+
+
+def get_bytes_context(context):
+    # Strings are passed as is without decoding.
+    bytes_context = Context()
+    bytes_context.server_info = context.server_info
+    bytes_context.settings = context.settings
+
+    client_settings = context.client_settings
+    client_settings['strings_as_bytes'] = True
+    bytes_context.client_settings = client_settings
+    return bytes_context
+
+
+def recode_column(context, spec, n_items, buf, parts,
+                  has_custom_serialization=False):
+    # Column is decoded and encoded back. Used for columns with state
+    # prefix or custom serialization.
+    context = get_bytes_context(context)
+    column_options = {
+        'context': context,
+        'has_custom_serialization': has_custom_serialization
+    }
+    column = get_column_by_spec(spec, column_options, use_numpy=False)
+    column.read_state_prefix(buf)
+    items = column.read_data(n_items, buf)
+
+    column_options = {'context': context}
+    column = get_column_by_spec(spec, column_options, use_numpy=False)
+    fout = CompressedBufferedWriter(parts, defines.BUFFER_SIZE)
+    column.write_state_prefix(fout)
+    column.write_data(items, fout)
+    fout.flush()
+
+
+def read_raw_block(buf, context):
+    """
+    Reads block in Native format without decoding columns data.
+
+    :param buf: buffered reader.
+    :param context: connection context.
+    :return: :class:`~clickhouse_driver.block.RawBlock` with block bytes.
+    """
+    parts = Parts()
+    info = BlockInfo()
+
+    revision = context.server_info.used_revision
+    if revision >= defines.DBMS_MIN_REVISION_WITH_BLOCK_INFO:
+        info.read(buf)
+        info.write(parts)
+
+    n_columns = read_varint(buf)
+    n_rows = read_varint(buf)
+    write_varint(n_columns, parts)
+    write_varint(n_rows, parts)
+
+    names, types = [], []
+    for i in range(n_columns):
+        column_name = read_binary_str(buf)
+        column_type = read_binary_str(buf)
+        write_binary_str(column_name, parts)
+        write_binary_str(column_type, parts)
+
+        names.append(column_name)
+        types.append(column_type)
+
+        has_custom_serialization = False
+        if revision >= defines.DBMS_MIN_REVISION_WITH_CUSTOM_SERIALIZATION:
+            has_custom_serialization = bool(read_binary_uint8(buf))
+            # Data is always written without custom serialization.
+            write_binary_uint8(0, parts)
+
+        if n_rows:
+            if is_raw_supported(column_type) and \
+                    not has_custom_serialization:
+                read_column_raw(column_type, n_rows, buf, parts)
+            else:
+                recode_column(
+                    context, column_type, n_rows, buf, parts,
+                    has_custom_serialization=has_custom_serialization
+                )
+
+    return RawBlock(
+        columns_with_types=list(zip(names, types)),
+        num_rows=n_rows,
+        data=b''.join(parts),
+        info=info
+    )
+
+
+def decode_raw_block(block, context):
+    """
+    Decodes columns data of raw block.
+
+    :param block: :class:`~clickhouse_driver.block.RawBlock`.
+    :param context: connection context.
+    :return: decoded block.
+    """
+    chunks = [block.data]
+
+    def read_chunk():
+        return chunks.pop() if chunks else b''
+
+    fin = CompressedBufferedReader(read_chunk, defines.BUFFER_SIZE)
+
+    if block.compressed:
+        from .compressed import CompressedBlockInputStream
+
+        stream = CompressedBlockInputStream(fin, context)
+    else:
+        from .native import BlockInputStream
+
+        stream = BlockInputStream(fin, context)
+
+    return stream.read()
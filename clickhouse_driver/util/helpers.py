@@ -1,7 +1,10 @@
+import queue
 import ssl
 from itertools import islice, tee
 from urllib.parse import urlparse, parse_qs, unquote
 
+from .compat import threading
+
 
 def chunks(seq, n):
     # islice is MUCH slower than slice for lists and tuples.
@@ -27,6 +30,60 @@ def pairwise(iterable):
     return zip(a, b)
 
 
+def prefetch(iterable, n):
+    """
+    Consumes iterable in background thread keeping at most n items ahead of
+    the caller. Exceptions are re-raised in the caller's thread. Background
+    thread is stopped and joined when the caller closes generator.
+    """
+    buffer = queue.Queue(maxsize=n)
+    stop = threading.Event()
+    end = object()
+
+    def put(item):
+        # Periodically check if consumer went away to not block forever.
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return not stop.is_set()
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            put((end, e))
+        else:
+            put((end, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+        # Iterable can read from the same connection as the caller. Caller
+        # can use connection only after producer finished the current item.
+        while True:
+            try:
+                buffer.get_nowait()
+            except queue.Empty:
+                break
+        thread.join()
+
+
 def column_chunks(columns, n):
     for column in columns:
         if not isinstance(column, (list, tuple)):
@@ -123,7 +180,8 @@ def parse_url(url):
         elif name == 'secure':
             kwargs[name] = asbool(value)
 
-        elif name == 'use_numpy':
+        elif name in ('use_numpy', 'lazy_rows', 'columns_as_arrays',
+                      'flat_arrays'):
             settings[name] = asbool(value)
 
         elif name == 'round_robin':
@@ -152,6 +210,9 @@ def parse_url(url):
         elif name == 'client_revision':
             kwargs[name] = int(value)
 
+        elif name == 'dns_cache_ttl':
+            kwargs[name] = float(value)
+
         # ssl
         elif name == 'verify':
             kwargs[name] = asbool(value)
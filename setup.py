@@ -45,10 +45,30 @@ extensions = [
         'clickhouse_driver.bufferedwriter',
         ['clickhouse_driver/bufferedwriter' + ext]
     ),
+    Extension(
+        'clickhouse_driver.columns.arraycodec',
+        ['clickhouse_driver/columns/arraycodec' + ext]
+    ),
+    Extension(
+        'clickhouse_driver.columns.datetimecodec',
+        ['clickhouse_driver/columns/datetimecodec' + ext]
+    ),
+    Extension(
+        'clickhouse_driver.columns.decimalcodec',
+        ['clickhouse_driver/columns/decimalcodec' + ext]
+    ),
     Extension(
         'clickhouse_driver.columns.largeint',
         ['clickhouse_driver/columns/largeint' + ext]
     ),
+    Extension(
+        'clickhouse_driver.columns.nullsmap',
+        ['clickhouse_driver/columns/nullsmap' + ext]
+    ),
+    Extension(
+        'clickhouse_driver.columns.uuidcodec',
+        ['clickhouse_driver/columns/uuidcodec' + ext]
+    ),
     Extension(
         'clickhouse_driver.varint',
         ['clickhouse_driver/varint' + ext]
@@ -133,7 +153,8 @@ setup(
             'clickhouse-cityhash>=1.0.2.1'
         ],
         'zstd': ['zstd', 'clickhouse-cityhash>=1.0.2.1'],
-        'numpy': ['numpy>=1.12.0', 'pandas>=0.24.0']
+        'numpy': ['numpy>=1.12.0', 'pandas>=0.24.0'],
+        'arrow': ['pyarrow>=14.0.0']
     },
     test_suite='pytest'
 )
@@ -0,0 +1,139 @@
+from datetime import date, datetime
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from clickhouse_driver import errors
+from tests.arrow.testcase import ArrowBaseTestCase
+
+
+class InsertArrowTestCase(ArrowBaseTestCase):
+    def test_simple(self):
+        table = pa.table({
+            'a': pa.array([1, 2, 3], type=pa.int32()),
+            'b': pa.array(['x', 'y', 'z'])
+        })
+
+        with self.create_table('a Int32, b String'):
+            rv = self.client.insert_arrow('INSERT INTO test VALUES', table)
+            self.assertEqual(rv, 3)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [(1, 'x'), (2, 'y'), (3, 'z')])
+
+    def test_blocks_slicing(self):
+        table = pa.table({'a': pa.array(range(100), type=pa.uint64())})
+
+        with self.create_table('a UInt64'):
+            rv = self.client.insert_arrow(
+                'INSERT INTO test VALUES', table.slice(10),
+                settings={'insert_block_size': 7}
+            )
+            self.assertEqual(rv, 90)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [(x, ) for x in range(10, 100)])
+
+    def test_columns_order(self):
+        table = pa.table({'b': ['x'], 'a': [1], 'c': [2]})
+
+        with self.create_table('a Int8, b String'):
+            self.client.insert_arrow('INSERT INTO test VALUES', table)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [(1, 'x')])
+
+    def test_missing_columns(self):
+        table = pa.table({'a': [1]})
+
+        with self.create_table('a Int8, b String'):
+            with self.assertRaises(ValueError) as e:
+                self.client.insert_arrow('INSERT INTO test VALUES', table)
+
+            self.assertIn('missing required columns', str(e.exception))
+
+    def test_types(self):
+        columns = (
+            'a Nullable(Int64), b FixedString(2), c Date, d Date32, '
+            "e DateTime('UTC'), f DateTime64(3, 'UTC'), "
+            "g Enum8('x' = 1, 'y' = 2), h Array(Nullable(Int32)), "
+            'i LowCardinality(String), j LowCardinality(Nullable(String)), '
+            'k Bool, l Nullable(String), m UUID'
+        )
+        table = pa.table({
+            'a': pa.array([1, None]),
+            'b': pa.array([b'ab', b'cd'], type=pa.binary(2)),
+            'c': pa.array([date(2020, 1, 1), date(2020, 1, 2)]),
+            'd': pa.array([date(1960, 1, 1), date(1960, 1, 2)]),
+            'e': pa.array(
+                [datetime(2020, 1, 1, 10), datetime(2020, 1, 1, 11)],
+                type=pa.timestamp('s', tz='UTC')
+            ),
+            'f': pa.array(
+                [datetime(2020, 1, 1, 10, 0, 0, 123000)] * 2,
+                type=pa.timestamp('ms', tz='UTC')
+            ),
+            'g': pa.array(['x', 'y']).dictionary_encode(),
+            'h': pa.array([[1, None], []]),
+            'i': pa.array(['a', 'a']),
+            'j': pa.array([None, 'b']).dictionary_encode(),
+            'k': pa.array([True, False]),
+            'l': pa.array(['s', None], type=pa.large_string()),
+            'm': pa.array(['c0a1f4b8-5ee0-4cf1-9d37-1f8f3f0a6b34'] * 2)
+        })
+
+        with self.create_table(columns):
+            self.client.insert_arrow('INSERT INTO test VALUES', table)
+
+            rv = self.client.query_arrow('SELECT * FROM test')
+            for name in 'acdghijkl':
+                self.assertEqual(
+                    rv.column(name).to_pylist(),
+                    table.column(name).to_pylist()
+                )
+            self.assertEqual(rv.column('b').to_pylist(), [b'ab', b'cd'])
+            self.assertEqual(
+                rv.column('e').cast(pa.int64()).to_pylist(),
+                table.column('e').cast(pa.int64()).to_pylist()
+            )
+            self.assertEqual(
+                rv.column('f').cast(pa.int64()).to_pylist(),
+                table.column('f').cast(pa.int64()).to_pylist()
+            )
+
+    def test_nulls_in_non_nullable(self):
+        table = pa.table({'a': pa.array([1, None], type=pa.int32())})
+
+        with self.create_table('a Int32'):
+            with self.assertRaises(errors.TypeMismatchError):
+                self.client.insert_arrow('INSERT INTO test VALUES', table)
+
+            self.client.insert_arrow(
+                'INSERT INTO test VALUES', table,
+                settings={'input_format_null_as_default': True}
+            )
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [(1, ), (0, )])
+
+    def test_overflow(self):
+        table = pa.table({'a': [1000]})
+
+        with self.create_table('a Int8'):
+            with self.assertRaises(errors.TypeMismatchError):
+                self.client.insert_arrow('INSERT INTO test VALUES', table)
+
+    def test_unknown_enum_element(self):
+        table = pa.table({'a': ['x', 'z']})
+
+        with self.create_table("a Enum8('x' = 1)"):
+            with self.assertRaises(errors.LogicalError):
+                self.client.insert_arrow('INSERT INTO test VALUES', table)
+
+    def test_record_batch(self):
+        batch = pa.record_batch([pa.array([1, 2])], names=['a'])
+
+        with self.create_table('a Int64'):
+            rv = self.client.insert_arrow('INSERT INTO test VALUES', batch)
+            self.assertEqual(rv, 2)
@@ -0,0 +1,134 @@
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from tests.arrow.testcase import ArrowBaseTestCase
+
+
+class QueryArrowTestCase(ArrowBaseTestCase):
+    def test_simple(self):
+        rv = self.client.query_arrow(
+            'SELECT number, toString(number) AS s FROM numbers(10)'
+        )
+
+        self.assertIsInstance(rv, pa.Table)
+        self.assertEqual(rv.num_rows, 10)
+        self.assertEqual(rv.schema.field('number').type, pa.uint64())
+        self.assertEqual(rv.schema.field('s').type, pa.large_string())
+        self.assertEqual(rv.column('number').to_pylist(), list(range(10)))
+        self.assertEqual(
+            rv.column('s').to_pylist(), [str(x) for x in range(10)]
+        )
+
+    def test_empty(self):
+        rv = self.client.query_arrow(
+            'SELECT toInt32(number) AS x FROM numbers(10) WHERE number > 100'
+        )
+
+        self.assertEqual(rv.num_rows, 0)
+        self.assertEqual(rv.schema.field('x').type, pa.int32())
+
+    def test_many_blocks(self):
+        rv = self.client.query_arrow(
+            'SELECT number FROM numbers(100)',
+            settings={'max_block_size': 10}
+        )
+
+        self.assertEqual(rv.num_rows, 100)
+        self.assertEqual(rv.column('number').num_chunks, 10)
+
+    def test_params(self):
+        rv = self.client.query_arrow(
+            'SELECT %(x)s AS x', params={'x': 42}
+        )
+        self.assertEqual(rv.column('x').to_pylist(), [42])
+
+    def test_types(self):
+        columns = (
+            'a Int8, b UInt64, c Float64, d Bool, e String, '
+            'f Nullable(String), g FixedString(2), h Date, i Date32, '
+            "j DateTime('UTC'), k DateTime64(3, 'UTC'), "
+            "l Enum8('x' = 1, 'y' = 2), m Array(Nullable(Int32)), "
+            'n LowCardinality(String), o LowCardinality(Nullable(String)), '
+            'p UUID, q Decimal(9, 2)'
+        )
+        data = [
+            (
+                -1, 2 ** 64 - 1, 0.5, True, 'привет', None, b'ab',
+                date(2020, 1, 1), date(1960, 1, 1),
+                datetime(2020, 1, 1, 10, 20, 30),
+                datetime(2020, 1, 1, 10, 20, 30, 123000), 'y', [1, None],
+                'lc', None, UUID(int=1), Decimal('1.23')
+            )
+        ]
+
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test VALUES', data)
+            rv = self.client.query_arrow('SELECT * FROM test')
+
+        row = rv.to_pylist()[0]
+        self.assertEqual(row['a'], -1)
+        self.assertEqual(row['b'], 2 ** 64 - 1)
+        self.assertEqual(row['c'], 0.5)
+        self.assertEqual(row['d'], True)
+        self.assertEqual(row['e'], 'привет')
+        self.assertIsNone(row['f'])
+        self.assertEqual(row['g'], b'ab')
+        self.assertEqual(row['h'], date(2020, 1, 1))
+        self.assertEqual(row['i'], date(1960, 1, 1))
+        self.assertEqual(
+            row['j'].replace(tzinfo=None), datetime(2020, 1, 1, 10, 20, 30)
+        )
+        self.assertEqual(
+            row['k'].replace(tzinfo=None),
+            datetime(2020, 1, 1, 10, 20, 30, 123000)
+        )
+        self.assertEqual(row['l'], 'y')
+        self.assertEqual(row['m'], [1, None])
+        self.assertEqual(row['n'], 'lc')
+        self.assertIsNone(row['o'])
+        self.assertEqual(row['p'], str(UUID(int=1)))
+        self.assertEqual(row['q'], Decimal('1.23'))
+
+        self.assertEqual(rv.schema.field('k').type, pa.timestamp('ms', 'UTC'))
+        self.assertTrue(pa.types.is_dictionary(rv.schema.field('n').type))
+
+    def test_strings_as_bytes(self):
+        rv = self.client.query_arrow(
+            "SELECT 'abc' AS x", settings={'strings_as_bytes': True}
+        )
+        self.assertEqual(rv.schema.field('x').type, pa.large_binary())
+        self.assertEqual(rv.column('x').to_pylist(), [b'abc'])
+
+    def test_totals_are_skipped(self):
+        rv = self.client.query_arrow(
+            'SELECT number % 2 AS x, count() AS c FROM numbers(10) '
+            'GROUP BY x WITH TOTALS ORDER BY x'
+        )
+        self.assertEqual(rv.column('c').to_pylist(), [5, 5])
+
+    def test_execute_after_arrow(self):
+        self.client.query_arrow('SELECT 1')
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+
+class IterArrowBatchesTestCase(ArrowBaseTestCase):
+    def test_batches(self):
+        batches = list(self.client.iter_arrow_batches(
+            'SELECT number FROM numbers(100)',
+            settings={'max_block_size': 10}
+        ))
+
+        self.assertEqual(len(batches), 10)
+        for batch in batches:
+            self.assertIsInstance(batch, pa.RecordBatch)
+            self.assertEqual(batch.num_rows, 10)
+
+        rows = [x for b in batches for x in b.column(0).to_pylist()]
+        self.assertEqual(rows, list(range(100)))
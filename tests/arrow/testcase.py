@@ -0,0 +1,13 @@
+from unittest import SkipTest
+
+from tests.testcase import BaseTestCase
+
+
+class ArrowBaseTestCase(BaseTestCase):
+    def setUp(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise SkipTest('PyArrow package is not installed')
+
+        super(ArrowBaseTestCase, self).setUp()
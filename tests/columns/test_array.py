@@ -1,3 +1,4 @@
+from array import array
 from uuid import UUID
 
 from tests.testcase import BaseTestCase
@@ -264,3 +265,27 @@ class ArrayTestCase(BaseTestCase):
 
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+    def test_flat_arrays(self):
+        columns = 'a Array(Float32), b Array(Array(Int8))'
+        data = [([1.5, 2.5], [[1], []]), ([], [[2, 3]]), ([3.5], [])]
+
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a, b) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, columnar=True, settings={
+                    'flat_arrays': True, 'max_block_size': 2
+                }
+            )
+            a, b = inserted
+            self.assertEqual(a.values, array('f', [1.5, 2.5, 3.5]))
+            self.assertEqual(list(a.offsets), [2, 2, 3])
+            self.assertEqual(b.values, [[1], [], [2, 3]])
+            self.assertEqual(list(b.offsets), [2, 3, 3])
+
+            inserted = self.client.execute(
+                query, settings={'flat_arrays': True}
+            )
+            self.assertEqual(inserted, data)
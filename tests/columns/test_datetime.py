@@ -62,6 +62,19 @@ class DateTimeTestCase(BaseTestCase):
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
 
+    @require_server_version(20, 1, 2)
+    def test_datetime_format(self):
+        columns = 'a Nullable(DateTime), b DateTime64(3)'
+        with self.create_table(columns):
+            data = [(1530211034, 1530211034123), (None, 0)]
+            self.client.execute('INSERT INTO test (a, b) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, settings={'datetime_format': 'int'}
+            )
+            self.assertEqual(inserted, data)
+
     def test_handle_errors_from_tzlocal(self):
         with patch('tzlocal.get_localzone') as mocked:
             mocked.side_effect = UnknownTimeZoneError()
@@ -269,3 +269,22 @@ class Decimal256TestCase(BaseTestCase):
                 (Decimal('1606938044258990275541962092341162602522202993782792835301676.42'), ),  # noqa: E501
                 (Decimal('-1606938044258990275541962092341162602522202993782792835301676.42'), )  # noqa: E501
             ])
+
+    def test_decimal_format(self):
+        with self.create_table('a Nullable(Decimal(9, 2)), b Decimal(38, 2)'):
+            data = [
+                (Decimal('300.42'), Decimal('-1.5')),
+                (None, Decimal('0'))
+            ]
+            self.client.execute('INSERT INTO test (a, b) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, settings={'decimal_format': 'float'}
+            )
+            self.assertEqual(inserted, [(300.42, -1.5), (None, 0.0)])
+
+            inserted = self.client.execute(
+                query, settings={'decimal_format': 'int'}
+            )
+            self.assertEqual(inserted, [(30042, -150), (None, 0)])
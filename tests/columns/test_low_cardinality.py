@@ -185,3 +185,58 @@ class LowCardinalityTestCase(BaseTestCase):
 
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+    def test_dictionary_reuse(self):
+        with self.create_table('a LowCardinality(Nullable(String))'):
+            data = [
+                ('status_{}'.format(x % 3) if x % 4 else None, )
+                for x in range(100)
+            ]
+            data[-1] = ('new', )
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data,
+                settings={'insert_block_size': 7}
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, settings={'max_block_size': 10}
+            )
+            self.assertEqual(inserted, data)
+            # Values of different blocks are taken from the same dictionary.
+            self.assertIs(inserted[1][0], inserted[97][0])
+
+    def test_dictionary_reuse_converted_items(self):
+        columns = 'a LowCardinality(Date), b LowCardinality(Decimal(9, 2))'
+        with self.create_table(columns):
+            data = [
+                (date(2023, 4, x % 3 + 1), Decimal(x % 2) + Decimal('0.5'))
+                for x in range(10)
+            ]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data,
+                settings={'insert_block_size': 3}
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    def test_dictionary_per_column(self):
+        columns = 'a LowCardinality(String), b LowCardinality(String)'
+        with self.create_table(columns):
+            data = [
+                ('a{}'.format(x % 3), 'b{}'.format(x % 2)) for x in range(20)
+            ]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data,
+                settings={'insert_block_size': 3}
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, settings={'max_block_size': 4}
+            )
+            self.assertEqual(inserted, data)
+            self.assertIs(inserted[0][0], inserted[18][0])
+            self.assertIs(inserted[0][1], inserted[18][1])
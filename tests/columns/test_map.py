@@ -133,3 +133,18 @@ class MapTestCase(BaseTestCase):
             self.assertEqual(inserted, '{}\n')
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+    def test_flat_arrays(self):
+        with self.create_table('a Map(String, UInt64)'):
+            data = [({'key1': 1}, ), ({}, ), ({'key2': 2}, )]
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, columnar=True, settings={'flat_arrays': True}
+            )
+            column = inserted[0]
+            self.assertEqual(list(column.keys), ['key1', 'key2'])
+            self.assertEqual(list(column.values), [1, 2])
+            self.assertEqual(list(column.offsets), [1, 1, 2])
+            self.assertEqual(column, [x[0] for x in data])
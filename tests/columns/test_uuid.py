@@ -77,3 +77,39 @@ class UUIDTestCase(BaseTestCase):
             self.assertEqual(inserted, [
                 (UUID(int=0), )
             ])
+
+    def test_uuid_format(self):
+        value = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+
+        with self.create_table('a Nullable(UUID)'):
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', [(value, ), (None, )]
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, settings={'uuid_format': 'bytes'}
+            )
+            self.assertEqual(inserted, [(value.bytes, ), (None, )])
+
+            inserted = self.client.execute(
+                query, settings={'uuid_format': 'str'}
+            )
+            self.assertEqual(inserted, [(str(value), ), (None, )])
+
+    def test_insert_bytes(self):
+        value = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+
+        with self.create_table('a UUID'):
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', [(value.bytes, )]
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, str(value) + '\n')
+
+            with self.assertRaises(errors.CannotParseUuidError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', [(b'a', )]
+                )
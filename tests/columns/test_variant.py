@@ -0,0 +1,107 @@
+from struct import pack
+from unittest import TestCase
+
+from clickhouse_driver.bufferedreader import CompressedBufferedReader
+from clickhouse_driver.columns.service import read_column
+from clickhouse_driver.context import Context
+from tests.testcase import BaseTestCase
+
+
+class VariantTestCase(BaseTestCase):
+    required_server_version = (24, 1)
+
+    def client_kwargs(self, version):
+        return {'settings': {'allow_experimental_variant_type': True}}
+
+    def cli_client_kwargs(self):
+        return {'allow_experimental_variant_type': 1}
+
+    def test_simple(self):
+        with self.create_table('a Variant(UInt64, String, Array(UInt64))'):
+            data = [(1, ), ('a', ), (None, ), ([1, 2], ), (2, )]
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "1\na\n\\N\n[1,2]\n2\n")
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    def test_select(self):
+        rv = self.client.execute(
+            "SELECT multiIf(number % 3 = 0, number, number % 3 = 1, "
+            "toString(number), NULL)::Variant(UInt64, String) "
+            "FROM numbers(6)"
+        )
+        self.assertEqual(
+            rv, [(0, ), ('1', ), (None, ), (3, ), ('4', ), (None, )]
+        )
+
+    def test_nested(self):
+        rv = self.client.execute(
+            "SELECT [1::Variant(UInt8, String), 'a', NULL]"
+        )
+        self.assertEqual(rv, [([1, 'a', None], )])
+
+
+class DynamicTestCase(BaseTestCase):
+    required_server_version = (24, 5)
+
+    def client_kwargs(self, version):
+        return {'settings': {'allow_experimental_dynamic_type': True}}
+
+    def test_select(self):
+        rv = self.client.execute(
+            "SELECT arrayJoin([1::Dynamic, 'a'::Dynamic, NULL, [1, 2]])"
+        )
+        self.assertEqual(rv, [(1, ), ('a', ), (None, ), ([1, 2], )])
+
+
+class DecodeTestCase(TestCase):
+    def setUp(self):
+        self.context = Context()
+        self.context.settings = {}
+        self.context.client_settings = {
+            'use_numpy': False,
+            'strings_as_bytes': False,
+            'strings_encoding': 'utf-8'
+        }
+        super(DecodeTestCase, self).setUp()
+
+    def read(self, spec, n_items, data):
+        chunks = [data]
+
+        def read_chunk():
+            return chunks.pop() if chunks else b''
+
+        fin = CompressedBufferedReader(read_chunk, 1024)
+        return list(read_column(self.context, spec, n_items, fin))
+
+    def test_compact_discriminators(self):
+        data = (
+            pack('<Q', 1) +
+            # Plain granule of 4 rows and compact granule of 2 rows.
+            bytes([4, 0, 0, 1, 255, 0]) + bytes([2, 1, 0]) +
+            pack('<4q', 1, 2, 3, 4) + b'\x01a'
+        )
+        rv = self.read('Variant(Int64, String)', 6, data)
+        self.assertEqual(rv, [1, 'a', None, 2, 3, 4])
+
+    def test_dynamic_v1(self):
+        data = (
+            pack('<Q', 1) + bytes([32, 1]) + b'\x06String' +
+            pack('<Q', 0) + bytes([0, 0]) + b'\x01a\x01b'
+        )
+        rv = self.read('Dynamic', 2, data)
+        self.assertEqual(rv, ['a', 'b'])
+
+    def test_dynamic_v2(self):
+        # Variants are sorted: Int64, SharedVariant, String.
+        data = (
+            pack('<Q', 2) + bytes([2]) + b'\x05Int64' + b'\x06String' +
+            pack('<Q', 0) + bytes([0, 2, 255, 1]) +
+            pack('<q', 5) + b'\x02\x15x' + b'\x02hi'
+        )
+        rv = self.read('Dynamic(max_types=8)', 4, data)
+        self.assertEqual(rv, [5, 'hi', None, b'\x15x'])
@@ -0,0 +1,86 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class ArrayTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a Array(Int32)'):
+            data = [np.array([[1, 2, 3], [], [4]], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '[1,2,3]\n[]\n[4]\n')
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0].dtype, object)
+            self.assertArraysListEqual(inserted[0], [[1, 2, 3], [], [4]])
+            self.assertEqual(inserted[0][0].dtype, np.int32)
+
+            # Rows are views of the same array.
+            self.assertIs(inserted[0][0].base, inserted[0][2].base)
+
+    def test_insert_arrays(self):
+        with self.create_table('a Array(Float64)'):
+            data = [[np.array([1.5, 2.5]), np.array([3.5])]]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '[1.5,2.5]\n[3.5]\n')
+
+    def test_nested(self):
+        with self.create_table('a Array(Array(String))'):
+            data = [np.array([[['a', 'b'], []], [], [['c']]], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "[['a','b'],[]]\n[]\n[['c']]\n")
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(
+                [[list(y) for y in x] for x in inserted[0]],
+                [[['a', 'b'], []], [], [['c']]]
+            )
+
+    def test_nullable(self):
+        with self.create_table('a Array(Nullable(Int8))'):
+            data = [np.array([[1, None], [None]], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '[1,NULL]\n[NULL]\n')
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(
+                [list(x) for x in inserted[0]], [[1, None], [None]]
+            )
+
+    def test_low_cardinality(self):
+        with self.create_table('a Array(LowCardinality(String))'):
+            data = [np.array([['a', 'b', 'a'], ['b']], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "['a','b','a']\n['b']\n")
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(
+                [list(x) for x in inserted[0]], [['a', 'b', 'a'], ['b']]
+            )
@@ -79,6 +79,23 @@ class DateTimeTestCase(BaseDateTimeTestCase):
             self.assertArraysEqual(inserted[0], data[0])
             self.assertEqual(inserted[0].dtype, object)
 
+    @require_server_version(22, 8)
+    def test_date32(self):
+        with self.create_table('a Date32'):
+            data = [
+                np.array(['1900-01-01', '2299-12-31'], dtype='datetime64[D]')
+            ]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '1900-01-01\n2299-12-31\n')
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(inserted[0], data[0])
+
     def test_nullable_datetime(self):
         with self.create_table('a Nullable(DateTime)'):
             data = [
@@ -0,0 +1,43 @@
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class DecimalTestCase(NumpyBaseTestCase):
+    def get_query(self, ch_type, settings=None):
+        with self.create_table('a {}'.format(ch_type)):
+            data = [np.array([Decimal('300.42'), -1.5, 0], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '300.42\n-1.5\n0\n')
+            return self.client.execute(
+                query, columnar=True, settings=settings
+            )
+
+    def test_decimal(self):
+        rv = self.get_query('Decimal(9, 2)')
+        self.assertArraysEqual(
+            rv[0], np.array([Decimal('300.42'), Decimal('-1.5'), 0])
+        )
+        self.assertEqual(rv[0].dtype, object)
+
+    def test_float(self):
+        settings = {'decimal_format': 'float'}
+        for ch_type in ('Decimal(9, 2)', 'Decimal(38, 2)'):
+            rv = self.get_query(ch_type, settings=settings)
+            self.assertArraysEqual(rv[0], np.array([300.42, -1.5, 0.0]))
+            self.assertEqual(rv[0].dtype, np.float64)
+
+    def test_int(self):
+        rv = self.get_query('Decimal(18, 2)', {'decimal_format': 'int'})
+        self.assertArraysEqual(rv[0], np.array([30042, -150, 0]))
+        self.assertEqual(rv[0].dtype, np.int64)
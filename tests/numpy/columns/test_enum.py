@@ -0,0 +1,83 @@
+from enum import Enum
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from clickhouse_driver import errors
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class A(Enum):
+    hello = -1
+    world = 2
+
+
+class EnumTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        columns = (
+            "a Enum8('hello' = -1, 'world' = 2), "
+            "b Enum16('foo' = -300, 'bar' = 300)"
+        )
+
+        with self.create_table(columns):
+            data = [
+                np.array(['world', A.hello, 2], dtype=object),
+                np.array([300, -300, 300], dtype=np.int16)
+            ]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted, 'world\tbar\nhello\tfoo\nworld\tbar\n'
+            )
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertIsInstance(inserted[0], pd.Categorical)
+            self.assertEqual(list(inserted[0].categories), ['hello', 'world'])
+            self.assertEqual(list(inserted[0]), ['world', 'hello', 'world'])
+            self.assertEqual(list(inserted[1]), ['bar', 'foo', 'bar'])
+
+    def test_categorical(self):
+        with self.create_table("a Enum8('hello' = 1, 'world' = 2)"):
+            data = [pd.Categorical(['world', 'hello'])]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            inserted = self.client.execute('SELECT * FROM test', columnar=True)
+            self.assertEqual(list(inserted[0]), ['world', 'hello'])
+
+    def test_nullable(self):
+        with self.create_table("a Nullable(Enum8('hello' = 1, 'world' = 2))"):
+            data = [np.array(['world', None], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, 'world\n\\N\n')
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0][0], 'world')
+            self.assertTrue(pd.isnull(inserted[0][1]))
+
+    def test_errors(self):
+        with self.create_table("a Enum8('hello' = 1, 'world' = 2)"):
+            with self.assertRaises(errors.LogicalError) as e:
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES',
+                    [np.array(['test'], dtype=object)], columnar=True
+                )
+
+            self.assertIn('Unknown element', str(e.exception))
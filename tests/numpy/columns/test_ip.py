@@ -0,0 +1,78 @@
+from ipaddress import IPv4Address, IPv6Address
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from clickhouse_driver import errors
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class IPv4TestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a IPv4'):
+            values = ['10.0.0.1', IPv4Address('192.168.1.1')]
+            data = [np.array(values, dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '10.0.0.1\n192.168.1.1\n')
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0].dtype, np.uint32)
+            self.assertArraysEqual(
+                inserted[0], np.array([167772161, 3232235777])
+            )
+
+    def test_insert_integers(self):
+        with self.create_table('a IPv4'):
+            data = [np.array([167772161], dtype=np.uint32)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '10.0.0.1\n')
+
+    def test_errors(self):
+        with self.create_table('a IPv4'):
+            with self.assertRaises(errors.CannotParseDomainError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES',
+                    [np.array(['1.1.1'], dtype=object)], columnar=True
+                )
+
+
+class IPv6TestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        values = [IPv6Address('79f4:e698:45de:a59b:2765:28e3:8d3a:35ae'),
+                  IPv6Address('::1')]
+
+        with self.create_table('a IPv6'):
+            data = [np.array([str(values[0]), values[1]], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted, '\n'.join(str(x) for x in values) + '\n'
+            )
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0].dtype, np.dtype('S16'))
+            self.assertEqual(
+                inserted[0].tobytes(), b''.join(x.packed for x in values)
+            )
+
+            # Packed addresses are inserted as is.
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', inserted, columnar=True
+            )
+            inserted = self.emit_cli('SELECT count() FROM test')
+            self.assertEqual(inserted, '4\n')
@@ -217,3 +217,25 @@ class LowCardinalityTestCase(NumpyBaseTestCase):
                 inserted[0].astype(str), pd.Categorical(data[0]).astype(str)
             )
             self.assertIsInstance(inserted[0], pd.Categorical)
+
+    def test_dictionary_reuse(self):
+        with self.create_table('a LowCardinality(Nullable(String))'):
+            values = [
+                'status_{}'.format(x % 3) if x % 4 else None
+                for x in range(100)
+            ]
+            values[-1] = 'new'
+            data = [np.array(values, dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True,
+                settings={'insert_block_size': 7}
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, columnar=True, settings={'max_block_size': 10}
+            )
+            self.assertArraysEqual(
+                inserted[0].astype(str), pd.Categorical(data[0]).astype(str)
+            )
+            self.assertIsInstance(inserted[0], pd.Categorical)
@@ -0,0 +1,68 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class MapTestCase(NumpyBaseTestCase):
+    required_server_version = (21, 1, 2)
+    stable_support_version = (21, 8, 1)
+
+    def client_kwargs(self, version):
+        settings = {'use_numpy': True}
+        if version < self.stable_support_version:
+            settings['allow_experimental_map_type'] = True
+        return {'settings': settings}
+
+    def cli_client_kwargs(self):
+        if self.stable_support_version > self.server_version:
+            return {'allow_experimental_map_type': 1}
+
+    def test_simple(self):
+        with self.create_table('a Map(String, UInt64)'):
+            data = [np.array([{}, {'key1': 1}, {'key1': 2, 'key2': 20}])]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted,
+                "{}\n{'key1':1}\n{'key1':2,'key2':20}\n"
+            )
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0].dtype, object)
+            self.assertEqual(list(inserted[0]), list(data[0]))
+
+    def test_python_types(self):
+        with self.create_table('a Map(String, UInt64)'):
+            data = [np.array([{'key1': 1}])]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            inserted = self.client.execute('SELECT * FROM test', columnar=True)
+            (key, value), = inserted[0][0].items()
+            self.assertIs(type(key), str)
+            self.assertIs(type(value), int)
+
+    def test_nested(self):
+        with self.create_table('a Map(String, Array(Nullable(Int32)))'):
+            data = [np.array([{'a': [1, None]}, {'b': []}])]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "{'a':[1,NULL]}\n{'b':[]}\n")
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(
+                [{k: list(v) for k, v in x.items()} for x in inserted[0]],
+                [{'a': [1, None]}, {'b': []}]
+            )
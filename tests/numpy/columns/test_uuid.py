@@ -0,0 +1,54 @@
+from uuid import UUID
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class UUIDTestCase(NumpyBaseTestCase):
+    values = [
+        UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d'),
+        UUID('2efcead4-ff55-4db5-bdb4-6b36a308d8e0')
+    ]
+
+    def test_simple(self):
+        with self.create_table('a UUID'):
+            data = [np.array(self.values, dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted, '\n'.join(str(x) for x in self.values) + '\n'
+            )
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(inserted[0], data[0])
+            self.assertEqual(inserted[0].dtype, object)
+
+    def test_bytes(self):
+        settings = {'uuid_format': 'bytes'}
+
+        with self.create_table('a UUID'):
+            data = [np.array([x.bytes for x in self.values], dtype='S16')]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True,
+                settings=settings
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted, '\n'.join(str(x) for x in self.values) + '\n'
+            )
+
+            inserted = self.client.execute(
+                query, columnar=True, settings=settings
+            )
+            self.assertEqual(inserted[0].dtype, np.dtype('S16'))
+            self.assertEqual(inserted[0].tobytes(), data[0].tobytes())
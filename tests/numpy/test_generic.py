@@ -91,6 +91,23 @@ class NumpyIteratorTestCase(NumpyBaseTestCase):
         )
         self.assertEqual(list(result), [])
 
+    def test_select_blocks(self):
+        result = self.client.execute_iter_blocks(
+            'SELECT number FROM system.numbers LIMIT 10',
+            settings={'max_block_size': 4}
+        )
+
+        blocks = list(result)
+        self.assertEqual(len(blocks), 3)
+        for columns_with_types, columns in blocks:
+            self.assertEqual(columns_with_types, [('number', 'UInt64')])
+            self.assertIsInstance(columns[0], np.ndarray)
+
+        self.assertArraysEqual(
+            np.concatenate([columns[0] for _, columns in blocks]),
+            np.arange(10)
+        )
+
 
 class DataFrameTestCase(NumpyBaseTestCase):
     def test_query_simple(self):
@@ -0,0 +1,43 @@
+from unittest import TestCase
+
+from clickhouse_driver.columns.arraycodec import (
+    dicts_from_offsets, flatten_dicts, flatten_items, split_by_offsets
+)
+
+
+def pack(*offsets):
+    return b''.join(x.to_bytes(8, 'little') for x in offsets)
+
+
+class ArrayCodecTestCase(TestCase):
+    def test_split_by_offsets(self):
+        rv = split_by_offsets((1, 2, 3), [0, 2, 2, 3])
+        self.assertEqual(rv, [[1, 2], [], [3]])
+
+        self.assertEqual(split_by_offsets([], [0]), [])
+
+        with self.assertRaises(ValueError):
+            split_by_offsets((1, 2), [0, 3])
+
+        with self.assertRaises(ValueError):
+            split_by_offsets((1, 2), [])
+
+    def test_dicts_from_offsets(self):
+        rv = dicts_from_offsets(('a', 'b', 'c'), (1, 2, 3), (2, 2, 3))
+        self.assertEqual(rv, [{'a': 1, 'b': 2}, {}, {'c': 3}])
+
+        with self.assertRaises(ValueError):
+            dicts_from_offsets(('a', ), (1, ), (2, ))
+
+    def test_flatten_items(self):
+        offsets, flat = flatten_items([[1, 2], (), (3, )])
+        self.assertEqual(offsets, pack(2, 2, 3))
+        self.assertEqual(flat, [1, 2, 3])
+
+        self.assertEqual(flatten_items([]), (b'', []))
+
+    def test_flatten_dicts(self):
+        offsets, keys, values = flatten_dicts([{'a': 1, 'b': 2}, {}])
+        self.assertEqual(offsets, pack(2, 2))
+        self.assertEqual(keys, ['a', 'b'])
+        self.assertEqual(values, [1, 2])
@@ -1,7 +1,12 @@
+from array import array
 import types
 from unittest.mock import patch
 
+from clickhouse_driver.chunkedcolumn import ChunkedColumn
 from clickhouse_driver.errors import ServerException
+from clickhouse_driver.rowfactory import dict_row, namedtuple_row
+from clickhouse_driver.rowview import RowView
+from clickhouse_driver.spill import SpilledRows
 from tests.testcase import BaseTestCase, file_config
 from tests.util import capture_logging
 from clickhouse_driver.util.helpers import chunks
@@ -57,6 +62,59 @@ class BlocksTestCase(BaseTestCase):
             inserted = self.client.execute(query, columnar=True)
             self.assertEqual(inserted, [(1, 2)])
 
+    def test_columnar_format_array(self):
+        rv = self.client.execute(
+            'SELECT number, toString(number) FROM numbers(10)',
+            columnar=True, settings={
+                'columnar_format': 'array', 'max_block_size': 3
+            }
+        )
+        self.assertIsInstance(rv[0], array)
+        self.assertEqual(rv[0].typecode, 'Q')
+        self.assertEqual(list(rv[0]), list(range(10)))
+        # Non-numeric columns are returned as tuples.
+        self.assertEqual(rv[1], tuple(str(x) for x in range(10)))
+
+    def test_columnar_format_chunked(self):
+        rv = self.client.execute(
+            'SELECT number FROM numbers(10)',
+            columnar=True, settings={
+                'columnar_format': 'chunked', 'max_block_size': 3
+            }
+        )
+        self.assertIsInstance(rv[0], ChunkedColumn)
+        self.assertEqual(len(rv[0].chunks), 4)
+        self.assertEqual(rv, [tuple(range(10))])
+
+    def test_columns_as_arrays(self):
+        rv = self.client.execute(
+            'SELECT toInt16(number), toFloat32(number), '
+            'toNullable(toInt8(number)), toDate(number) '
+            'FROM numbers(10)',
+            columnar=True, settings={
+                'columns_as_arrays': True, 'max_block_size': 3
+            }
+        )
+        self.assertEqual(rv[0], array('h', range(10)))
+        self.assertEqual(rv[1], array('f', range(10)))
+        # Nullable and converted columns are returned as tuples.
+        self.assertEqual(rv[2], tuple(range(10)))
+        self.assertIsInstance(rv[3], tuple)
+
+    def test_columns_as_arrays_rows(self):
+        rv = self.client.execute(
+            'SELECT number, [number] FROM numbers(3)',
+            settings={'columns_as_arrays': True}
+        )
+        self.assertEqual(rv, [(0, [0]), (1, [1]), (2, [2])])
+
+    def test_columnar_format_unknown(self):
+        with self.assertRaises(ValueError):
+            self.client.execute(
+                'SELECT 1', columnar=True,
+                settings={'columnar_format': 'unknown'}
+            )
+
     def test_select_with_column_types(self):
         rv = self.client.execute(
             'SELECT CAST(1 AS Int32) AS x', with_column_types=True
@@ -185,6 +243,21 @@ class IteratorTestCase(BaseTestCase):
         )
         self.assertEqual(list(result), [])
 
+    def test_select_with_prefetch_iter(self):
+        result = self.client.execute_iter(
+            'SELECT number FROM system.numbers LIMIT 10',
+            settings={'max_block_size': 3}, prefetch=2
+        )
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertEqual(list(result), list(zip(range(10))))
+        self.assertEqual(list(result), [])
+
+    def test_select_with_prefetch_iter_error(self):
+        with self.assertRaises(ServerException):
+            list(self.client.execute_iter('SELECT error', prefetch=2))
+
+        self.assertFalse(self.client.connection.connected)
+
     def test_select_with_iter_error(self):
         with self.assertRaises(ServerException):
             result = self.client.execute_iter('SELECT error')
@@ -204,6 +277,138 @@ class IteratorTestCase(BaseTestCase):
         self.assertFalse(self.client.connection.connected)
 
 
+class IterBlocksTestCase(BaseTestCase):
+    def test_select_blocks(self):
+        result = self.client.execute_iter_blocks(
+            'SELECT CAST(number AS UInt32) AS x, toString(number) AS y '
+            'FROM system.numbers LIMIT 10',
+            settings={'max_block_size': 4}
+        )
+
+        blocks = list(result)
+        self.assertEqual(len(blocks), 3)
+        for columns_with_types, columns in blocks:
+            self.assertEqual(
+                columns_with_types, [('x', 'UInt32'), ('y', 'String')]
+            )
+            self.assertEqual(len(columns), 2)
+
+        x = [v for _, columns in blocks for v in columns[0]]
+        y = [v for _, columns in blocks for v in columns[1]]
+        self.assertEqual(x, list(range(10)))
+        self.assertEqual(y, [str(v) for v in range(10)])
+        self.assertEqual(list(result), [])
+
+    def test_select_blocks_empty(self):
+        result = self.client.execute_iter_blocks(
+            'SELECT number FROM system.numbers LIMIT 0'
+        )
+        self.assertEqual(list(result), [])
+
+    def test_select_blocks_with_prefetch(self):
+        result = self.client.execute_iter_blocks(
+            'SELECT number FROM system.numbers LIMIT 10',
+            settings={'max_block_size': 3}, prefetch=2
+        )
+        x = [v for _, columns in result for v in columns[0]]
+        self.assertEqual(x, list(range(10)))
+
+    def test_select_blocks_error(self):
+        with self.assertRaises(ServerException):
+            list(self.client.execute_iter_blocks('SELECT error'))
+
+        self.assertFalse(self.client.connection.connected)
+
+
+class LazyRowsTestCase(BaseTestCase):
+    client_kwargs = {'settings': {'lazy_rows': True}}
+
+    def test_select(self):
+        rv = self.client.execute(
+            'SELECT number AS x, toString(number) AS y '
+            'FROM system.numbers LIMIT 10',
+            settings={'max_block_size': 3}
+        )
+
+        self.assertIsInstance(rv, RowView)
+        self.assertEqual(rv, [(i, str(i)) for i in range(10)])
+        self.assertEqual(rv[4]['y'], '4')
+        self.assertEqual(rv[-1][0], 9)
+
+    def test_select_with_column_types(self):
+        rv, columns = self.client.execute(
+            'SELECT CAST(1 AS UInt8) AS x', with_column_types=True
+        )
+        self.assertEqual(columns, [('x', 'UInt8')])
+        self.assertEqual(rv[0]['x'], 1)
+
+    def test_disabled_per_query(self):
+        rv = self.client.execute('SELECT 1', settings={'lazy_rows': False})
+        self.assertEqual(rv, [(1, )])
+        self.assertIsInstance(rv[0], tuple)
+
+    def test_iter(self):
+        rows = list(self.client.execute_iter(
+            'SELECT number AS x FROM system.numbers LIMIT 5'
+        ))
+        self.assertEqual([row['x'] for row in rows], list(range(5)))
+
+
+class RowFactoryTestCase(BaseTestCase):
+    def test_namedtuple_row(self):
+        rv = self.client.execute(
+            'SELECT number AS x, toString(number) AS y FROM numbers(10)',
+            settings={'max_block_size': 3}, row_factory=namedtuple_row
+        )
+
+        self.assertEqual(rv, [(i, str(i)) for i in range(10)])
+        self.assertEqual(rv[4].y, '4')
+        # The same class for all blocks.
+        self.assertEqual(len({type(x) for x in rv}), 1)
+
+    def test_dict_row_with_column_types(self):
+        rv, columns = self.client.execute(
+            'SELECT CAST(1 AS UInt8) AS x', with_column_types=True,
+            row_factory=dict_row
+        )
+        self.assertEqual(columns, [('x', 'UInt8')])
+        self.assertEqual(rv, [{'x': 1}])
+
+    def test_lazy_rows(self):
+        rv = self.client.execute(
+            'SELECT 1 AS x', settings={'lazy_rows': True},
+            row_factory=dict_row
+        )
+        self.assertEqual(rv, [{'x': 1}])
+
+    def test_columnar(self):
+        rv = self.client.execute(
+            'SELECT 1 AS x', columnar=True, row_factory=dict_row
+        )
+        self.assertEqual(rv, [(1, )])
+
+
+class SpillTestCase(BaseTestCase):
+    def test_spill(self):
+        rv = self.client.execute(
+            'SELECT number, toString(number) FROM numbers(100)',
+            settings={'max_result_memory': 1024, 'max_block_size': 10}
+        )
+
+        self.assertIsInstance(rv, SpilledRows)
+        self.assertEqual(len(rv), 100)
+        self.assertEqual(rv[55], (55, '55'))
+        self.assertEqual(rv, [(x, str(x)) for x in range(100)])
+        rv.close()
+
+    def test_under_limit(self):
+        rv = self.client.execute(
+            'SELECT 1', settings={'max_result_memory': 1024}
+        )
+        self.assertEqual(rv, [(1, )])
+        self.assertIsInstance(rv, list)
+
+
 class LogTestCase(BaseTestCase):
     required_server_version = (18, 12, 13)
 
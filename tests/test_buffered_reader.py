@@ -2,6 +2,7 @@ import socket
 from unittest import TestCase, mock
 
 from clickhouse_driver.bufferedreader import BufferedSocketReader
+from clickhouse_driver.varint import make_varint
 
 
 class BufferedReaderTestCase(TestCase):
@@ -20,3 +21,62 @@ class BufferedReaderTestCase(TestCase):
             # Trying to allocate huge amount of memory.
             with self.assertRaises(MemoryError):
                 reader.read_strings(5, encoding='utf-8')
+
+    def test_read_strings_buffers(self):
+        strings = [b'', b'a', b'xyz' * 10, 'юникод'.encode('utf-8'), b'']
+        data = b''.join(bytes([len(x)]) + x for x in strings)
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+
+        def recv_into(buf):
+            chunk = chunks.pop(0)
+            buf[0:len(chunk)] = chunk
+            return len(chunk)
+
+        with mock.patch('socket.socket') as mock_socket:
+            mock_socket.return_value.recv_into.side_effect = recv_into
+            reader = BufferedSocketReader(socket.socket(), 16)
+
+            offsets, values = reader.read_strings_buffers(len(strings))
+
+        offsets = memoryview(offsets).cast('q').tolist()
+        self.assertEqual(offsets, [0, 0, 1, 31, 43, 43])
+        self.assertEqual(values, b''.join(strings))
+
+    def test_read_strings_raw(self):
+        strings = [b'', b'a', b'xyz' * 100, 'юникод'.encode('utf-8')]
+        data = b''.join(make_varint(len(x)) + x for x in strings)
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+
+        def recv_into(buf):
+            chunk = chunks.pop(0)
+            buf[0:len(chunk)] = chunk
+            return len(chunk)
+
+        with mock.patch('socket.socket') as mock_socket:
+            mock_socket.return_value.recv_into.side_effect = recv_into
+            reader = BufferedSocketReader(socket.socket(), 16)
+
+            rv = reader.read_strings_raw(len(strings))
+
+        self.assertEqual(rv, data)
+
+    def test_read_and_readinto(self):
+        data = bytes(range(256)) * 3
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+
+        def recv_into(buf):
+            chunk = chunks.pop(0)
+            buf[0:len(chunk)] = chunk
+            return len(chunk)
+
+        with mock.patch('socket.socket') as mock_socket:
+            mock_socket.return_value.recv_into.side_effect = recv_into
+            reader = BufferedSocketReader(socket.socket(), 16)
+
+            head = reader.read(3)
+            out = bytearray(500)
+            size = reader.readinto(out)
+            tail = reader.read(len(data) - 503)
+
+        self.assertEqual(size, 500)
+        self.assertEqual(head + out + tail, data)
@@ -0,0 +1,229 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from clickhouse_driver.block import RawBlock
+from clickhouse_driver.cache import DiskQueryCache, QueryCache
+from tests.testcase import BaseTestCase
+
+
+def make_blocks(size):
+    return [RawBlock([('x', 'UInt8')], size, b'\x00' * size)]
+
+
+class QueryCacheTestCase(TestCase):
+    def make_cache(self, **kwargs):
+        return QueryCache(**kwargs)
+
+    def test_get_set(self):
+        cache = self.make_cache()
+        key = cache.make_key('SELECT 1', {'a': 1}, 'default')
+
+        self.assertIsNone(cache.get(key))
+        cache.set(key, make_blocks(10))
+
+        blocks = cache.get(key)
+        self.assertEqual(blocks[0].data, b'\x00' * 10)
+        self.assertEqual(len(cache), 1)
+
+    def test_key(self):
+        cache = self.make_cache()
+        cache.set(cache.make_key('SELECT 1', {'a': 1}, 'db'), make_blocks(1))
+
+        self.assertIsNone(cache.get(cache.make_key('SELECT 1', {}, 'db')))
+        self.assertIsNone(
+            cache.get(cache.make_key('SELECT 1', {'a': 1}, 'other'))
+        )
+        self.assertIsNotNone(
+            cache.get(cache.make_key('SELECT 1', {'a': 1}, 'db'))
+        )
+
+    def test_client_identity_key(self):
+        cache = self.make_cache()
+        key = cache.make_key(
+            'SELECT 1', {}, 'db', user='a',
+            hosts=[('h1', 9000), ('h2', 9000)]
+        )
+        cache.set(key, make_blocks(1))
+
+        for kwargs in [{'user': 'b', 'hosts': [('h1', 9000), ('h2', 9000)]},
+                       {'user': 'a', 'hosts': [('h1', 9000)]},
+                       {'user': 'a', 'hosts': [('h1', 9001), ('h2', 9000)]}]:
+            self.assertIsNone(
+                cache.get(cache.make_key('SELECT 1', {}, 'db', **kwargs))
+            )
+
+        # Hosts order doesn't matter.
+        self.assertIsNotNone(cache.get(cache.make_key(
+            'SELECT 1', {}, 'db', user='a',
+            hosts=[('h2', 9000), ('h1', 9000)]
+        )))
+
+    def test_ttl(self):
+        cache = self.make_cache(ttl=-1)
+        key = cache.make_key('SELECT 1', {}, 'default')
+        cache.set(key, make_blocks(1))
+
+        self.assertIsNone(cache.get(key))
+
+    def test_invalidate(self):
+        cache = self.make_cache()
+        cache.set(cache.make_key('SELECT 1', {}, 'a'), make_blocks(1))
+        cache.set(cache.make_key('SELECT 1', {}, 'b'), make_blocks(1))
+        cache.set(cache.make_key('SELECT 2', {}, 'a'), make_blocks(1))
+
+        cache.invalidate('SELECT 1')
+        self.assertEqual(len(cache), 1)
+        self.assertIsNotNone(cache.get(cache.make_key('SELECT 2', {}, 'a')))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_too_large_entry(self):
+        cache = self.make_cache(max_size=10)
+        key = cache.make_key('SELECT 1', {}, 'default')
+        cache.set(key, make_blocks(11))
+
+        self.assertIsNone(cache.get(key))
+
+    def test_lru_eviction(self):
+        cache = QueryCache(max_size=30)
+        keys = [
+            cache.make_key('SELECT {}'.format(i), {}, '') for i in range(3)
+        ]
+
+        cache.set(keys[0], make_blocks(10))
+        cache.set(keys[1], make_blocks(10))
+        # Touch the first entry.
+        cache.get(keys[0])
+        cache.set(keys[2], make_blocks(15))
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertEqual(cache.size, 25)
+
+
+class DiskQueryCacheTestCase(QueryCacheTestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        super(DiskQueryCacheTestCase, self).setUp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        super(DiskQueryCacheTestCase, self).tearDown()
+
+    def make_cache(self, **kwargs):
+        return DiskQueryCache(self.path, **kwargs)
+
+    def test_lru_eviction(self):
+        cache = self.make_cache(max_size=2 * 1024)
+        keys = [
+            cache.make_key('SELECT {}'.format(i), {}, '') for i in range(3)
+        ]
+
+        cache.set(keys[0], make_blocks(800))
+        cache.set(keys[1], make_blocks(800))
+        os.utime(cache.get_filename(keys[0]), (0, 0))
+        cache.set(keys[2], make_blocks(800))
+
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertIsNotNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+
+    def test_broken_entry(self):
+        cache = self.make_cache()
+        key = cache.make_key('SELECT 1', {}, 'default')
+        cache.set(key, make_blocks(1))
+
+        with open(cache.get_filename(key), 'wb') as f:
+            f.write(b'garbage')
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(len(cache), 0)
+
+
+class ClientQueryCacheTestCase(BaseTestCase):
+    def setUp(self):
+        super(ClientQueryCacheTestCase, self).setUp()
+        self.cache = QueryCache()
+        self.client.query_cache = self.cache
+
+    def test_cached(self):
+        query = 'SELECT rand(), number FROM numbers(3)'
+
+        rv = self.client.execute(query)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.client.execute(query), rv)
+
+        rv_columnar = self.client.execute(query, columnar=True)
+        self.assertEqual(rv_columnar, [tuple(c) for c in zip(*rv)])
+
+        self.assertNotEqual(self.client.execute(query, cache=False), rv)
+
+    def test_hit_does_not_connect(self):
+        query = 'SELECT rand()'
+
+        rv = self.client.execute(query)
+        self.client.disconnect()
+
+        with patch.object(self.client.connection, 'force_connect') as connect:
+            self.assertEqual(self.client.execute(query), rv)
+            connect.assert_not_called()
+
+    def test_params(self):
+        query = 'SELECT rand(), %(x)s'
+
+        rv = self.client.execute(query, {'x': 1})
+        self.assertEqual(self.client.execute(query, {'x': 1}), rv)
+        self.assertNotEqual(self.client.execute(query, {'x': 2}), rv)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_settings(self):
+        query = 'SELECT rand()'
+
+        rv = self.client.execute(query)
+        self.assertNotEqual(
+            self.client.execute(query, settings={'max_threads': 1}), rv
+        )
+
+    def test_invalidate(self):
+        query = 'SELECT rand()'
+
+        rv = self.client.execute(query)
+        self.cache.invalidate(query)
+        self.assertNotEqual(self.client.execute(query), rv)
+
+    def test_empty_with_column_types(self):
+        query = 'SELECT toInt32(number) AS x FROM numbers(10) WHERE x > 100'
+        expected = ([], [('x', 'Int32')])
+
+        self.assertEqual(
+            self.client.execute(query, with_column_types=True), expected
+        )
+        self.assertEqual(
+            self.client.execute(query, with_column_types=True), expected
+        )
+
+    def test_totals_are_not_cached(self):
+        query = (
+            'SELECT number % 2 AS x, count() FROM numbers(10) '
+            'GROUP BY x WITH TOTALS ORDER BY x'
+        )
+        rv = self.client.execute(query)
+
+        self.assertEqual(rv, [(0, 5), (1, 5), (0, 10)])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_insert_is_not_cached(self):
+        with self.create_table('a UInt8'):
+            self.client.execute('INSERT INTO test VALUES', [(1, )])
+            rv = self.client.execute('SELECT * FROM test')
+            self.assertEqual(rv, [(1, )])
+
+            self.client.execute('INSERT INTO test VALUES', [(2, )])
+            rv = self.client.execute('SELECT * FROM test')
+            self.assertEqual(rv, [(1, )])
+            self.assertEqual(len(self.cache), 1)
@@ -0,0 +1,65 @@
+from array import array
+from unittest import TestCase
+
+from clickhouse_driver.chunkedcolumn import ChunkedColumn, concat_chunks
+
+
+class ChunkedColumnTestCase(TestCase):
+    def test_sequence(self):
+        column = ChunkedColumn([(1, 2), (), (3, 4, 5)])
+
+        self.assertEqual(len(column), 5)
+        self.assertEqual(list(column), [1, 2, 3, 4, 5])
+        self.assertEqual(column[2], 3)
+        self.assertEqual(column[-1], 5)
+        self.assertEqual(column[1:4], [2, 3, 4])
+        self.assertEqual(column, (1, 2, 3, 4, 5))
+        self.assertEqual(len(column.chunks), 2)
+
+        with self.assertRaises(IndexError):
+            column[5]
+
+    def test_empty(self):
+        column = ChunkedColumn([])
+
+        self.assertEqual(len(column), 0)
+        self.assertEqual(column, ())
+
+
+class ConcatChunksTestCase(TestCase):
+    def test_tuple(self):
+        chunks = [(1, 2), (3, )]
+
+        self.assertEqual(concat_chunks(chunks), (1, 2, 3))
+        # Chunks are released.
+        self.assertEqual(chunks, [])
+
+    def test_single_chunk_is_not_copied(self):
+        chunk = (1, 2)
+
+        self.assertIs(concat_chunks([chunk]), chunk)
+
+    def test_array(self):
+        rv = concat_chunks([(1, 2), (3, )], 'array', spec='Int32')
+        self.assertEqual(rv, array('i', [1, 2, 3]))
+
+        rv = concat_chunks([('a', ), ('b', )], 'array', spec='String')
+        self.assertEqual(rv, ('a', 'b'))
+
+    def test_array_chunks(self):
+        chunks = [array('d', [1.0, 2.0]), array('d', [3.0])]
+        rv = concat_chunks(chunks, spec='Float64')
+        self.assertEqual(rv, array('d', [1.0, 2.0, 3.0]))
+
+        chunk = array('q', [1, 2])
+        self.assertIs(concat_chunks([chunk], 'array', spec='Int64'), chunk)
+
+    def test_chunked(self):
+        rv = concat_chunks([(1, 2), (3, )], 'chunked')
+
+        self.assertIsInstance(rv, ChunkedColumn)
+        self.assertEqual(rv, (1, 2, 3))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            concat_chunks([(1, )], 'unknown')
@@ -228,6 +228,53 @@ class ClientFromUrlTestCase(TestCase):
         c = Client.from_url('clickhouse://host?use_numpy=true')
         self.assertTrue(c.connection.context.client_settings['use_numpy'])
 
+    def test_lazy_rows(self):
+        c = Client.from_url('clickhouse://host?lazy_rows=true')
+        self.assertTrue(c.connection.context.client_settings['lazy_rows'])
+
+        c = Client.from_url('clickhouse://host?lazy_rows=0')
+        self.assertFalse(c.connection.context.client_settings['lazy_rows'])
+
+    def test_columnar_format(self):
+        c = Client.from_url('clickhouse://host?columnar_format=chunked')
+        self.assertEqual(
+            c.connection.context.client_settings['columnar_format'], 'chunked'
+        )
+
+    def test_columns_as_arrays(self):
+        c = Client.from_url('clickhouse://host?columns_as_arrays=true')
+        self.assertTrue(
+            c.connection.context.client_settings['columns_as_arrays']
+        )
+
+    def test_uuid_format(self):
+        c = Client.from_url('clickhouse://host?uuid_format=str')
+        self.assertEqual(
+            c.connection.context.client_settings['uuid_format'], 'str'
+        )
+
+    def test_decimal_format(self):
+        c = Client.from_url('clickhouse://host?decimal_format=float')
+        self.assertEqual(
+            c.connection.context.client_settings['decimal_format'], 'float'
+        )
+
+    def test_datetime_format(self):
+        c = Client.from_url('clickhouse://host?datetime_format=int')
+        self.assertEqual(
+            c.connection.context.client_settings['datetime_format'], 'int'
+        )
+
+    def test_flat_arrays(self):
+        c = Client.from_url('clickhouse://host?flat_arrays=true')
+        self.assertTrue(c.connection.context.client_settings['flat_arrays'])
+
+    def test_max_result_memory(self):
+        c = Client.from_url('clickhouse://host?max_result_memory=1024')
+        self.assertEqual(
+            c.connection.context.client_settings['max_result_memory'], 1024
+        )
+
     def test_opentelemetry(self):
         c = Client.from_url(
             'clickhouse://host?opentelemetry_traceparent='
@@ -288,3 +335,10 @@ class ClientFromUrlTestCase(TestCase):
     def test_client_revision(self):
         c = Client.from_url('clickhouse://host?client_revision=54032')
         self.assertEqual(c.connection.client_revision, 54032)
+
+    def test_dns_cache_ttl(self):
+        c = Client.from_url('clickhouse://host?dns_cache_ttl=30')
+        self.assertEqual(c.connection.dns_cache_ttl, 30.0)
+
+        c = Client.from_url('clickhouse://host')
+        self.assertIsNone(c.connection.dns_cache_ttl)
@@ -0,0 +1,152 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+from clickhouse_driver.bufferedreader import CompressedBufferedReader
+from clickhouse_driver.bufferedwriter import CompressedBufferedWriter
+from clickhouse_driver.columns.service import (
+    ColumnFactory, read_column, write_column
+)
+from clickhouse_driver.connection import ServerInfo
+from clickhouse_driver.context import Context
+from clickhouse_driver.streams.raw import Parts
+
+
+class ColumnFactoryTestCase(TestCase):
+    def setUp(self):
+        self.factory = ColumnFactory()
+
+        self.context = Context()
+        self.context.column_factory = self.factory
+        self.context.server_info = ServerInfo(
+            'ClickHouse', 24, 8, 1, 54468, 'UTC', 'localhost', 54468
+        )
+        self.context.settings = {}
+        self.context.client_settings = {
+            'use_numpy': False,
+            'strings_as_bytes': False,
+            'strings_encoding': 'utf-8',
+            'input_format_null_as_default': False,
+            'namedtuple_as_json': True
+        }
+        super(ColumnFactoryTestCase, self).setUp()
+
+    def roundtrip(self, spec, items):
+        parts = Parts()
+        fout = CompressedBufferedWriter(parts, 1024)
+        write_column(self.context, 'a', spec, list(items), fout)
+        fout.flush()
+
+        chunks = [b''.join(parts)]
+
+        def read_chunk():
+            return chunks.pop() if chunks else b''
+
+        fin = CompressedBufferedReader(read_chunk, 1024)
+        return list(read_column(self.context, spec, len(items), fin))
+
+    def assertRoundtrip(self, spec, items):
+        # Cached column must be reset between blocks.
+        for _ in range(3):
+            self.assertEqual(self.roundtrip(spec, items), items)
+
+    def test_array(self):
+        self.assertRoundtrip(
+            'Array(Array(Nullable(Int32)))', [[[1, None], []], [[3]], []]
+        )
+
+    def test_low_cardinality(self):
+        self.assertRoundtrip(
+            'LowCardinality(Nullable(String))', ['a', None, 'b', 'a']
+        )
+        self.assertRoundtrip(
+            'Array(LowCardinality(Nullable(String)))',
+            [['a', None, 'a'], [], ['b']]
+        )
+
+    def test_map(self):
+        self.assertRoundtrip(
+            'Map(String, Array(UInt8))', [{'a': [1, 2]}, {}, {'b': []}]
+        )
+
+    def test_tuple(self):
+        self.assertRoundtrip(
+            'Tuple(Array(String), LowCardinality(String))',
+            [(['x'], 'y'), ([], 'z')]
+        )
+
+    def test_nested(self):
+        self.assertRoundtrip(
+            'Nested(a UInt8, b String)',
+            [[(1, 'x')], [], [(2, 'y'), (3, 'z')]]
+        )
+
+    def test_nullable(self):
+        self.assertRoundtrip('Nullable(Date)', [date(2020, 1, 1), None])
+
+    def test_stats(self):
+        self.roundtrip('UInt8', [1])
+        self.roundtrip('UInt8', [2])
+
+        self.assertEqual(
+            self.factory.stats, {'hits': 3, 'misses': 1, 'size': 1}
+        )
+
+    def test_types_check_is_key(self):
+        self.roundtrip('UInt8', [1])
+
+        column = self.factory.get_column(
+            'UInt8', {'context': self.context, 'types_check': True}
+        )
+        self.assertTrue(column.types_check_enabled)
+        self.assertEqual(self.factory.stats['misses'], 2)
+
+    def test_settings_are_key(self):
+        self.roundtrip('String', ['a'])
+
+        # Settings that don't affect columns.
+        self.context.settings = {'max_block_size': 10}
+        client_settings = self.context.client_settings
+        client_settings['insert_block_size'] = 10
+        self.context.client_settings = client_settings
+        self.roundtrip('String', ['a'])
+        self.assertEqual(self.factory.stats['misses'], 1)
+
+        client_settings['strings_as_bytes'] = True
+        self.context.client_settings = client_settings
+        self.assertEqual(self.roundtrip('String', [b'a']), [b'a'])
+        self.assertEqual(len(self.factory.columns), 2)
+
+        self.context.settings = {'use_client_time_zone': True}
+        self.roundtrip('String', [b'a'])
+        self.assertEqual(len(self.factory.columns), 3)
+
+    def test_cleared_on_server_info_change(self):
+        self.roundtrip('String', ['a'])
+
+        self.context.server_info = ServerInfo(
+            'ClickHouse', 24, 8, 1, 54468, 'UTC', 'other', 54468
+        )
+        self.assertEqual(len(self.factory.columns), 0)
+
+    def test_session_timezone_is_key(self):
+        spec = 'DateTime'
+        items = [datetime(2020, 1, 1, 12)]
+
+        before = self.factory.get_column(spec, {'context': self.context})
+        self.context.server_info.session_timezone = 'Asia/Tokyo'
+        after = self.factory.get_column(spec, {'context': self.context})
+        self.assertIsNot(before, after)
+        self.assertEqual(after.timezone.zone, 'Asia/Tokyo')
+        self.assertEqual(self.roundtrip(spec, items), items)
+
+        self.context.server_info.session_timezone = None
+        self.assertIs(
+            self.factory.get_column(spec, {'context': self.context}), before
+        )
+
+    def test_max_size(self):
+        self.factory.max_size = 2
+        for spec in ('UInt8', 'UInt16', 'UInt32'):
+            self.roundtrip(spec, [1])
+
+        self.assertEqual(len(self.factory.columns), 1)
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 from clickhouse_driver import errors
 from clickhouse_driver.client import Client
+from clickhouse_driver.connection import addrinfo_cache
 from clickhouse_driver.protocol import ClientPacketTypes, ServerPacketTypes
 from clickhouse_driver.bufferedreader import BufferedReader
 from clickhouse_driver.writer import write_binary_str
@@ -286,6 +287,54 @@ class ConnectTestCase(BaseTestCase):
             self.assertFalse(client.connection.connected)
             self.assertFalse(list(client.connections)[0].connected)
 
+    def test_warmup(self):
+        kwargs = {
+            'round_robin': True,
+            'alt_hosts': '{}:{}'.format(self.host, self.port)
+        }
+        with self.created_client(**kwargs) as client:
+            self.assertEqual(client.warmup(1), 1)
+            self.assertTrue(client.connection.connected)
+            self.assertFalse(list(client.connections)[0].connected)
+
+            self.assertEqual(client.warmup(), 2)
+            self.assertTrue(list(client.connections)[0].connected)
+
+            rv = client.execute('SELECT 1')
+            self.assertEqual(rv, [(1, )])
+
+    def test_warmup_error(self):
+        client = Client('bad-address')
+
+        with patch('socket.getaddrinfo') as mocked_getaddrinfo:
+            mocked_getaddrinfo.side_effect = socket.error(
+                -2, 'Name or service not known'
+            )
+
+            with self.assertRaises(errors.NetworkError):
+                client.warmup()
+
+    def test_dns_cache(self):
+        addrinfo_cache.clear()
+        getaddrinfo = socket.getaddrinfo
+
+        with patch('socket.getaddrinfo') as mocked_getaddrinfo:
+            mocked_getaddrinfo.side_effect = getaddrinfo
+
+            with self.created_client(dns_cache_ttl=60) as client:
+                client.execute('SELECT 1')
+                client.disconnect()
+                client.execute('SELECT 1')
+
+            self.assertEqual(mocked_getaddrinfo.call_count, 1)
+
+            with self.created_client() as client:
+                client.execute('SELECT 1')
+
+            self.assertEqual(mocked_getaddrinfo.call_count, 2)
+
+        addrinfo_cache.clear()
+
     def test_round_robin_client_construction(self):
         # host and port as keyword args
         Client(
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone as fixed_timezone
+from unittest import TestCase
+
+from pytz import timezone, utc
+
+from clickhouse_driver.columns.datetimecodec import (
+    datetimes_from_ints, get_transition_table
+)
+from tests.util import patch_env_tz
+
+
+class DateTimeCodecTestCase(TestCase):
+    tz_names = [
+        'Europe/Moscow', 'America/New_York', 'Australia/Lord_Howe',
+        'Asia/Kamchatka', 'Etc/GMT-3', 'UTC'
+    ]
+
+    def get_timestamps(self, tz):
+        # Timestamps around each transition in DateTime range.
+        timestamps = list(range(0, 2 ** 32, 7654321))
+        for start in get_transition_table(tz)[0]:
+            if 0 <= start - 7200 and start + 7200 < 2 ** 32:
+                timestamps.extend(range(start - 7200, start + 7200, 900))
+        return timestamps
+
+    def test_offset_aware(self):
+        for tz_name in self.tz_names:
+            tz = timezone(tz_name)
+            timestamps = self.get_timestamps(tz)
+
+            rv = datetimes_from_ints(timestamps, tz, offset_naive=False)
+            expected = tuple(datetime.fromtimestamp(x, tz) for x in timestamps)
+            self.assertEqual(rv, expected)
+            self.assertEqual(
+                [x.tzinfo for x in rv], [x.tzinfo for x in expected]
+            )
+
+    def test_offset_naive(self):
+        for tz_name in self.tz_names:
+            tz = timezone(tz_name)
+            timestamps = self.get_timestamps(tz)
+
+            rv = datetimes_from_ints(timestamps, tz)
+            self.assertEqual(rv, tuple(
+                datetime.fromtimestamp(x, tz).replace(tzinfo=None)
+                for x in timestamps
+            ))
+            self.assertTrue(all(x.tzinfo is None for x in rv))
+
+    def test_local_time(self):
+        for tz_name in self.tz_names:
+            tz = timezone(tz_name)
+            timestamps = self.get_timestamps(tz)
+
+            with patch_env_tz(tz_name):
+                rv = datetimes_from_ints(timestamps, tz, local_time=True)
+                expected = [datetime.fromtimestamp(x) for x in timestamps]
+
+            self.assertEqual(
+                [(x, x.fold) for x in rv], [(x, x.fold) for x in expected]
+            )
+
+    def test_scale(self):
+        tz = timezone('Europe/Moscow')
+        rv = datetimes_from_ints(
+            [1530211034123, -1, 0], tz, scale=3, offset_naive=False
+        )
+        self.assertEqual(rv, (
+            tz.localize(datetime(2018, 6, 28, 21, 37, 14, 123000)),
+            datetime.fromtimestamp(0, tz) - timedelta(milliseconds=1),
+            datetime.fromtimestamp(0, tz)
+        ))
+
+        # Rounding half to even.
+        rv = datetimes_from_ints(
+            [1500, 2500, 2501, 999999500, -500], utc, scale=9
+        )
+        self.assertEqual(rv, (
+            datetime(1970, 1, 1, 0, 0, 0, 2),
+            datetime(1970, 1, 1, 0, 0, 0, 2),
+            datetime(1970, 1, 1, 0, 0, 0, 3),
+            datetime(1970, 1, 1, 0, 0, 1),
+            datetime(1970, 1, 1)
+        ))
+
+    def test_fixed_offset(self):
+        tz = fixed_timezone(timedelta(hours=3))
+        rv = datetimes_from_ints([0], tz, offset_naive=False)
+        self.assertEqual(rv, (datetime.fromtimestamp(0, tz), ))
+        self.assertIs(rv[0].tzinfo, tz)
+
+    def test_nulls_map(self):
+        rv = datetimes_from_ints(
+            [1, 4294967295, 2], utc, nulls_map=b'\x00\x01\x00'
+        )
+        self.assertEqual(
+            rv, (datetime(1970, 1, 1, 0, 0, 1), None,
+                 datetime(1970, 1, 1, 0, 0, 2))
+        )
+
+        rv = datetimes_from_ints([0, 0], utc, nulls_map=b'\x01\x01')
+        self.assertEqual(rv, (None, None))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            datetimes_from_ints([0], utc, scale=19)
+
+        with self.assertRaises(ValueError):
+            datetimes_from_ints([0, 1], utc, nulls_map=b'\x00')
@@ -0,0 +1,52 @@
+from decimal import Decimal, localcontext
+from unittest import TestCase
+
+from clickhouse_driver.columns.decimalcodec import (
+    decimals_from_ints, decimals_to_ints, floats_from_ints
+)
+
+
+class DecimalCodecTestCase(TestCase):
+    def test_decimals_from_ints(self):
+        rv = decimals_from_ints([30042, -150, 0, 12300], 2)
+        self.assertEqual(
+            [str(x) for x in rv], ['300.42', '-1.5', '0', '123']
+        )
+
+        rv = decimals_from_ints((1, 2), 0)
+        self.assertEqual(rv, (Decimal(1), Decimal(2)))
+
+    def test_large_decimals_from_ints(self):
+        value = 2 ** 200 + 42
+
+        with localcontext() as ctx:
+            ctx.prec = 76
+            rv = decimals_from_ints([value, -value], 2)
+
+        expected = '{}.{}'.format(value // 100, value % 100)
+        self.assertEqual(rv, (Decimal(expected), Decimal('-' + expected)))
+
+    def test_floats_from_ints(self):
+        rv = floats_from_ints([30042, -150, 0, 2 ** 60 + 1], 2)
+        self.assertEqual(rv, (300.42, -1.5, 0.0, (2 ** 60 + 1) / 100))
+
+        rv = floats_from_ints([10 ** 40], 30)
+        self.assertEqual(rv, (10.0 ** 10, ))
+
+    def test_nulls_map(self):
+        rv = decimals_from_ints([100, 0], 2, nulls_map=b'\x00\x01')
+        self.assertEqual(rv, (Decimal(1), None))
+
+        rv = floats_from_ints([100, 0], 2, nulls_map=[False, True])
+        self.assertEqual(rv, (1.0, None))
+
+        with self.assertRaises(ValueError):
+            floats_from_ints([100, 0], 2, nulls_map=b'\x00')
+
+    def test_decimals_to_ints(self):
+        items = [Decimal('300.42'), 300.42, -300, Decimal('1.239'), None]
+        decimals_to_ints(
+            items, 2, nulls_map=[False, False, False, False, True],
+            null_value=0
+        )
+        self.assertEqual(items, [30042, 30042, -30000, 123, 0])
@@ -0,0 +1,43 @@
+from array import array
+from unittest import TestCase
+
+from clickhouse_driver.chunkedcolumn import concat_chunks
+from clickhouse_driver.flatcolumn import FlatColumn
+
+
+class FlatColumnTestCase(TestCase):
+    def test_arrays(self):
+        column = FlatColumn(array('i', [1, 2, 3]), [2, 2, 3])
+
+        self.assertEqual(len(column), 3)
+        self.assertEqual(list(column), [[1, 2], [], [3]])
+        self.assertEqual(column[-1], [3])
+        self.assertEqual(column[:2], [[1, 2], []])
+        self.assertEqual(column, ([1, 2], [], [3]))
+
+        with self.assertRaises(IndexError):
+            column[3]
+
+    def test_maps(self):
+        column = FlatColumn((1, 2), (1, 1, 2), keys=('a', 'b'))
+
+        self.assertEqual(list(column), [{'a': 1}, {}, {'b': 2}])
+
+    def test_concat(self):
+        chunks = [
+            FlatColumn(array('f', [1, 2]), [1, 2]),
+            FlatColumn(array('f', [3]), [0, 1])
+        ]
+
+        column = concat_chunks(chunks)
+        self.assertEqual(column.values, array('f', [1, 2, 3]))
+        self.assertEqual(list(column.offsets), [1, 2, 2, 3])
+        self.assertEqual(column, ([1], [2], [], [3]))
+        self.assertEqual(chunks, [])
+
+        chunks = [
+            FlatColumn((1, ), [1], keys=('a', )),
+            FlatColumn((2, ), [1], keys=('b', ))
+        ]
+        column = concat_chunks(chunks)
+        self.assertEqual(column, ({'a': 1}, {'b': 2}))
@@ -0,0 +1,96 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from clickhouse_driver.hostselector import HostSelector
+from tests.testcase import BaseTestCase
+
+
+class HostSelectorTestCase(TestCase):
+    hosts = [('host1', 9000), ('host2', 9000), ('host3', 9000)]
+
+    def test_unknown_hosts_keep_order(self):
+        selector = HostSelector()
+        self.assertEqual(selector.sort(self.hosts), self.hosts)
+
+    def test_fastest_first(self):
+        selector = HostSelector()
+        selector.record_connect('host1', 9000, 0.3)
+        selector.record_connect('host2', 9000, 0.2)
+        selector.record_connect('host3', 9000, 0.1)
+        selector.record_query('host3', 9000, 0.5)
+
+        self.assertEqual(
+            selector.sort(self.hosts),
+            [('host2', 9000), ('host1', 9000), ('host3', 9000)]
+        )
+
+    def test_latency_ewma(self):
+        selector = HostSelector(alpha=0.5)
+        selector.record_query('host1', 9000, 1.0)
+        selector.record_query('host1', 9000, 3.0)
+
+        stats = selector.stats[('host1', 9000)]
+        self.assertEqual(stats.query_latency, 2.0)
+
+    def test_failed_host_goes_last(self):
+        selector = HostSelector()
+        selector.record_connect('host2', 9000, 0.1)
+        selector.record_error('host1', 9000)
+
+        self.assertTrue(selector.is_available('host1', 9000))
+        self.assertEqual(
+            selector.sort(self.hosts),
+            [('host3', 9000), ('host2', 9000), ('host1', 9000)]
+        )
+
+    def test_circuit_breaker(self):
+        selector = HostSelector(error_threshold=0.5, cooldown=10)
+
+        with patch('clickhouse_driver.hostselector.time') as mocked_time:
+            mocked_time.return_value = 100.0
+
+            selector.record_connect('host1', 9000, 0.1)
+            selector.record_connect('host2', 9000, 1.0)
+            selector.record_error('host1', 9000)
+            self.assertTrue(selector.is_available('host1', 9000))
+
+            selector.record_error('host1', 9000)
+            self.assertFalse(selector.is_available('host1', 9000))
+            self.assertEqual(
+                selector.sort(self.hosts[:2]),
+                [('host2', 9000), ('host1', 9000)]
+            )
+
+            # Cooldown is over.
+            mocked_time.return_value = 111.0
+            self.assertTrue(selector.is_available('host1', 9000))
+            self.assertEqual(
+                selector.sort(self.hosts[:2]),
+                [('host1', 9000), ('host2', 9000)]
+            )
+
+            # Host is still suspicious after single success.
+            selector.record_connect('host1', 9000, 0.1)
+            selector.record_error('host1', 9000)
+            self.assertFalse(selector.is_available('host1', 9000))
+
+            mocked_time.return_value = 122.0
+            selector.record_connect('host1', 9000, 0.1)
+            selector.record_connect('host1', 9000, 0.1)
+            selector.record_connect('host1', 9000, 0.1)
+            selector.record_error('host1', 9000)
+            self.assertTrue(selector.is_available('host1', 9000))
+
+
+class ClientHostSelectorTestCase(BaseTestCase):
+    def test_streamed_query_latency_is_not_recorded(self):
+        selector = HostSelector()
+
+        with self.created_client(host_selector=selector) as client:
+            rv = client.execute_iter('SELECT sleep(0.1)')
+            stats = selector.stats[(self.host, self.port)]
+            self.assertIsNone(stats.query_latency)
+            list(rv)
+
+            client.execute('SELECT 1')
+            self.assertIsNotNone(stats.query_latency)
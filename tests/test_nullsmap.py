@@ -0,0 +1,25 @@
+from array import array
+from unittest import TestCase
+
+from clickhouse_driver.columns.nullsmap import apply_nulls_map, make_nulls_map
+
+
+class NullsMapTestCase(TestCase):
+    def test_apply(self):
+        rv = apply_nulls_map((1, 2, 3), b'\x00\x01\x00')
+        self.assertEqual(rv, (1, None, 3))
+
+        rv = apply_nulls_map(array('i', [1, 2]), b'\x01\x00')
+        self.assertEqual(rv, (None, 2))
+
+        self.assertEqual(apply_nulls_map([], b''), ())
+
+    def test_apply_not_enough_items(self):
+        with self.assertRaises(ValueError):
+            apply_nulls_map((1, ), b'\x00\x00')
+
+    def test_make(self):
+        self.assertEqual(
+            make_nulls_map([None, 0, '', None]), b'\x01\x00\x00\x01'
+        )
+        self.assertEqual(make_nulls_map(()), b'')
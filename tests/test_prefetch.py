@@ -0,0 +1,48 @@
+from time import sleep
+from unittest import TestCase
+
+from clickhouse_driver.util.compat import threading
+from clickhouse_driver.util.helpers import prefetch
+
+
+class PrefetchTestCase(TestCase):
+    def test_items(self):
+        self.assertEqual(list(prefetch(range(10), 2)), list(range(10)))
+        self.assertEqual(list(prefetch([], 2)), [])
+
+    def test_error(self):
+        def iterable():
+            yield 1
+            yield 2
+            raise ValueError('broken')
+
+        gen = prefetch(iterable(), 1)
+        self.assertEqual(next(gen), 1)
+        self.assertEqual(next(gen), 2)
+
+        with self.assertRaises(ValueError) as e:
+            next(gen)
+        self.assertEqual(str(e.exception), 'broken')
+
+    def test_close(self):
+        consumed = []
+        producers = []
+
+        def iterable():
+            producers.append(threading.current_thread())
+            for i in range(100):
+                # Item is being read when consumer goes away.
+                sleep(0.01)
+                consumed.append(i)
+                yield i
+
+        gen = prefetch(iterable(), 2)
+        self.assertEqual(next(gen), 0)
+        gen.close()
+
+        # Producer is stopped on close and doesn't read more.
+        self.assertFalse(producers[0].is_alive())
+        n_consumed = len(consumed)
+        self.assertLess(n_consumed, 10)
+        sleep(0.05)
+        self.assertEqual(len(consumed), n_consumed)
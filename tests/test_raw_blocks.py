@@ -0,0 +1,112 @@
+from datetime import date
+
+from clickhouse_driver.block import RawBlock
+from tests.testcase import BaseTestCase, file_config
+
+
+class RawBlocksTestCase(BaseTestCase):
+    columns = (
+        'a Int32, b String, c Nullable(String), d Array(Nullable(Int32)), '
+        'e Map(String, UInt64), f Tuple(Int8, String), g FixedString(2), '
+        'h Date, i LowCardinality(String)'
+    )
+    data = [
+        (
+            i, 'str{}'.format(i), None if i % 2 else 'x' * i, [i, None],
+            {'k': i}, (i, 's'), b'ab', date(2020, 1, 1),
+            'lc{}'.format(i % 3)
+        )
+        for i in range(10)
+    ]
+
+    def test_execute_raw(self):
+        with self.create_table(self.columns):
+            self.client.execute('INSERT INTO test VALUES', self.data)
+
+            blocks = self.client.execute_raw(
+                'SELECT * FROM test', settings={'max_block_size': 3}
+            )
+
+        self.assertEqual(len(blocks), 4)
+        self.assertTrue(all(isinstance(x, RawBlock) for x in blocks))
+        self.assertEqual(sum(x.num_rows for x in blocks), 10)
+        self.assertEqual(blocks[0].columns_with_types[0], ('a', 'Int32'))
+        self.assertFalse(blocks[0].compressed)
+
+    def test_insert_raw(self):
+        with self.create_table(self.columns):
+            self.client.execute('INSERT INTO test VALUES', self.data)
+            blocks = list(self.client.iter_raw_blocks('SELECT * FROM test'))
+
+            self.client.execute('TRUNCATE TABLE test')
+            rv = self.client.insert_raw('INSERT INTO test VALUES', blocks)
+            self.assertEqual(rv, 10)
+
+            inserted = self.client.execute('SELECT * FROM test ORDER BY a')
+            self.assertEqual(inserted, self.data)
+
+    def test_empty(self):
+        blocks = self.client.execute_raw(
+            'SELECT number FROM numbers(10) WHERE number > 100'
+        )
+        self.assertEqual(blocks, [])
+
+    def test_execute_after_raw(self):
+        self.client.execute_raw('SELECT 1')
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+
+class CompressedRawBlocksTestCase(BaseTestCase):
+    compression = 'lz4'
+
+    def setUp(self):
+        super(CompressedRawBlocksTestCase, self).setUp()
+        supported = file_config.get('db', 'compression').split(',')
+        if self.compression not in supported:
+            self.skipTest(
+                'Compression {} is not supported'.format(self.compression)
+            )
+
+    def _create_client(self, **kwargs):
+        kwargs['compression'] = self.compression
+        return super(CompressedRawBlocksTestCase, self)._create_client(
+            **kwargs
+        )
+
+    def test_compressed(self):
+        with self.create_table('a UInt64, b String'):
+            data = [(i, str(i)) for i in range(100)]
+            self.client.execute('INSERT INTO test VALUES', data)
+
+            blocks = self.client.execute_raw(
+                'SELECT * FROM test', compressed=True
+            )
+            self.assertTrue(all(x.compressed for x in blocks))
+
+            self.client.execute('TRUNCATE TABLE test')
+            self.client.insert_raw('INSERT INTO test VALUES', blocks)
+
+            inserted = self.client.execute('SELECT * FROM test ORDER BY a')
+            self.assertEqual(inserted, data)
+
+    def test_compressed_to_uncompressed_connection(self):
+        blocks = self.client.execute_raw('SELECT 1', compressed=True)
+
+        client = super(CompressedRawBlocksTestCase, self)._create_client()
+        try:
+            with self.create_table('a UInt8'):
+                with self.assertRaises(ValueError):
+                    client.insert_raw('INSERT INTO test VALUES', blocks)
+        finally:
+            client.disconnect()
+
+    def test_uncompressed(self):
+        with self.create_table('a UInt64'):
+            blocks = self.client.execute_raw('SELECT number FROM numbers(5)')
+            self.assertFalse(blocks[0].compressed)
+
+            self.client.insert_raw('INSERT INTO test VALUES', blocks)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [(x, ) for x in range(5)])
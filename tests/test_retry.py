@@ -0,0 +1,120 @@
+import socket
+from unittest import TestCase
+from unittest.mock import patch
+
+from clickhouse_driver import errors
+from clickhouse_driver.connection import Connection
+from clickhouse_driver.retry import RetryPolicy, is_read_query
+from tests.testcase import BaseTestCase
+
+
+class RetryPolicyTestCase(TestCase):
+    def test_read_query(self):
+        self.assertTrue(is_read_query('SELECT 1'))
+        self.assertTrue(is_read_query('  \n with 1 AS x SELECT x'))
+        self.assertTrue(is_read_query('show tables'))
+        self.assertFalse(is_read_query('INSERT INTO test SELECT 1'))
+        self.assertFalse(is_read_query('CREATE TABLE selected (x Int8)'))
+        self.assertFalse(is_read_query('SELECTED'))
+
+    def test_delay(self):
+        policy = RetryPolicy(
+            backoff=1, backoff_multiplier=3, max_backoff=5, jitter=False
+        )
+        self.assertEqual(
+            [policy.get_delay(i) for i in range(1, 5)], [1, 3, 5, 5]
+        )
+
+        policy = RetryPolicy(backoff=1, jitter=True)
+        for _ in range(10):
+            self.assertLessEqual(policy.get_delay(2), 2)
+
+    def test_transient(self):
+        policy = RetryPolicy(server_codes=[errors.ErrorCodes.ABORTED])
+
+        self.assertTrue(policy.is_transient(errors.NetworkError()))
+        self.assertTrue(policy.is_transient(socket.timeout()))
+        self.assertTrue(policy.is_transient(EOFError()))
+        self.assertTrue(policy.is_transient(
+            errors.ServerException('', code=errors.ErrorCodes.ABORTED)
+        ))
+        self.assertFalse(policy.is_transient(
+            errors.ServerException('', code=errors.ErrorCodes.UNKNOWN_TABLE)
+        ))
+        self.assertFalse(policy.is_transient(ValueError()))
+
+
+class RetryTestCase(BaseTestCase):
+    def created_client(self, **kwargs):
+        policy = RetryPolicy(max_attempts=2, backoff=0.01)
+        return super(RetryTestCase, self).created_client(
+            retry_policy=policy, **kwargs
+        )
+
+    def failing_send_query(self, n_failures):
+        send_query = Connection.send_query
+        self.n_calls = 0
+
+        def side_send_query(connection, *args, **kwargs):
+            self.n_calls += 1
+            if self.n_calls <= n_failures:
+                raise socket.error(-1, 'Connection reset by peer')
+            return send_query(connection, *args, **kwargs)
+
+        return patch.object(
+            Connection, 'send_query', autospec=True,
+            side_effect=side_send_query
+        )
+
+    def test_select_retried(self):
+        with self.created_client() as client, self.failing_send_query(1):
+            self.assertEqual(client.execute('SELECT 1'), [(1, )])
+            self.assertEqual(self.n_calls, 2)
+
+    def test_attempts_exceeded(self):
+        with self.created_client() as client, self.failing_send_query(2):
+            with self.assertRaises(socket.error):
+                client.execute('SELECT 1')
+            self.assertEqual(self.n_calls, 2)
+
+    def test_failover_to_alt_host(self):
+        alt_hosts = '{}:{}'.format(self.host, self.port)
+
+        with self.created_client(alt_hosts=alt_hosts) as client:
+            client.execute('SELECT 1')
+            client.connection.hosts[0] = ('wrong_host', self.port)
+
+            with self.failing_send_query(1):
+                self.assertEqual(client.execute('SELECT 1'), [(1, )])
+
+    def test_insert(self):
+        with self.create_table('a UInt8'):
+            with self.created_client() as client:
+                query = 'INSERT INTO test (a) VALUES'
+
+                # Not idempotent.
+                with self.failing_send_query(1):
+                    with self.assertRaises(socket.error):
+                        client.execute(query, [(1, )])
+
+                settings = {'insert_deduplication_token': 'token'}
+                with self.failing_send_query(1):
+                    rv = client.execute(query, [(1, )], settings=settings)
+                    self.assertEqual(rv, 1)
+
+                # Generator can't be replayed.
+                with self.failing_send_query(1):
+                    with self.assertRaises(socket.error):
+                        client.execute(
+                            query, ((x, ) for x in range(2)),
+                            settings=settings
+                        )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1\n')
+
+    def test_not_read_query(self):
+        with self.created_client() as client, self.failing_send_query(1):
+            with self.assertRaises(socket.error):
+                client.execute('SYSTEM FLUSH LOGS')
+            self.assertEqual(self.n_calls, 1)
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+import pickle
+from unittest import TestCase
+
+from clickhouse_driver.rowfactory import (
+    dataclass_row, dict_row, make_namedtuple, namedtuple_row
+)
+
+
+columns_with_types = [('a', 'UInt8'), ('b', 'String')]
+columns = [(1, 2), ('x', 'y')]
+
+
+@dataclass
+class Record(object):
+    b: str
+    a: int
+    c: int = field(default=0, init=False)
+
+
+class RowFactoryTestCase(TestCase):
+    def test_namedtuple_row(self):
+        rows = namedtuple_row(columns_with_types)(columns)
+
+        self.assertEqual(rows, [(1, 'x'), (2, 'y')])
+        self.assertEqual(rows[1].b, 'y')
+
+    def test_namedtuple_class_is_reused(self):
+        cls = make_namedtuple(('a', 'b'))
+
+        rows = namedtuple_row(columns_with_types)(columns)
+        self.assertIsInstance(rows[0], cls)
+
+    def test_namedtuple_fields(self):
+        cls = make_namedtuple(('count()', '1', '_x', 'a', 'a'))
+        self.assertEqual(cls._fields[:4], ('count__', 'f1', 'f_x', 'a'))
+
+    def test_namedtuple_pickle(self):
+        rows = namedtuple_row(columns_with_types)(columns)
+
+        unpickled = pickle.loads(pickle.dumps(rows))
+        self.assertEqual(unpickled, rows)
+        self.assertIs(type(unpickled[0]), type(rows[0]))
+
+    def test_dict_row(self):
+        rows = dict_row(columns_with_types)(columns)
+        self.assertEqual(rows, [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}])
+
+    def test_dataclass_row(self):
+        rows = dataclass_row(Record)(columns_with_types)(columns)
+        self.assertEqual(rows, [Record('x', 1), Record('y', 2)])
+
+    def test_dataclass_row_positional(self):
+        make_rows = dataclass_row(Record)([('x', 'String'), ('y', 'UInt8')])
+        rows = make_rows([('x', 'y'), (1, 2)])
+        self.assertEqual(rows, [Record('x', 1), Record('y', 2)])
+
+    def test_dataclass_row_mismatch(self):
+        with self.assertRaises(ValueError):
+            dataclass_row(Record)([('x', 'UInt8')])
+
+        with self.assertRaises(TypeError):
+            dataclass_row(dict)
@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from clickhouse_driver.rowview import Row, RowView
+
+
+class RowViewTestCase(TestCase):
+    columns_with_types = [('a', 'UInt8'), ('b', 'String'), ('a', 'UInt8')]
+
+    def make_view(self):
+        chunks = [
+            [(1, 2), ('x', 'y'), (10, 20)],
+            [(), (), ()],
+            [(3, ), ('z', ), (30, )]
+        ]
+        return RowView(chunks, self.columns_with_types)
+
+    def test_len_and_iter(self):
+        view = self.make_view()
+
+        self.assertEqual(len(view), 3)
+        self.assertEqual(
+            [tuple(row) for row in view],
+            [(1, 'x', 10), (2, 'y', 20), (3, 'z', 30)]
+        )
+
+    def test_getitem(self):
+        view = self.make_view()
+
+        self.assertEqual(view[2], (3, 'z', 30))
+        self.assertEqual(view[-3], (1, 'x', 10))
+        self.assertEqual(view[0:3:2], [(1, 'x', 10), (3, 'z', 30)])
+
+        with self.assertRaises(IndexError):
+            view[3]
+
+        with self.assertRaises(IndexError):
+            view[-4]
+
+    def test_row_access(self):
+        row = self.make_view()[1]
+
+        self.assertIsInstance(row, Row)
+        self.assertEqual(row[1], 'y')
+        self.assertEqual(row[-1], 20)
+        self.assertEqual(row[:2], (2, 'y'))
+        # The first column wins for duplicated names.
+        self.assertEqual(row['a'], 2)
+        self.assertEqual(row['b'], 'y')
+        self.assertEqual(row.as_dict(), {'a': 2, 'b': 'y'})
+
+        with self.assertRaises(KeyError):
+            row['c']
+
+    def test_row_compares_to_tuple(self):
+        view = self.make_view()
+
+        self.assertEqual(view[0], (1, 'x', 10))
+        self.assertNotEqual(view[0], (1, 'x', 11))
+        self.assertEqual(hash(view[0]), hash((1, 'x', 10)))
+        self.assertEqual(repr(view[0]), repr((1, 'x', 10)))
+        self.assertEqual(
+            view, [(1, 'x', 10), (2, 'y', 20), (3, 'z', 30)]
+        )
+
+    def test_row_has_no_dict(self):
+        row = self.make_view()[0]
+
+        with self.assertRaises(AttributeError):
+            row.__dict__
+
+    def test_empty(self):
+        view = RowView([])
+
+        self.assertEqual(len(view), 0)
+        self.assertEqual(list(view), [])
+        self.assertEqual(view, [])
@@ -0,0 +1,147 @@
+from functools import partial
+from time import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from clickhouse_driver import errors
+from clickhouse_driver.scheduler import Job, QueryScheduler
+from tests.testcase import BaseTestCase
+
+
+class QuerySchedulerTestCase(BaseTestCase):
+    def created_scheduler(self, **kwargs):
+        return QueryScheduler(
+            self.host, port=self.port, database=self.database,
+            user=self.user, password=self.password, **kwargs
+        )
+
+    def test_execute(self):
+        with self.created_scheduler(workers=2) as scheduler:
+            futures = [
+                scheduler.submit('SELECT %(x)s', {'x': i}) for i in range(10)
+            ]
+            rv = [f.result() for f in futures]
+            self.assertEqual(rv, [[(i, )] for i in range(10)])
+
+            rv = scheduler.execute('SELECT 1', with_column_types=True)
+            self.assertEqual(rv, ([(1, )], [('1', 'UInt8')]))
+
+    def test_priority(self):
+        order = []
+
+        with self.created_scheduler(workers=1) as scheduler:
+            # Occupy single worker.
+            first = scheduler.submit('SELECT sleep(0.5)')
+
+            futures = []
+            for i, priority in enumerate([5, 0, 1]):
+                future = scheduler.submit('SELECT 1', priority=priority)
+                future.add_done_callback(
+                    lambda f, i=i: order.append(i)
+                )
+                futures.append(future)
+
+            first.result()
+            for future in futures:
+                future.result()
+
+        self.assertEqual(order, [1, 2, 0])
+
+    def test_deadline_cancel(self):
+        with self.created_scheduler(workers=1) as scheduler:
+            started = time()
+            future = scheduler.submit('SELECT sleep(3)', timeout=0.5)
+
+            with self.assertRaises(errors.DeadlineExceededError):
+                future.result()
+            self.assertLess(time() - started, 2.5)
+
+            # Client is still usable.
+            self.assertEqual(scheduler.execute('SELECT 1'), [(1, )])
+
+    def test_deadline_in_queue(self):
+        with self.created_scheduler(workers=1) as scheduler:
+            scheduler.submit('SELECT sleep(0.5)')
+            future = scheduler.submit('SELECT 1', deadline=time() + 0.1)
+
+            with self.assertRaises(errors.DeadlineExceededError):
+                future.result()
+
+    def test_server_error(self):
+        with self.created_scheduler(workers=1) as scheduler:
+            with self.assertRaises(errors.ServerException):
+                scheduler.execute('SELECT unknown_column')
+
+            self.assertEqual(scheduler.execute('SELECT 1'), [(1, )])
+
+    def test_closed(self):
+        scheduler = self.created_scheduler(workers=1)
+        scheduler.close()
+
+        with self.assertRaises(RuntimeError):
+            scheduler.submit('SELECT 1')
+
+
+class QuerySchedulerCancelTestCase(TestCase):
+    def setUp(self):
+        self.scheduler = QueryScheduler('localhost', workers=1)
+        self.client = self.scheduler.clients[0]
+        self.connection = self.client.connection
+
+        self.job = Job('SELECT 1', None, time(), {})
+        self.job.client = self.client
+        self.scheduler._set_receiving_callback(
+            self.client, partial(self.scheduler._set_receiving, self.job)
+        )
+
+        patcher = patch.object(self.connection, 'send_cancel')
+        self.send_cancel = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.scheduler._set_receiving_callback(self.client, None)
+        self.scheduler.close()
+
+    def test_cancel_on_receive(self):
+        self.connection.set_receiving(True)
+        self.scheduler._cancel(self.job)
+
+        self.assertEqual(self.send_cancel.call_count, 1)
+        self.assertTrue(self.job.expired)
+
+        # Cancel is sent once.
+        self.connection.set_receiving(True)
+        self.assertEqual(self.send_cancel.call_count, 1)
+
+    def test_cancel_on_send(self):
+        self.scheduler._cancel(self.job)
+        self.assertFalse(self.send_cancel.called)
+        self.assertFalse(self.job.expired)
+
+        # Cancel is sent when query is sent.
+        self.connection.set_receiving(True)
+        self.assertEqual(self.send_cancel.call_count, 1)
+        self.assertTrue(self.job.expired)
+
+    def test_no_cancel_after_end_of_result(self):
+        self.connection.set_receiving(True)
+        self.connection.set_receiving(False)
+        self.scheduler._cancel(self.job)
+
+        self.assertFalse(self.send_cancel.called)
+        self.assertFalse(self.job.expired)
+
+    def test_no_cancel_after_end_of_query(self):
+        self.job.client = None
+        self.scheduler._cancel(self.job)
+
+        self.assertFalse(self.job.cancel_requested)
+        self.connection.set_receiving(True)
+        self.assertFalse(self.send_cancel.called)
+
+    def test_cancel_error(self):
+        self.send_cancel.side_effect = OSError('broken pipe')
+        self.connection.set_receiving(True)
+        self.scheduler._cancel(self.job)
+
+        self.assertFalse(self.job.expired)
@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+from clickhouse_driver.spill import SpilledRows, estimate_rows_size
+
+
+class SpilledRowsTestCase(TestCase):
+    def make_rows(self):
+        rows = SpilledRows()
+        rows.append([(1, 'a'), (2, 'b')])
+        rows.append([])
+        rows.append([(3, 'c')])
+        rows.finalize()
+        return rows
+
+    def test_sequence(self):
+        with self.make_rows() as rows:
+            self.assertEqual(len(rows), 3)
+            self.assertEqual(list(rows), [(1, 'a'), (2, 'b'), (3, 'c')])
+            self.assertEqual(rows[2], (3, 'c'))
+            self.assertEqual(rows[-3], (1, 'a'))
+            self.assertEqual(rows[1:], [(2, 'b'), (3, 'c')])
+            self.assertEqual(rows, [(1, 'a'), (2, 'b'), (3, 'c')])
+
+            with self.assertRaises(IndexError):
+                rows[3]
+
+    def test_types(self):
+        data = [(date(2020, 1, 1), Decimal('1.5'), None, [1, 2])]
+
+        with SpilledRows() as rows:
+            rows.append(data)
+            rows.finalize()
+            self.assertEqual(list(rows), data)
+
+    def test_empty(self):
+        with SpilledRows() as rows:
+            rows.finalize()
+            self.assertEqual(len(rows), 0)
+            self.assertEqual(list(rows), [])
+
+    def test_closed(self):
+        rows = self.make_rows()
+        rows.close()
+
+        with self.assertRaises(ValueError):
+            rows[0]
+
+    def test_estimate_rows_size(self):
+        self.assertEqual(estimate_rows_size([]), 0)
+
+        one = estimate_rows_size([(1, 'a')])
+        self.assertGreater(one, 0)
+        self.assertEqual(estimate_rows_size([(1, 'a')] * 10), one * 10)
@@ -0,0 +1,60 @@
+from unittest import TestCase
+from uuid import UUID
+
+from clickhouse_driver import errors
+from clickhouse_driver.columns.exceptions import ColumnTypeMismatchException
+from clickhouse_driver.columns.uuidcodec import (
+    read_uuids, read_uuids_as_bytes, read_uuids_as_str, write_uuids
+)
+
+
+class UUIDCodecTestCase(TestCase):
+    uuids = [
+        UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d'),
+        UUID('2efcead4-ff55-4db5-bdb4-6b36a308d8e0'),
+        UUID(int=0),
+        UUID(int=2 ** 128 - 1)
+    ]
+
+    # Two little-endian uint64 per UUID: high and low halves.
+    data = (
+        b'\xed\x44\x52\x07\xa9\xbb\xfc\xc0\x9d\xb8\x42\x43\xfb\x4d\xd6\xa5'
+        b'\xb5\x4d\x55\xff\xd4\xea\xfc\x2e\xe0\xd8\x08\xa3\x36\x6b\xb4\xbd' +
+        b'\x00' * 16 + b'\xff' * 16
+    )
+
+    def test_read(self):
+        rv = read_uuids(self.data, 4)
+        self.assertEqual(list(rv), self.uuids)
+        self.assertEqual(hash(rv[0]), hash(self.uuids[0]))
+        self.assertEqual(rv[0].is_safe, self.uuids[0].is_safe)
+
+    def test_read_as_bytes(self):
+        rv = read_uuids_as_bytes(self.data, 4)
+        self.assertEqual(list(rv), [x.bytes for x in self.uuids])
+
+    def test_read_as_str(self):
+        rv = read_uuids_as_str(self.data, 4)
+        self.assertEqual(list(rv), [str(x) for x in self.uuids])
+
+    def test_read_not_enough_data(self):
+        with self.assertRaises(ValueError):
+            read_uuids(self.data[:-1], 4)
+
+    def test_write(self):
+        self.assertEqual(write_uuids(self.uuids), self.data)
+        self.assertEqual(write_uuids([str(x) for x in self.uuids]), self.data)
+        self.assertEqual(write_uuids([x.bytes for x in self.uuids]), self.data)
+        self.assertEqual(write_uuids([]), b'')
+
+    def test_write_bad_uuid(self):
+        with self.assertRaises(errors.CannotParseUuidError):
+            write_uuids(['a'])
+
+        with self.assertRaises(errors.CannotParseUuidError):
+            write_uuids([b'a'])
+
+    def test_write_type_mismatch(self):
+        for item in (1, None, 1.5):
+            with self.assertRaises(ColumnTypeMismatchException):
+                write_uuids([item])